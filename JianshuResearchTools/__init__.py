@@ -1,11 +1,36 @@
 __version__ = "2.10.1"
 
-from . import (article, beikeisland, collection, island, notebook, objects,
-               rank, user)
+from . import (aio, article, beikeisland, collection, crawler, graph_store,
+               island, notebook, objects, rank, records, user)
+from .assert_funcs import (clear_status_cache, configure_status_cache,
+                           get_status_cache_stats, invalidate_status_cache)
+from .cache import (clear_response_cache, configure_response_cache,
+                    get_response_cache_stats, get_response_cache_status,
+                    set_response_cache_status)
+from .client import close, configure_client
+from .disk_cache import (clear_disk_cache, get_disk_cache_stats,
+                         get_disk_cache_status, set_disk_cache_status)
+from .ratelimit import (configure_rate_limit, get_rate_limit_stats,
+                        reset_rate_limit_stats)
+from .retry import (configure_retry, get_retry_config, get_retry_stats,
+                    reset_retry_stats)
+from .slug_index import (clear_slug_index, get_slug_index_stats,
+                         get_slug_index_status, set_slug_index_status)
 
 __all__ = [
-    "article", "beikeisland", "collection", "island", "notebook", "objects",
-    "rank", "user"
+    "aio", "article", "beikeisland", "collection", "crawler",
+    "graph_store", "island", "notebook", "objects", "rank", "records", "user",
+    "configure_client", "close",
+    "set_response_cache_status", "get_response_cache_status",
+    "configure_response_cache", "get_response_cache_stats",
+    "clear_response_cache", "configure_status_cache",
+    "get_status_cache_stats", "invalidate_status_cache",
+    "clear_status_cache", "set_disk_cache_status", "get_disk_cache_status",
+    "get_disk_cache_stats", "clear_disk_cache", "set_slug_index_status",
+    "get_slug_index_status", "get_slug_index_stats", "clear_slug_index",
+    "configure_rate_limit", "get_rate_limit_stats",
+    "reset_rate_limit_stats", "configure_retry", "get_retry_config",
+    "get_retry_stats", "reset_retry_stats"
 ]
 
 
@@ -0,0 +1,13 @@
+"""异步版本的 JRT 接口
+
+所有函数均为协程，异步生成器需使用 async for 遍历，所有请求共享同一个异步客户端
+"""
+
+from ..client import aclose as close
+from . import (article, basic_apis, beikeisland, collection, island, notebook,
+               rank, user)
+
+__all__ = [
+    "article", "basic_apis", "beikeisland", "collection", "island", "notebook",
+    "rank", "user", "close"
+]
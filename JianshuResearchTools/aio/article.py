@@ -0,0 +1,542 @@
+from datetime import datetime
+from re import findall, sub
+from typing import AsyncGenerator, Dict, Iterable, List, Tuple, Union
+
+from lxml import etree
+
+from ..assert_funcs import (AssertArticleJsonDataNormal, AssertArticleUrl,
+                            AssertCachedStatusNormal)
+from ..parsers import ParseArticleCommentsJson
+from ..records import CommentRecord
+from ..utils import AsyncBatchCall, AsyncRunConcurrently
+from .assert_funcs import AssertArticleStatusNormal
+from .basic_apis import (GetArticleCommentsJsonDataApi,
+                         GetArticleHtmlJsonDataApi, GetArticleJsonDataApi)
+
+try:
+    from tomd import convert as html2md
+except ImportError:
+    pass
+
+__all__ = [
+    "GetArticleTitle", "GetArticleAuthorName", "GetArticleReadsCount",
+    "GetArticleWordage", "GetArticleLikesCount", "GetArticleCommentsCount",
+    "GetArticleMostValuableCommentsCount", "GetArticleTotalFPCount",
+    "GetArticleDescription", "GetArticlePublishTime", "GetArticleUpdateTime",
+    "GetArticlePaidStatus", "GetArticleReprintStatus",
+    "GetArticleCommentStatus", "GetArticleHtml", "GetArticleText",
+    "GetArticleMarkdown", "GetArticleCommentsData", "GetArticleAllBasicData",
+    "GetArticlesAllBasicData", "GetArticleAllCommentsData"
+]
+
+
+async def GetArticleTitle(article_url: str, disable_check: bool = False) -> str:
+    """获取文章标题
+
+    Args:
+        article_url (str): 文章 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        str: 文章标题
+    """
+    if not disable_check:
+        AssertArticleUrl(article_url)
+        AssertCachedStatusNormal(article_url)
+    json_obj = await GetArticleJsonDataApi(article_url)
+    if not disable_check:
+        AssertArticleJsonDataNormal(article_url, json_obj)
+    result = json_obj["public_title"]
+    return result
+
+
+async def GetArticleAuthorName(article_url: str, disable_check: bool = False) -> str:
+    """获取文章作者名
+
+    Args:
+        article_url (str): 文章 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        str: 文章作者名
+    """
+    if not disable_check:
+        AssertArticleUrl(article_url)
+        await AssertArticleStatusNormal(article_url)
+    json_obj = await GetArticleHtmlJsonDataApi(article_url)
+    result = json_obj["props"]["initialState"]["note"]["data"]["user"]["nickname"]
+    return result
+
+
+async def GetArticleReadsCount(article_url: str, disable_check: bool = False) -> int:
+    """获取文章阅读量
+
+    Args:
+        article_url (str): 文章 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        str: 文章阅读量
+    """
+    if not disable_check:
+        AssertArticleUrl(article_url)
+        await AssertArticleStatusNormal(article_url)
+    json_obj = await GetArticleHtmlJsonDataApi(article_url)
+    result = json_obj["props"]["initialState"]["note"]["data"]["views_count"]
+    return result
+
+
+async def GetArticleWordage(article_url: str, disable_check: bool = False) -> int:
+    """获取文章字数
+
+    Args:
+        article_url (str): 文章 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        str: 文章字数
+    """
+    if not disable_check:
+        AssertArticleUrl(article_url)
+        await AssertArticleStatusNormal(article_url)
+    json_obj = await GetArticleHtmlJsonDataApi(article_url)
+    result = json_obj["props"]["initialState"]["note"]["data"]["wordage"]
+    return result
+
+
+async def GetArticleLikesCount(article_url: str, disable_check: bool = False) -> int:
+    """获取文章点赞量
+
+    Args:
+        article_url (str): 文章 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        int: 文章点赞量
+    """
+    if not disable_check:
+        AssertArticleUrl(article_url)
+        AssertCachedStatusNormal(article_url)
+    json_obj = await GetArticleJsonDataApi(article_url)
+    if not disable_check:
+        AssertArticleJsonDataNormal(article_url, json_obj)
+    result = json_obj["likes_count"]
+    return result
+
+
+async def GetArticleCommentsCount(article_url: str, disable_check: bool = False) -> int:
+    """获取文章评论数量
+
+    Args:
+        article_url (str): 文章 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        int: 文章评论数量
+    """
+    if not disable_check:
+        AssertArticleUrl(article_url)
+        AssertCachedStatusNormal(article_url)
+    json_obj = await GetArticleJsonDataApi(article_url)
+    if not disable_check:
+        AssertArticleJsonDataNormal(article_url, json_obj)
+    result = json_obj["public_comment_count"]
+    return result
+
+
+async def GetArticleMostValuableCommentsCount(article_url: str, disable_check: bool = False) -> int:
+    """获取文章精选评论数量
+
+    Args:
+        article_url (str): 文章 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        int: 文章精选评论数量
+    """
+    if not disable_check:
+        AssertArticleUrl(article_url)
+        AssertCachedStatusNormal(article_url)
+    json_obj = await GetArticleJsonDataApi(article_url)
+    if not disable_check:
+        AssertArticleJsonDataNormal(article_url, json_obj)
+    result = json_obj["featured_comments_count"]
+    return result
+
+
+async def GetArticleTotalFPCount(article_url: str, disable_check: bool = False) -> float:
+    """获取文章总获钻量
+
+    Args:
+        article_url (str): 文章 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        int: 文章总获钻量
+    """
+    if not disable_check:
+        AssertArticleUrl(article_url)
+        AssertCachedStatusNormal(article_url)
+    json_obj = await GetArticleJsonDataApi(article_url)
+    if not disable_check:
+        AssertArticleJsonDataNormal(article_url, json_obj)
+    result = json_obj["total_fp_amount"] / 1000
+    return result
+
+
+async def GetArticleDescription(article_url: str, disable_check: bool = False) -> str:
+    """获取文章摘要
+
+    Args:
+        article_url (str): 文章 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        str: 文章摘要
+    """
+    if not disable_check:
+        AssertArticleUrl(article_url)
+        AssertCachedStatusNormal(article_url)
+    json_obj = await GetArticleJsonDataApi(article_url)
+    if not disable_check:
+        AssertArticleJsonDataNormal(article_url, json_obj)
+    result = json_obj["description"]
+    return result
+
+
+async def GetArticlePublishTime(article_url: str, disable_check: bool = False) -> datetime:
+    """获取文章发布时间
+
+    Args:
+        article_url (str): 文章 URL
+        disable_check (str): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        datetime: 文章发布时间
+    """
+    if not disable_check:
+        AssertArticleUrl(article_url)
+        AssertCachedStatusNormal(article_url)
+    json_obj = await GetArticleJsonDataApi(article_url)
+    if not disable_check:
+        AssertArticleJsonDataNormal(article_url, json_obj)
+    result = datetime.fromisoformat(json_obj["first_shared_at"])
+    return result
+
+
+async def GetArticleUpdateTime(article_url: str, disable_check: bool = False) -> datetime:
+    """获取文章更新时间
+
+    Args:
+        article_url (str): 文章 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        datetime: 文章更新时间
+    """
+    if not disable_check:
+        AssertArticleUrl(article_url)
+        AssertCachedStatusNormal(article_url)
+    json_obj = await GetArticleJsonDataApi(article_url)
+    if not disable_check:
+        AssertArticleJsonDataNormal(article_url, json_obj)
+    result = datetime.fromtimestamp(json_obj["last_updated_at"])
+    return result
+
+
+async def GetArticlePaidStatus(article_url: str, disable_check: bool = False) -> bool:
+    """获取文章付费状态
+
+    Args:
+        article_url (str): 文章 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        bool: 文章付费状态，True 为付费文章，False 为免费文章
+    """
+    if not disable_check:
+        AssertArticleUrl(article_url)
+        AssertCachedStatusNormal(article_url)
+    json_obj = await GetArticleJsonDataApi(article_url)
+    if not disable_check:
+        AssertArticleJsonDataNormal(article_url, json_obj)
+    paid_type = {
+        "free": False,   # 免费文章
+        "fbook_free": False,   # 免费连载中的免费文章
+        "pbook_free": False,   # 付费连载中的免费文章
+        "paid": True,   # 付费文章
+        "fbook_paid": True,   # 免费连载中的付费文章
+        "pbook_paid": True   # 付费连载中的付费文章
+    }
+    result = paid_type[json_obj["paid_type"]]
+    return result
+
+
+async def GetArticleReprintStatus(article_url: str, disable_check: bool = False) -> bool:
+    """获取文章转载声明状态
+
+    Args:
+        article_url (str): 文章 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        bool: 文章转载声明状态，True 为允许转载，False 为禁止转载
+    """
+    if not disable_check:
+        AssertArticleUrl(article_url)
+        AssertCachedStatusNormal(article_url)
+    json_obj = await GetArticleJsonDataApi(article_url)
+    if not disable_check:
+        AssertArticleJsonDataNormal(article_url, json_obj)
+    result = json_obj["reprintable"]
+    return result
+
+
+async def GetArticleCommentStatus(article_url: str, disable_check: bool = False) -> bool:
+    """获取文章评论区状态
+
+    Args:
+        article_url (str): 文章 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        bool: 文章评论区状态，True 为开启评论，False 为关闭评论
+    """
+    if not disable_check:
+        AssertArticleUrl(article_url)
+        AssertCachedStatusNormal(article_url)
+    json_obj = await GetArticleJsonDataApi(article_url)
+    if not disable_check:
+        AssertArticleJsonDataNormal(article_url, json_obj)
+    result = json_obj["commentable"]
+    return result
+
+
+async def GetArticleHtml(article_url: str, disable_check: bool = False) -> str:
+    """获取 Html 格式的文章内容
+
+    # ! 该函数可以获取设置禁止转载的文章内容，请尊重作者版权，由此带来的风险您需自行承担
+    # ! 该函数不能获取文章付费部分的内容
+
+    Args:
+        article_url (str): 文章 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        str: Html 格式的文章内容
+    """
+    if not disable_check:
+        AssertArticleUrl(article_url)
+        AssertCachedStatusNormal(article_url)
+    json_obj = await GetArticleJsonDataApi(article_url)
+    if not disable_check:
+        AssertArticleJsonDataNormal(article_url, json_obj)
+    html_text = json_obj["free_content"]
+
+    # 去除 image-container、image-container-fill 和 image-view
+    html_text = sub(r'<div class="image-.*?" .*?>', "", html_text)
+    # 去除 image-package
+    html_text = html_text.replace('<div class="image-package">', "")
+
+    old_img_blocks = findall(r'<img .*?>', html_text)  # 匹配旧的 img 标签
+    if not old_img_blocks:  # 文章中没有图片块
+        return html_text
+
+    img_urls = [findall(r'<img data-original-src="(.*?)".*>', i)[0] for i in old_img_blocks]
+    new_img_blocks = [f'<img src="https:{img_url}">' for img_url in img_urls]
+
+    for old_img_block, new_img_block in zip(old_img_blocks, new_img_blocks):
+        html_text = html_text.replace(old_img_block, new_img_block)  # 替换 img 标签
+    with open("result.html", "w", encoding="utf-8") as f:
+        f.write(html_text)
+    return html_text
+
+
+async def GetArticleText(article_url: str, disable_check: bool = False) -> str:
+    """获取纯文本格式的文章内容
+
+    # ! 该函数可以获取设置禁止转载的文章内容，请尊重作者版权，由此带来的风险您需自行承担
+    # ! 该函数不能获取文章付费部分的内容
+
+    Args:
+        article_url (str): 文章 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        str: 纯文本格式的文章内容
+    """
+    if not disable_check:
+        AssertArticleUrl(article_url)
+        AssertCachedStatusNormal(article_url)
+    json_obj = await GetArticleJsonDataApi(article_url)
+    if not disable_check:
+        AssertArticleJsonDataNormal(article_url, json_obj)
+    html_obj = etree.HTML(json_obj["free_content"])
+    result = "".join(html_obj.itertext())
+    result = sub(r"\s{3,}", "", result)  # 去除多余的空行
+    return result
+
+
+async def GetArticleMarkdown(article_url: str, disable_check: bool = False) -> str:
+    """获取 Markdown 格式的文章内容
+
+    # ! 该函数可以获取设置禁止转载的文章内容，请尊重作者版权，由此带来的风险您需自行承担
+    # ! 该函数不能获取文章付费部分的内容
+
+    Args:
+        article_url (str): 文章 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        str: Markdown 格式的文章内容
+    """
+    try:
+        html2md
+    except NameError:
+        raise ImportError("未安装 html2md 模块，该函数不可用")
+    if not disable_check:
+        AssertArticleUrl(article_url)
+        await AssertArticleStatusNormal(article_url)
+    html_text = await GetArticleHtml(article_url, disable_check=True)
+    image_descriptions = [description for description in findall(r'class="image-caption">.+</div>', html_text)]  # 获取图片描述块
+    image_descriptions_text = [description.replace('class="image-caption">', "").replace("</div>", "")
+                               for description in findall(r'class="image-caption">.+</div>', html_text)]  # 获取图片描述文本
+    for index in range(len(image_descriptions)):
+        html_text = html_text.replace(image_descriptions[index], "<p>&&" + image_descriptions_text[index] + "&&</p>")  # 将图片描述替换成带有标记符的文本
+    images = findall(r'<img src=".+">', html_text)  # 获取图片块
+    for image in images:
+        html_text = html_text.replace(image, f"<p>{image}</img></p>")  # 处理图片块
+    markdown = html2md(html_text)  # 将 HTML 格式的文章转换成 Markdown 格式
+
+    md_images_and_description = findall(r'!\[.*\]\(.+\)\n\n&&.+&&', markdown)  # 获取 Markdown 中图片语法和对应描述的部分
+    md_images_url = [findall(r'https://.+\)', item)[0].replace(")", "") for item in md_images_and_description]  # 获取所有图片链接
+    md_image_descriptions = [findall(r'&&.+&&', item)[0].replace("&&", "") for item in md_images_and_description]  # 获取所有图片描述
+
+    for index, item in enumerate(md_images_and_description):
+        markdown = markdown.replace(item, f"![{md_image_descriptions[index]}]({md_images_url[index]})")  # 拼接 Markdown 语法并进行替换
+
+    return markdown
+
+
+async def GetArticleCommentsData(article_id: int, page: int = 1, count: int = 10,
+                                 author_only: bool = False, sorting_method: str = "positive",
+                                 as_record: bool = False) -> List[Union[Dict, CommentRecord]]:
+    """获取文章评论信息
+
+    Args:
+        article_id (int): 文章 ID
+        page (int, optional): 页码. Defaults to 1.
+        count (int, optional): 每次获取的评论数（不包含子评论）. Defaults to 10.
+        author_only (bool, optional): 为 True 时只获取作者发布的评论，包含作者发布的子评论及其父评论. Defaults to False.
+        sorting_method (str, optional): 排序方式，为”positive“时按时间正序排列，为”reverse“时按时间倒序排列. Defaults to "positive".
+        as_record (bool, optional): 为 True 时返回 CommentRecord 而不是字典，占用内存更少，可通过 to_dict 方法转换为字典. Defaults to False.
+
+    Returns:
+        List[Dict]: 文章评论信息
+    """
+    order_by = {
+        "positive": "asc",   # 正序
+        "reverse": "desc"  # 倒序
+    }[sorting_method]
+    json_obj = await GetArticleCommentsJsonDataApi(article_id, page, count, author_only, order_by)
+    if as_record:
+        return [CommentRecord.from_json(item) for item in json_obj["comments"]]
+    return ParseArticleCommentsJson(json_obj)
+
+
+async def GetArticleAllBasicData(article_url: str, disable_check: bool = False) -> Dict:
+    """获取文章的全部基础信息
+
+    Args:
+        article_url (str): 文章 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        Dict: 文章基础信息
+    """
+    if not disable_check:
+        AssertArticleUrl(article_url)
+
+    async def GetJsonData() -> Dict:
+        json_obj = await GetArticleJsonDataApi(article_url)
+        if not disable_check:
+            AssertArticleJsonDataNormal(article_url, json_obj)
+        return json_obj
+
+    # 两个请求互不依赖，并发发送；文章状态异常时会优先抛出对应的异常
+    json_obj, html_json_obj = await AsyncRunConcurrently([GetJsonData(), GetArticleHtmlJsonDataApi(article_url)])
+    result = {}
+    result["title"] = json_obj["public_title"]
+    result["author_name"] = html_json_obj["props"]["initialState"]["note"]["data"]["user"]["nickname"]
+    result["reads_count"] = html_json_obj["props"]["initialState"]["note"]["data"]["views_count"]
+    result["likes_count"] = json_obj["likes_count"]
+    result["comments_count"] = json_obj["public_comment_count"]
+    result["most_valuable_comments_count"] = json_obj["featured_comments_count"]
+    result["wordage"] = html_json_obj["props"]["initialState"]["note"]["data"]["wordage"]
+    result["FP_count"] = json_obj["total_fp_amount"] / 1000
+    result["description"] = json_obj["description"]
+    result["publish_time"] = datetime.fromisoformat(json_obj["first_shared_at"])
+    result["update_time"] = datetime.fromtimestamp(json_obj["last_updated_at"])
+    result["paid_status"] = {
+        "free": False,
+        "fbook_free": False,
+        "pbook_free": False,
+        "paid": True,
+        "fbook_paid": True,
+        "pbook_paid": True
+    }[json_obj["paid_type"]]
+    result["reprint_status"] = json_obj["reprintable"]
+    result["comment_status"] = json_obj["commentable"]
+    return result
+
+
+async def GetArticlesAllBasicData(article_urls: Iterable[str], concurrency: int = 32, ordered: bool = True,
+                                  disable_check: bool = False) -> AsyncGenerator[Tuple[str, Union[Dict, Exception]], None]:
+    """批量获取文章的所有基础信息
+
+    单个文章获取失败时不会中断其它文章的获取，无效 URL、资源异常、接口受限与网络错误会以异常对象的形式返回
+
+    Args:
+        article_urls (Iterable[str]): 文章 URL 列表
+        concurrency (int, optional): 最大并发数. Defaults to 32.
+        ordered (bool, optional): 为 True 时按输入顺序返回结果，为 False 时按完成顺序返回结果. Defaults to True.
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Yields:
+        Iterator[Tuple[str, Union[Dict, Exception]]]: (文章 URL, 文章基础信息或异常对象)
+    """
+    async for item in AsyncBatchCall(lambda article_url: GetArticleAllBasicData(article_url, disable_check=disable_check),
+                                     article_urls, concurrency, ordered):
+        yield item
+
+
+async def GetArticleAllCommentsData(article_id: int, count: int = 10, author_only: bool = False,
+                                    sorting_method: str = "positive", max_count: int = None,
+                                    as_record: bool = False) -> AsyncGenerator[Union[Dict, CommentRecord], None]:
+    """获取文章的全部评论信息
+
+    Args:
+        article_id (int): 文章 ID
+        count (int, optional): 单次获取的数据数量，会影响性能. Defaults to 10.
+        author_only (bool, optional): 为 True 时只获取作者发布的评论，包含作者发布的子评论及其父评论. Defaults to False.
+        sorting_method (str, optional): 排序方式，为”positive“时按时间正序排列，为”reverse“时按时间倒序排列. Defaults to "positive".
+        max_count (int, optional): 获取的文章评论信息数量上限，Defaults to None.
+        as_record (bool, optional): 为 True 时返回 CommentRecord 而不是字典，占用内存更少，可通过 to_dict 方法转换为字典. Defaults to False.
+
+    Yields:
+        Iterator[Dict], None, None]: 文章信息
+    """
+    page = 1
+    now_count = 0
+    while True:
+        result = await GetArticleCommentsData(article_id, page, count, author_only, sorting_method, as_record)
+        if result:
+            page += 1
+        else:
+            return
+        for item in result:
+            yield item
+            if max_count:
+                now_count += 1
+                if now_count == max_count:
+                    return
@@ -0,0 +1,92 @@
+from ..assert_funcs import (AssertArticleJsonDataNormal, AssertArticleUrl,
+                            AssertCachedStatusNormal,
+                            AssertCollectionJsonDataNormal,
+                            AssertIslandJsonDataNormal,
+                            AssertNotebookJsonDataNormal, AssertNotebookUrl,
+                            AssertUserJsonDataNormal)
+from .basic_apis import (GetArticleJsonDataApi, GetCollectionJsonDataApi,
+                         GetIslandJsonDataApi, GetNotebookJsonDataApi,
+                         GetUserJsonDataApi)
+
+__all__ = [
+    "AssertUserStatusNormal", "AssertArticleStatusNormal",
+    "AssertNotebookStatusNormal", "AssertCollectionStatusNormal",
+    "AssertIslandStatusNormal"
+]
+
+
+async def AssertUserStatusNormal(user_url: str) -> None:
+    """判断用户账号状态是否正常
+
+    与同步版本共用资源状态缓存
+
+    Args:
+        user_url (str): 用户主页 URL
+
+    Raises:
+        ResourceError: 用户账号状态异常时抛出此错误
+    """
+    if not AssertCachedStatusNormal(user_url):
+        AssertUserJsonDataNormal(user_url, await GetUserJsonDataApi(user_url))
+
+
+async def AssertArticleStatusNormal(article_url: str) -> None:
+    """判断文章状态是否正常
+
+    与同步版本共用资源状态缓存
+
+    Args:
+        article_url (str): 文章 URL
+
+    Raises:
+        ResourceError: 文章状态异常时抛出此错误
+    """
+    AssertArticleUrl(article_url)
+    if not AssertCachedStatusNormal(article_url):
+        AssertArticleJsonDataNormal(article_url, await GetArticleJsonDataApi(article_url))
+
+
+async def AssertNotebookStatusNormal(notebook_url: str) -> None:
+    """判断文集状态是否正常
+
+    与同步版本共用资源状态缓存
+
+    Args:
+        notebook_url (str): 文集 URL
+
+    Raises:
+        ResourceError: 文集状态异常时抛出此错误
+    """
+    AssertNotebookUrl(notebook_url)
+    if not AssertCachedStatusNormal(notebook_url):
+        AssertNotebookJsonDataNormal(notebook_url, await GetNotebookJsonDataApi(notebook_url))
+
+
+async def AssertCollectionStatusNormal(collection_url: str) -> None:
+    """判断专题状态是否正常
+
+    与同步版本共用资源状态缓存
+
+    Args:
+        collection_url (str): 专题 URL
+
+    Raises:
+        ResourceError: 专题状态异常时抛出此错误
+    """
+    if not AssertCachedStatusNormal(collection_url):
+        AssertCollectionJsonDataNormal(collection_url, await GetCollectionJsonDataApi(collection_url))
+
+
+async def AssertIslandStatusNormal(island_url: str) -> None:
+    """判断小岛状态是否正常
+
+    与同步版本共用资源状态缓存
+
+    Args:
+        island_url (str): 小岛 URL
+
+    Raises:
+        ResourceError: 小岛状态异常时抛出此错误
+    """
+    if not AssertCachedStatusNormal(island_url):
+        AssertIslandJsonDataNormal(island_url, await GetIslandJsonDataApi(island_url))
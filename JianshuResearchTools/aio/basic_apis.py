@@ -0,0 +1,296 @@
+from typing import Dict, List, Union, Optional
+
+from lxml import etree
+from lxml.etree import _Element
+
+from ..client import async_send_request
+from ..headers import (BeikeIsland_request_header, PC_header,
+                       api_request_header, mobile_header)
+from ..slug_index import IndexPayload
+
+try:
+    from ujson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+__all__ = [
+    "GetArticleJsonDataApi", "GetArticleHtmlJsonDataApi",
+    "GetArticleCommentsJsonDataApi", "GetBeikeIslandTradeRankListJsonDataApi",
+    "GetBeikeIslandTradeListJsonDataApi", "GetCollectionJsonDataApi",
+    "GetCollectionEditorsJsonDataApi",
+    "GetCollectionRecommendedWritersJsonDataApi",
+    "GetCollectionSubscribersJsonDataApi", "GetCollectionArticlesJsonDataApi",
+    "GetIslandJsonDataApi", "GetIslandPostsJsonDataApi",
+    "GetNotebookJsonDataApi", "GetDailyArticleRankListJsonDataApi",
+    "GetArticlesFPRankListJsonDataApi", "GetUserJsonDataApi",
+    "GetUserPCHtmlDataApi", "GetUserCollectionsAndNotebooksJsonDataApi",
+    "GetUserArticlesListJsonDataApi", "GetUserFollowingListHtmlDataApi",
+    "GetUserFollowersListHtmlDataApi", "GetUserNextAnniversaryDayHtmlDataApi",
+    "GetIslandPostJsonDataApi", "GetUserTimelineHtmlDataApi",
+    "GetNotebookArticlesJsonDataApi", "GetAssetsRankJsonDataApi"
+]
+
+
+async def GetArticleJsonDataApi(article_url: str) -> Dict:
+    request_url = article_url.replace("https://www.jianshu.com/",
+                                      "https://www.jianshu.com/asimov/")
+    source = await async_send_request("GET", request_url, headers=api_request_header)
+    json_obj = json_loads(source)
+    IndexPayload(json_obj, "article")
+    return json_obj
+
+
+async def GetArticleHtmlJsonDataApi(article_url: str) -> _Element:
+    source = await async_send_request("GET", article_url, headers=PC_header)
+    html_obj = etree.HTML(source)
+    json_obj = json_loads(html_obj.xpath("//script[@id='__NEXT_DATA__']/text()")[0])
+    return json_obj
+
+
+async def GetArticleCommentsJsonDataApi(article_id: int, page: int, count: int,
+                                        author_only: bool, order_by: str) -> Dict:
+    params = {
+        "page": page,
+        "count": count,
+        "author_only": author_only,
+        "order_by": order_by
+    }
+    request_url = f"https://www.jianshu.com/shakespeare/notes/{article_id}/comments"
+    source = await async_send_request("GET", request_url, params=params, headers=api_request_header)
+    json_obj = json_loads(source)
+    IndexPayload(json_obj, "user", ("comments", "*", "user"))
+    return json_obj
+
+
+async def GetBeikeIslandTradeRankListJsonDataApi(ranktype: Union[int, None], pageIndex: Union[int, None]) -> Dict:
+    params = {
+        "ranktype": ranktype,
+        "pageIndex": pageIndex
+    }
+    source = await async_send_request("POST", "https://www.beikeisland.com/api/Trade/getTradeRankList",
+                                      headers=BeikeIsland_request_header, json=params)
+    json_obj = json_loads(source)
+    return json_obj
+
+
+async def GetBeikeIslandTradeListJsonDataApi(pageIndex: int, retype: int):
+    params = {
+        "pageIndex": pageIndex,
+        "retype": retype
+    }
+    source = await async_send_request("POST", "https://www.beikeisland.com/api/Trade/getTradeList",
+                                      headers=BeikeIsland_request_header, json=params)
+    json_obj = json_loads(source)
+    return json_obj
+
+
+async def GetCollectionJsonDataApi(collection_url: str) -> Dict:
+    request_url = collection_url.replace("https://www.jianshu.com/c/", "https://www.jianshu.com/asimov/collections/slug/")
+    source = await async_send_request("GET", request_url, headers=api_request_header)
+    json_obj = json_loads(source)
+    IndexPayload(json_obj, "collection")
+    IndexPayload(json_obj, "user", ("owner", ))
+    return json_obj
+
+
+async def GetCollectionEditorsJsonDataApi(collection_id: int, page: int) -> Dict:
+    request_url = f"https://www.jianshu.com/collections/{collection_id}/editors"
+    params = {
+        "page": page
+    }
+    source = await async_send_request("GET", request_url, params=params, headers=api_request_header)
+    json_obj = json_loads(source)
+    return json_obj
+
+
+async def GetCollectionRecommendedWritersJsonDataApi(collection_id: int, page: int, count: int) -> Dict:
+    params = {
+        "collection_id": collection_id,
+        "page": page,
+        "count": count
+    }
+    source = await async_send_request("GET", "https://www.jianshu.com/collections/recommended_users",
+                                      params=params, headers=api_request_header)
+    json_obj = json_loads(source)
+    IndexPayload(json_obj, "user", ("users", "*"))
+    return json_obj
+
+
+async def GetCollectionSubscribersJsonDataApi(collection_id: int, max_sort_id: int) -> Dict:
+    request_url = f"https://www.jianshu.com/collection/{collection_id}/subscribers"
+    params = {
+        "max_sort_id": max_sort_id
+    }
+    source = await async_send_request("GET", request_url, params=params, headers=api_request_header)
+    json_obj = json_loads(source)
+    return json_obj
+
+
+async def GetCollectionArticlesJsonDataApi(collection_slug: str, page: int, count: int, order_by: str) -> Dict:
+    request_url = f"https://www.jianshu.com/asimov/collections/slug/{collection_slug}/public_notes"
+    params = {
+        "page": page,
+        "count": count,
+        "order_by": order_by
+    }
+    source = await async_send_request("GET", request_url, params=params, headers=api_request_header)
+    json_obj = json_loads(source)
+    IndexPayload(json_obj, "article", ("*", "object", "data"))
+    IndexPayload(json_obj, "user", ("*", "object", "data", "user"))
+    return json_obj
+
+
+async def GetIslandJsonDataApi(island_url: str) -> Dict:
+    request_url = island_url.replace("https://www.jianshu.com/g/", "https://www.jianshu.com/asimov/groups/")
+    source = await async_send_request("GET", request_url, headers=api_request_header)
+    json_obj = json_loads(source)
+    return json_obj
+
+
+async def GetIslandPostsJsonDataApi(group_slug: str, max_id: int,
+                                    count: int, topic_id: int, order_by: str):
+    params = {
+        "group_slug": group_slug,
+        "order_by": order_by,
+        "max_id": max_id,
+        "count": count,
+        "topic_id": topic_id
+    }
+    source = await async_send_request("GET", "https://www.jianshu.com/asimov/posts",
+                                      params=params, headers=api_request_header)
+    json_obj = json_loads(source)
+    return json_obj
+
+
+async def GetNotebookJsonDataApi(notebook_url: str) -> Dict:
+    request_url = notebook_url.replace("https://www.jianshu.com/", "https://www.jianshu.com/asimov/")
+    source = await async_send_request("GET", request_url, headers=api_request_header)
+    json_obj = json_loads(source)
+    return json_obj
+
+
+async def GetNotebookArticlesJsonDataApi(notebook_url: str, page: int,
+                                         count: int, order_by: str) -> Dict:
+    request_url = notebook_url.replace("https://www.jianshu.com/nb/",
+                                       "https://www.jianshu.com/asimov/notebooks/") + "/public_notes/"
+    params = {
+        "page": page,
+        "count": count,
+        "order_by": order_by
+    }
+    source = await async_send_request("GET", request_url, params=params, headers=api_request_header)
+    json_obj = json_loads(source)
+    IndexPayload(json_obj, "article", ("*", "object", "data"))
+    IndexPayload(json_obj, "user", ("*", "object", "data", "user"))
+    return json_obj
+
+
+async def GetAssetsRankJsonDataApi(max_id: int, since_id: int) -> Dict:
+    params = {
+        "max_id": max_id,
+        "since_id": since_id
+    }
+    source = await async_send_request("GET", "https://www.jianshu.com/asimov/fp_rankings", params=params, headers=api_request_header)
+    json_obj = json_loads(source)
+    return json_obj
+
+
+async def GetDailyArticleRankListJsonDataApi() -> Dict:
+    source = await async_send_request("GET", "https://www.jianshu.com/asimov/daily_activity_participants/rank", headers=api_request_header)
+    json_obj = json_loads(source)
+    return json_obj
+
+
+async def GetArticlesFPRankListJsonDataApi(date: str, type_: Optional[str]) -> Dict:  # 避免覆盖内置函数
+    params = {
+        "date": date,
+        "type": type_
+    }
+    source = await async_send_request("GET", "https://www.jianshu.com/asimov/fp_rankings/voter_notes", params=params, headers=api_request_header)
+    json_obj = json_loads(source)
+    return json_obj
+
+
+async def GetUserJsonDataApi(user_url: str) -> Dict:
+    request_url = user_url.replace("https://www.jianshu.com/u/", "https://www.jianshu.com/asimov/users/slug/")
+    source = await async_send_request("GET", request_url, headers=api_request_header)
+    json_obj = json_loads(source)
+    IndexPayload(json_obj, "user")
+    return json_obj
+
+
+async def GetUserPCHtmlDataApi(user_url: str) -> _Element:
+    source = await async_send_request("GET", user_url, headers=PC_header)
+    html_obj = etree.HTML(source)
+    return html_obj
+
+
+async def GetUserCollectionsAndNotebooksJsonDataApi(user_url: str, user_slug: str) -> Dict:
+    request_url = user_url.replace("/u/", "/users/") + "/collections_and_notebooks"
+    params = {
+        "slug": user_slug
+    }
+    source = await async_send_request("GET", request_url, headers=api_request_header, params=params)
+    json_obj = json_loads(source)
+    IndexPayload(json_obj, "collection", ("own_collections", "*"))
+    IndexPayload(json_obj, "collection", ("manageable_collections", "*"))
+    return json_obj
+
+
+async def GetUserArticlesListJsonDataApi(user_url: str, page: int,
+                                         count: int, order_by: str) -> Dict:
+    request_url = user_url.replace("/u/", "/asimov/users/slug/") + "/public_notes"
+    params = {
+        "page": page,
+        "count": count,
+        "order_by": order_by
+    }
+    source = await async_send_request("GET", request_url, headers=api_request_header, params=params)
+    json_obj = json_loads(source)
+    IndexPayload(json_obj, "article", ("*", "object", "data"))
+    IndexPayload(json_obj, "user", ("*", "object", "data", "user"))
+    return json_obj
+
+
+async def GetUserFollowingListHtmlDataApi(user_url: str, page: int) -> _Element:
+    request_url = user_url.replace("/u/", "/users/") + "/following"
+    params = {
+        "page": page
+    }
+    source = await async_send_request("GET", request_url, headers=PC_header, params=params)
+    html_obj = etree.HTML(source)
+    return html_obj
+
+
+async def GetUserFollowersListHtmlDataApi(user_url: str, page: int) -> _Element:
+    request_url = user_url.replace("/u/", "/users/") + "/followers"
+    params = {
+        "page": page
+    }
+    source = await async_send_request("GET", request_url, headers=PC_header, params=params)
+    html_obj = etree.HTML(source)
+    return html_obj
+
+
+async def GetUserNextAnniversaryDayHtmlDataApi(user_slug: str) -> _Element:
+    request_url = f"https://www.jianshu.com/mobile/u/{user_slug}/anniversary"
+    source = await async_send_request("GET", request_url, headers=mobile_header)
+    html_obj = etree.HTML(source)
+    return html_obj
+
+
+async def GetIslandPostJsonDataApi(post_slug: str) -> List[Dict]:
+    request_url = f"https://www.jianshu.com/asimov/posts/{post_slug}"
+    source = await async_send_request("GET", request_url, headers=api_request_header)
+    json_obj = json_loads(source)
+    return json_obj
+
+
+async def GetUserTimelineHtmlDataApi(uslug: str, max_id: int) -> _Element:
+    request_url = f"https://www.jianshu.com/users/{uslug}/timeline"
+    params = {
+        "max_id": max_id
+    }
+    source = await async_send_request("GET", request_url, headers=PC_header, params=params)
+    html_obj = etree.HTML(source)
+    return html_obj
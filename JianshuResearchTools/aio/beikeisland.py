@@ -0,0 +1,156 @@
+from typing import Dict, List
+
+from ..convert import UserUrlToUserSlug
+from ..exceptions import ResourceError
+from ..parsers import ParseBeikeIslandTradeListJson
+from .basic_apis import (GetBeikeIslandTradeListJsonDataApi,
+                         GetBeikeIslandTradeRankListJsonDataApi)
+
+__all__ = [
+    "GetBeikeIslandTotalTradeAmount", "GetBeikeIslandTotalTradeCount",
+    "GetBeikeIslandTotalTradeRankData", "GetBeikeIslandBuyTradeRankData",
+    "GetBeikeIslandSellTradeRankData", "GetBeikeIslandTradeOrderInfo",
+    "GetBeikeIslandTradePrice"
+]
+
+
+async def GetBeikeIslandTotalTradeAmount() -> int:
+    """获取贝壳小岛总交易量
+
+    Returns:
+        int: 总交易量
+    """
+    json_obj = await GetBeikeIslandTradeRankListJsonDataApi(ranktype=None, pageIndex=None)
+    result = json_obj["data"]["totalcount"]
+    return result
+
+
+async def GetBeikeIslandTotalTradeCount() -> int:
+    """获取贝壳小岛总交易笔数
+
+    Returns:
+        int: 总交易笔数
+    """
+    json_obj = await GetBeikeIslandTradeRankListJsonDataApi(ranktype=None, pageIndex=None)
+    result = json_obj["data"]["totaltime"]
+    return result
+
+
+async def GetBeikeIslandTotalTradeRankData(page: int = 1) -> List[Dict]:
+    """获取贝壳小岛总交易排行榜中的用户信息
+
+    Args:
+        page (int, optional): 页码. Defaults to 1.
+
+    Returns:
+        List: 总交易排行榜的用户信息
+    """
+    json_obj = await GetBeikeIslandTradeRankListJsonDataApi(ranktype=3, pageIndex=page)
+    result = []
+    for item in json_obj["data"]["ranklist"]:
+        item_data = {
+            "bkuid": item["userid"],
+            "jianshuname": item["jianshuname"],
+            "avatar_url": item["avatarurl"],
+            "userurl": item["jianshupath"],
+            "uslug": UserUrlToUserSlug(item["jianshupath"]),
+            "total_trade_amount": item["totalamount"],
+            "total_trade_times": item["totaltime"]
+        }
+        result.append(item_data)
+    return result
+
+
+async def GetBeikeIslandBuyTradeRankData(page: int = 1) -> List[Dict]:
+    """获取贝壳小岛买贝排行榜中的用户信息
+
+    Args:
+        page (int, optional): 页码. Defaults to 1.
+
+    Returns:
+        List: 买贝榜的用户信息
+    """
+    json_obj = await GetBeikeIslandTradeRankListJsonDataApi(ranktype=1, pageIndex=page)
+    result = []
+    for item in json_obj["data"]["ranklist"]:
+        item_data = {
+            "bkuid": item["userid"],
+            "jianshuname": item["jianshuname"],
+            "avatar_url": item["avatarurl"],
+            "userurl": item["jianshupath"],
+            "uslug": UserUrlToUserSlug(item["jianshupath"]),
+            "total_trade_amount": item["totalamount"],
+            "total_trade_times": item["totaltime"]
+        }
+        result.append(item_data)
+    return result
+
+
+async def GetBeikeIslandSellTradeRankData(page: int = 1) -> List[Dict]:
+    """获取贝壳小岛卖贝排行榜中的用户信息
+
+    Args:
+        page (int, optional): 页码. Defaults to 1.
+
+    Returns:
+        List: 卖贝榜的用户信息
+    """
+    json_obj = await GetBeikeIslandTradeRankListJsonDataApi(ranktype=2, pageIndex=page)
+    result = []
+    for item in json_obj["data"]["ranklist"]:
+        item_data = {
+            "bkuid": item["userid"],
+            "jianshuname": item["jianshuname"],
+            "avatar_url": item["avatarurl"],
+            "userurl": item["jianshupath"],
+            "uslug": UserUrlToUserSlug(item["jianshupath"]),
+            "total_trade_amount": item["totalamount"],
+            "total_trade_times": item["totaltime"]
+        }
+        result.append(item_data)
+    return result
+
+
+async def GetBeikeIslandTradeOrderInfo(trade_type: str, page: int = 1) -> List[Dict]:
+    """获取贝壳小岛的挂单信息
+
+    Args:
+        trade_type (str): 为 "buy" 时获取买单信息，为 "sell" 时获取卖单信息
+        page (int, optional): 页码. Defaults to 1.
+
+    Returns:
+        List: 挂单数据
+    """
+    # 通过 trade_type 构建 retype
+    retype = {
+        "buy": 2,
+        "sell": 1
+    }[trade_type]
+    json_obj = await GetBeikeIslandTradeListJsonDataApi(pageIndex=page,
+                                                        retype=retype)
+    return ParseBeikeIslandTradeListJson(json_obj)
+
+
+async def GetBeikeIslandTradePrice(trade_type: str, rank: int = 1) -> float:
+    """获取特定位置交易单的价格
+
+    Args:
+        trade_type (str): trade_type (str): 为 "buy" 时获取买单信息，为 "sell" 时获取卖单信息
+        rank (int, optional): 自最低 / 最高价开始，需要获取的价格所在的位置. Defaults to 1.
+
+    Returns:
+        float: 交易单的价格
+    """
+    pageIndex = int(rank / 10)  # 确定需要请求的页码
+    # 通过 trade_type 构建 retype
+    retype = {
+        "buy": 2,
+        "sell": 1
+    }[trade_type]
+    json_obj = await GetBeikeIslandTradeListJsonDataApi(pageIndex=pageIndex, retype=retype)
+    rank_in_this_page = rank % 10 - 1  # 本页信息中目标交易单的位置，考虑索引下标起始值为 0 问题
+    try:
+        result = json_obj["data"]["tradelist"][rank_in_this_page]["reprice"]
+    except IndexError:
+        raise ResourceError("该排名没有对应的交易单")
+    return result
@@ -0,0 +1,451 @@
+from datetime import datetime
+from math import ceil
+from typing import AsyncGenerator, Dict, List, Union
+
+from ..assert_funcs import (AssertCachedStatusNormal,
+                            AssertCollectionJsonDataNormal,
+                            AssertCollectionUrl)
+from ..convert import CollectionUrlToCollectionSlug
+from ..parsers import ParseArticlesListJson
+from ..records import ArticleBriefRecord
+from ..utils import AsyncIterPages
+from .assert_funcs import AssertCollectionStatusNormal
+from .basic_apis import (GetCollectionArticlesJsonDataApi,
+                         GetCollectionEditorsJsonDataApi,
+                         GetCollectionJsonDataApi,
+                         GetCollectionRecommendedWritersJsonDataApi,
+                         GetCollectionSubscribersJsonDataApi)
+
+__all__ = [
+    "GetCollectionName", "GetCollectionAvatarUrl",
+    "GetCollectionIntroductionText", "GetCollectionIntroductionHtml",
+    "GetCollectionArticlesCount", "GetCollectionSubscribersCount",
+    "GetCollectionArticlesUpdateTime", "GetCollectionInformationUpdateTime",
+    "GetCollectionOwnerInfo", "GetCollectionEditorsInfo",
+    "GetCollectionRecommendedWritersInfo", "GetCollectionSubscribersInfo",
+    "GetCollectionAllBasicData", "GetCollectionAllEditorsInfo",
+    "GetCollectionAllRecommendedWritersInfo",
+    "GetCollectionAllSubscribersInfo", "GetCollectionAllArticlesInfo"
+]
+
+
+async def GetCollectionName(collection_url: str, disable_check: bool = False) -> str:
+    """获取专题名称
+
+    Args:
+        collection_url (str): 专题 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        str: 专题名称
+    """
+    if not disable_check:
+        AssertCollectionUrl(collection_url)
+        AssertCachedStatusNormal(collection_url)
+    json_obj = await GetCollectionJsonDataApi(collection_url)
+    if not disable_check:
+        AssertCollectionJsonDataNormal(collection_url, json_obj)
+    result = json_obj["title"]
+    return result
+
+
+async def GetCollectionAvatarUrl(collection_url: str, disable_check: bool = False) -> str:
+    """获取专题头像链接
+
+    Args:
+        collection_url (str): 专题 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        str: 专题头像链接
+    """
+    if not disable_check:
+        AssertCollectionUrl(collection_url)
+        AssertCachedStatusNormal(collection_url)
+    json_obj = await GetCollectionJsonDataApi(collection_url)
+    if not disable_check:
+        AssertCollectionJsonDataNormal(collection_url, json_obj)
+    result = json_obj["image"]
+    return result
+
+
+async def GetCollectionIntroductionText(collection_url: str, disable_check: bool = False) -> str:
+    """获取纯文本格式的专题简介
+
+    Args:
+        collection_url (str): 专题 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        str: 纯文本格式的专题简介
+    """
+    if not disable_check:
+        AssertCollectionUrl(collection_url)
+        AssertCachedStatusNormal(collection_url)
+    json_obj = await GetCollectionJsonDataApi(collection_url)
+    if not disable_check:
+        AssertCollectionJsonDataNormal(collection_url, json_obj)
+    result = json_obj["content_without_html"]
+    return result
+
+
+async def GetCollectionIntroductionHtml(collection_url: str, disable_check: bool = False) -> str:
+    """获取 Html 格式的专题简介
+
+    Args:
+        collection_url (str): 专题 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        str: Html 格式的专题简介
+    """
+    if not disable_check:
+        AssertCollectionUrl(collection_url)
+        AssertCachedStatusNormal(collection_url)
+    json_obj = await GetCollectionJsonDataApi(collection_url)
+    if not disable_check:
+        AssertCollectionJsonDataNormal(collection_url, json_obj)
+    result = json_obj["content_in_full"]
+    return result
+
+
+async def GetCollectionArticlesCount(collection_url: str, disable_check: bool = False) -> int:
+    """获取专题中的文章数量
+
+    Args:
+        collection_url (str): 专题 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        int: 专题中的文章数量
+    """
+    if not disable_check:
+        AssertCollectionUrl(collection_url)
+        AssertCachedStatusNormal(collection_url)
+    json_obj = await GetCollectionJsonDataApi(collection_url)
+    if not disable_check:
+        AssertCollectionJsonDataNormal(collection_url, json_obj)
+    result = json_obj["notes_count"]
+    return result
+
+
+async def GetCollectionSubscribersCount(collection_url: str, disable_check: bool = False) -> int:
+    """获取专题的订阅者数量
+
+    Args:
+        collection_url (str): 专题 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        int: 专题的订阅者数量
+    """
+    if not disable_check:
+        AssertCollectionUrl(collection_url)
+        AssertCachedStatusNormal(collection_url)
+    json_obj = await GetCollectionJsonDataApi(collection_url)
+    if not disable_check:
+        AssertCollectionJsonDataNormal(collection_url, json_obj)
+    result = json_obj["subscribers_count"]
+    return result
+
+
+async def GetCollectionArticlesUpdateTime(collection_url: str, disable_check: bool = False) -> datetime:
+    """获取专题文章更新时间
+
+    Args:
+        collection_url (str): 专题 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        datetime: 专题文章更新时间
+    """
+    if not disable_check:
+        AssertCollectionUrl(collection_url)
+        AssertCachedStatusNormal(collection_url)
+    json_obj = await GetCollectionJsonDataApi(collection_url)
+    if not disable_check:
+        AssertCollectionJsonDataNormal(collection_url, json_obj)
+    result = datetime.fromtimestamp(json_obj["newly_added_at"])
+    return result
+
+
+async def GetCollectionInformationUpdateTime(collection_url: str, disable_check: bool = False) -> datetime:
+    """获取专题信息更新时间
+
+    Args:
+        collection_url (str): 专题 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        datetime: 专题信息更新时间
+    """
+    if not disable_check:
+        AssertCollectionUrl(collection_url)
+        AssertCachedStatusNormal(collection_url)
+    json_obj = await GetCollectionJsonDataApi(collection_url)
+    if not disable_check:
+        AssertCollectionJsonDataNormal(collection_url, json_obj)
+    result = datetime.fromtimestamp(json_obj["last_updated_at"])
+    return result
+
+
+async def GetCollectionOwnerInfo(collection_url: str, disable_check: bool = False) -> Dict:
+    """获取专题的所有者信息
+
+    Args:
+        collection_url (str): 专题 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        Dict: 用户信息
+    """
+    if not disable_check:
+        AssertCollectionUrl(collection_url)
+        AssertCachedStatusNormal(collection_url)
+    json_obj = await GetCollectionJsonDataApi(collection_url)
+    if not disable_check:
+        AssertCollectionJsonDataNormal(collection_url, json_obj)
+    result = {
+        "uid": json_obj["owner"]["id"],
+        "name": json_obj["owner"]["nickname"],
+        "uslug": json_obj["owner"]["slug"]
+    }
+    return result
+
+
+async def GetCollectionEditorsInfo(collection_id: int, page: int = 1) -> List[Dict]:
+    """获取专题编辑信息
+
+    Args:
+        collection_id (int): 专题 ID
+        page (int, optional): 页码. Defaults to 1.
+
+    Returns:
+        List[Dict]: 专题编辑信息
+    """
+    json_obj = await GetCollectionEditorsJsonDataApi(collection_id, page=page)
+    result = []
+    for item in json_obj["editors"]:
+        item_data = {
+            "uslug": item["slug"],
+            "name": item["nickname"],
+            "avatar_url": item["avatar_source"]
+        }
+        result.append(item_data)
+    return result
+
+
+async def GetCollectionRecommendedWritersInfo(collection_id: int, page: int = 1, count: int = 20) -> List[Dict]:
+    """获取专题推荐作者信息
+
+    Args:
+        collection_id (int): 专题 ID
+        page (int, optional): 页码. Defaults to 1.
+        count (int, optional): 每次返回的结果数量. Defaults to 20.
+
+    Returns:
+        List[Dict]: 专题推荐作者信息
+    """
+    json_obj = await GetCollectionRecommendedWritersJsonDataApi(collection_id, page=page, count=count)
+    result = []
+    for item in json_obj["users"]:
+        item_data = {
+            "uid": item["id"],
+            "uslug": item["slug"],
+            "name": item["nickname"],
+            "avatar_url": item["avatar_source"],
+            "collection_name": item["collection_name"],
+            "likes_count": item["total_likes_count"],
+            "words_count": item["total_wordage"]
+        }
+        result.append(item_data)
+    return result
+
+
+async def GetCollectionSubscribersInfo(collection_id: int, start_sort_id: int = None) -> List[Dict]:
+    """获取专题关注者信息
+
+    Args:
+        collection_id (int): 专题 ID
+        start_sort_id (int): 起始序号，等于上一条数据的序号
+
+    Returns:
+        List[Dict]: 关注者信息
+    """
+    json_obj = await GetCollectionSubscribersJsonDataApi(collection_id, max_sort_id=start_sort_id)
+    result = []
+    for item in json_obj:
+        item_data = {
+            "uslug": item["slug"],
+            "name": item["nickname"],
+            "avatar_url": item["avatar_source"],
+            "sort_id": item["like_id"],
+            "subscribe_time": datetime.fromisoformat(item["subscribed_at"])
+        }
+        result.append(item_data)
+    return result
+
+
+async def GetCollectionArticlesInfo(collection_url: str, page: int = 1,
+                                    count: int = 10, sorting_method: str = "time",
+                                    disable_check: bool = False,
+                                    as_record: bool = False) -> List[Union[Dict, ArticleBriefRecord]]:
+    """获取专题文章信息
+
+    Args:
+        collection_url (str): 专题 URL
+        page (int, optional): 页码. Defaults to 1.
+        count (int, optional): 每次返回的数据数量. Defaults to 10.
+        sorting_method (str, optional): 排序方法，"time" 为按照发布时间排序，
+        "comment_time" 为按照最近评论时间排序，"hot" 为按照热度排序. Defaults to "time".
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+        as_record (bool, optional): 为 True 时返回 ArticleBriefRecord 而不是字典，占用内存更少，可通过 to_dict 方法转换为字典. Defaults to False.
+
+    Returns:
+        List[Dict]: 文章信息
+    """
+    if not disable_check:
+        AssertCollectionUrl(collection_url)
+        await AssertCollectionStatusNormal(collection_url)
+    order_by = {
+        "time": "added_at",
+        "comment_time": "commented_at",
+        "hot": "top"
+    }[sorting_method]
+    json_obj = await GetCollectionArticlesJsonDataApi(CollectionUrlToCollectionSlug(collection_url),
+                                                      page=page, count=count, order_by=order_by)
+    if as_record:
+        return [ArticleBriefRecord.from_json(item["object"]["data"], with_is_top=False) for item in json_obj]
+    return ParseArticlesListJson(json_obj, with_is_top=False)
+
+
+async def GetCollectionAllBasicData(collection_url: str, disable_check: bool = False) -> Dict:
+    """获取专题的所有基础信息
+
+    Args:
+        collection_url (str): 专题 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        Dict: 专题基础信息
+    """
+    if not disable_check:
+        AssertCollectionUrl(collection_url)
+        AssertCachedStatusNormal(collection_url)
+    result = {}
+    json_obj = await GetCollectionJsonDataApi(collection_url)
+    if not disable_check:
+        AssertCollectionJsonDataNormal(collection_url, json_obj)
+
+    result["name"] = json_obj["title"]
+    result["avatar_url"] = json_obj["image"]
+    result["introduction_text"] = json_obj["content_without_html"]
+    result["introduction_html"] = json_obj["content_in_full"]
+    result["articles_count"] = json_obj["notes_count"]
+    result["subscribers_count"] = json_obj["subscribers_count"]
+    result["articles_update_time"] = datetime.fromtimestamp(json_obj["newly_added_at"])
+    result["information_update_time"] = datetime.fromtimestamp(json_obj["last_updated_at"])
+    result["owner_info"] = {
+        "uid": json_obj["owner"]["id"],
+        "name": json_obj["owner"]["nickname"],
+        "uslug": json_obj["owner"]["slug"]
+    }
+    return result
+
+
+async def GetCollectionAllEditorsInfo(collection_id: int, max_count: int = None, prefetch: int = 0) -> AsyncGenerator[Dict, None]:
+    """获取专题的所有编辑信息
+
+    Args:
+        collection_id (int): 专题 ID
+        max_count (int, optional): 获取的专题编辑信息数量上限，Defaults to None.
+        prefetch (int, optional): 预取页数，大于 0 时会在后台并发获取后续页面. Defaults to 0.
+
+    Yields:
+        Iterator[Dict], None, None]: 编辑信息
+    """
+    async for item in AsyncIterPages(lambda page: GetCollectionEditorsInfo(collection_id, page),
+                                     prefetch, max_count=max_count):
+        yield item
+
+
+async def GetCollectionAllRecommendedWritersInfo(collection_id: int, count: int = 20, max_count: int = None,
+                                                 prefetch: int = 0) -> AsyncGenerator[Dict, None]:
+    """获取专题的所有推荐作者信息
+
+    Args:
+        collection_id (int): 专题 ID
+        count (int, optional): 单次获取的数据数量，会影响性能. Defaults to 20.
+        max_count (int, optional): 获取的专题推荐作者信息数量上限，Defaults to None.
+        prefetch (int, optional): 预取页数，大于 0 时会在后台并发获取后续页面. Defaults to 0.
+
+    Yields:
+        Iterator[Dict], None, None]: 推荐作者信息
+    """
+    async for item in AsyncIterPages(lambda page: GetCollectionRecommendedWritersInfo(collection_id, page, count),
+                                     prefetch, max_count=max_count):
+        yield item
+
+
+async def GetCollectionAllSubscribersInfo(collection_id: int, max_count: int = None) -> AsyncGenerator[Dict, None]:
+    """获取专题的所有关注者信息
+
+    Args:
+        collection_id (int): 专题 ID
+        max_count (int, optional): 获取的专题关注者信息数量上限，Defaults to None.
+
+    Yields:
+        Iterator[Dict], None, None]: 关注者信息
+    """
+    start_sort_id = None
+    now_count = 0
+    while True:
+        result = await GetCollectionSubscribersInfo(collection_id, start_sort_id)
+        if result:
+            start_sort_id = result[-1]["sort_id"]
+        else:
+            return
+        for item in result:
+            yield item
+            if max_count:
+                now_count += 1
+                if now_count == max_count:
+                    return
+
+
+async def GetCollectionAllArticlesInfo(collection_url: str, count: int = 10,
+                                       sorting_method: str = "time", max_count: int = None,
+                                       disable_check: bool = False, prefetch: int = 0,
+                                       as_record: bool = False) -> AsyncGenerator[Union[Dict, ArticleBriefRecord], None]:
+    """获取专题的所有文章信息
+
+    Args:
+        collection_url (str): 专题 URL
+        count (int, optional): 单次获取的数据数量，会影响性能. Defaults to 10.
+        sorting_method (str, optional): 排序方法，"time" 为按照发布时间排序，
+        "comment_time" 为按照最近评论时间排序，"hot" 为按照热度排序. Defaults to "time".
+        max_count (int, optional): 获取的专题文章信息数量上限，Defaults to None.
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+        prefetch (int, optional): 预取页数，大于 0 时会在后台并发获取后续页面. Defaults to 0.
+        as_record (bool, optional): 为 True 时返回 ArticleBriefRecord 而不是字典，占用内存更少，可通过 to_dict 方法转换为字典. Defaults to False.
+
+    Yields:
+        Iterator[Dict], None, None]: 文章信息
+    """
+    if not disable_check:
+        AssertCollectionUrl(collection_url)
+        AssertCachedStatusNormal(collection_url)
+    total_pages = None
+    if prefetch:  # 根据专题文章数计算总页数，以便并发获取全部页面
+        json_obj = await GetCollectionJsonDataApi(collection_url)
+        if not disable_check:
+            AssertCollectionJsonDataNormal(collection_url, json_obj)
+        total_pages = ceil(min(json_obj["notes_count"], max_count or json_obj["notes_count"]) / count)
+    elif not disable_check:
+        await AssertCollectionStatusNormal(collection_url)
+    async for item in AsyncIterPages(
+        lambda page: GetCollectionArticlesInfo(collection_url, page, count, sorting_method, disable_check=True,
+                                               as_record=as_record),
+        prefetch, total_pages, max_count
+    ):
+        yield item
@@ -0,0 +1,279 @@
+from typing import AsyncGenerator, Dict, List, Union
+
+from ..assert_funcs import (AssertCachedStatusNormal,
+                            AssertIslandJsonDataNormal, AssertIslandPostUrl,
+                            AssertIslandUrl)
+from ..convert import (IslandPostSlugToIslandPostUrl,
+                       IslandPostUrlToIslandPostSlug, IslandUrlToIslandSlug)
+from ..parsers import ParseIslandPostJson
+from ..records import IslandPostRecord
+from .assert_funcs import AssertIslandStatusNormal
+from .basic_apis import (GetIslandJsonDataApi, GetIslandPostJsonDataApi,
+                         GetIslandPostsJsonDataApi)
+
+__all__ = [
+    "GetIslandName", "GetIslandAvatarUrl", "GetIslandIntroduction",
+    "GetIslandMembersCount", "GetIslandPostsCount", "GetIslandCategory",
+    "GetIslandPostFullContent", "GetIslandPosts", "GetIslandAllBasicData",
+    "GetIslandAllPostsData"
+]
+
+
+async def GetIslandName(island_url: str, disable_check: bool = False) -> str:
+    """获取小岛名称
+
+    Args:
+        island_url (str): 小岛 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        str: 小岛名称
+    """
+    if not disable_check:
+        AssertIslandUrl(island_url)
+        AssertCachedStatusNormal(island_url)
+    json_obj = await GetIslandJsonDataApi(island_url)
+    if not disable_check:
+        AssertIslandJsonDataNormal(island_url, json_obj)
+    result = json_obj["name"]
+    return result
+
+
+async def GetIslandAvatarUrl(island_url: str, disable_check: bool = False) -> str:
+    """获取小岛头像链接
+
+    Args:
+        island_url (str): 小岛 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        str: 小岛头像链接
+    """
+    if not disable_check:
+        AssertIslandUrl(island_url)
+        AssertCachedStatusNormal(island_url)
+    json_obj = await GetIslandJsonDataApi(island_url)
+    if not disable_check:
+        AssertIslandJsonDataNormal(island_url, json_obj)
+    result = json_obj["image"]
+    return result
+
+
+async def GetIslandIntroduction(island_url: str, disable_check: bool = False) -> str:
+    """获取小岛简介
+
+    Args:
+        island_url (str): 小岛 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        str: 小岛简介
+    """
+    if not disable_check:
+        AssertIslandUrl(island_url)
+        AssertCachedStatusNormal(island_url)
+    json_obj = await GetIslandJsonDataApi(island_url)
+    if not disable_check:
+        AssertIslandJsonDataNormal(island_url, json_obj)
+    result = json_obj["intro"]
+    return result
+
+
+async def GetIslandMembersCount(island_url: str, disable_check: bool = False) -> int:
+    """获取小岛成员数量
+
+    Args:
+        island_url (str): 小岛 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        int: 成员数量
+    """
+    if not disable_check:
+        AssertIslandUrl(island_url)
+        AssertCachedStatusNormal(island_url)
+    json_obj = await GetIslandJsonDataApi(island_url)
+    if not disable_check:
+        AssertIslandJsonDataNormal(island_url, json_obj)
+    result = json_obj["members_count"]
+    return result
+
+
+async def GetIslandPostsCount(island_url: str, disable_check: bool = False) -> int:
+    """获取小岛帖子数量
+
+    Args:
+        island_url (str): 小岛 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        int: 帖子数量
+    """
+    if not disable_check:
+        AssertIslandUrl(island_url)
+        AssertCachedStatusNormal(island_url)
+    json_obj = await GetIslandJsonDataApi(island_url)
+    if not disable_check:
+        AssertIslandJsonDataNormal(island_url, json_obj)
+    result = json_obj["posts_count"]
+    return result
+
+
+async def GetIslandCategory(island_url: str, disable_check: bool = False) -> str:
+    """获取小岛分类
+
+    Args:
+        island_url (str): 小岛 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        str: 分类
+    """
+    if not disable_check:
+        AssertIslandUrl(island_url)
+        AssertCachedStatusNormal(island_url)
+    json_obj = await GetIslandJsonDataApi(island_url)
+    if not disable_check:
+        AssertIslandJsonDataNormal(island_url, json_obj)
+    result = json_obj["category"]["name"]
+    return result
+
+
+async def GetIslandPostFullContent(post_url: str, disable_check: bool = False) -> str:
+    """获取小岛帖子完整内容
+
+    Args:
+        post_url (str): 小岛帖子 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        str: 小岛帖子完整内容
+    """
+    if not disable_check:
+        AssertIslandPostUrl(post_url)
+        await AssertIslandStatusNormal(post_url)
+    json_obj = await GetIslandPostJsonDataApi(IslandPostUrlToIslandPostSlug(post_url))
+    result = json_obj["content"]
+    return result
+
+
+async def GetIslandPosts(island_url: str, start_sort_id: int = None, count: int = 10,
+                         topic_id: int = None, sorting_method: str = "time",
+                         get_full_content: bool = False, disable_check: bool = False,
+                         as_record: bool = False) -> List[Union[Dict, IslandPostRecord]]:
+    """获取小岛帖子信息
+
+        Args:
+            island_url (str): 小岛 URL
+            start_sort_id (int, optional): 起始序号，等于上一条数据的序号. Defaults to None.
+            count (int, optional): 每次返回的数据数量. Defaults to 10.
+            topic_id (int, optional): 话题 ID. Defaults to None.
+            sorting_method (str, optional): 排序方法，"time" 为按照发布时间排序，
+            "comment_time" 为按照最近评论时间排序，"hot" 为按照热度排序. Defaults to "time".
+            get_full_content (bool, optional): 为 True 时，当检测到获取的帖子内容不全时，
+            自动调用 GetIslandPostFullContent 函数获取完整内容并替换. Defaults to False.
+            disable_check (bool): 禁用参数有效性检查. Defaults to False.
+            as_record (bool, optional): 为 True 时返回 IslandPostRecord 而不是字典，占用内存更少，可通过 to_dict 方法转换为字典. Defaults to False.
+
+        Returns:
+            List[Dict]: 帖子信息
+    """
+    if not disable_check:
+        AssertIslandUrl(island_url)
+        await AssertIslandStatusNormal(island_url)
+    order_by = {
+        "time": "latest",
+        "hot": "hot",
+        "most_valuable": "best"
+    }[sorting_method],
+    json_obj = await GetIslandPostsJsonDataApi(group_slug=IslandUrlToIslandSlug(island_url),
+                                               max_id=start_sort_id, count=count, topic_id=topic_id,
+                                               order_by=order_by)
+
+    if as_record:
+        result = []
+        for item in json_obj:
+            item_data = IslandPostRecord.from_json(item)
+            if get_full_content and "..." in item_data.content:  # 获取到的帖子内容不全
+                content = await GetIslandPostFullContent(IslandPostSlugToIslandPostUrl(item_data.pslug), disable_check=True)
+                item_data = item_data._replace(content=content)
+            result.append(item_data)
+        return result
+
+    result = []
+    for item in json_obj:
+        item_data = ParseIslandPostJson(item)
+        if get_full_content and "..." in item_data["content"]:  # 获取到的帖子内容不全
+            item_data["content"] = await GetIslandPostFullContent(IslandPostSlugToIslandPostUrl(item_data["pslug"]),
+                                                                  disable_check=True)
+        result.append(item_data)
+    return result
+
+
+async def GetIslandAllBasicData(island_url: str, disable_check: bool = False) -> Dict:
+    """获取小岛的所有基础信息
+
+    Args:
+        island_url (str): 小岛 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        Dict: 小岛基础信息
+    """
+    if not disable_check:
+        AssertIslandPostUrl(island_url)
+        AssertCachedStatusNormal(island_url)
+    result = {}
+    json_obj = await GetIslandJsonDataApi(island_url)
+    if not disable_check:
+        AssertIslandJsonDataNormal(island_url, json_obj)
+
+    result["name"] = json_obj["name"]
+    result["avatar_url"] = json_obj["image"]
+    result["introduction"] = json_obj["intro"]
+    result["members_count"] = json_obj["members_count"]
+    result["posts_count"] = json_obj["posts_count"]
+    result["category"] = json_obj["category"]["name"]
+    return result
+
+
+async def GetIslandAllPostsData(island_url: str, count: int = 10,
+                                topic_id: int = None, sorting_method: str = "time",
+                                get_full_content: bool = False, max_count: int = None,
+                                disable_check: bool = False,
+                                as_record: bool = False) -> AsyncGenerator[Union[Dict, IslandPostRecord], None]:
+    """获取小岛的所有帖子信息
+
+    Args:
+        island_url (str): 小岛 URL
+        count (int, optional): 单次获取的数据数量，会影响性能. Defaults to 10.
+        topic_id (int, optional): 话题 ID. Defaults to None.
+        sorting_method (str, optional): 排序方法，time 为按照发布时间排序，
+        comment_time 为按照最近评论时间排序，hot 为按照热度排序. Defaults to "time".
+        get_full_content (bool, optional): 为 True 时，当检测到获取的帖子内容不全时，
+        自动调用 GetIslandPostFullContent 函数获取完整内容并替换. Defaults to False.
+        max_count (int, optional): 获取的小岛帖子信息数量上限，Defaults to None.
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+        as_record (bool, optional): 为 True 时返回 IslandPostRecord 而不是字典，占用内存更少，可通过 to_dict 方法转换为字典. Defaults to False.
+
+    Yields:
+        Iterator[Dict], None, None]: 帖子信息
+    """
+    if not disable_check:
+        AssertIslandUrl(island_url)
+        await AssertIslandStatusNormal(island_url)
+    start_sort_id = None
+    now_count = 0
+    while True:
+        result = await GetIslandPosts(island_url, start_sort_id, count, topic_id,
+                                      sorting_method, get_full_content, disable_check=True, as_record=as_record)
+        if result:
+            start_sort_id = result[-1].sorted_id if as_record else result[-1]["sorted_id"]
+        else:
+            return
+        for item in result:
+            yield item
+            if max_count:
+                now_count += 1
+                if now_count == max_count:
+                    return
@@ -0,0 +1,244 @@
+from datetime import datetime
+from math import ceil
+from typing import AsyncGenerator, Dict, List, Union
+
+from ..assert_funcs import (AssertCachedStatusNormal,
+                            AssertNotebookJsonDataNormal, AssertNotebookUrl)
+from ..parsers import ParseArticlesListJson
+from ..records import ArticleBriefRecord
+from ..utils import AsyncIterPages
+from .assert_funcs import AssertNotebookStatusNormal
+from .basic_apis import GetNotebookArticlesJsonDataApi, GetNotebookJsonDataApi
+
+__all__ = [
+    "GetNotebookName", "GetNotebookArticlesCount", "GetNotebookAuthorInfo",
+    "GetNotebookWordage", "GetNotebookSubscribersCount",
+    "GetNotebookUpdateTime", "GetNotebookArticlesInfo",
+    "GetNotebookAllBasicData", "GetNotebookAllArticlesInfo"
+]
+
+
+async def GetNotebookName(notebook_url: str, disable_check: bool = False) -> str:
+    """获取文集名称
+
+    Args:
+        notebook_url (str): 文集 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        str: 文集名称
+    """
+    if not disable_check:
+        AssertNotebookUrl(notebook_url)
+        AssertCachedStatusNormal(notebook_url)
+    json_obj = await GetNotebookJsonDataApi(notebook_url)
+    if not disable_check:
+        AssertNotebookJsonDataNormal(notebook_url, json_obj)
+    result = json_obj["name"]
+    return result
+
+
+async def GetNotebookArticlesCount(notebook_url: str, disable_check: bool = False) -> int:
+    """获取文集中的文章数量
+
+    Args:
+        notebook_url (str): 文集 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        int: 文章数量
+    """
+    if not disable_check:
+        AssertNotebookUrl(notebook_url)
+        AssertCachedStatusNormal(notebook_url)
+    json_obj = await GetNotebookJsonDataApi(notebook_url)
+    if not disable_check:
+        AssertNotebookJsonDataNormal(notebook_url, json_obj)
+    result = json_obj["notes_count"]
+    return result
+
+
+async def GetNotebookAuthorInfo(notebook_url: str, disable_check: bool = False) -> Dict:
+    """获取文集作者的信息
+
+    Args:
+        notebook_url (str): 文集 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        Dict: 作者信息
+    """
+    if not disable_check:
+        AssertNotebookUrl(notebook_url)
+        AssertCachedStatusNormal(notebook_url)
+    json_obj = await GetNotebookJsonDataApi(notebook_url)
+    if not disable_check:
+        AssertNotebookJsonDataNormal(notebook_url, json_obj)
+    result = {
+        "name": json_obj["user"]["nickname"],
+        "uslug": json_obj["user"]["slug"],
+        "avatar_url": json_obj["user"]["avatar"]
+    }
+    return result
+
+
+async def GetNotebookWordage(notebook_url: str, disable_check: bool = False) -> int:
+    """获取文集中所有文章的总字数
+
+    Args:
+        notebook_url (str): 文集 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        int: 文集中的文章总字数
+    """
+    if not disable_check:
+        AssertNotebookUrl(notebook_url)
+        AssertCachedStatusNormal(notebook_url)
+    json_obj = await GetNotebookJsonDataApi(notebook_url)
+    if not disable_check:
+        AssertNotebookJsonDataNormal(notebook_url, json_obj)
+    result = json_obj["wordage"]
+    return result
+
+
+async def GetNotebookSubscribersCount(notebook_url: str, disable_check: bool = False) -> int:
+    """获取文集的订阅者数量
+
+    Args:
+        notebook_url (str): 文集 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        int: 文集订阅者数量
+    """
+    if not disable_check:
+        AssertNotebookUrl(notebook_url)
+        AssertCachedStatusNormal(notebook_url)
+    json_obj = await GetNotebookJsonDataApi(notebook_url)
+    if not disable_check:
+        AssertNotebookJsonDataNormal(notebook_url, json_obj)
+    result = json_obj["subscribers_count"]
+    return result
+
+
+async def GetNotebookUpdateTime(notebook_url: str, disable_check: bool = False) -> datetime:
+    """获取文集的更新时间
+
+    Args:
+        notebook_url (str): 文集 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        datetime: 更新时间
+    """
+    if not disable_check:
+        AssertNotebookUrl(notebook_url)
+        AssertCachedStatusNormal(notebook_url)
+    json_obj = await GetNotebookJsonDataApi(notebook_url)
+    if not disable_check:
+        AssertNotebookJsonDataNormal(notebook_url, json_obj)
+    result = datetime.fromtimestamp(json_obj["last_updated_at"])
+    return result
+
+
+async def GetNotebookArticlesInfo(notebook_url: str, page: int = 1,
+                                  count: int = 10, sorting_method: str = "time",
+                                  disable_check: bool = False,
+                                  as_record: bool = False) -> List[Union[Dict, ArticleBriefRecord]]:
+    """获取文集中的文章信息
+
+    Args:
+        notebook_url (str): 文集 URL
+        page (int, optional): 页码. Defaults to 1.
+        count (int, optional): 每次返回的数据数量. Defaults to 10.
+        sorting_method (str, optional): 排序方法，"time" 为按照发布时间排序，
+        "comment_time" 为按照最近评论时间排序，"hot" 为按照热度排序. Defaults to "time".
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+        as_record (bool, optional): 为 True 时返回 ArticleBriefRecord 而不是字典，占用内存更少，可通过 to_dict 方法转换为字典. Defaults to False.
+
+    Returns:
+        List[Dict]: 文章信息
+    """
+    if not disable_check:
+        AssertNotebookUrl(notebook_url)
+        await AssertNotebookStatusNormal(notebook_url)
+    order_by = {
+        "time": "added_at",
+        "comment_time": "commented_at",
+        "hot": "top"
+    }[sorting_method]
+    json_obj = await GetNotebookArticlesJsonDataApi(notebook_url=notebook_url,
+                                                    page=page, count=count, order_by=order_by)
+    if as_record:
+        return [ArticleBriefRecord.from_json(item["object"]["data"]) for item in json_obj]
+    return ParseArticlesListJson(json_obj)
+
+
+async def GetNotebookAllBasicData(notebook_url: str, disable_check: bool = False) -> Dict:
+    """获取文集的所有基础信息
+
+    Args:
+        notebook_url (str): 文集 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        Dict: 文集基础信息
+    """
+    if not disable_check:
+        AssertNotebookUrl(notebook_url)
+        AssertCachedStatusNormal(notebook_url)
+    result = {}
+    json_obj = await GetNotebookJsonDataApi(notebook_url)
+    if not disable_check:
+        AssertNotebookJsonDataNormal(notebook_url, json_obj)
+
+    result["name"] = json_obj["name"]
+    result["author_info"] = {
+        "name": json_obj["user"]["nickname"],
+        "uslug": json_obj["user"]["slug"],
+        "avatar_url": json_obj["user"]["avatar"]
+    }
+    result["articles_count"] = json_obj["notes_count"]
+    result["wordage"] = json_obj["wordage"]
+    result["subscribers_count"] = json_obj["subscribers_count"]
+    result["update_time"] = datetime.fromtimestamp(json_obj["last_updated_at"])
+    return result
+
+
+async def GetNotebookAllArticlesInfo(notebook_url: str, count: int = 10, sorting_method: str = "time",
+                                     max_count: int = None, disable_check: bool = False,
+                                     prefetch: int = 0,
+                                     as_record: bool = False) -> AsyncGenerator[Union[Dict, ArticleBriefRecord], None]:
+    """获取文集中的全部文章信息
+
+    Args:
+        notebook_url (str): 文集 URL
+        count (int, optional): 单次获取的数据数量，会影响性能. Defaults to 10.
+        sorting_method (str, optional): 排序方法，time 为按照发布时间排序，
+        comment_time 为按照最近评论时间排序，hot 为按照热度排序. Defaults to "time".
+        max_count (int, optional): 获取的文集文章信息数量上限，Defaults to None.
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+        prefetch (int, optional): 预取页数，大于 0 时会在后台并发获取后续页面. Defaults to 0.
+        as_record (bool, optional): 为 True 时返回 ArticleBriefRecord 而不是字典，占用内存更少，可通过 to_dict 方法转换为字典. Defaults to False.
+
+    Yields:
+        Iterator[Dict], None, None]: 文章信息
+    """
+    if not disable_check:
+        AssertNotebookUrl(notebook_url)
+        AssertCachedStatusNormal(notebook_url)
+    total_pages = None
+    if prefetch:  # 根据文集文章数计算总页数，以便并发获取全部页面
+        json_obj = await GetNotebookJsonDataApi(notebook_url)
+        if not disable_check:
+            AssertNotebookJsonDataNormal(notebook_url, json_obj)
+        total_pages = ceil(min(json_obj["notes_count"], max_count or json_obj["notes_count"]) / count)
+    elif not disable_check:
+        await AssertNotebookStatusNormal(notebook_url)
+    async for item in AsyncIterPages(
+        lambda page: GetNotebookArticlesInfo(notebook_url, page, count, sorting_method, disable_check=True,
+                                             as_record=as_record),
+        prefetch, total_pages, max_count
+    ):
+        yield item
@@ -0,0 +1,197 @@
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Union
+
+from ..convert import UserSlugToUserUrl
+from ..exceptions import ResourceError
+from ..planner import CalculateFTNCount
+from ..records import (ArticleFPRankRecord, AssetsRankRecord,
+                       DailyArticleRankRecord, UserFPRankRecord)
+from ..utils import _SHARED_EXECUTOR_MAX_WORKERS, AsyncRunConcurrently
+from .basic_apis import (GetArticlesFPRankListJsonDataApi,
+                         GetAssetsRankJsonDataApi,
+                         GetDailyArticleRankListJsonDataApi)
+from .user import GetUserData
+
+__all__ = [
+    "GetAssetsRankData", "GetDailyArticleRankData", "GetUserFPRankData",
+    "GetArticleFPRankBasicInfo", "GetUserFPRankData"
+]
+
+
+async def GetAssetsRankData(start_id: int = 1, get_full: bool = False,
+                            as_record: bool = False) -> List[Union[Dict, AssetsRankRecord]]:
+    """获取资产排行榜信息
+
+    Args:
+        start_id (int, optional): 起始位置. Defaults to 1.
+        get_full (bool, optional): 为 True 时获取简书贝和总资产数据. Defaults to False.
+        as_record (bool, optional): 为 True 时返回 AssetsRankRecord 而不是字典，占用内存更少，可通过 to_dict 方法转换为字典. Defaults to False.
+
+    Returns:
+        List[Dict]: 资产排行榜信息
+    """
+    since_id = start_id - 1  # 索引下标为 0
+    json_obj = await GetAssetsRankJsonDataApi(max_id=1000000000, since_id=since_id)
+    if as_record:
+        result = [AssetsRankRecord.from_json(item) for item in json_obj["rankings"]]
+    else:
+        result = []
+        for item in json_obj["rankings"]:
+            item_data = {
+                "ranking": item["ranking"],
+                "uid": item["user"]["id"],
+                "uslug": item["user"]["slug"],
+                "name": item["user"]["nickname"],
+                "avatar_url": item["user"]["avatar"],
+                "FP": item["amount"] / 1000
+            }
+            result.append(item_data)
+
+    if get_full:
+        # 简书钻数量已包含在排行榜数据中，只需并发获取各用户的总资产，并发数与同步版本的共享线程池一致
+        users_data = await AsyncRunConcurrently([
+            GetUserData(UserSlugToUserUrl(item["user"]["slug"]), ["assets_count"], disable_check=True)
+            for item in json_obj["rankings"]
+        ], concurrency=_SHARED_EXECUTOR_MAX_WORKERS)
+        for index, user_data in enumerate(users_data):
+            if user_data["assets_count"] is None:  # 用户无文章时无法获取总资产
+                continue
+            assets = user_data["assets_count"]
+            if as_record:
+                result[index] = result[index]._replace(Assets=assets, FTN=CalculateFTNCount(assets, result[index].FP))
+            else:
+                result[index]["Assets"] = assets
+                result[index]["FTN"] = CalculateFTNCount(assets, result[index]["FP"])
+    return result
+
+
+async def GetDailyArticleRankData(as_record: bool = False) -> List[Union[Dict, DailyArticleRankRecord]]:
+    """获取日更排行榜信息
+
+    Args:
+        as_record (bool, optional): 为 True 时返回 DailyArticleRankRecord 而不是字典，占用内存更少，可通过 to_dict 方法转换为字典. Defaults to False.
+
+    Returns:
+        List[Dict]: 日更排行榜信息
+    """
+    json_obj = await GetDailyArticleRankListJsonDataApi()
+    if as_record:
+        return [DailyArticleRankRecord.from_json(item) for item in json_obj["daps"]]
+    result = []
+    for item in json_obj["daps"]:
+        item_data = {
+            "ranking": item["rank"],
+            "uslug": item["slug"],
+            "name": item["nickname"],
+            "avatar_url": item["avatar"],
+            "check_in_count": item["checkin_count"]
+        }
+        result.append(item_data)
+    return result
+
+
+async def GetArticleFPRankData(target_date: str = "latest",
+                               as_record: bool = False) -> List[Union[Dict, ArticleFPRankRecord]]:
+    """获取文章收益排行榜信息
+
+    目前只能获取 2020 年 6 月 20 日之后的数据。
+
+    Args:
+        target_date (str, optional): 日期，格式“YYYYMMDD”. Defaults to "latest".
+        as_record (bool, optional): 为 True 时返回 ArticleFPRankRecord 而不是字典，占用内存更少，可通过 to_dict 方法转换为字典. Defaults to False.
+
+    Raises:
+        ResourceError: 对应日期的排行榜数据为空时抛出此异常
+
+    Returns:
+        List[Dict]: 文章收益排行榜信息
+    """
+    if target_date == "latest":
+        target_date = (datetime.today() + timedelta(days=-1)).strftime(r"%Y%m%d")
+    json_obj = await GetArticlesFPRankListJsonDataApi(date=target_date, type_=None)
+    if json_obj["notes"] == []:
+        raise ResourceError(f"对应日期 {date} 的排行榜数据为空")
+    if as_record:
+        return [ArticleFPRankRecord.from_json(item, ranking + 1) for ranking, item in enumerate(json_obj["notes"])]
+    result = []
+    for ranking, item in enumerate(json_obj["notes"]):
+        item_data = {
+            "ranking": ranking + 1,
+            "aslug": item["slug"],
+            "title": item["title"],
+            "author_name": item["author_nickname"],
+            "author_avatar_url": item["author_avatar"],
+            "fp_to_author": item["author_fp"] / 1000,
+            "fp_to_voter": item["voter_fp"] / 1000,
+            "total_fp": item["fp"] / 1000
+        }
+        result.append(item_data)
+    return result
+
+
+async def GetArticleFPRankBasicInfo(target_date: str = "latest") -> Dict:
+    """获取文章收益排行榜信息
+
+    目前只能获取 2020 年 6 月 20 日之后的数据。
+
+    Args:
+        target_date (str, optional): 日期，格式“YYYYMMDD”. Defaults to "latest".
+
+    Raises:
+        ResourceError: 对应日期的排行榜数据为空时抛出此异常
+
+    Returns:
+        Dict: 文章收益排行榜基础信息
+    """
+    if target_date == "latest":
+        target_date = (date.today() + timedelta(days=-1)).strftime("%Y%m%d")
+    json_obj = await GetArticlesFPRankListJsonDataApi(date=target_date, type_=None)
+    if json_obj["notes"] == []:
+        raise ResourceError(f"对应日期 {target_date} 的排行榜数据为空")
+    result = {
+        "total_fp": json_obj["fp"],
+        "fp_to_author": json_obj["author_fp"],
+        "fp_to_voter": json_obj["voter_fp"]
+    }
+    return result
+
+
+async def GetUserFPRankData(target_date: str = "latest", rank_type: str = "all",
+                            as_record: bool = False) -> List[Union[Dict, UserFPRankRecord]]:
+    """获取用户收益排行榜信息
+
+    目前只能获取 2020 年 6 月 20 日之后的数据。
+
+    Args:
+        target_date (str, optional): 日期，格式“YYYYMMDD”. Defaults to "latest".
+        rank_type (str, optional): 排行榜分类，"all" 为总收益榜，"write" 为内容收益榜，"vote" 为投票收益榜
+        as_record (bool, optional): 为 True 时返回 UserFPRankRecord 而不是字典，占用内存更少，可通过 to_dict 方法转换为字典. Defaults to False.
+
+    Raises:
+        ResourceError: 对应日期的排行榜数据为空时抛出此异常
+
+    Returns:
+        List[Dict]: 用户收益排行榜信息
+    """
+    type_ = {
+        "all": None,
+        "write": "note",
+        "vote": "like"
+    }[rank_type]
+    json_obj = await GetArticlesFPRankListJsonDataApi(date=target_date, type_=type_)
+    if json_obj["users"] == []:
+        raise ResourceError(f"对应日期 {target_date} 的排行榜数据为空")
+    if as_record:
+        return [UserFPRankRecord.from_json(item, ranking) for ranking, item in enumerate(json_obj["users"])]
+    result = []
+    for ranking, item in enumerate(json_obj["users"]):
+        item_data = {
+            "ranking": ranking,
+            "uslug": item["slug"],
+            "name": item["nickname"],
+            "avatar_url": item["avatar"],
+            "fp_from_write": item["author_fp"],
+            "fp_from_vote": item["voter_fp"]
+        }
+        result.append(item_data)
+    return result
@@ -0,0 +1,827 @@
+from collections import deque
+from datetime import datetime
+from math import ceil
+from re import findall
+from typing import AsyncGenerator, Dict, Iterable, List, Optional, Tuple, Union
+
+from lxml import etree
+
+from ..assert_funcs import (AssertCachedStatusNormal, AssertUserJsonDataNormal,
+                            AssertUserUrl)
+from ..checkpoint import CheckpointStore
+from ..convert import UserUrlToUserSlug
+from ..exceptions import APIError
+from ..parsers import (ParseArticlesListJson, ParseUserFollowListHtml,
+                       ParseUserTimelineHtml)
+from ..planner import (USER_ANNIVERSARY_HTML_SOURCE, USER_JSON_SOURCE,
+                       USER_PC_HTML_SOURCE, ParseUserData, PlanUserDataSources)
+from ..records import ArticleBriefRecord
+from ..utils import AsyncBatchCall, AsyncIterPages, AsyncRunConcurrently
+from .assert_funcs import AssertUserStatusNormal
+from .basic_apis import (GetUserArticlesListJsonDataApi,
+                         GetUserCollectionsAndNotebooksJsonDataApi,
+                         GetUserFollowersListHtmlDataApi,
+                         GetUserFollowingListHtmlDataApi, GetUserJsonDataApi,
+                         GetUserNextAnniversaryDayHtmlDataApi,
+                         GetUserPCHtmlDataApi, GetUserTimelineHtmlDataApi)
+
+__all__ = [
+    "GetUserName", "GetUserGender", "GetUserFollowersCount",
+    "GetUserFansCount", "GetUserArticlesCount", "GetUserWordage",
+    "GetUserLikesCount", "GetUserAssetsCount", "GetUserFPCount",
+    "GetUserFTNCount", "GetUserBadgesList", "GetUserLastUpdateTime",
+    "GetUserVIPInfo", "GetUserIntroductionHtml", "GetUserIntroductionText",
+    "GetUserNextAnniversaryDay", "GetUserNotebooksInfo",
+    "GetUserOwnCollectionsInfo", "GetUserManageableCollectionsInfo",
+    "GetUserArticlesInfo", "GetUserFollowingInfo", "GetUserFansInfo",
+    "GetUserAllBasicData", "GetUsersAllBasicData", "GetUserData",
+    "GetUserTimelineInfo", "GetUserAllArticlesInfo", "GetUserAllFollowingInfo",
+    "GetUserAllFansInfo", "GetUserAllTimelineInfo", "GetUserNewTimelineInfo"
+]
+
+
+async def GetUserName(user_url: str, disable_check: bool = False) -> str:
+    """获取用户昵称
+
+    Args:
+        user_url (str): 用户个人主页 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        str: 用户昵称
+    """
+    if not disable_check:
+        AssertUserUrl(user_url)
+        AssertCachedStatusNormal(user_url)
+    json_obj = await GetUserJsonDataApi(user_url)
+    if not disable_check:
+        AssertUserJsonDataNormal(user_url, json_obj)
+    result = json_obj["nickname"]
+    return result
+
+
+async def GetUserGender(user_url: str, disable_check: bool = False) -> int:
+    """获取用户性别
+
+    Args:
+        user_url (str): 用户个人主页 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        int: 用户性别，0 为未知，1 为男，2 为女
+    """
+    if not disable_check:
+        AssertUserUrl(user_url)
+        AssertCachedStatusNormal(user_url)
+    json_obj = await GetUserJsonDataApi(user_url)
+    if not disable_check:
+        AssertUserJsonDataNormal(user_url, json_obj)
+    result = json_obj["gender"]
+    if result == 3:  # 某些未设置性别的账号性别值为 3，怀疑为简书系统遗留问题
+        result = 0  # 3 也代表性别未知
+    return result
+
+
+async def GetUserFollowersCount(user_url: str, disable_check: bool = False) -> int:
+    """获取用户关注人数
+
+    Args:
+        user_url (str): 用户个人主页 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        int: 用户关注人数
+    """
+    if not disable_check:
+        AssertUserUrl(user_url)
+        AssertCachedStatusNormal(user_url)
+    json_obj = await GetUserJsonDataApi(user_url)
+    if not disable_check:
+        AssertUserJsonDataNormal(user_url, json_obj)
+    result = json_obj["following_users_count"]
+    return result
+
+
+async def GetUserFansCount(user_url: str, disable_check: bool = False) -> int:
+    """获取用户粉丝数
+
+    Args:
+        user_url (str): 用户个人主页 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        int: 用户粉丝数
+    """
+    if not disable_check:
+        AssertUserUrl(user_url)
+        AssertCachedStatusNormal(user_url)
+    json_obj = await GetUserJsonDataApi(user_url)
+    if not disable_check:
+        AssertUserJsonDataNormal(user_url, json_obj)
+    result = json_obj["followers_count"]
+    return result
+
+
+async def GetUserArticlesCount(user_url: str, disable_check: bool = False) -> int:
+    """获取用户文章数
+
+    Args:
+        user_url (str): 用户个人主页 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        int: 用户文章数
+    """
+    if not disable_check:
+        AssertUserUrl(user_url)
+        await AssertUserStatusNormal(user_url)
+    html_obj = await GetUserPCHtmlDataApi(user_url)
+    result = html_obj.xpath("//div[@class='info']/ul/li[3]/div[@class='meta-block']/a/p")[0].text
+    result = int(result)
+    return result
+
+
+async def GetUserWordage(user_url: str, disable_check: bool = False) -> int:
+    """获取用户文章总字数
+
+    Args:
+        user_url (str): 用户个人主页 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        int: 用户文章总字数
+    """
+    if not disable_check:
+        AssertUserUrl(user_url)
+        AssertCachedStatusNormal(user_url)
+    json_obj = await GetUserJsonDataApi(user_url)
+    if not disable_check:
+        AssertUserJsonDataNormal(user_url, json_obj)
+    result = json_obj["total_wordage"]
+    return result
+
+
+async def GetUserLikesCount(user_url: str, disable_check: bool = False) -> int:
+    """获取用户被喜欢数
+
+    Args:
+        user_url (str): 用户个人主页 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        int: 用户被喜欢数
+    """
+    if not disable_check:
+        AssertUserUrl(user_url)
+        AssertCachedStatusNormal(user_url)
+    json_obj = await GetUserJsonDataApi(user_url)
+    if not disable_check:
+        AssertUserJsonDataNormal(user_url, json_obj)
+    result = json_obj["total_likes_count"]
+    return result
+
+
+async def GetUserAssetsCount(user_url: str, disable_check: bool = False) -> float:
+    """获取用户总资产
+
+    # ! 当用户资产大于 10000 时，结果的精确度将下降到 1000
+    # ! 当用户没有文章时，该函数将抛出 APIError 异常
+
+    Args:
+        user_url (str): 用户个人主页 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Raises:
+        APIError: 由于用户没有文章导致无法获取总资产信息时抛出此异常
+
+    Returns:
+        float: 用户总资产
+    """
+    # 判断账号状态所需的用户 JSON 数据会与个人主页并发获取
+    result = await GetUserData(user_url, ["assets_count"], disable_check=disable_check)
+    if result["assets_count"] is None:
+        raise APIError("受简书 API 限制，用户无文章时无法获取其总资产数据")
+    return result["assets_count"]
+
+
+async def GetUserFPCount(user_url: str, disable_check: bool = False) -> float:
+    """获取用户简书钻数量
+
+    # ! 当用户没有文章时，该函数将抛出 APIError 异常
+
+    Args:
+        user_url (str): 用户个人主页 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Raises:
+        APIError: 由于用户没有文章导致无法获取总资产信息时抛出此异常
+
+    Returns:
+        float: 用户简书钻数量
+    """
+    if not disable_check:
+        AssertUserUrl(user_url)
+        AssertCachedStatusNormal(user_url)
+    json_obj = await GetUserJsonDataApi(user_url)
+    if not disable_check:
+        AssertUserJsonDataNormal(user_url, json_obj)
+    result = json_obj["jsd_balance"] / 1000
+    if json_obj["total_wordage"] == 0 and result == 0:
+        raise APIError("受简书 API 限制，用户无文章时无法获取其简书钻数据")
+    return result
+
+
+async def GetUserFTNCount(user_url: str, disable_check: bool = False) -> float:
+    """获取用户简书贝数量
+
+    # ! 视用户资产配置情况不同，该函数获取到的数值会有不大于 1000 的偏差
+
+    Args:
+        user_url (str): 用户个人主页 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Raises:
+        APIError: 由于用户没有文章导致无法获取简书钻或总资产信息时抛出此异常
+
+    Returns:
+        float: 用户简书贝数量
+    """
+    # 简书贝数量由简书钻数量与总资产计算得出，所需的用户 JSON 数据与个人主页各只获取一次
+    result = await GetUserData(user_url, ["FP_count", "assets_count", "FTN_count"], disable_check=disable_check)
+    if result["FP_count"] is None:
+        raise APIError("受简书 API 限制，用户无文章时无法获取其简书钻数据")
+    if result["assets_count"] is None:
+        raise APIError("受简书 API 限制，用户无文章时无法获取其总资产数据")
+    return result["FTN_count"]
+
+
+async def GetUserBadgesList(user_url: str, disable_check: bool = False) -> List[str]:
+    """获取用户徽章列表
+
+    Args:
+        user_url (str): 用户个人主页 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        List[str]: 用户徽章列表
+    """
+    if not disable_check:
+        AssertUserUrl(user_url)
+        await AssertUserStatusNormal(user_url)
+    html_obj = await GetUserPCHtmlDataApi(user_url)
+    result = html_obj.xpath("//li[@class='badge-icon']/a/text()")
+    result = [item.replace(" ", "").replace("\n", "") for item in result]  # 移除空格和换行符
+    result = [item for item in result if item != ""]  # 去除空值
+    return result
+
+
+async def GetUserLastUpdateTime(user_url: str, disable_check: bool = False) -> datetime:
+    """获取用户文章最后更新时间
+
+    Args:
+        user_url (str): 用户个人主页 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        datetime: 用户文章最后更新时间
+    """
+    if not disable_check:
+        AssertUserUrl(user_url)
+        AssertCachedStatusNormal(user_url)
+    json_obj = await GetUserJsonDataApi(user_url)
+    if not disable_check:
+        AssertUserJsonDataNormal(user_url, json_obj)
+    result = datetime.fromtimestamp(json_obj["last_updated_at"])
+    return result
+
+
+async def GetUserVIPInfo(user_url: str, disable_check: bool = False) -> Dict:
+    """获取用户会员信息
+
+    Args:
+        user_url (str): 用户个人主页 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        Dict: 用户会员信息
+    """
+    if not disable_check:
+        AssertUserUrl(user_url)
+        AssertCachedStatusNormal(user_url)
+    json_obj = await GetUserJsonDataApi(user_url)
+    if not disable_check:
+        AssertUserJsonDataNormal(user_url, json_obj)
+    try:
+        result = {
+            "vip_type": {
+                "bronze": "铜牌",
+                "silver": "银牌",
+                "gold": "黄金",
+                "platina": "白金"
+            }[json_obj["member"]["type"]],
+            "expire_date": datetime.fromtimestamp(json_obj["member"]["expires_at"])
+        }
+    except KeyError:
+        result = {
+            "vip_type": None,
+            "expire_date": None
+        }
+    return result
+
+
+async def GetUserIntroductionHtml(user_url: str, disable_check: bool = False) -> str:
+    """获取 Html 格式的用户简介
+
+    Args:
+        user_url (str): 用户个人主页 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        str: Html 格式的用户个人简介
+    """
+    if not disable_check:
+        AssertUserUrl(user_url)
+        AssertCachedStatusNormal(user_url)
+    json_obj = await GetUserJsonDataApi(user_url)
+    if not disable_check:
+        AssertUserJsonDataNormal(user_url, json_obj)
+    result = json_obj["intro"]
+    return result
+
+
+async def GetUserIntroductionText(user_url: str, disable_check: bool = False) -> str:
+    """获取纯文本格式的用户简介
+
+    Args:
+        user_url (str): 用户个人主页 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        str: 纯文本格式的用户个人简介
+    """
+    if not disable_check:
+        AssertUserUrl(user_url)
+        AssertCachedStatusNormal(user_url)
+    json_obj = await GetUserJsonDataApi(user_url)
+    if not disable_check:
+        AssertUserJsonDataNormal(user_url, json_obj)
+    if json_obj["intro"] == "":   # 简介为空
+        return ""
+    html_obj = etree.HTML(json_obj["intro"])
+    result = html_obj.xpath("//*/text()")
+    result = "\n".join(result)
+    return result
+
+
+async def GetUserNextAnniversaryDay(user_url: str, disable_check: bool = False) -> datetime:
+    """获取用户的下一次简书周年纪念日
+
+    Args:
+        user_url (str): 用户个人主页 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        datetime: 用户的下一次简书周年纪念日
+    """
+    if not disable_check:
+        AssertUserUrl(user_url)
+        await AssertUserStatusNormal(user_url)
+    user_slug = UserUrlToUserSlug(user_url)
+    html_obj = await GetUserNextAnniversaryDayHtmlDataApi(user_slug)
+    result = html_obj.xpath('//*[@id="app"]/div[1]/div/text()')[0]
+    result = findall(r"\d+", result)
+    result = datetime.fromisoformat("-".join(result))
+    return result
+
+
+async def GetUserNotebooksInfo(user_url: str, disable_check: bool = False) -> List[Dict]:
+    """获取用户文集与连载信息
+
+    Args:
+        user_url (str): 用户个人主页 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        List[Dict]: 用户文集与连载信息
+    """
+    if not disable_check:
+        AssertUserUrl(user_url)
+        await AssertUserStatusNormal(user_url)
+    json_obj = await GetUserCollectionsAndNotebooksJsonDataApi(user_url=user_url, user_slug=UserUrlToUserSlug(user_url))
+    result = []
+    for item in json_obj["notebooks"]:
+        item_data = {
+            "nid": item["id"],
+            "name": item["name"],
+            "is_book": item["book"]
+        }
+        if item["book"]:
+            item_data["is_paid_book"] = item["paid_book"]  # 如果是连载，则判断是否是付费连载
+        result.append(item_data)
+    return result
+
+
+async def GetUserOwnCollectionsInfo(user_url: str, disable_check: bool = False) -> List[Dict]:
+    """获取用户自己创建的专题信息
+
+    Args:
+        user_url (str): 用户个人主页 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        List[Dict]: 用户自己创建的专题信息
+    """
+    if not disable_check:
+        AssertUserUrl(user_url)
+        await AssertUserStatusNormal(user_url)
+    json_obj = await GetUserCollectionsAndNotebooksJsonDataApi(user_url=user_url, user_slug=UserUrlToUserSlug(user_url))
+    result = []
+    for item in json_obj["own_collections"]:
+        item_data = {
+            "cid": item["id"],
+            "cslug": item["slug"],
+            "name": item["title"],
+            "avatar_url": item["avatar"]
+        }
+        result.append(item_data)
+    return result
+
+
+async def GetUserManageableCollectionsInfo(user_url: str, disable_check: bool = False) -> List[Dict]:
+    """获取用户管理的专题信息
+
+    Args:
+        user_url (str): 用户个人主页 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        List[Dict]: 用户管理的专题信息
+    """
+    if not disable_check:
+        AssertUserUrl(user_url)
+        await AssertUserStatusNormal(user_url)
+    json_obj = await GetUserCollectionsAndNotebooksJsonDataApi(user_url=user_url, user_slug=UserUrlToUserSlug(user_url))
+    result = []
+    for item in json_obj["manageable_collections"]:
+        item_data = {
+            "cid": item["id"],
+            "cslug": item["slug"],
+            "name": item["title"],
+            "avatar_url": item["avatar"]
+        }
+        result.append(item_data)
+    return result
+
+
+async def GetUserArticlesInfo(user_url: str, page: int = 1, count: int = 10,
+                              sorting_method: str = "time", disable_check: bool = False,
+                              as_record: bool = False) -> List[Union[Dict, ArticleBriefRecord]]:
+    """获取用户文章信息
+
+    Args:
+        user_url (str): 用户个人主页 URL
+        page (int, optional): 页码，与网页端文章顺序相同. Defaults to 1.
+        count (int, optional): 获取的文章数量. Defaults to 10.
+        sorting_method (str, optional): 排序方法，time 为按照发布时间排序，
+        comment_time 为按照最近评论时间排序，hot 为按照热度排序. Defaults to "time".
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+        as_record (bool, optional): 为 True 时返回 ArticleBriefRecord 而不是字典，占用内存更少，可通过 to_dict 方法转换为字典. Defaults to False.
+
+    Returns:
+        List[Dict]: 用户文章信息
+    """
+    if not disable_check:
+        AssertUserUrl(user_url)
+        await AssertUserStatusNormal(user_url)
+    order_by = {
+        "time": "added_at",
+        "comment_time": "commented_at",
+        "hot": "top"
+    }[sorting_method]
+    json_obj = await GetUserArticlesListJsonDataApi(user_url=user_url, page=page,
+                                                    count=count, order_by=order_by)
+    if as_record:
+        return [ArticleBriefRecord.from_json(item["object"]["data"]) for item in json_obj]
+    return ParseArticlesListJson(json_obj)
+
+
+async def GetUserFollowingInfo(user_url: str, page: int = 1, disable_check: bool = False) -> List[Dict]:
+    """获取用户关注者信息
+
+    Args:
+        user_url (str): 用户个人主页 URL
+        page (int, optional): 关注列表页码. Defaults to 1.
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        List[Dict]: 用户关注者信息
+    """
+    if not disable_check:
+        AssertUserUrl(user_url)
+        await AssertUserStatusNormal(user_url)
+    html_obj = await GetUserFollowingListHtmlDataApi(user_url=user_url, page=page)
+    return ParseUserFollowListHtml(html_obj)
+
+
+async def GetUserFansInfo(user_url: str, page: int = 1, disable_check: bool = False) -> List[Dict]:
+    """获取用户粉丝信息
+
+    Args:
+        user_url (str): 用户个人主页 URL
+        page (int, optional): 粉丝列表页码. Defaults to 1.
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        List[Dict]: 用户粉丝信息
+    """
+    if not disable_check:
+        AssertUserUrl(user_url)
+        await AssertUserStatusNormal(user_url)
+    html_obj = await GetUserFollowersListHtmlDataApi(user_url=user_url, page=page)
+    return ParseUserFollowListHtml(html_obj)
+
+
+async def GetUserAllBasicData(user_url: str, disable_check: bool = False) -> Dict:
+    """获取用户的所有基础信息
+
+    包含 USER_DATA_FIELDS 中的全部字段，与调用 GetUserData 时不指定字段相同
+
+    # ! 旧版本中 articles_count 错误地返回了用户 JSON 数据本身，现在与 GetUserArticlesCount 相同，
+    # ! 为从个人主页解析出的文章数（int），依赖旧返回值的代码需要修改
+
+    Args:
+        user_url (str): 用户个人主页 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        Dict: 用户基础信息
+    """
+    return await GetUserData(user_url, disable_check=disable_check)
+
+
+async def GetUsersAllBasicData(user_urls: Iterable[str], concurrency: int = 32, ordered: bool = True,
+                               disable_check: bool = False) -> AsyncGenerator[Tuple[str, Union[Dict, Exception]], None]:
+    """批量获取用户的所有基础信息
+
+    单个用户获取失败时不会中断其它用户的获取，无效 URL、资源异常、接口受限与网络错误会以异常对象的形式返回
+
+    Args:
+        user_urls (Iterable[str]): 用户 URL 列表
+        concurrency (int, optional): 最大并发数. Defaults to 32.
+        ordered (bool, optional): 为 True 时按输入顺序返回结果，为 False 时按完成顺序返回结果. Defaults to True.
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Yields:
+        Iterator[Tuple[str, Union[Dict, Exception]]]: (用户 URL, 用户基础信息或异常对象)
+    """
+    async for item in AsyncBatchCall(lambda user_url: GetUserAllBasicData(user_url, disable_check=disable_check),
+                                     user_urls, concurrency, ordered):
+        yield item
+
+
+async def GetUserData(user_url: str, fields: Optional[Iterable[str]] = None, disable_check: bool = False) -> Dict:
+    """获取用户的指定信息
+
+    只获取所需字段对应的数据来源，多个数据来源会并发获取
+    可用字段与 GetUserAllBasicData 的返回值相同
+
+    Args:
+        user_url (str): 用户个人主页 URL
+        fields (Optional[Iterable[str]], optional): 字段列表，为 None 时获取全部字段. Defaults to None.
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Raises:
+        InputError: 存在不支持的字段时抛出此错误
+
+    Returns:
+        Dict: 用户信息，键的顺序与字段列表相同
+    """
+    if not disable_check:
+        AssertUserUrl(user_url)
+    fields, sources = PlanUserDataSources(fields)
+    if not disable_check and USER_JSON_SOURCE not in sources and not AssertCachedStatusNormal(user_url):
+        sources.insert(0, USER_JSON_SOURCE)  # 需要根据用户 JSON 数据判断账号状态
+
+    async def GetJsonData() -> Dict:
+        json_obj = await GetUserJsonDataApi(user_url)
+        if not disable_check:
+            AssertUserJsonDataNormal(user_url, json_obj)
+        return json_obj
+
+    # 用户 JSON 数据排在第一位，账号状态异常时会优先抛出对应的异常
+    fetchers = {
+        USER_JSON_SOURCE: GetJsonData,
+        USER_PC_HTML_SOURCE: lambda: GetUserPCHtmlDataApi(user_url),
+        USER_ANNIVERSARY_HTML_SOURCE: lambda: GetUserNextAnniversaryDayHtmlDataApi(UserUrlToUserSlug(user_url))
+    }
+    payloads = dict(zip(sources, await AsyncRunConcurrently([fetchers[source]() for source in sources])))
+    return ParseUserData(user_url, fields, payloads)
+
+
+async def GetUserTimelineInfo(user_url: str, max_id: int = 1000000000, disable_check: bool = False) -> List[Dict]:
+    """获取用户动态信息
+
+    ！在极少数情况下可能会遇到不在可解析列表中的动态类型，此时程序会跳过这条动态，不会抛出异常
+
+    Args:
+        user_url (str): 用户个人主页 URL
+        max_id (int, optional): 最大 id，值等于上一次获取到的数据中最后一项的 operation_id. Defaults to 1000000000.
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        List[Dict]: 用户动态信息
+    """
+    if not disable_check:
+        AssertUserUrl(user_url)
+        await AssertUserStatusNormal(user_url)
+    user_slug = UserUrlToUserSlug(user_url)
+    html_obj = await GetUserTimelineHtmlDataApi(user_slug, max_id)
+    return ParseUserTimelineHtml(html_obj)
+
+
+async def GetUserAllArticlesInfo(user_url: str, count: int = 10, sorting_method: str = "time",
+                                 max_count: int = None, disable_check: bool = False,
+                                 prefetch: int = 0,
+                                 as_record: bool = False) -> AsyncGenerator[Union[Dict, ArticleBriefRecord], None]:
+    """获取用户的所有文章信息
+
+    Args:
+        user_url (str): 用户个人主页 URL
+        count (int, optional): 单次获取的数据数量，会影响性能. Defaults to 10.
+        sorting_method (str, optional): 排序方法，time 为按照发布时间排序，
+        comment_time 为按照最近评论时间排序，hot 为按照热度排序. Defaults to "time".
+        max_count (int, optional): 获取的文章信息数量上限，Defaults to None.
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+        prefetch (int, optional): 预取页数，大于 0 时会在后台并发获取后续页面. Defaults to 0.
+        as_record (bool, optional): 为 True 时返回 ArticleBriefRecord 而不是字典，占用内存更少，可通过 to_dict 方法转换为字典. Defaults to False.
+
+    Yields:
+        Iterator[Dict], None, None]: 文章信息
+    """
+    if not disable_check:
+        AssertUserUrl(user_url)
+        AssertCachedStatusNormal(user_url)
+    total_pages = None
+    if prefetch:  # 根据用户的公开文章数计算总页数，省去最后一次空页请求；缺少该字段时逐页判断
+        json_obj = await GetUserJsonDataApi(user_url)
+        if not disable_check:
+            AssertUserJsonDataNormal(user_url, json_obj)
+        articles_count = json_obj.get("public_notes_count")
+        if articles_count is not None:
+            total_pages = ceil(min(articles_count, max_count or articles_count) / count)
+    elif not disable_check:
+        await AssertUserStatusNormal(user_url)
+    async for item in AsyncIterPages(
+        lambda page: GetUserArticlesInfo(user_url, page, count, sorting_method, disable_check=True,
+                                         as_record=as_record),
+        prefetch, total_pages, max_count
+    ):
+        yield item
+
+
+async def GetUserAllFollowingInfo(user_url: str, max_count: int = None, disable_check: bool = False) -> AsyncGenerator[Dict, None]:
+    """获取用户的所有关注者信息
+
+    Args:
+        user_url (str): 用户个人主页 URL
+        max_count (int, optional): 获取的关注者信息数量上限，Defaults to None.
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Yields:
+        Iterator[Dict], None, None]: 关注者信息
+    """
+    if not disable_check:
+        AssertUserUrl(user_url)
+        await AssertUserStatusNormal(user_url)
+    page = 1
+    now_count = 0
+    while True:
+        result = await GetUserFollowingInfo(user_url, page, disable_check=True)
+        if result:
+            page += 1
+        else:
+            return
+        for item in result:
+            yield item
+            if max_count:
+                now_count += 1
+                if now_count == max_count:
+                    return
+
+
+async def GetUserAllFansInfo(user_url: str, max_count: int = None, disable_check: bool = False) -> AsyncGenerator[Dict, None]:
+    """获取用户的所有粉丝信息
+
+    Args:
+        user_url (str): 用户个人主页 URL
+        max_count (int, optional): 获取的粉丝信息数量上限，Defaults to None.
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Yields:
+        Iterator[Dict], None, None]: 粉丝信息
+    """
+    if not disable_check:
+        AssertUserUrl(user_url)
+        await AssertUserStatusNormal(user_url)
+    page = 1
+    now_count = 0
+    while True:
+        result = await GetUserFansInfo(user_url, page, disable_check=True)
+        if result:
+            page += 1
+        else:
+            return
+        for item in result:
+            yield item
+            if max_count:
+                now_count += 1
+                if now_count == max_count:
+                    return
+
+
+async def GetUserAllTimelineInfo(user_url: str, max_count: int = None, disable_check: bool = False) -> AsyncGenerator[Dict, None]:
+    """获取用户的所有动态信息
+
+    Args:
+        user_url (str): 用户个人主页 URL
+        max_count (int, optional): 获取的动态信息数量上限，Defaults to None.
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Yields:
+        Iterator[Dict], None, None]: 动态信息
+    """
+    if not disable_check:
+        AssertUserUrl(user_url)
+        await AssertUserStatusNormal(user_url)
+    max_id = None
+    now_count = 0
+    while True:
+        result = await GetUserTimelineInfo(user_url, max_id, disable_check=True)
+        if result:
+            max_id = result[-1]["operation_id"]
+        else:
+            return
+        for item in result:
+            yield item
+            if max_count:
+                now_count += 1
+                if now_count == max_count:
+                    return
+
+
+async def GetUserNewTimelineInfo(user_url: str, checkpoint_store: Optional[CheckpointStore] = None,
+                                 last_operation_id: Optional[int] = None, max_count: int = None,
+                                 disable_check: bool = False) -> List[Dict]:
+    """获取用户在检查点之后产生的新动态
+
+    从最新的动态开始获取，遇到 operation_id 不大于检查点的动态时立即停止翻页，没有新动态时只需发送一次请求；
+    第一页为空时才请求用户账号状态，账号状态异常时抛出 ResourceError，而不是返回空列表
+
+    新动态数量超过 max_count 时返回其中最旧的 max_count 条，剩余的新动态会在之后的调用中返回；
+    检查点只会推进到已返回的最新一条动态，不会遗漏任何动态
+
+    # ! max_count 只限制返回数量，不减少请求数量：接口只能从最新的动态开始翻页，
+    # ! 因此每次调用都需要翻页至检查点处，没有检查点时需要翻完用户的全部动态。
+    # ! 积压 N 条新动态时，分批获取完毕共需翻阅约 N * N / (2 * max_count) 条动态，积压较多时应增大 max_count 或不设置上限
+
+    Args:
+        user_url (str): 用户个人主页 URL
+        checkpoint_store (Optional[CheckpointStore], optional): 检查点存储，为 None 时不读取和保存检查点. Defaults to None.
+        last_operation_id (Optional[int], optional): 上一次获取到的最新动态的 operation_id，
+        不为 None 时忽略检查点存储中已有的值，两者均为空时获取全部动态. Defaults to None.
+        max_count (int, optional): 返回的动态信息数量上限，不减少请求数量. Defaults to None.
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Raises:
+        ResourceError: 用户账号状态异常时抛出此异常
+
+    Returns:
+        List[Dict]: 新动态信息，按时间从新到旧排列
+    """
+    if not disable_check:
+        AssertUserUrl(user_url)
+        AssertCachedStatusNormal(user_url)
+    user_slug = UserUrlToUserSlug(user_url)
+    if last_operation_id is None and checkpoint_store is not None:
+        last_operation_id = checkpoint_store.get(user_slug)
+
+    # 超过 max_count 时只保留最旧的部分，使检查点之后的动态连续且不被跳过
+    result = deque(maxlen=max_count or None)
+    max_id = None
+    finished = False
+    while not finished:
+        page = await GetUserTimelineInfo(user_url, max_id, disable_check=True)
+        if not page:
+            if max_id is None and not disable_check:
+                await AssertUserStatusNormal(user_url)  # 账号状态异常的用户动态为空，需要与没有动态区分
+            break
+        for item in page:
+            if last_operation_id is not None and item["operation_id"] <= last_operation_id:
+                finished = True  # 已到达检查点，之后的动态均已获取过
+                break
+            result.append(item)
+        max_id = page[-1]["operation_id"]
+
+    if result and checkpoint_store is not None:
+        checkpoint_store.set(user_slug, result[0]["operation_id"])
+    return list(result)
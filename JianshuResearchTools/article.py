@@ -1,12 +1,17 @@
 from datetime import datetime
 from re import findall, sub
-from typing import Dict, Generator, List
+from typing import Dict, Generator, Iterable, List, Tuple, Union
 
 from lxml import etree
 
-from .assert_funcs import AssertArticleStatusNormal, AssertArticleUrl
+from .assert_funcs import (AssertArticleJsonDataNormal,
+                           AssertArticleStatusNormal, AssertArticleUrl,
+                           AssertCachedStatusNormal)
 from .basic_apis import (GetArticleCommentsJsonDataApi,
                          GetArticleHtmlJsonDataApi, GetArticleJsonDataApi)
+from .parsers import ParseArticleCommentsJson
+from .records import CommentRecord
+from .utils import BatchCall, RunConcurrently
 
 try:
     from tomd import convert as html2md
@@ -21,7 +26,7 @@ __all__ = [
     "GetArticlePaidStatus", "GetArticleReprintStatus",
     "GetArticleCommentStatus", "GetArticleHtml", "GetArticleText",
     "GetArticleMarkdown", "GetArticleCommentsData", "GetArticleAllBasicData",
-    "GetArticleAllCommentsData"
+    "GetArticlesAllBasicData", "GetArticleAllCommentsData"
 ]
 
 
@@ -37,8 +42,10 @@ def GetArticleTitle(article_url: str, disable_check: bool = False) -> str:
     """
     if not disable_check:
         AssertArticleUrl(article_url)
-        AssertArticleStatusNormal(article_url)
+        AssertCachedStatusNormal(article_url)
     json_obj = GetArticleJsonDataApi(article_url)
+    if not disable_check:
+        AssertArticleJsonDataNormal(article_url, json_obj)
     result = json_obj["public_title"]
     return result
 
@@ -109,8 +116,10 @@ def GetArticleLikesCount(article_url: str, disable_check: bool = False) -> int:
     """
     if not disable_check:
         AssertArticleUrl(article_url)
-        AssertArticleStatusNormal(article_url)
+        AssertCachedStatusNormal(article_url)
     json_obj = GetArticleJsonDataApi(article_url)
+    if not disable_check:
+        AssertArticleJsonDataNormal(article_url, json_obj)
     result = json_obj["likes_count"]
     return result
 
@@ -127,8 +136,10 @@ def GetArticleCommentsCount(article_url: str, disable_check: bool = False) -> in
     """
     if not disable_check:
         AssertArticleUrl(article_url)
-        AssertArticleStatusNormal(article_url)
+        AssertCachedStatusNormal(article_url)
     json_obj = GetArticleJsonDataApi(article_url)
+    if not disable_check:
+        AssertArticleJsonDataNormal(article_url, json_obj)
     result = json_obj["public_comment_count"]
     return result
 
@@ -145,8 +156,10 @@ def GetArticleMostValuableCommentsCount(article_url: str, disable_check: bool =
     """
     if not disable_check:
         AssertArticleUrl(article_url)
-        AssertArticleStatusNormal(article_url)
+        AssertCachedStatusNormal(article_url)
     json_obj = GetArticleJsonDataApi(article_url)
+    if not disable_check:
+        AssertArticleJsonDataNormal(article_url, json_obj)
     result = json_obj["featured_comments_count"]
     return result
 
@@ -163,8 +176,10 @@ def GetArticleTotalFPCount(article_url: str, disable_check: bool = False) -> flo
     """
     if not disable_check:
         AssertArticleUrl(article_url)
-        AssertArticleStatusNormal(article_url)
+        AssertCachedStatusNormal(article_url)
     json_obj = GetArticleJsonDataApi(article_url)
+    if not disable_check:
+        AssertArticleJsonDataNormal(article_url, json_obj)
     result = json_obj["total_fp_amount"] / 1000
     return result
 
@@ -181,8 +196,10 @@ def GetArticleDescription(article_url: str, disable_check: bool = False) -> str:
     """
     if not disable_check:
         AssertArticleUrl(article_url)
-        AssertArticleStatusNormal(article_url)
+        AssertCachedStatusNormal(article_url)
     json_obj = GetArticleJsonDataApi(article_url)
+    if not disable_check:
+        AssertArticleJsonDataNormal(article_url, json_obj)
     result = json_obj["description"]
     return result
 
@@ -199,8 +216,10 @@ def GetArticlePublishTime(article_url: str, disable_check: bool = False) -> date
     """
     if not disable_check:
         AssertArticleUrl(article_url)
-        AssertArticleStatusNormal(article_url)
+        AssertCachedStatusNormal(article_url)
     json_obj = GetArticleJsonDataApi(article_url)
+    if not disable_check:
+        AssertArticleJsonDataNormal(article_url, json_obj)
     result = datetime.fromisoformat(json_obj["first_shared_at"])
     return result
 
@@ -217,8 +236,10 @@ def GetArticleUpdateTime(article_url: str, disable_check: bool = False) -> datet
     """
     if not disable_check:
         AssertArticleUrl(article_url)
-        AssertArticleStatusNormal(article_url)
+        AssertCachedStatusNormal(article_url)
     json_obj = GetArticleJsonDataApi(article_url)
+    if not disable_check:
+        AssertArticleJsonDataNormal(article_url, json_obj)
     result = datetime.fromtimestamp(json_obj["last_updated_at"])
     return result
 
@@ -235,8 +256,10 @@ def GetArticlePaidStatus(article_url: str, disable_check: bool = False) -> bool:
     """
     if not disable_check:
         AssertArticleUrl(article_url)
-        AssertArticleStatusNormal(article_url)
+        AssertCachedStatusNormal(article_url)
     json_obj = GetArticleJsonDataApi(article_url)
+    if not disable_check:
+        AssertArticleJsonDataNormal(article_url, json_obj)
     paid_type = {
         "free": False,   # 免费文章
         "fbook_free": False,   # 免费连载中的免费文章
@@ -261,8 +284,10 @@ def GetArticleReprintStatus(article_url: str, disable_check: bool = False) -> bo
     """
     if not disable_check:
         AssertArticleUrl(article_url)
-        AssertArticleStatusNormal(article_url)
+        AssertCachedStatusNormal(article_url)
     json_obj = GetArticleJsonDataApi(article_url)
+    if not disable_check:
+        AssertArticleJsonDataNormal(article_url, json_obj)
     result = json_obj["reprintable"]
     return result
 
@@ -279,8 +304,10 @@ def GetArticleCommentStatus(article_url: str, disable_check: bool = False) -> bo
     """
     if not disable_check:
         AssertArticleUrl(article_url)
-        AssertArticleStatusNormal(article_url)
+        AssertCachedStatusNormal(article_url)
     json_obj = GetArticleJsonDataApi(article_url)
+    if not disable_check:
+        AssertArticleJsonDataNormal(article_url, json_obj)
     result = json_obj["commentable"]
     return result
 
@@ -300,8 +327,10 @@ def GetArticleHtml(article_url: str, disable_check: bool = False) -> str:
     """
     if not disable_check:
         AssertArticleUrl(article_url)
-        AssertArticleStatusNormal(article_url)
+        AssertCachedStatusNormal(article_url)
     json_obj = GetArticleJsonDataApi(article_url)
+    if not disable_check:
+        AssertArticleJsonDataNormal(article_url, json_obj)
     html_text = json_obj["free_content"]
 
     # 去除 image-container、image-container-fill 和 image-view
@@ -338,8 +367,10 @@ def GetArticleText(article_url: str, disable_check: bool = False) -> str:
     """
     if not disable_check:
         AssertArticleUrl(article_url)
-        AssertArticleStatusNormal(article_url)
+        AssertCachedStatusNormal(article_url)
     json_obj = GetArticleJsonDataApi(article_url)
+    if not disable_check:
+        AssertArticleJsonDataNormal(article_url, json_obj)
     html_obj = etree.HTML(json_obj["free_content"])
     result = "".join(html_obj.itertext())
     result = sub(r"\s{3,}", "", result)  # 去除多余的空行
@@ -388,7 +419,8 @@ def GetArticleMarkdown(article_url: str, disable_check: bool = False) -> str:
 
 
 def GetArticleCommentsData(article_id: int, page: int = 1, count: int = 10,
-                           author_only: bool = False, sorting_method: str = "positive") -> List[Dict]:
+                           author_only: bool = False, sorting_method: str = "positive",
+                           as_record: bool = False) -> List[Union[Dict, CommentRecord]]:
     """获取文章评论信息
 
     Args:
@@ -397,6 +429,7 @@ def GetArticleCommentsData(article_id: int, page: int = 1, count: int = 10,
         count (int, optional): 每次获取的评论数（不包含子评论）. Defaults to 10.
         author_only (bool, optional): 为 True 时只获取作者发布的评论，包含作者发布的子评论及其父评论. Defaults to False.
         sorting_method (str, optional): 排序方式，为”positive“时按时间正序排列，为”reverse“时按时间倒序排列. Defaults to "positive".
+        as_record (bool, optional): 为 True 时返回 CommentRecord 而不是字典，占用内存更少，可通过 to_dict 方法转换为字典. Defaults to False.
 
     Returns:
         List[Dict]: 文章评论信息
@@ -406,78 +439,9 @@ def GetArticleCommentsData(article_id: int, page: int = 1, count: int = 10,
         "reverse": "desc"  # 倒序
     }[sorting_method]
     json_obj = GetArticleCommentsJsonDataApi(article_id, page, count, author_only, order_by)
-    result = []
-    for item in json_obj["comments"]:
-        item_data = {
-            "cmid": item["id"],
-            "publish_time": datetime.fromisoformat(item["created_at"]),
-            "content": item["compiled_content"],
-            "floor": item["floor"],
-            "images": [image["url"] for image in item["images"]],
-            "likes_count": item["likes_count"],
-            "sub_comments_count": item["children_count"],
-            "user": {
-                "uid": item["user"]["id"],
-                "name": item["user"]["nickname"],
-                "uslug": item["user"]["slug"],
-                "avatar_url": item["user"]["avatar"]
-            }
-        }
-        try:
-            item["user"]["member"]
-        except KeyError:  # 没有开通会员
-            pass
-        else:
-            item_data["user"]["vip_type"] = {
-                "bronze": "铜牌",
-                "silver": "银牌",
-                "gold": "黄金",
-                "platina": "白金",
-                "ordinary": "普通（旧会员）",
-                "distinguished": "至尊（旧会员）"
-            }[item["user"]["member"]["type"]]
-            item_data["user"]["vip_expire_date"] = datetime.fromtimestamp(item["user"]["member"]["expires_at"])
-
-        try:
-            item["children"]
-        except KeyError:  # 没有子评论
-            pass
-        else:
-            item_data["sub_comments"] = []
-            for sub_comment in item["children"]:
-                sub_comment_data = {
-                    "cmid": sub_comment["id"],
-                    "publish_time": datetime.fromisoformat(sub_comment["created_at"]),
-                    "content": sub_comment["compiled_content"],
-                    "images": [image["url"] for image in sub_comment["images"]],
-                    "parent_comment_id": sub_comment["parent_id"],
-                    "user": {
-                        "uid": sub_comment["user"]["id"],
-                        "name": sub_comment["user"]["nickname"],
-                        "uslug": sub_comment["user"]["slug"],
-                        "avatar_url": sub_comment["user"]["avatar"]
-                    }
-                }
-
-                try:
-                    sub_comment["user"]["member"]
-                except KeyError:  # 没有开通会员
-                    pass
-                else:
-                    sub_comment_data["user"]["vip_type"] = {
-                        "bronze": "铜牌",
-                        "silver": "银牌",
-                        "gold": "黄金",
-                        "platina": "白金",
-                        "ordinary": "普通（旧会员）",
-                        "distinguished": "至尊（旧会员）"
-                    }[sub_comment["user"]["member"]["type"]]
-                    sub_comment_data["user"]["vip_expire_date"] = datetime.fromtimestamp(sub_comment["user"]["member"]["expires_at"])
-
-                item_data["sub_comments"].append(sub_comment_data)
-
-        result.append(item_data)
-    return result
+    if as_record:
+        return [CommentRecord.from_json(item) for item in json_obj["comments"]]
+    return ParseArticleCommentsJson(json_obj)
 
 
 def GetArticleAllBasicData(article_url: str, disable_check: bool = False) -> Dict:
@@ -492,11 +456,16 @@ def GetArticleAllBasicData(article_url: str, disable_check: bool = False) -> Dic
     """
     if not disable_check:
         AssertArticleUrl(article_url)
-        AssertArticleStatusNormal(article_url)
-    result = {}
-    json_obj = GetArticleJsonDataApi(article_url)
-    html_json_obj = GetArticleHtmlJsonDataApi(article_url)
 
+    def GetJsonData() -> Dict:
+        json_obj = GetArticleJsonDataApi(article_url)
+        if not disable_check:
+            AssertArticleJsonDataNormal(article_url, json_obj)
+        return json_obj
+
+    # 两个请求互不依赖，并发发送；文章状态异常时会优先抛出对应的异常
+    json_obj, html_json_obj = RunConcurrently([GetJsonData, lambda: GetArticleHtmlJsonDataApi(article_url)])
+    result = {}
     result["title"] = json_obj["public_title"]
     result["author_name"] = html_json_obj["props"]["initialState"]["note"]["data"]["user"]["nickname"]
     result["reads_count"] = html_json_obj["props"]["initialState"]["note"]["data"]["views_count"]
@@ -521,8 +490,28 @@ def GetArticleAllBasicData(article_url: str, disable_check: bool = False) -> Dic
     return result
 
 
+def GetArticlesAllBasicData(article_urls: Iterable[str], concurrency: int = 32, ordered: bool = True,
+                            disable_check: bool = False) -> Generator[Tuple[str, Union[Dict, Exception]], None, None]:
+    """批量获取文章的所有基础信息
+
+    单个文章获取失败时不会中断其它文章的获取，无效 URL、资源异常、接口受限与网络错误会以异常对象的形式返回
+
+    Args:
+        article_urls (Iterable[str]): 文章 URL 列表
+        concurrency (int, optional): 最大并发数. Defaults to 32.
+        ordered (bool, optional): 为 True 时按输入顺序返回结果，为 False 时按完成顺序返回结果. Defaults to True.
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Yields:
+        Iterator[Tuple[str, Union[Dict, Exception]]]: (文章 URL, 文章基础信息或异常对象)
+    """
+    yield from BatchCall(lambda article_url: GetArticleAllBasicData(article_url, disable_check=disable_check),
+                         article_urls, concurrency, ordered)
+
+
 def GetArticleAllCommentsData(article_id: int, count: int = 10, author_only: bool = False,
-                              sorting_method: str = "positive", max_count: int = None) -> Generator[Dict, None, None]:
+                              sorting_method: str = "positive", max_count: int = None,
+                              as_record: bool = False) -> Generator[Union[Dict, CommentRecord], None, None]:
     """获取文章的全部评论信息
 
     Args:
@@ -531,6 +520,7 @@ def GetArticleAllCommentsData(article_id: int, count: int = 10, author_only: boo
         author_only (bool, optional): 为 True 时只获取作者发布的评论，包含作者发布的子评论及其父评论. Defaults to False.
         sorting_method (str, optional): 排序方式，为”positive“时按时间正序排列，为”reverse“时按时间倒序排列. Defaults to "positive".
         max_count (int, optional): 获取的文章评论信息数量上限，Defaults to None.
+        as_record (bool, optional): 为 True 时返回 CommentRecord 而不是字典，占用内存更少，可通过 to_dict 方法转换为字典. Defaults to False.
 
     Yields:
         Iterator[Dict], None, None]: 文章信息
@@ -538,7 +528,7 @@ def GetArticleAllCommentsData(article_id: int, count: int = 10, author_only: boo
     page = 1
     now_count = 0
     while True:
-        result = GetArticleCommentsData(article_id, page, count, author_only, sorting_method)
+        result = GetArticleCommentsData(article_id, page, count, author_only, sorting_method, as_record)
         if result:
             page += 1
         else:
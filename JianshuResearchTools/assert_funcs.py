@@ -1,21 +1,26 @@
-from functools import lru_cache
 from re import compile as re_compile
-from typing import Any
+from typing import Any, Dict, Optional, Union
 
 from .basic_apis import (GetArticleJsonDataApi, GetCollectionJsonDataApi,
                          GetIslandJsonDataApi, GetNotebookJsonDataApi,
                          GetUserJsonDataApi)
+from .cache import _MISSING, TTLCache
 from .exceptions import InputError, ResourceError
 
 __all__ = [
     "JIANSHU_URL_REGEX", "JIANSHU_USER_URL_REGEX",
     "JIANSHU_ARTICLES_URL_REGEX", "JIANSHU_NOTEBOOK_URL_REGEX",
     "JIANSHU_COLLECTION_URL_REGEX", "JIANSHU_ISLAND_URL_REGEX",
-    "JIANSHU_ISLAND_POST_URL_REGEX", "AssertType", "AssertJianshuUrl",
-    "AssertUserUrl", "AssertUserStatusNormal", "AssertArticleUrl",
-    "AssertArticleStatusNormal", "AssertCollectionUrl",
+    "JIANSHU_ISLAND_POST_URL_REGEX", "JIANSHU_URL_CLASSIFY_REGEX",
+    "AssertType", "AssertJianshuUrl", "AssertUserUrl", "AssertUserJsonDataNormal", "AssertUserStatusNormal",
+    "AssertArticleUrl", "AssertArticleJsonDataNormal",
+    "AssertArticleStatusNormal", "AssertNotebookUrl",
+    "AssertNotebookJsonDataNormal", "AssertNotebookStatusNormal",
+    "AssertCollectionUrl", "AssertCollectionJsonDataNormal",
     "AssertCollectionStatusNormal", "AssertIslandUrl",
-    "AssertIslandStatusNormal", "AssertIslandPostUrl"
+    "AssertIslandJsonDataNormal", "AssertIslandStatusNormal",
+    "AssertIslandPostUrl", "configure_status_cache", "get_status_cache_stats",
+    "invalidate_status_cache", "clear_status_cache"
 ]
 
 
@@ -26,6 +31,100 @@ JIANSHU_NOTEBOOK_URL_REGEX = re_compile(r"^https://www\.jianshu\.com/nb/\d{7,8}/
 JIANSHU_COLLECTION_URL_REGEX = re_compile(r"^https://www\.jianshu\.com/c/\w{6,12}/?$")
 JIANSHU_ISLAND_URL_REGEX = re_compile(r"^https://www\.jianshu\.com/g/\w{16}/?$")
 JIANSHU_ISLAND_POST_URL_REGEX = re_compile(r"^https://www\.jianshu\.com/gp/\w{16}/?$")
+# 一次匹配即可判断 URL 对应的资源类型，分组名即为资源类型
+JIANSHU_URL_CLASSIFY_REGEX = re_compile(
+    r"^https://www\.jianshu\.com/(?:"
+    r"u/(?P<user>\w{6,12})|p/(?P<article>\w{12})|nb/(?P<notebook>\d{7,8})|"
+    r"c/(?P<collection>\w{6,12})|g/(?P<island>\w{16})|gp/(?P<island_post>\w{16})"
+    r")/?$"
+)
+
+
+_status_cache = TTLCache(max_size=4096)
+_status_cache_positive_ttl: Optional[float] = 600  # 状态正常的资源可能随时被封禁或删除
+_status_cache_negative_ttl: Optional[float] = 3600  # 状态异常的资源很少恢复
+
+
+def configure_status_cache(max_size: Optional[int] = None,
+                           positive_ttl: Union[float, None] = _MISSING,
+                           negative_ttl: Union[float, None] = _MISSING) -> None:
+    """修改资源状态缓存配置，未传入的配置项保持不变
+
+    Args:
+        max_size (Optional[int], optional): 最大缓存条目数，为 0 时不缓存. Defaults to None.
+        positive_ttl (Union[float, None], optional): 状态正常的结果的过期时间（秒），为 None 时永不过期.
+        negative_ttl (Union[float, None], optional): 状态异常的结果的过期时间（秒），为 None 时永不过期.
+    """
+    global _status_cache_positive_ttl, _status_cache_negative_ttl
+    if max_size is not None:
+        _status_cache.max_size = max_size
+    if positive_ttl is not _MISSING:
+        _status_cache_positive_ttl = positive_ttl
+    if negative_ttl is not _MISSING:
+        _status_cache_negative_ttl = negative_ttl
+
+
+def get_status_cache_stats() -> Dict[str, Union[int, float]]:
+    """获取资源状态缓存统计信息
+
+    Returns:
+        Dict[str, Union[int, float]]: 包含命中次数、未命中次数、命中率与当前条目数
+    """
+    return _status_cache.stats()
+
+
+def invalidate_status_cache(url: str) -> None:
+    """使某个资源的状态缓存失效，下次判断时重新请求
+
+    Args:
+        url (str): 资源 URL
+    """
+    _status_cache.invalidate(url)
+
+
+def clear_status_cache() -> None:
+    """清空资源状态缓存
+    """
+    _status_cache.clear()
+
+
+def AssertCachedStatusNormal(url: str) -> bool:
+    """根据资源状态缓存判断资源状态是否正常
+
+    Args:
+        url (str): 资源 URL
+
+    Raises:
+        ResourceError: 缓存中记录资源状态异常时抛出此错误
+
+    Returns:
+        bool: 是否命中缓存，未命中时需要请求数据进行判断
+    """
+    error_message = _status_cache.get(url, _MISSING)
+    if error_message is _MISSING:
+        return False
+    if error_message is not None:
+        raise ResourceError(error_message)
+    return True
+
+
+def _AssertJsonDataNormal(url: str, json_data: Dict, key: str, error_message: str) -> None:
+    """根据 JSON 数据中是否存在某个键判断资源状态是否正常，并将结果写入资源状态缓存
+
+    Args:
+        url (str): 资源 URL
+        json_data (Dict): 资源 JSON 数据
+        key (str): 资源状态正常时必定存在的键
+        error_message (str): 资源状态异常时的错误信息
+
+    Raises:
+        ResourceError: 资源状态异常时抛出此错误
+    """
+    if key in json_data:
+        _status_cache.set(url, None, _status_cache_positive_ttl)
+        return
+    _status_cache.set(url, error_message, _status_cache_negative_ttl)
+    raise ResourceError(error_message)
 
 
 def AssertType(obj: Any, type_obj: Any) -> None:
@@ -68,21 +167,32 @@ def AssertUserUrl(string: str) -> None:
         raise InputError(f"{string} 不是有效的简书用户主页 URL")
 
 
-@lru_cache(maxsize=64)
+def AssertUserJsonDataNormal(user_url: str, user_json_data: Dict) -> None:
+    """根据已获取的用户 JSON 数据判断用户账号状态是否正常，不会发送请求
+
+    Args:
+        user_url (str): 用户主页 URL
+        user_json_data (Dict): 用户 JSON 数据
+
+    Raises:
+        ResourceError: 用户账号状态异常时抛出此错误
+    """
+    _AssertJsonDataNormal(user_url, user_json_data, "nickname", f"用户 {user_url} 账号状态异常")
+
+
 def AssertUserStatusNormal(user_url: str) -> None:
     """判断用户账号状态是否正常
 
+    结果会写入资源状态缓存，缓存过期前不会重复请求
+
     Args:
         user_url (str): 用户主页 URL
 
     Raises:
         ResourceError: 用户账号状态异常时抛出此错误
     """
-    user_json_data = GetUserJsonDataApi(user_url)
-    try:
-        user_json_data["nickname"]
-    except KeyError:
-        raise ResourceError(f"用户 {user_url} 账号状态异常")
+    if not AssertCachedStatusNormal(user_url):
+        AssertUserJsonDataNormal(user_url, GetUserJsonDataApi(user_url))
 
 
 def AssertArticleUrl(string: str) -> None:
@@ -98,10 +208,24 @@ def AssertArticleUrl(string: str) -> None:
         raise InputError(f"{string} 不是有效的简书文章 URL")
 
 
-@lru_cache(maxsize=64)
+def AssertArticleJsonDataNormal(article_url: str, article_json_data: Dict) -> None:
+    """根据已获取的文章 JSON 数据判断文章状态是否正常，不会发送请求
+
+    Args:
+        article_url (str): 文章 URL
+        article_json_data (Dict): 文章 JSON 数据
+
+    Raises:
+        ResourceError: 文章状态异常时抛出此错误
+    """
+    _AssertJsonDataNormal(article_url, article_json_data, "show_ad", f"文章 {article_url} 状态异常")
+
+
 def AssertArticleStatusNormal(article_url: str) -> None:
     """判断文章状态是否正常
 
+    结果会写入资源状态缓存，缓存过期前不会重复请求
+
     Args:
         article_url (str): 文章 URL
 
@@ -109,11 +233,8 @@ def AssertArticleStatusNormal(article_url: str) -> None:
         ResourceError: 文章状态异常时抛出此错误
     """
     AssertArticleUrl(article_url)
-    json_obj = GetArticleJsonDataApi(article_url)
-    try:
-        json_obj["show_ad"]
-    except KeyError:
-        raise ResourceError(f"文章 {article_url} 状态异常")
+    if not AssertCachedStatusNormal(article_url):
+        AssertArticleJsonDataNormal(article_url, GetArticleJsonDataApi(article_url))
 
 
 def AssertNotebookUrl(string: str) -> None:
@@ -129,9 +250,24 @@ def AssertNotebookUrl(string: str) -> None:
         raise InputError(f"{string} 不是有效的简书文集 URL")
 
 
+def AssertNotebookJsonDataNormal(notebook_url: str, notebook_json_data: Dict) -> None:
+    """根据已获取的文集 JSON 数据判断文集状态是否正常，不会发送请求
+
+    Args:
+        notebook_url (str): 文集 URL
+        notebook_json_data (Dict): 文集 JSON 数据
+
+    Raises:
+        ResourceError: 文集状态异常时抛出此错误
+    """
+    _AssertJsonDataNormal(notebook_url, notebook_json_data, "name", f"文集 {notebook_url} 状态异常")
+
+
 def AssertNotebookStatusNormal(notebook_url: str) -> None:
     """判断文集状态是否正常
 
+    结果会写入资源状态缓存，缓存过期前不会重复请求
+
     Args:
         notebook_url (str): 文集 URL
 
@@ -139,11 +275,8 @@ def AssertNotebookStatusNormal(notebook_url: str) -> None:
         ResourceError: 文集状态异常时抛出此错误
     """
     AssertNotebookUrl(notebook_url)
-    json_obj = GetNotebookJsonDataApi(notebook_url)
-    try:
-        json_obj["name"]
-    except KeyError:
-        raise ResourceError(f"文集 {notebook_url} 状态异常")
+    if not AssertCachedStatusNormal(notebook_url):
+        AssertNotebookJsonDataNormal(notebook_url, GetNotebookJsonDataApi(notebook_url))
 
 
 def AssertCollectionUrl(string: str) -> None:
@@ -159,21 +292,32 @@ def AssertCollectionUrl(string: str) -> None:
         raise InputError(f"{string} 不是有效的简书专题 URL")
 
 
-@lru_cache(maxsize=64)
+def AssertCollectionJsonDataNormal(collection_url: str, collection_json_data: Dict) -> None:
+    """根据已获取的专题 JSON 数据判断专题状态是否正常，不会发送请求
+
+    Args:
+        collection_url (str): 专题 URL
+        collection_json_data (Dict): 专题 JSON 数据
+
+    Raises:
+        ResourceError: 专题状态异常时抛出此错误
+    """
+    _AssertJsonDataNormal(collection_url, collection_json_data, "title", f"专题 {collection_url} 状态异常")
+
+
 def AssertCollectionStatusNormal(collection_url: str) -> None:
     """判断专题状态是否正常
 
+    结果会写入资源状态缓存，缓存过期前不会重复请求
+
     Args:
         collection_url (str): 专题 URL
 
     Raises:
         ResourceError: 专题状态异常时抛出此错误
     """
-    collection_json_data = GetCollectionJsonDataApi(collection_url)
-    try:
-        collection_json_data["title"]
-    except KeyError:
-        raise ResourceError(f"专题 {collection_url} 状态异常")
+    if not AssertCachedStatusNormal(collection_url):
+        AssertCollectionJsonDataNormal(collection_url, GetCollectionJsonDataApi(collection_url))
 
 
 def AssertIslandUrl(string: str) -> None:
@@ -189,13 +333,32 @@ def AssertIslandUrl(string: str) -> None:
         raise InputError(f"{string} 不是有效的简书小岛 URL")
 
 
-@lru_cache(maxsize=64)
+def AssertIslandJsonDataNormal(island_url: str, island_json_data: Dict) -> None:
+    """根据已获取的小岛 JSON 数据判断小岛状态是否正常，不会发送请求
+
+    Args:
+        island_url (str): 小岛 URL
+        island_json_data (Dict): 小岛 JSON 数据
+
+    Raises:
+        ResourceError: 小岛状态异常时抛出此错误
+    """
+    _AssertJsonDataNormal(island_url, island_json_data, "name", f"小岛 {island_url} 状态异常")
+
+
 def AssertIslandStatusNormal(island_url: str) -> None:
-    island_json_data = GetIslandJsonDataApi(island_url)
-    try:
-        island_json_data["name"]
-    except KeyError:
-        raise ResourceError(f"小岛 {island_url} 状态异常")
+    """判断小岛状态是否正常
+
+    结果会写入资源状态缓存，缓存过期前不会重复请求
+
+    Args:
+        island_url (str): 小岛 URL
+
+    Raises:
+        ResourceError: 小岛状态异常时抛出此错误
+    """
+    if not AssertCachedStatusNormal(island_url):
+        AssertIslandJsonDataNormal(island_url, GetIslandJsonDataApi(island_url))
 
 
 def AssertIslandPostUrl(string: str) -> None:
@@ -1,12 +1,12 @@
 from typing import Dict, List, Union, Optional
 
-from httpx import get as httpx_get
-from httpx import post as httpx_post
 from lxml import etree
 from lxml.etree import _Element
 
+from .client import send_request
 from .headers import (BeikeIsland_request_header, PC_header,
                       api_request_header, mobile_header)
+from .slug_index import IndexPayload
 
 try:
     from ujson import loads as json_loads
@@ -33,13 +33,14 @@ __all__ = [
 def GetArticleJsonDataApi(article_url: str) -> Dict:
     request_url = article_url.replace("https://www.jianshu.com/",
                                       "https://www.jianshu.com/asimov/")
-    source = httpx_get(request_url, headers=api_request_header).content
+    source = send_request("GET", request_url, headers=api_request_header)
     json_obj = json_loads(source)
+    IndexPayload(json_obj, "article")
     return json_obj
 
 
 def GetArticleHtmlJsonDataApi(article_url: str) -> _Element:
-    source = httpx_get(article_url, headers=PC_header).content
+    source = send_request("GET", article_url, headers=PC_header)
     html_obj = etree.HTML(source)
     json_obj = json_loads(html_obj.xpath("//script[@id='__NEXT_DATA__']/text()")[0])
     return json_obj
@@ -54,8 +55,9 @@ def GetArticleCommentsJsonDataApi(article_id: int, page: int, count: int,
         "order_by": order_by
     }
     request_url = f"https://www.jianshu.com/shakespeare/notes/{article_id}/comments"
-    source = httpx_get(request_url, params=params, headers=api_request_header).content
+    source = send_request("GET", request_url, params=params, headers=api_request_header)
     json_obj = json_loads(source)
+    IndexPayload(json_obj, "user", ("comments", "*", "user"))
     return json_obj
 
 
@@ -64,8 +66,8 @@ def GetBeikeIslandTradeRankListJsonDataApi(ranktype: Union[int, None], pageIndex
         "ranktype": ranktype,
         "pageIndex": pageIndex
     }
-    source = httpx_post("https://www.beikeisland.com/api/Trade/getTradeRankList",
-                        headers=BeikeIsland_request_header, json=params).content
+    source = send_request("POST", "https://www.beikeisland.com/api/Trade/getTradeRankList",
+                          headers=BeikeIsland_request_header, json=params)
     json_obj = json_loads(source)
     return json_obj
 
@@ -75,16 +77,18 @@ def GetBeikeIslandTradeListJsonDataApi(pageIndex: int, retype: int):
         "pageIndex": pageIndex,
         "retype": retype
     }
-    source = httpx_post("https://www.beikeisland.com/api/Trade/getTradeList",
-                        headers=BeikeIsland_request_header, json=params).content
+    source = send_request("POST", "https://www.beikeisland.com/api/Trade/getTradeList",
+                          headers=BeikeIsland_request_header, json=params)
     json_obj = json_loads(source)
     return json_obj
 
 
 def GetCollectionJsonDataApi(collection_url: str) -> Dict:
     request_url = collection_url.replace("https://www.jianshu.com/c/", "https://www.jianshu.com/asimov/collections/slug/")
-    source = httpx_get(request_url, headers=api_request_header).content
+    source = send_request("GET", request_url, headers=api_request_header)
     json_obj = json_loads(source)
+    IndexPayload(json_obj, "collection")
+    IndexPayload(json_obj, "user", ("owner", ))
     return json_obj
 
 
@@ -93,7 +97,7 @@ def GetCollectionEditorsJsonDataApi(collection_id: int, page: int) -> Dict:
     params = {
         "page": page
     }
-    source = httpx_get(request_url, params=params, headers=api_request_header).content
+    source = send_request("GET", request_url, params=params, headers=api_request_header)
     json_obj = json_loads(source)
     return json_obj
 
@@ -104,9 +108,10 @@ def GetCollectionRecommendedWritersJsonDataApi(collection_id: int, page: int, co
         "page": page,
         "count": count
     }
-    source = httpx_get("https://www.jianshu.com/collections/recommended_users",
-                       params=params, headers=api_request_header).content
+    source = send_request("GET", "https://www.jianshu.com/collections/recommended_users",
+                          params=params, headers=api_request_header)
     json_obj = json_loads(source)
+    IndexPayload(json_obj, "user", ("users", "*"))
     return json_obj
 
 
@@ -115,7 +120,7 @@ def GetCollectionSubscribersJsonDataApi(collection_id: int, max_sort_id: int) ->
     params = {
         "max_sort_id": max_sort_id
     }
-    source = httpx_get(request_url, params=params, headers=api_request_header).content
+    source = send_request("GET", request_url, params=params, headers=api_request_header)
     json_obj = json_loads(source)
     return json_obj
 
@@ -127,14 +132,16 @@ def GetCollectionArticlesJsonDataApi(collection_slug: str, page: int, count: int
         "count": count,
         "order_by": order_by
     }
-    source = httpx_get(request_url, params=params, headers=api_request_header).content
+    source = send_request("GET", request_url, params=params, headers=api_request_header)
     json_obj = json_loads(source)
+    IndexPayload(json_obj, "article", ("*", "object", "data"))
+    IndexPayload(json_obj, "user", ("*", "object", "data", "user"))
     return json_obj
 
 
 def GetIslandJsonDataApi(island_url: str) -> Dict:
     request_url = island_url.replace("https://www.jianshu.com/g/", "https://www.jianshu.com/asimov/groups/")
-    source = httpx_get(request_url, headers=api_request_header).content
+    source = send_request("GET", request_url, headers=api_request_header)
     json_obj = json_loads(source)
     return json_obj
 
@@ -148,15 +155,15 @@ def GetIslandPostsJsonDataApi(group_slug: str, max_id: int,
         "count": count,
         "topic_id": topic_id
     }
-    source = httpx_get("https://www.jianshu.com/asimov/posts",
-                       params=params, headers=api_request_header).content
+    source = send_request("GET", "https://www.jianshu.com/asimov/posts",
+                          params=params, headers=api_request_header)
     json_obj = json_loads(source)
     return json_obj
 
 
 def GetNotebookJsonDataApi(notebook_url: str) -> Dict:
     request_url = notebook_url.replace("https://www.jianshu.com/", "https://www.jianshu.com/asimov/")
-    source = httpx_get(request_url, headers=api_request_header).content
+    source = send_request("GET", request_url, headers=api_request_header)
     json_obj = json_loads(source)
     return json_obj
 
@@ -170,8 +177,10 @@ def GetNotebookArticlesJsonDataApi(notebook_url: str, page: int,
         "count": count,
         "order_by": order_by
     }
-    source = httpx_get(request_url, params=params, headers=api_request_header).content
+    source = send_request("GET", request_url, params=params, headers=api_request_header)
     json_obj = json_loads(source)
+    IndexPayload(json_obj, "article", ("*", "object", "data"))
+    IndexPayload(json_obj, "user", ("*", "object", "data", "user"))
     return json_obj
 
 
@@ -180,13 +189,13 @@ def GetAssetsRankJsonDataApi(max_id: int, since_id: int) -> Dict:
         "max_id": max_id,
         "since_id": since_id
     }
-    source = httpx_get("https://www.jianshu.com/asimov/fp_rankings", params=params, headers=api_request_header).content
+    source = send_request("GET", "https://www.jianshu.com/asimov/fp_rankings", params=params, headers=api_request_header)
     json_obj = json_loads(source)
     return json_obj
 
 
 def GetDailyArticleRankListJsonDataApi() -> Dict:
-    source = httpx_get("https://www.jianshu.com/asimov/daily_activity_participants/rank", headers=api_request_header).content
+    source = send_request("GET", "https://www.jianshu.com/asimov/daily_activity_participants/rank", headers=api_request_header)
     json_obj = json_loads(source)
     return json_obj
 
@@ -196,20 +205,21 @@ def GetArticlesFPRankListJsonDataApi(date: str, type_: Optional[str]) -> Dict:
         "date": date,
         "type": type_
     }
-    source = httpx_get("https://www.jianshu.com/asimov/fp_rankings/voter_notes", params=params, headers=api_request_header).content
+    source = send_request("GET", "https://www.jianshu.com/asimov/fp_rankings/voter_notes", params=params, headers=api_request_header)
     json_obj = json_loads(source)
     return json_obj
 
 
 def GetUserJsonDataApi(user_url: str) -> Dict:
     request_url = user_url.replace("https://www.jianshu.com/u/", "https://www.jianshu.com/asimov/users/slug/")
-    source = httpx_get(request_url, headers=api_request_header).content
+    source = send_request("GET", request_url, headers=api_request_header)
     json_obj = json_loads(source)
+    IndexPayload(json_obj, "user")
     return json_obj
 
 
 def GetUserPCHtmlDataApi(user_url: str) -> _Element:
-    source = httpx_get(user_url, headers=PC_header).content
+    source = send_request("GET", user_url, headers=PC_header)
     html_obj = etree.HTML(source)
     return html_obj
 
@@ -219,8 +229,10 @@ def GetUserCollectionsAndNotebooksJsonDataApi(user_url: str, user_slug: str) ->
     params = {
         "slug": user_slug
     }
-    source = httpx_get(request_url, headers=api_request_header, params=params).content
+    source = send_request("GET", request_url, headers=api_request_header, params=params)
     json_obj = json_loads(source)
+    IndexPayload(json_obj, "collection", ("own_collections", "*"))
+    IndexPayload(json_obj, "collection", ("manageable_collections", "*"))
     return json_obj
 
 
@@ -232,8 +244,10 @@ def GetUserArticlesListJsonDataApi(user_url: str, page: int,
         "count": count,
         "order_by": order_by
     }
-    source = httpx_get(request_url, headers=api_request_header, params=params).content
+    source = send_request("GET", request_url, headers=api_request_header, params=params)
     json_obj = json_loads(source)
+    IndexPayload(json_obj, "article", ("*", "object", "data"))
+    IndexPayload(json_obj, "user", ("*", "object", "data", "user"))
     return json_obj
 
 
@@ -242,7 +256,7 @@ def GetUserFollowingListHtmlDataApi(user_url: str, page: int) -> _Element:
     params = {
         "page": page
     }
-    source = httpx_get(request_url, headers=PC_header, params=params).content
+    source = send_request("GET", request_url, headers=PC_header, params=params)
     html_obj = etree.HTML(source)
     return html_obj
 
@@ -252,21 +266,21 @@ def GetUserFollowersListHtmlDataApi(user_url: str, page: int) -> _Element:
     params = {
         "page": page
     }
-    source = httpx_get(request_url, headers=PC_header, params=params).content
+    source = send_request("GET", request_url, headers=PC_header, params=params)
     html_obj = etree.HTML(source)
     return html_obj
 
 
 def GetUserNextAnniversaryDayHtmlDataApi(user_slug: str) -> _Element:
     request_url = f"https://www.jianshu.com/mobile/u/{user_slug}/anniversary"
-    source = httpx_get(request_url, headers=mobile_header).content
+    source = send_request("GET", request_url, headers=mobile_header)
     html_obj = etree.HTML(source)
     return html_obj
 
 
 def GetIslandPostJsonDataApi(post_slug: str) -> List[Dict]:
     request_url = f"https://www.jianshu.com/asimov/posts/{post_slug}"
-    source = httpx_get(request_url, headers=api_request_header).content
+    source = send_request("GET", request_url, headers=api_request_header)
     json_obj = json_loads(source)
     return json_obj
 
@@ -276,6 +290,6 @@ def GetUserTimelineHtmlDataApi(uslug: str, max_id: int) -> _Element:
     params = {
         "max_id": max_id
     }
-    source = httpx_get(request_url, headers=PC_header, params=params).content
+    source = send_request("GET", request_url, headers=PC_header, params=params)
     html_obj = etree.HTML(source)
     return html_obj
@@ -1,10 +1,10 @@
-from datetime import datetime
 from typing import Dict, List
 
 from .basic_apis import (GetBeikeIslandTradeListJsonDataApi,
                          GetBeikeIslandTradeRankListJsonDataApi)
 from .convert import UserUrlToUserSlug
 from .exceptions import ResourceError
+from .parsers import ParseBeikeIslandTradeListJson
 
 __all__ = [
     "GetBeikeIslandTotalTradeAmount", "GetBeikeIslandTotalTradeCount",
@@ -128,45 +128,7 @@ def GetBeikeIslandTradeOrderInfo(trade_type: str, page: int = 1) -> List[Dict]:
     }[trade_type]
     json_obj = GetBeikeIslandTradeListJsonDataApi(pageIndex=page,
                                                   retype=retype)
-    result = []
-    for item in json_obj["data"]["tradelist"]:
-        item_data = {
-            "trade_id": item["id"],
-            "trade_slug": item["tradeno"],
-            "publish_time": datetime.fromisoformat(item["releasetime"]),
-            "status": {
-                "code": item["statuscode"],
-                "text": item["statustext"]
-            },
-            "trade": {
-                "total": item["recount"],
-                "traded": item["recount"] - item["cantradenum"],
-                "remaining": item["cantradenum"],
-                "minimum_trade_limit": item["minlimit"],
-                "traded_percentage": round(
-                    float(item["compeletper"]) / 100, 3
-                ),
-                "price": item["reprice"],
-            }
-        }
-
-        if item["anonymity"]:
-            item_data["user"] = {
-                "is_anonymity": True
-            }
-        else:
-            item_data["user"] = {
-                "is_anonymity": False,
-                "name": item["reusername"],
-                "avatar_url": item["avatarurl"],
-                "level": {
-                    "code": item["levelnum"],
-                    "text": item["userlevel"]
-                }
-            }
-
-        result.append(item_data)
-    return result
+    return ParseBeikeIslandTradeListJson(json_obj)
 
 
 def GetBeikeIslandTradePrice(trade_type: str, rank: int = 1) -> float:
@@ -0,0 +1,299 @@
+from collections import OrderedDict
+from datetime import date, timedelta
+from re import compile as re_compile
+from threading import Lock
+from time import monotonic
+from typing import (Any, Callable, Dict, Hashable, List, Optional, Pattern,
+                    Tuple, Union)
+
+__all__ = [
+    "TTLCache", "DEFAULT_RESPONSE_TTL_RULES", "set_response_cache_status",
+    "get_response_cache_status", "configure_response_cache",
+    "get_response_cache_stats", "clear_response_cache"
+]
+
+_MISSING: Any = object()  # 用于区分未传入参数、缓存未命中与值为 None 的情况
+
+
+class TTLCache:
+    """带有容量上限与过期时间的线程安全 LRU 缓存
+    """
+    def __init__(self, max_size: int = 1024):
+        """构建新的缓存对象
+
+        Args:
+            max_size (int, optional): 最大缓存条目数，超出后淘汰最久未使用的条目. Defaults to 1024.
+        """
+        self._max_size = max_size
+        self._data: "OrderedDict[Hashable, Tuple[Any, Optional[float]]]" = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def max_size(self) -> int:
+        """获取最大缓存条目数
+
+        Returns:
+            int: 最大缓存条目数
+        """
+        return self._max_size
+
+    @max_size.setter
+    def max_size(self, value: int) -> None:
+        with self._lock:
+            self._max_size = value
+            while len(self._data) > self._max_size:
+                self._data.popitem(last=False)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """获取缓存值，未命中或已过期时返回默认值
+
+        Args:
+            key (Hashable): 缓存键
+            default (Any, optional): 未命中时的返回值. Defaults to None.
+
+        Returns:
+            Any: 缓存值
+        """
+        with self._lock:
+            item = self._data.get(key, _MISSING)
+            if item is not _MISSING:
+                value, expire_time = item
+                if expire_time is None or expire_time > monotonic():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]  # 已过期
+            self.misses += 1
+            return default
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """写入缓存值
+
+        Args:
+            key (Hashable): 缓存键
+            value (Any): 缓存值
+            ttl (Optional[float], optional): 过期时间（秒），为 None 时永不过期. Defaults to None.
+        """
+        if self._max_size <= 0:
+            return
+        expire_time = None if ttl is None else monotonic() + ttl
+        with self._lock:
+            self._data[key] = (value, expire_time)
+            self._data.move_to_end(key)
+            while len(self._data) > self._max_size:
+                self._data.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """使某个缓存条目失效
+
+        Args:
+            key (Hashable): 缓存键
+        """
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """清空缓存与命中统计
+        """
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, Union[int, float]]:
+        """获取缓存统计信息
+
+        Returns:
+            Dict[str, Union[int, float]]: 包含命中次数、未命中次数、命中率与当前条目数
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / total if total else 0.0,
+                "size": len(self._data),
+                "max_size": self._max_size
+            }
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+TTLType = Union[Optional[float], Callable[[str, Optional[Dict[str, Any]]], Optional[float]]]
+
+
+def _VoterNotesRankTTL(url: str, params: Optional[Dict[str, Any]]) -> Optional[float]:
+    """文章收益排行榜的过期时间，两天前的榜单不会再变化，永久缓存
+
+    Args:
+        url (str): 请求 URL
+        params (Optional[Dict[str, Any]]): 查询参数
+
+    Returns:
+        Optional[float]: 过期时间（秒）
+    """
+    target_date = (params or {}).get("date")
+    yesterday = (date.today() - timedelta(days=1)).strftime(r"%Y%m%d")
+    if isinstance(target_date, str) and target_date < yesterday:
+        return None
+    return 600
+
+
+# 按顺序匹配请求 URL，使用第一个匹配的规则，过期时间为 0 时不缓存
+DEFAULT_RESPONSE_TTL_RULES: List[Tuple[str, TTLType]] = [
+    (r"/asimov/fp_rankings/voter_notes", _VoterNotesRankTTL),
+    (r"/asimov/fp_rankings", 60),
+    (r"/asimov/daily_activity_participants/rank", 300),
+    (r"/asimov/users/slug/[^/]+$", 10),
+    (r"/users/[^/]+/(following|followers|timeline)", 30),
+    (r"/u/[^/]+$", 10),
+    (r"/mobile/u/[^/]+/anniversary", 3600),
+    (r"/shakespeare/notes/\d+/comments", 30),
+    (r"beikeisland\.com", 10)
+]
+
+_response_cache = TTLCache(max_size=1024)
+_response_cache_enabled = False  # 默认关闭响应缓存
+_response_cache_default_ttl: Optional[float] = 60
+_response_ttl_rules: List[Tuple[Pattern, TTLType]] = [
+    (re_compile(pattern), ttl) for pattern, ttl in DEFAULT_RESPONSE_TTL_RULES
+]
+
+
+def set_response_cache_status(status: bool) -> None:
+    """设置响应缓存状态
+
+    开启后，相同方法、URL 与参数的请求在过期前只会发送一次
+
+    Args:
+        status (bool): True 为开启，False 为关闭
+    """
+    if not isinstance(status, bool):
+        raise TypeError(f"{status} 不是 bool 类型，而是 {type(status).__name__} 类型")
+
+    global _response_cache_enabled
+    _response_cache_enabled = status
+
+
+def get_response_cache_status() -> bool:
+    """查询响应缓存状态
+
+    Returns:
+        bool: True 为开启，False 为关闭
+    """
+    return _response_cache_enabled
+
+
+def configure_response_cache(max_size: Optional[int] = None,
+                             default_ttl: Union[float, None] = _MISSING,
+                             ttl_rules: Optional[List[Tuple[str, TTLType]]] = None) -> None:
+    """修改响应缓存配置，未传入的配置项保持不变
+
+    Args:
+        max_size (Optional[int], optional): 最大缓存条目数. Defaults to None.
+        default_ttl (Union[float, None], optional): 未匹配任何规则时的过期时间（秒），为 None 时永不过期.
+        ttl_rules (Optional[List[Tuple[str, TTLType]]], optional): 由 (URL 正则表达式, 过期时间) 组成的规则列表，
+        过期时间可以是秒数、None 或接收 (url, params) 并返回过期时间的函数. Defaults to None.
+    """
+    global _response_cache_default_ttl, _response_ttl_rules
+    if max_size is not None:
+        _response_cache.max_size = max_size
+    if default_ttl is not _MISSING:
+        _response_cache_default_ttl = default_ttl
+    if ttl_rules is not None:
+        _response_ttl_rules = [(re_compile(pattern), ttl) for pattern, ttl in ttl_rules]
+
+
+def get_response_cache_stats() -> Dict[str, Union[int, float]]:
+    """获取响应缓存统计信息
+
+    Returns:
+        Dict[str, Union[int, float]]: 包含命中次数、未命中次数、命中率与当前条目数
+    """
+    return _response_cache.stats()
+
+
+def clear_response_cache() -> None:
+    """清空响应缓存
+    """
+    _response_cache.clear()
+
+
+def _FreezeArgs(args: Optional[Dict[str, Any]]) -> Optional[Tuple]:
+    """将参数字典转换为可哈希的元组
+
+    Args:
+        args (Optional[Dict[str, Any]]): 参数字典
+
+    Returns:
+        Optional[Tuple]: 参数元组
+    """
+    if args is None:
+        return None
+    return tuple(sorted(args.items()))
+
+
+def GetRequestKey(method: str, url: str, params: Optional[Dict[str, Any]] = None,
+                  json: Optional[Dict[str, Any]] = None) -> Tuple:
+    """根据请求方法、URL 与参数生成请求标识
+
+    Args:
+        method (str): 请求方法
+        url (str): 请求 URL
+        params (Optional[Dict[str, Any]], optional): 查询参数. Defaults to None.
+        json (Optional[Dict[str, Any]], optional): JSON 请求体. Defaults to None.
+
+    Returns:
+        Tuple: 请求标识
+    """
+    return (method, url, _FreezeArgs(params), _FreezeArgs(json))
+
+
+def GetResponseTTL(url: str, params: Optional[Dict[str, Any]] = None) -> Optional[float]:
+    """根据缓存规则获取响应的过期时间
+
+    Args:
+        url (str): 请求 URL
+        params (Optional[Dict[str, Any]], optional): 查询参数. Defaults to None.
+
+    Returns:
+        Optional[float]: 过期时间（秒），为 None 时永不过期
+    """
+    for pattern, ttl in _response_ttl_rules:
+        if pattern.search(url):
+            return ttl(url, params) if callable(ttl) else ttl
+    return _response_cache_default_ttl
+
+
+def GetCachedResponse(key: Tuple) -> Optional[bytes]:
+    """从响应缓存中读取响应内容，缓存关闭或未命中时返回 None
+
+    Args:
+        key (Tuple): 请求标识
+
+    Returns:
+        Optional[bytes]: 响应内容
+    """
+    if not _response_cache_enabled:
+        return None
+    return _response_cache.get(key)
+
+
+def SetCachedResponse(key: Tuple, url: str, params: Optional[Dict[str, Any]], content: bytes) -> None:
+    """将响应内容写入响应缓存，缓存关闭或过期时间为 0 时不写入
+
+    Args:
+        key (Tuple): 请求标识
+        url (str): 请求 URL
+        params (Optional[Dict[str, Any]]): 查询参数
+        content (bytes): 响应内容
+    """
+    if not _response_cache_enabled:
+        return
+    ttl = GetResponseTTL(url, params)
+    if ttl == 0:
+        return
+    _response_cache.set(key, content, ttl)
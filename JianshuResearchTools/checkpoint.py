@@ -0,0 +1,147 @@
+from abc import ABC, abstractmethod
+from json import dump as json_dump
+from json import load as json_load
+from os import path as os_path
+from os import replace
+from sqlite3 import Connection
+from sqlite3 import connect as sqlite_connect
+from threading import Lock
+from typing import Dict, Optional
+
+__all__ = [
+    "CheckpointStore", "MemoryCheckpointStore", "JsonCheckpointStore",
+    "SQLiteCheckpointStore"
+]
+
+
+class CheckpointStore(ABC):
+    """增量同步检查点存储的基类
+
+    检查点以字符串为键、整数为值，例如以用户 Slug 为键、最后一次同步到的动态 operation_id 为值；
+    子类必须实现 get 与 set 方法
+    """
+    @abstractmethod
+    def get(self, key: str) -> Optional[int]:
+        """读取检查点
+
+        Args:
+            key (str): 键
+
+        Returns:
+            Optional[int]: 检查点，不存在时为 None
+        """
+
+    @abstractmethod
+    def set(self, key: str, value: int) -> None:
+        """写入检查点
+
+        Args:
+            key (str): 键
+            value (int): 检查点
+        """
+
+    def flush(self) -> None:
+        """将尚未保存的检查点写入存储
+        """
+
+    def close(self) -> None:
+        """保存检查点并释放资源
+        """
+        self.flush()
+
+
+class MemoryCheckpointStore(CheckpointStore):
+    """保存在内存中的检查点存储，程序退出后失效
+    """
+    def __init__(self):
+        self._data: Dict[str, int] = {}
+        self._lock = Lock()
+
+    def get(self, key: str) -> Optional[int]:
+        with self._lock:
+            return self._data.get(key)
+
+    def set(self, key: str, value: int) -> None:
+        with self._lock:
+            self._data[key] = value
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class JsonCheckpointStore(MemoryCheckpointStore):
+    """基于 JSON 文件的检查点存储
+
+    检查点较多时每次写入都保存整个文件开销较大，可关闭自动保存，同步完成后调用 flush 一次性写入
+    """
+    def __init__(self, path: str, autosave: bool = True):
+        """打开或创建 JSON 文件
+
+        Args:
+            path (str): JSON 文件路径
+            autosave (bool, optional): 是否在每次写入检查点后立即保存. Defaults to True.
+        """
+        super().__init__()
+        self.path = path
+        self.autosave = autosave
+        self._dirty = False
+        if os_path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                self._data = {key: int(value) for key, value in json_load(f).items()}
+
+    def set(self, key: str, value: int) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._dirty = True
+        if self.autosave:
+            self.flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            if not self._dirty:
+                return
+            # 先写入临时文件再替换，避免写入中断导致文件损坏
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json_dump(self._data, f, ensure_ascii=False)
+            replace(temp_path, self.path)
+            self._dirty = False
+
+
+class SQLiteCheckpointStore(CheckpointStore):
+    """基于 SQLite 的检查点存储，适合检查点较多的场景
+    """
+    def __init__(self, path: str):
+        """打开或创建数据库
+
+        Args:
+            path (str): 数据库文件路径，为 ":memory:" 时使用内存数据库
+        """
+        self.path = path
+        self._lock = Lock()
+        self._connection: Connection = sqlite_connect(path, check_same_thread=False)
+        self._connection.execute("""
+            CREATE TABLE IF NOT EXISTS checkpoints (
+                key TEXT PRIMARY KEY,
+                value INTEGER NOT NULL
+            )
+        """)
+        self._connection.commit()
+
+    def get(self, key: str) -> Optional[int]:
+        with self._lock:
+            row = self._connection.execute("SELECT value FROM checkpoints WHERE key = ?", (key, )).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, value: int) -> None:
+        with self._lock:
+            self._connection.execute("INSERT OR REPLACE INTO checkpoints VALUES (?, ?)", (key, value))
+            self._connection.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM checkpoints").fetchone()[0]
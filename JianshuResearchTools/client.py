@@ -0,0 +1,342 @@
+from asyncio import (AbstractEventLoop, get_running_loop,
+                     run_coroutine_threadsafe)
+from asyncio import sleep as asyncio_sleep
+from threading import Lock
+from time import sleep
+from typing import Any, Callable, Dict, Optional, Union
+
+from httpx import (AsyncClient, AsyncHTTPTransport, Client, HTTPTransport,
+                   Limits, Response, Timeout, TransportError)
+
+from .cache import GetCachedResponse, GetRequestKey, SetCachedResponse
+from .disk_cache import (GetDiskCachedEntry, HandleDiskCacheResponse,
+                         get_disk_cache_status)
+from .exceptions import InputError
+from .ratelimit import AsyncWaitForToken, WaitForToken
+from .retry import (AssertCircuitClosed, GetBackoffTime, GetMaxRetries,
+                    IsRetriable, RaiseForFailure, RecordResult)
+from .singleflight import AsyncSingleFlight, SingleFlight
+
+__all__ = [
+    "JIANSHU_HOST", "BEIKEISLAND_HOST", "configure_client", "get_client_config",
+    "get_client", "close", "send_request", "get_async_client", "aclose",
+    "async_send_request", "get_single_flight_shared_count"
+]
+
+JIANSHU_HOST = "https://www.jianshu.com"
+BEIKEISLAND_HOST = "https://www.beikeisland.com"
+
+_client_config: Dict[str, Any] = {
+    "timeout": 5.0,  # 与 httpx 默认值保持一致
+    "http2": False,
+    "jianshu_max_connections": 20,
+    "jianshu_max_keepalive_connections": 10,
+    "beikeisland_max_connections": 5,
+    "beikeisland_max_keepalive_connections": 2,
+    "keepalive_expiry": 30.0,
+    "single_flight": True,  # 合并并发的相同请求
+    "transport": None  # 自定义传输层，设置后替代默认的连接池
+}
+_client: Optional[Client] = None
+_client_lock = Lock()
+_async_client: Optional[AsyncClient] = None
+_async_client_loop: Optional[AbstractEventLoop] = None  # 异步客户端所属的事件循环
+_single_flight = SingleFlight()
+_async_single_flight = AsyncSingleFlight()
+
+
+def _BuildTransport(max_connections: int, max_keepalive_connections: int,
+                    is_async: bool = False) -> Union[HTTPTransport, AsyncHTTPTransport]:
+    """根据当前配置构建一个拥有独立连接池的传输层
+
+    Args:
+        max_connections (int): 最大连接数
+        max_keepalive_connections (int): 最大保持连接数
+        is_async (bool, optional): 为 True 时构建异步传输层. Defaults to False.
+
+    Returns:
+        Union[HTTPTransport, AsyncHTTPTransport]: 传输层对象
+    """
+    limits = Limits(max_connections=max_connections,
+                    max_keepalive_connections=max_keepalive_connections,
+                    keepalive_expiry=_client_config["keepalive_expiry"])
+    transport_class = AsyncHTTPTransport if is_async else HTTPTransport
+    return transport_class(limits=limits, http2=_client_config["http2"])
+
+
+def _BuildClient(is_async: bool = False) -> Union[Client, AsyncClient]:
+    """根据当前配置构建客户端，简书与贝壳小岛分别使用独立的连接池
+
+    Args:
+        is_async (bool, optional): 为 True 时构建异步客户端. Defaults to False.
+
+    Returns:
+        Union[Client, AsyncClient]: 客户端对象
+    """
+    client_class = AsyncClient if is_async else Client
+    if _client_config["transport"] is not None:
+        return client_class(timeout=Timeout(_client_config["timeout"]), transport=_client_config["transport"])
+
+    mounts = {
+        JIANSHU_HOST: _BuildTransport(_client_config["jianshu_max_connections"],
+                                      _client_config["jianshu_max_keepalive_connections"],
+                                      is_async),
+        BEIKEISLAND_HOST: _BuildTransport(_client_config["beikeisland_max_connections"],
+                                          _client_config["beikeisland_max_keepalive_connections"],
+                                          is_async)
+    }
+    return client_class(timeout=Timeout(_client_config["timeout"]),
+                        http2=_client_config["http2"], mounts=mounts)
+
+
+def _CloseAsyncClientLater(client: Optional[AsyncClient], loop: Optional[AbstractEventLoop]) -> None:
+    """在异步客户端所属的事件循环中关闭客户端，不等待关闭完成
+
+    事件循环已关闭时无法再关闭连接，只能丢弃引用，由垃圾回收释放套接字
+
+    Args:
+        client (Optional[AsyncClient]): 被替换的异步客户端
+        loop (Optional[AbstractEventLoop]): 客户端所属的事件循环
+    """
+    if client is None or loop is None or loop.is_closed():
+        return
+    # 可以在任意线程中调用，事件循环未运行时会在下次运行时关闭
+    run_coroutine_threadsafe(client.aclose(), loop)
+
+
+def configure_client(**kwargs: Any) -> None:
+    """修改网络请求客户端配置
+
+    已创建的客户端会被关闭，新配置在下一次请求时生效
+    配置同时作用于同步客户端与异步客户端
+
+    可用的配置项：timeout、http2、jianshu_max_connections、jianshu_max_keepalive_connections、
+    beikeisland_max_connections、beikeisland_max_keepalive_connections、keepalive_expiry、
+    single_flight（为 True 时，并发的相同请求只会发送一次并共享响应）、
+    transport（自定义传输层，需同时实现 handle_request 与 handle_async_request，例如 RecordTransport 与 ReplayTransport）
+
+    # ! 启用 HTTP/2 需要安装 h2 库
+
+    Raises:
+        InputError: 配置项不存在时抛出此异常
+    """
+    for key in kwargs:
+        if key not in _client_config:
+            raise InputError(f"{key} 不是有效的客户端配置项")
+    global _async_client, _async_client_loop
+    with _client_lock:
+        _client_config.update(kwargs)
+        async_client, async_client_loop = _async_client, _async_client_loop
+        _async_client, _async_client_loop = None, None
+    # 异步客户端只能在其所属的事件循环中关闭
+    _CloseAsyncClientLater(async_client, async_client_loop)
+    close()
+
+
+def get_client_config() -> Dict[str, Any]:
+    """获取当前的网络请求客户端配置
+
+    Returns:
+        Dict[str, Any]: 客户端配置
+    """
+    return _client_config.copy()
+
+
+def get_client() -> Client:
+    """获取共享的网络请求客户端，如果客户端不存在则创建
+
+    Returns:
+        Client: 客户端对象
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:  # 避免多个线程重复创建客户端
+                _client = _BuildClient()
+    return _client
+
+
+def close() -> None:
+    """关闭共享的网络请求客户端，释放所有连接
+
+    关闭后再次发起请求时会自动创建新的客户端
+    """
+    global _client
+    with _client_lock:
+        client, _client = _client, None
+    if client is not None:
+        client.close()
+
+
+def get_single_flight_shared_count() -> int:
+    """获取被合并的并发请求数量
+
+    Returns:
+        int: 同步与异步请求中因合并而未实际发送的请求数量
+    """
+    return _single_flight.shared_count + _async_single_flight.shared_count
+
+
+def send_request(method: str, url: str, headers: Dict[str, str],
+                 params: Optional[Dict[str, Any]] = None,
+                 json: Optional[Dict[str, Any]] = None) -> bytes:
+    """通过共享的客户端发送请求
+
+    依次使用响应缓存与磁盘缓存，GET 请求遇到超时、网络错误或 5xx、429 状态码时会按退避策略重试
+
+    Args:
+        method (str): 请求方法
+        url (str): 请求 URL
+        headers (Dict[str, str]): 请求头
+        params (Optional[Dict[str, Any]], optional): 查询参数. Defaults to None.
+        json (Optional[Dict[str, Any]], optional): JSON 请求体. Defaults to None.
+
+    Raises:
+        APIError: 接口处于熔断状态，或重试次数用尽后状态码仍表示暂时性错误时抛出此异常
+
+    Returns:
+        bytes: 响应内容
+    """
+    key = GetRequestKey(method, url, params, json)
+    content = GetCachedResponse(key)
+    if content is not None:
+        return content
+
+    def DoRequest() -> bytes:
+        entry = GetDiskCachedEntry(key)
+        if entry is not None and entry.is_fresh():
+            SetCachedResponse(key, url, params, entry.content)
+            return entry.content
+        # 磁盘缓存已过期时，使用 ETag / Last-Modified 发送条件请求
+        request_headers = {**headers, **entry.conditional_headers()} if entry is not None else headers
+
+        breaker = AssertCircuitClosed(url)
+        max_retries = GetMaxRetries(method)
+        for attempt in range(max_retries + 1):
+            WaitForToken(url, request_headers)
+            try:
+                result: Union[Response, TransportError] = get_client().request(
+                    method, url, headers=request_headers, params=params, json=json)
+            except TransportError as e:
+                result = e
+            will_retry = attempt < max_retries and IsRetriable(result)
+            RecordResult(breaker, result, will_retry)
+            # 重试期间接口进入熔断状态时，不再继续重试
+            if not will_retry or not breaker.allow_request():
+                break
+            sleep(GetBackoffTime(attempt + 1, result if isinstance(result, Response) else None))
+        RaiseForFailure(url, result)
+
+        content = HandleDiskCacheResponse(key, url, params, result, entry)
+        if result.is_success or result.status_code == 304:
+            SetCachedResponse(key, url, params, content)
+        return content
+
+    if _client_config["single_flight"]:
+        return _single_flight.do(key, DoRequest)
+    return DoRequest()
+
+
+def get_async_client() -> AsyncClient:
+    """获取共享的异步网络请求客户端，如果客户端不存在则创建
+
+    异步客户端与创建它的事件循环绑定，在新的事件循环中调用时会重新创建客户端，
+    旧客户端会在原事件循环中关闭
+
+    Returns:
+        AsyncClient: 异步客户端对象
+    """
+    global _async_client, _async_client_loop
+    loop = get_running_loop()
+    if _async_client is None or _async_client_loop is not loop:
+        if _client_config["transport"] is None:  # 自定义传输层会被新客户端继续使用，不能关闭
+            _CloseAsyncClientLater(_async_client, _async_client_loop)
+        _async_client = _BuildClient(is_async=True)
+        _async_client_loop = loop
+    return _async_client
+
+
+async def aclose() -> None:
+    """关闭共享的异步网络请求客户端，释放所有连接
+
+    关闭后再次发起请求时会自动创建新的客户端
+    """
+    global _async_client, _async_client_loop
+    client, _async_client, _async_client_loop = _async_client, None, None
+    if client is not None:
+        await client.aclose()
+
+
+async def _RunDiskCacheOperation(func: Callable[..., Any], *args: Any) -> Any:
+    """在默认线程池中执行磁盘缓存操作，避免 SQLite 读写阻塞事件循环，磁盘缓存关闭时直接调用
+
+    Args:
+        func (Callable[..., Any]): 磁盘缓存操作
+        *args (Any): 参数
+
+    Returns:
+        Any: 返回值
+    """
+    if not get_disk_cache_status():
+        return func(*args)
+    return await get_running_loop().run_in_executor(None, func, *args)
+
+
+async def async_send_request(method: str, url: str, headers: Dict[str, str],
+                             params: Optional[Dict[str, Any]] = None,
+                             json: Optional[Dict[str, Any]] = None) -> bytes:
+    """通过共享的异步客户端发送请求
+
+    依次使用响应缓存与磁盘缓存，GET 请求遇到超时、网络错误或 5xx、429 状态码时会按退避策略重试
+
+    Args:
+        method (str): 请求方法
+        url (str): 请求 URL
+        headers (Dict[str, str]): 请求头
+        params (Optional[Dict[str, Any]], optional): 查询参数. Defaults to None.
+        json (Optional[Dict[str, Any]], optional): JSON 请求体. Defaults to None.
+
+    Raises:
+        APIError: 接口处于熔断状态，或重试次数用尽后状态码仍表示暂时性错误时抛出此异常
+
+    Returns:
+        bytes: 响应内容
+    """
+    key = GetRequestKey(method, url, params, json)
+    content = GetCachedResponse(key)
+    if content is not None:
+        return content
+
+    async def DoRequest() -> bytes:
+        entry = await _RunDiskCacheOperation(GetDiskCachedEntry, key)
+        if entry is not None and entry.is_fresh():
+            SetCachedResponse(key, url, params, entry.content)
+            return entry.content
+        # 磁盘缓存已过期时，使用 ETag / Last-Modified 发送条件请求
+        request_headers = {**headers, **entry.conditional_headers()} if entry is not None else headers
+
+        breaker = AssertCircuitClosed(url)
+        max_retries = GetMaxRetries(method)
+        for attempt in range(max_retries + 1):
+            await AsyncWaitForToken(url, request_headers)
+            try:
+                result: Union[Response, TransportError] = await get_async_client().request(
+                    method, url, headers=request_headers, params=params, json=json)
+            except TransportError as e:
+                result = e
+            will_retry = attempt < max_retries and IsRetriable(result)
+            RecordResult(breaker, result, will_retry)
+            # 重试期间接口进入熔断状态时，不再继续重试
+            if not will_retry or not breaker.allow_request():
+                break
+            await asyncio_sleep(GetBackoffTime(attempt + 1, result if isinstance(result, Response) else None))
+        RaiseForFailure(url, result)
+
+        content = await _RunDiskCacheOperation(HandleDiskCacheResponse, key, url, params, result, entry)
+        if result.is_success or result.status_code == 304:
+            SetCachedResponse(key, url, params, content)
+        return content
+
+    if _client_config["single_flight"]:
+        return await _async_single_flight.do(key, DoRequest)
+    return await DoRequest()
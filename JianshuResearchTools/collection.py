@@ -1,13 +1,19 @@
 from datetime import datetime
-from typing import Dict, Generator, List
+from math import ceil
+from typing import Dict, Generator, List, Union
 
-from .assert_funcs import AssertCollectionStatusNormal, AssertCollectionUrl
+from .assert_funcs import (AssertCachedStatusNormal,
+                           AssertCollectionJsonDataNormal,
+                           AssertCollectionStatusNormal, AssertCollectionUrl)
 from .basic_apis import (GetCollectionArticlesJsonDataApi,
                          GetCollectionEditorsJsonDataApi,
                          GetCollectionJsonDataApi,
                          GetCollectionRecommendedWritersJsonDataApi,
                          GetCollectionSubscribersJsonDataApi)
 from .convert import CollectionUrlToCollectionSlug
+from .parsers import ParseArticlesListJson
+from .records import ArticleBriefRecord
+from .utils import IterPages
 
 __all__ = [
     "GetCollectionName", "GetCollectionAvatarUrl",
@@ -34,8 +40,10 @@ def GetCollectionName(collection_url: str, disable_check: bool = False) -> str:
     """
     if not disable_check:
         AssertCollectionUrl(collection_url)
-        AssertCollectionStatusNormal(collection_url)
+        AssertCachedStatusNormal(collection_url)
     json_obj = GetCollectionJsonDataApi(collection_url)
+    if not disable_check:
+        AssertCollectionJsonDataNormal(collection_url, json_obj)
     result = json_obj["title"]
     return result
 
@@ -52,8 +60,10 @@ def GetCollectionAvatarUrl(collection_url: str, disable_check: bool = False) ->
     """
     if not disable_check:
         AssertCollectionUrl(collection_url)
-        AssertCollectionStatusNormal(collection_url)
+        AssertCachedStatusNormal(collection_url)
     json_obj = GetCollectionJsonDataApi(collection_url)
+    if not disable_check:
+        AssertCollectionJsonDataNormal(collection_url, json_obj)
     result = json_obj["image"]
     return result
 
@@ -70,8 +80,10 @@ def GetCollectionIntroductionText(collection_url: str, disable_check: bool = Fal
     """
     if not disable_check:
         AssertCollectionUrl(collection_url)
-        AssertCollectionStatusNormal(collection_url)
+        AssertCachedStatusNormal(collection_url)
     json_obj = GetCollectionJsonDataApi(collection_url)
+    if not disable_check:
+        AssertCollectionJsonDataNormal(collection_url, json_obj)
     result = json_obj["content_without_html"]
     return result
 
@@ -88,8 +100,10 @@ def GetCollectionIntroductionHtml(collection_url: str, disable_check: bool = Fal
     """
     if not disable_check:
         AssertCollectionUrl(collection_url)
-        AssertCollectionStatusNormal(collection_url)
+        AssertCachedStatusNormal(collection_url)
     json_obj = GetCollectionJsonDataApi(collection_url)
+    if not disable_check:
+        AssertCollectionJsonDataNormal(collection_url, json_obj)
     result = json_obj["content_in_full"]
     return result
 
@@ -106,8 +120,10 @@ def GetCollectionArticlesCount(collection_url: str, disable_check: bool = False)
     """
     if not disable_check:
         AssertCollectionUrl(collection_url)
-        AssertCollectionStatusNormal(collection_url)
+        AssertCachedStatusNormal(collection_url)
     json_obj = GetCollectionJsonDataApi(collection_url)
+    if not disable_check:
+        AssertCollectionJsonDataNormal(collection_url, json_obj)
     result = json_obj["notes_count"]
     return result
 
@@ -124,8 +140,10 @@ def GetCollectionSubscribersCount(collection_url: str, disable_check: bool = Fal
     """
     if not disable_check:
         AssertCollectionUrl(collection_url)
-        AssertCollectionStatusNormal(collection_url)
+        AssertCachedStatusNormal(collection_url)
     json_obj = GetCollectionJsonDataApi(collection_url)
+    if not disable_check:
+        AssertCollectionJsonDataNormal(collection_url, json_obj)
     result = json_obj["subscribers_count"]
     return result
 
@@ -142,8 +160,10 @@ def GetCollectionArticlesUpdateTime(collection_url: str, disable_check: bool = F
     """
     if not disable_check:
         AssertCollectionUrl(collection_url)
-        AssertCollectionStatusNormal(collection_url)
+        AssertCachedStatusNormal(collection_url)
     json_obj = GetCollectionJsonDataApi(collection_url)
+    if not disable_check:
+        AssertCollectionJsonDataNormal(collection_url, json_obj)
     result = datetime.fromtimestamp(json_obj["newly_added_at"])
     return result
 
@@ -160,8 +180,10 @@ def GetCollectionInformationUpdateTime(collection_url: str, disable_check: bool
     """
     if not disable_check:
         AssertCollectionUrl(collection_url)
-        AssertCollectionStatusNormal(collection_url)
+        AssertCachedStatusNormal(collection_url)
     json_obj = GetCollectionJsonDataApi(collection_url)
+    if not disable_check:
+        AssertCollectionJsonDataNormal(collection_url, json_obj)
     result = datetime.fromtimestamp(json_obj["last_updated_at"])
     return result
 
@@ -178,8 +200,10 @@ def GetCollectionOwnerInfo(collection_url: str, disable_check: bool = False) ->
     """
     if not disable_check:
         AssertCollectionUrl(collection_url)
-        AssertCollectionStatusNormal(collection_url)
+        AssertCachedStatusNormal(collection_url)
     json_obj = GetCollectionJsonDataApi(collection_url)
+    if not disable_check:
+        AssertCollectionJsonDataNormal(collection_url, json_obj)
     result = {
         "uid": json_obj["owner"]["id"],
         "name": json_obj["owner"]["nickname"],
@@ -263,7 +287,8 @@ def GetCollectionSubscribersInfo(collection_id: int, start_sort_id: int = None)
 
 def GetCollectionArticlesInfo(collection_url: str, page: int = 1,
                               count: int = 10, sorting_method: str = "time",
-                              disable_check: bool = False) -> List[Dict]:
+                              disable_check: bool = False,
+                              as_record: bool = False) -> List[Union[Dict, ArticleBriefRecord]]:
     """获取专题文章信息
 
     Args:
@@ -273,6 +298,7 @@ def GetCollectionArticlesInfo(collection_url: str, page: int = 1,
         sorting_method (str, optional): 排序方法，"time" 为按照发布时间排序，
         "comment_time" 为按照最近评论时间排序，"hot" 为按照热度排序. Defaults to "time".
         disable_check (bool): 禁用参数有效性检查. Defaults to False.
+        as_record (bool, optional): 为 True 时返回 ArticleBriefRecord 而不是字典，占用内存更少，可通过 to_dict 方法转换为字典. Defaults to False.
 
     Returns:
         List[Dict]: 文章信息
@@ -287,31 +313,9 @@ def GetCollectionArticlesInfo(collection_url: str, page: int = 1,
     }[sorting_method]
     json_obj = GetCollectionArticlesJsonDataApi(CollectionUrlToCollectionSlug(collection_url),
                                                 page=page, count=count, order_by=order_by)
-    result = []
-    for item in json_obj:
-        item_data = {
-            "aid": item["object"]["data"]["id"],
-            "title": item["object"]["data"]["title"],
-            "aslug": item["object"]["data"]["slug"],
-            "release_time": datetime.fromisoformat(item["object"]["data"]["first_shared_at"]),
-            "first_image_url": item["object"]["data"]["list_image_url"],
-            "summary": item["object"]["data"]["public_abbr"],
-            "views_count": item["object"]["data"]["views_count"],
-            "likes_count": item["object"]["data"]["likes_count"],
-            "paid": item["object"]["data"]["paid"],
-            "commentable": item["object"]["data"]["commentable"],
-            "user": {
-                "uid": item["object"]["data"]["user"]["id"],
-                "name": item["object"]["data"]["user"]["nickname"],
-                "uslug": item["object"]["data"]["user"]["slug"],
-                "avatar_url": item["object"]["data"]["user"]["avatar"]
-            },
-            "total_fp_amount": item["object"]["data"]["total_fp_amount"] / 1000,
-            "comments_count": item["object"]["data"]["public_comments_count"],
-            "rewards_count": item["object"]["data"]["total_rewards_count"]
-        }
-        result.append(item_data)
-    return result
+    if as_record:
+        return [ArticleBriefRecord.from_json(item["object"]["data"], with_is_top=False) for item in json_obj]
+    return ParseArticlesListJson(json_obj, with_is_top=False)
 
 
 def GetCollectionAllBasicData(collection_url: str, disable_check: bool = False) -> Dict:
@@ -326,9 +330,11 @@ def GetCollectionAllBasicData(collection_url: str, disable_check: bool = False)
     """
     if not disable_check:
         AssertCollectionUrl(collection_url)
-        AssertCollectionStatusNormal(collection_url)
+        AssertCachedStatusNormal(collection_url)
     result = {}
     json_obj = GetCollectionJsonDataApi(collection_url)
+    if not disable_check:
+        AssertCollectionJsonDataNormal(collection_url, json_obj)
 
     result["name"] = json_obj["title"]
     result["avatar_url"] = json_obj["image"]
@@ -346,57 +352,35 @@ def GetCollectionAllBasicData(collection_url: str, disable_check: bool = False)
     return result
 
 
-def GetCollectionAllEditorsInfo(collection_id: int, max_count: int = None) -> Generator[Dict, None, None]:
+def GetCollectionAllEditorsInfo(collection_id: int, max_count: int = None, prefetch: int = 0) -> Generator[Dict, None, None]:
     """获取专题的所有编辑信息
 
     Args:
         collection_id (int): 专题 ID
         max_count (int, optional): 获取的专题编辑信息数量上限，Defaults to None.
+        prefetch (int, optional): 预取页数，大于 0 时会在后台并发获取后续页面. Defaults to 0.
 
     Yields:
         Iterator[Dict], None, None]: 编辑信息
     """
-    page = 1
-    now_count = 0
-    while True:
-        result = GetCollectionEditorsInfo(collection_id, page)
-        if result:
-            page += 1
-        else:
-            return
-        for item in result:
-            yield item
-            if max_count:
-                now_count += 1
-                if now_count == max_count:
-                    return
+    yield from IterPages(lambda page: GetCollectionEditorsInfo(collection_id, page), prefetch, max_count=max_count)
 
 
-def GetCollectionAllRecommendedWritersInfo(collection_id: int, count: int = 20, max_count: int = None) -> Generator[Dict, None, None]:
+def GetCollectionAllRecommendedWritersInfo(collection_id: int, count: int = 20, max_count: int = None,
+                                           prefetch: int = 0) -> Generator[Dict, None, None]:
     """获取专题的所有推荐作者信息
 
     Args:
         collection_id (int): 专题 ID
         count (int, optional): 单次获取的数据数量，会影响性能. Defaults to 20.
         max_count (int, optional): 获取的专题推荐作者信息数量上限，Defaults to None.
+        prefetch (int, optional): 预取页数，大于 0 时会在后台并发获取后续页面. Defaults to 0.
 
     Yields:
         Iterator[Dict], None, None]: 推荐作者信息
     """
-    page = 1
-    now_count = 0
-    while True:
-        result = GetCollectionRecommendedWritersInfo(collection_id, page, count)
-        if result:
-            page += 1
-        else:
-            return
-        for item in result:
-            yield item
-            if max_count:
-                now_count += 1
-                if now_count == max_count:
-                    return
+    yield from IterPages(lambda page: GetCollectionRecommendedWritersInfo(collection_id, page, count),
+                         prefetch, max_count=max_count)
 
 
 def GetCollectionAllSubscribersInfo(collection_id: int, max_count: int = None) -> Generator[Dict, None, None]:
@@ -427,7 +411,8 @@ def GetCollectionAllSubscribersInfo(collection_id: int, max_count: int = None) -
 
 def GetCollectionAllArticlesInfo(collection_url: str, count: int = 10,
                                  sorting_method: str = "time", max_count: int = None,
-                                 disable_check: bool = False) -> Generator[Dict, None, None]:
+                                 disable_check: bool = False, prefetch: int = 0,
+                                 as_record: bool = False) -> Generator[Union[Dict, ArticleBriefRecord], None, None]:
     """获取专题的所有文章信息
 
     Args:
@@ -437,24 +422,23 @@ def GetCollectionAllArticlesInfo(collection_url: str, count: int = 10,
         "comment_time" 为按照最近评论时间排序，"hot" 为按照热度排序. Defaults to "time".
         max_count (int, optional): 获取的专题文章信息数量上限，Defaults to None.
         disable_check (bool): 禁用参数有效性检查. Defaults to False.
+        prefetch (int, optional): 预取页数，大于 0 时会在后台并发获取后续页面. Defaults to 0.
+        as_record (bool, optional): 为 True 时返回 ArticleBriefRecord 而不是字典，占用内存更少，可通过 to_dict 方法转换为字典. Defaults to False.
 
     Yields:
         Iterator[Dict], None, None]: 文章信息
     """
     if not disable_check:
         AssertCollectionUrl(collection_url)
+        AssertCachedStatusNormal(collection_url)
+    total_pages = None
+    if prefetch:  # 根据专题文章数计算总页数，以便并发获取全部页面
+        json_obj = GetCollectionJsonDataApi(collection_url)
+        if not disable_check:
+            AssertCollectionJsonDataNormal(collection_url, json_obj)
+        total_pages = ceil(min(json_obj["notes_count"], max_count or json_obj["notes_count"]) / count)
+    elif not disable_check:
         AssertCollectionStatusNormal(collection_url)
-    page = 1
-    now_count = 0
-    while True:
-        result = GetCollectionArticlesInfo(collection_url, page, count, sorting_method, disable_check=True)
-        if result:
-            page += 1
-        else:
-            return
-        for item in result:
-            yield item
-            if max_count:
-                now_count += 1
-                if now_count == max_count:
-                    return
+    yield from IterPages(lambda page: GetCollectionArticlesInfo(collection_url, page, count, sorting_method, disable_check=True,
+                                                                as_record=as_record),
+                         prefetch, total_pages, max_count)
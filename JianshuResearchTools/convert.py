@@ -1,9 +1,15 @@
-from .assert_funcs import (AssertArticleStatusNormal, AssertArticleUrl,
+from typing import Callable, Generator, Iterable, List, Optional, Tuple, Union
+
+from .assert_funcs import (JIANSHU_URL_CLASSIFY_REGEX,
+                           AssertArticleJsonDataNormal, AssertArticleUrl,
                            AssertCollectionUrl, AssertIslandPostUrl,
                            AssertIslandUrl, AssertNotebookUrl, AssertType,
-                           AssertUserUrl)
+                           AssertUserJsonDataNormal, AssertUserUrl)
 from .basic_apis import (GetArticleJsonDataApi, GetCollectionJsonDataApi,
                          GetUserJsonDataApi)
+from .exceptions import InputError
+from .slug_index import GetIndexedId
+from .utils import BatchCall
 
 __all__ = [
     "UserUrlToUserId", "UserSlugToUserId", "UserUrlToUserSlug",
@@ -14,9 +20,13 @@ __all__ = [
     "IslandUrlToIslandSlug", "IslandSlugToIslandUrl", "UserUrlToUserUrlScheme",
     "ArticleUrlToArticleUrlScheme", "NotebookUrlToNotebookUrlScheme",
     "CollectionUrlToCollectionUrlScheme", "IslandPostUrlToIslandPostSlug",
-    "IslandPostSlugToIslandPostUrl"
+    "IslandPostSlugToIslandPostUrl", "ClassifyJianshuUrl", "ClassifyJianshuUrls",
+    "UserUrlsToUserIds", "UserSlugsToUserIds", "ArticleUrlsToArticleIds",
+    "ArticleSlugsToArticleIds"
 ]
 
+_RESOURCE_TYPE_TO_NAME = {"user": "简书用户主页", "article": "简书文章"}
+
 
 def UserUrlToUserId(user_url: str) -> int:
     """用户个人主页 URL 转用户 ID
@@ -24,13 +34,19 @@ def UserUrlToUserId(user_url: str) -> int:
     Args:
         user_url (str): 用户个人主页 URL
 
+    Raises:
+        ResourceError: 用户账号状态异常时抛出此错误
+
     Returns:
         int: 用户 ID
     """
     AssertType(user_url, str)
     AssertUserUrl(user_url)
-    json_obj = GetUserJsonDataApi(user_url)
-    result = json_obj["id"]
+    result = GetIndexedId("user", UserUrlToUserSlug(user_url))
+    if result is None:
+        json_obj = GetUserJsonDataApi(user_url)
+        AssertUserJsonDataNormal(user_url, json_obj)
+        result = json_obj["id"]
     return result
 
 
@@ -114,12 +130,19 @@ def ArticleSlugToArticleId(article_slug: str) -> int:
     Args:
         article_slug (str): 文章 Slug
 
+    Raises:
+        ResourceError: 文章状态异常时抛出此错误
+
     Returns:
         int: 文章 ID
     """
     AssertType(article_slug, str)
-    json_obj = GetArticleJsonDataApi(ArticleSlugToArticleUrl(article_slug))
-    result = json_obj["id"]
+    article_url = ArticleSlugToArticleUrl(article_slug)
+    result = GetIndexedId("article", article_slug)
+    if result is None:
+        json_obj = GetArticleJsonDataApi(article_url)
+        AssertArticleJsonDataNormal(article_url, json_obj)
+        result = json_obj["id"]
     return result
 
 
@@ -134,9 +157,11 @@ def ArticleUrlToArticleId(article_url: str) -> int:
     """
     AssertType(article_url, str)
     AssertArticleUrl(article_url)
-    AssertArticleStatusNormal(article_url)
-    json_obj = GetArticleJsonDataApi(article_url)
-    result = json_obj["id"]
+    result = GetIndexedId("article", ArticleUrlToArticleSlug(article_url))
+    if result is None:
+        json_obj = GetArticleJsonDataApi(article_url)
+        AssertArticleJsonDataNormal(article_url, json_obj)
+        result = json_obj["id"]
     return result
 
 
@@ -225,7 +250,9 @@ def CollectionUrlToCollectionId(collection_url: str) -> int:
     """
     AssertType(collection_url, str)
     AssertCollectionUrl(collection_url)
-    result = GetCollectionJsonDataApi(collection_url)["id"]
+    result = GetIndexedId("collection", CollectionUrlToCollectionSlug(collection_url))
+    if result is None:
+        result = GetCollectionJsonDataApi(collection_url)["id"]
     return result
 
 
@@ -342,3 +369,166 @@ def IslandPostSlugToIslandPostUrl(post_slug: str) -> str:
     result = f"https://www.jianshu.com/gp/{post_slug}"
     AssertIslandPostUrl(result)
     return result
+
+
+def ClassifyJianshuUrl(url: str) -> Optional[Tuple[str, str]]:
+    """判断 URL 对应的资源类型，并提取其 Slug
+
+    只进行一次正则匹配，适用于从大量文本中筛选简书链接
+    资源类型为 "user"、"article"、"notebook"、"collection"、"island" 或 "island_post"，文集的 Slug 即为文集 ID
+
+    Args:
+        url (str): URL
+
+    Returns:
+        Optional[Tuple[str, str]]: (资源类型, Slug)，不是有效的简书资源 URL 时为 None
+    """
+    AssertType(url, str)
+    match = JIANSHU_URL_CLASSIFY_REGEX.fullmatch(url)
+    if match is None:
+        return None
+    return match.lastgroup, match.group(match.lastgroup)
+
+
+def ClassifyJianshuUrls(urls: Iterable[str]) -> Generator[Optional[Tuple[str, str]], None, None]:
+    """批量判断 URL 对应的资源类型，并提取其 Slug
+
+    不检查参数类型，每个 URL 只进行一次正则匹配；与逐个尝试各资源类型的正则相比约快 1.8 至 2 倍，
+    其中大部分耗时来自正则匹配本身，可使用 benchmark_classify.py 测量
+
+    Args:
+        urls (Iterable[str]): URL 列表
+
+    Yields:
+        Iterator[Optional[Tuple[str, str]], None, None]: 按输入顺序返回 (资源类型, Slug)，不是有效的简书资源 URL 时为 None
+    """
+    fullmatch = JIANSHU_URL_CLASSIFY_REGEX.fullmatch  # 避免循环中重复查找属性
+    for url in urls:
+        match = fullmatch(url)
+        if match is None:
+            yield None
+        else:
+            lastgroup = match.lastgroup
+            yield lastgroup, match.group(lastgroup)
+
+
+def _UrlsToSlugs(urls: Iterable[str], resource_type: str) -> List[str]:
+    """一次性检查所有 URL 并提取 Slug
+
+    Args:
+        urls (Iterable[str]): URL 列表
+        resource_type (str): 资源类型
+
+    Raises:
+        InputError: 存在无效 URL 时抛出此错误，此时不会发送任何请求
+
+    Returns:
+        List[str]: Slug 列表
+    """
+    result = []
+    fullmatch = JIANSHU_URL_CLASSIFY_REGEX.fullmatch
+    for url in urls:
+        AssertType(url, str)
+        match = fullmatch(url)
+        if match is None or match.lastgroup != resource_type:
+            raise InputError(f"{url} 不是有效的{_RESOURCE_TYPE_TO_NAME[resource_type]} URL")
+        result.append(match.group(resource_type))
+    return result
+
+
+def _SlugsToIds(slugs: List[str], resource_type: str, func: Callable[[str], int],
+                concurrency: int) -> List[Union[int, Exception]]:
+    """批量将 Slug 转换为 ID，优先从索引中查找，其余的并发请求
+
+    Args:
+        slugs (List[str]): Slug 列表
+        resource_type (str): 资源类型
+        func (Callable[[str], int]): 单个 Slug 的转换函数
+        concurrency (int): 最大并发数
+
+    Returns:
+        List[Union[int, Exception]]: 按输入顺序排列的 ID 或异常对象
+    """
+    result = {}
+    pending = []
+    for slug in dict.fromkeys(slugs):  # 去除重复的 Slug，保持顺序
+        resource_id = GetIndexedId(resource_type, slug)
+        if resource_id is None:
+            pending.append(slug)
+        else:
+            result[slug] = resource_id
+    if pending:
+        result.update(BatchCall(func, pending, concurrency, ordered=False))
+    return [result[slug] for slug in slugs]
+
+
+def UserUrlsToUserIds(user_urls: Iterable[str], concurrency: int = 32) -> List[Union[int, Exception]]:
+    """批量将用户个人主页 URL 转换为用户 ID
+
+    单个用户转换失败时不会中断其它用户的转换，资源异常、接口受限与网络错误会以异常对象的形式返回
+
+    Args:
+        user_urls (Iterable[str]): 用户个人主页 URL 列表
+        concurrency (int, optional): 最大并发数. Defaults to 32.
+
+    Returns:
+        List[Union[int, Exception]]: 按输入顺序排列的用户 ID 或异常对象
+    """
+    return _SlugsToIds(_UrlsToSlugs(user_urls, "user"), "user",
+                       lambda user_slug: UserUrlToUserId(UserSlugToUserUrl(user_slug)), concurrency)
+
+
+def UserSlugsToUserIds(user_slugs: Iterable[str], concurrency: int = 32) -> List[Union[int, Exception]]:
+    """批量将用户 Slug 转换为用户 ID
+
+    单个用户转换失败时不会中断其它用户的转换，资源异常、接口受限与网络错误会以异常对象的形式返回
+
+    Args:
+        user_slugs (Iterable[str]): 用户 Slug 列表
+        concurrency (int, optional): 最大并发数. Defaults to 32.
+
+    Returns:
+        List[Union[int, Exception]]: 按输入顺序排列的用户 ID 或异常对象
+    """
+    user_urls = []
+    for user_slug in user_slugs:
+        AssertType(user_slug, str)
+        user_urls.append(f"https://www.jianshu.com/u/{user_slug}")
+    return UserUrlsToUserIds(user_urls, concurrency)
+
+
+def ArticleUrlsToArticleIds(article_urls: Iterable[str], concurrency: int = 32) -> List[Union[int, Exception]]:
+    """批量将文章 URL 转换为文章 ID
+
+    单篇文章转换失败时不会中断其它文章的转换，资源异常、接口受限与网络错误会以异常对象的形式返回
+
+    Args:
+        article_urls (Iterable[str]): 文章 URL 列表
+        concurrency (int, optional): 最大并发数. Defaults to 32.
+
+    Returns:
+        List[Union[int, Exception]]: 按输入顺序排列的文章 ID 或异常对象
+    """
+    return _SlugsToIds(_UrlsToSlugs(article_urls, "article"), "article",
+                       lambda article_slug: ArticleUrlToArticleId(ArticleSlugToArticleUrl(article_slug)),
+                       concurrency)
+
+
+def ArticleSlugsToArticleIds(article_slugs: Iterable[str],
+                             concurrency: int = 32) -> List[Union[int, Exception]]:
+    """批量将文章 Slug 转换为文章 ID
+
+    单篇文章转换失败时不会中断其它文章的转换，资源异常、接口受限与网络错误会以异常对象的形式返回
+
+    Args:
+        article_slugs (Iterable[str]): 文章 Slug 列表
+        concurrency (int, optional): 最大并发数. Defaults to 32.
+
+    Returns:
+        List[Union[int, Exception]]: 按输入顺序排列的文章 ID 或异常对象
+    """
+    article_urls = []
+    for article_slug in article_slugs:
+        AssertType(article_slug, str)
+        article_urls.append(f"https://www.jianshu.com/p/{article_slug}")
+    return ArticleUrlsToArticleIds(article_urls, concurrency)
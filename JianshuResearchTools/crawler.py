@@ -0,0 +1,168 @@
+from hashlib import blake2b
+from math import ceil, log
+from typing import Any, Dict, Iterable, List, Optional
+
+from .assert_funcs import AssertUserUrl
+from .convert import UserSlugToUserUrl, UserUrlToUserSlug
+from .exceptions import InputError
+from .user import GetUserAllFansInfo, GetUserAllFollowingInfo
+from .utils import BATCH_CALL_ERRORS, BatchCall
+
+__all__ = ["BloomFilter", "CRAWL_DIRECTIONS", "CrawlUserGraph"]
+
+# following 为获取用户的关注列表，fans 为获取用户的粉丝列表，both 为同时获取
+CRAWL_DIRECTIONS = ("following", "fans", "both")
+
+
+class BloomFilter:
+    """布隆过滤器，用于以较小的内存记录大量字符串
+
+    判断为不存在的元素一定未被添加过，判断为存在的元素有较小的概率未被添加过
+    """
+    def __init__(self, capacity: int = 1000000, error_rate: float = 0.001):
+        """构建新的布隆过滤器
+
+        Args:
+            capacity (int, optional): 预计添加的元素数量. Defaults to 1000000.
+            error_rate (float, optional): 添加的元素数量不超过 capacity 时的误判率. Defaults to 0.001.
+        """
+        if capacity <= 0 or not 0 < error_rate < 1:
+            raise InputError("capacity 必须大于 0，error_rate 必须在 0 到 1 之间")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.bits_count = ceil(-capacity * log(error_rate) / (log(2) ** 2))
+        self.hashes_count = max(1, round(self.bits_count / capacity * log(2)))
+        self._bits = bytearray(ceil(self.bits_count / 8))
+        self._count = 0
+
+    def _GetIndexes(self, item: str) -> List[int]:
+        """计算元素对应的比特位置，使用两个哈希值的线性组合模拟多个哈希函数
+
+        Args:
+            item (str): 元素
+
+        Returns:
+            List[int]: 比特位置
+        """
+        digest = blake2b(item.encode("utf-8"), digest_size=16).digest()
+        hash1 = int.from_bytes(digest[:8], "little")
+        hash2 = int.from_bytes(digest[8:], "little") | 1
+        return [(hash1 + i * hash2) % self.bits_count for i in range(self.hashes_count)]
+
+    def add(self, item: str) -> bool:
+        """添加元素
+
+        Args:
+            item (str): 元素
+
+        Returns:
+            bool: 元素此前不存在时为 True
+        """
+        added = False
+        for index in self._GetIndexes(item):
+            mask = 1 << (index & 7)
+            if not self._bits[index >> 3] & mask:
+                self._bits[index >> 3] |= mask
+                added = True
+        if added:
+            self._count += 1
+        return added
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[index >> 3] & (1 << (index & 7)) for index in self._GetIndexes(item))
+
+    def __len__(self) -> int:
+        """已添加的元素数量，存在误判时会略小于实际值
+        """
+        return self._count
+
+
+def _GetNeighbors(user_slug: str, direction: str, max_count: Optional[int]) -> Dict[str, List[str]]:
+    """获取用户的关注者与粉丝的 Slug
+
+    Args:
+        user_slug (str): 用户 Slug
+        direction (str): 获取方向
+        max_count (Optional[int]): 每个列表获取的用户数量上限
+
+    Returns:
+        Dict[str, List[str]]: 键为 following 或 fans，值为对应列表中的用户 Slug
+    """
+    user_url = UserSlugToUserUrl(user_slug)
+    result = {}
+    if direction in ("following", "both"):
+        result["following"] = [item["uslug"] for item in GetUserAllFollowingInfo(user_url, max_count, disable_check=True)]
+    if direction in ("fans", "both"):
+        result["fans"] = [item["uslug"] for item in GetUserAllFansInfo(user_url, max_count, disable_check=True)]
+    return result
+
+
+def CrawlUserGraph(seed_urls: Iterable[str], edges_path: str, max_depth: int = 1, direction: str = "following",
+                   concurrency: int = 8, max_count_per_user: Optional[int] = None,
+                   visited: Optional[Any] = None, disable_check: bool = False) -> Dict[str, int]:
+    """从种子用户开始广度优先抓取用户关注关系
+
+    同一层的用户并发获取，每获取完一个用户就将关注关系写入文件，不会在内存中保存整个图；
+    边文件每行为一条 “关注者 Slug<Tab>被关注者 Slug”，direction 为 both 时同一条边可能出现两次
+
+    Args:
+        seed_urls (Iterable[str]): 种子用户个人主页 URL
+        edges_path (str): 边文件路径，已存在时会被覆盖
+        max_depth (int, optional): 抓取深度，为 1 时只获取种子用户的列表. Defaults to 1.
+        direction (str, optional): following 为获取关注列表，fans 为获取粉丝列表，both 为同时获取. Defaults to "following".
+        concurrency (int, optional): 最大并发数. Defaults to 8.
+        max_count_per_user (Optional[int], optional): 每个列表获取的用户数量上限，为 None 时获取全部. Defaults to None.
+        visited (Optional[Any], optional): 记录已发现用户的集合，需支持 add 与 in 操作，
+        为 None 时使用容量为一百万的 BloomFilter. Defaults to None.
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Raises:
+        InputError: direction 或 max_depth 无效时抛出此错误
+
+    Returns:
+        Dict[str, int]: 包含已抓取用户数、已发现用户数、边数与获取失败的用户数
+    """
+    if direction not in CRAWL_DIRECTIONS:
+        raise InputError(f"不支持的抓取方向 {direction}，可用方向为 {'、'.join(CRAWL_DIRECTIONS)}")
+    if max_depth < 1:
+        raise InputError("max_depth 必须大于等于 1")
+    seed_urls = list(seed_urls)
+    if not disable_check:
+        for seed_url in seed_urls:
+            AssertUserUrl(seed_url)
+    if visited is None:
+        visited = BloomFilter()
+
+    frontier: List[str] = []
+    for seed_url in seed_urls:
+        user_slug = UserUrlToUserSlug(seed_url)
+        if user_slug not in visited:
+            visited.add(user_slug)
+            frontier.append(user_slug)
+    stats = {"crawled_users_count": 0, "found_users_count": len(frontier), "edges_count": 0, "failed_users_count": 0}
+
+    # 分批提交任务，避免单层用户过多时一次性创建大量任务
+    batch_size = concurrency * 16
+    with open(edges_path, "w", encoding="utf-8") as f:
+        for depth in range(1, max_depth + 1):
+            next_frontier: List[str] = []
+            for start in range(0, len(frontier), batch_size):
+                batch = frontier[start:start + batch_size]
+                for user_slug, result in BatchCall(lambda x: _GetNeighbors(x, direction, max_count_per_user),
+                                                   batch, concurrency, ordered=False):
+                    if isinstance(result, BATCH_CALL_ERRORS):
+                        stats["failed_users_count"] += 1
+                        continue
+                    stats["crawled_users_count"] += 1
+                    following, fans = result.get("following", []), result.get("fans", [])
+                    f.writelines(f"{user_slug}\t{target}\n" for target in following)
+                    f.writelines(f"{source}\t{user_slug}\n" for source in fans)
+                    stats["edges_count"] += len(following) + len(fans)
+                    for neighbor in following + fans:
+                        if neighbor not in visited:
+                            visited.add(neighbor)
+                            stats["found_users_count"] += 1
+                            if depth < max_depth:  # 最后一层发现的用户不会被继续抓取
+                                next_frontier.append(neighbor)
+            frontier = next_frontier
+    return stats
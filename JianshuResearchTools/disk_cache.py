@@ -0,0 +1,308 @@
+from sqlite3 import Connection
+from sqlite3 import connect as sqlite_connect
+from threading import Lock
+from time import time
+from typing import Any, Dict, NamedTuple, Optional, Tuple, Union
+
+from httpx import Response
+
+from .cache import GetResponseTTL
+
+__all__ = [
+    "DiskCache", "DiskCacheEntry", "set_disk_cache_status",
+    "get_disk_cache_status", "get_disk_cache_stats", "clear_disk_cache"
+]
+
+DEFAULT_DISK_CACHE_PATH = "jrt_response_cache.db"
+
+
+class DiskCacheEntry(NamedTuple):
+    """磁盘缓存条目
+    """
+    content: bytes
+    etag: Optional[str]
+    last_modified: Optional[str]
+    stored_time: float
+    ttl: Optional[float]
+
+    def is_fresh(self) -> bool:
+        """判断缓存条目是否仍在有效期内
+
+        Returns:
+            bool: 是否在有效期内
+        """
+        return self.ttl is None or self.stored_time + self.ttl > time()
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """获取用于条件请求的请求头
+
+        Returns:
+            Dict[str, str]: 包含 If-None-Match 与 If-Modified-Since 的请求头，没有验证信息时为空
+        """
+        result = {}
+        if self.etag:
+            result["If-None-Match"] = self.etag
+        if self.last_modified:
+            result["If-Modified-Since"] = self.last_modified
+        return result
+
+
+class DiskCache:
+    """基于 SQLite 的持久化响应缓存
+
+    保存响应内容、写入时间与 ETag / Last-Modified，过期后可通过条件请求重新验证
+    关闭后读取操作视为未命中，写入操作不进行任何操作，正在进行的请求不会因缓存被关闭而出错
+    """
+    def __init__(self, path: str = DEFAULT_DISK_CACHE_PATH):
+        """打开或创建缓存数据库
+
+        Args:
+            path (str, optional): 数据库文件路径，为 ":memory:" 时使用内存数据库. Defaults to DEFAULT_DISK_CACHE_PATH.
+        """
+        self.path = path
+        self._lock = Lock()
+        self._connection: Optional[Connection] = sqlite_connect(path, check_same_thread=False)
+        self._connection.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                content BLOB NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                stored_time REAL NOT NULL,
+                ttl REAL
+            )
+        """)
+        self._connection.commit()
+
+        self.hits = 0  # 未过期，直接使用缓存
+        self.revalidations = 0  # 已过期，服务器返回 304 后继续使用缓存
+        self.misses = 0
+
+    def _Count(self, name: str) -> None:
+        """将统计项加一，与其它操作共用同一把锁，避免并发请求时计数丢失
+
+        Args:
+            name (str): 统计项名称，可选 hits、revalidations、misses
+        """
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def get(self, key: str) -> Optional[DiskCacheEntry]:
+        """读取缓存条目，不判断是否过期
+
+        Args:
+            key (str): 缓存键
+
+        Returns:
+            Optional[DiskCacheEntry]: 缓存条目，不存在时为 None
+        """
+        with self._lock:
+            if self._connection is None:
+                return None
+            row = self._connection.execute(
+                "SELECT content, etag, last_modified, stored_time, ttl FROM responses WHERE key = ?",
+                (key, )).fetchone()
+        return DiskCacheEntry(*row) if row else None
+
+    def set(self, key: str, url: str, content: bytes, etag: Optional[str] = None,
+            last_modified: Optional[str] = None, ttl: Optional[float] = None) -> None:
+        """写入缓存条目
+
+        Args:
+            key (str): 缓存键
+            url (str): 请求 URL
+            content (bytes): 响应内容
+            etag (Optional[str], optional): 响应的 ETag. Defaults to None.
+            last_modified (Optional[str], optional): 响应的 Last-Modified. Defaults to None.
+            ttl (Optional[float], optional): 有效期（秒），为 None 时永不过期. Defaults to None.
+        """
+        with self._lock:
+            if self._connection is None:
+                return
+            self._connection.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                                     (key, url, content, etag, last_modified, time(), ttl))
+            self._connection.commit()
+
+    def touch(self, key: str, ttl: Optional[float] = None) -> None:
+        """重新验证成功后刷新缓存条目的写入时间
+
+        Args:
+            key (str): 缓存键
+            ttl (Optional[float], optional): 新的有效期（秒）. Defaults to None.
+        """
+        with self._lock:
+            if self._connection is None:
+                return
+            self._connection.execute("UPDATE responses SET stored_time = ?, ttl = ? WHERE key = ?",
+                                     (time(), ttl, key))
+            self._connection.commit()
+
+    def invalidate(self, key: str) -> None:
+        """删除缓存条目
+
+        Args:
+            key (str): 缓存键
+        """
+        with self._lock:
+            if self._connection is None:
+                return
+            self._connection.execute("DELETE FROM responses WHERE key = ?", (key, ))
+            self._connection.commit()
+
+    def clear(self) -> None:
+        """清空缓存与统计信息
+        """
+        with self._lock:
+            if self._connection is None:
+                return
+            self._connection.execute("DELETE FROM responses")
+            self._connection.commit()
+            self.hits = 0
+            self.revalidations = 0
+            self.misses = 0
+
+    def close(self) -> None:
+        """关闭数据库连接
+        """
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def stats(self) -> Dict[str, Union[int, float, str]]:
+        """获取缓存统计信息
+
+        Returns:
+            Dict[str, Union[int, float, str]]: 包含命中次数、重新验证次数、未命中次数、命中率与当前条目数
+        """
+        with self._lock:
+            size = self._connection.execute("SELECT COUNT(*) FROM responses").fetchone()[0] if self._connection else 0
+            hits, revalidations, misses = self.hits, self.revalidations, self.misses
+        total = hits + revalidations + misses
+        return {
+            "path": self.path,
+            "hits": hits,
+            "revalidations": revalidations,
+            "misses": misses,
+            "hit_ratio": (hits + revalidations) / total if total else 0.0,
+            "size": size
+        }
+
+    def __len__(self) -> int:
+        return self.stats()["size"]
+
+
+_disk_cache: Optional[DiskCache] = None  # 默认关闭磁盘缓存
+
+
+def set_disk_cache_status(status: bool, path: str = DEFAULT_DISK_CACHE_PATH) -> None:
+    """设置磁盘缓存状态
+
+    开启后，响应会保存到 SQLite 数据库中，程序重启后仍然有效；
+    缓存过期后，如果服务器提供了 ETag 或 Last-Modified，会发送条件请求重新验证
+
+    Args:
+        status (bool): True 为开启，False 为关闭
+        path (str, optional): 数据库文件路径. Defaults to DEFAULT_DISK_CACHE_PATH.
+    """
+    if not isinstance(status, bool):
+        raise TypeError(f"{status} 不是 bool 类型，而是 {type(status).__name__} 类型")
+
+    global _disk_cache
+    if _disk_cache is not None:
+        _disk_cache.close()
+        _disk_cache = None
+    if status:
+        _disk_cache = DiskCache(path)
+
+
+def get_disk_cache_status() -> bool:
+    """查询磁盘缓存状态
+
+    Returns:
+        bool: True 为开启，False 为关闭
+    """
+    return _disk_cache is not None
+
+
+def get_disk_cache_stats() -> Optional[Dict[str, Union[int, float, str]]]:
+    """获取磁盘缓存统计信息
+
+    Returns:
+        Optional[Dict[str, Union[int, float, str]]]: 包含命中次数、重新验证次数、未命中次数、命中率与当前条目数，
+        磁盘缓存关闭时为 None
+    """
+    return _disk_cache.stats() if _disk_cache else None
+
+
+def clear_disk_cache() -> None:
+    """清空磁盘缓存
+    """
+    if _disk_cache:
+        _disk_cache.clear()
+
+
+def GetDiskCacheKey(key: Tuple) -> str:
+    """将请求标识转换为磁盘缓存键
+
+    Args:
+        key (Tuple): 请求标识
+
+    Returns:
+        str: 磁盘缓存键
+    """
+    return repr(key)
+
+
+def GetDiskCachedEntry(key: Tuple) -> Optional[DiskCacheEntry]:
+    """从磁盘缓存中读取缓存条目，磁盘缓存关闭或未命中时返回 None
+
+    Args:
+        key (Tuple): 请求标识
+
+    Returns:
+        Optional[DiskCacheEntry]: 缓存条目，可能已过期
+    """
+    disk_cache = _disk_cache  # 其它线程可能同时关闭磁盘缓存
+    if disk_cache is None:
+        return None
+    entry = disk_cache.get(GetDiskCacheKey(key))
+    if entry is None:
+        disk_cache._Count("misses")
+    elif entry.is_fresh():
+        disk_cache._Count("hits")
+    return entry
+
+
+def HandleDiskCacheResponse(key: Tuple, url: str, params: Optional[Dict[str, Any]],
+                            response: Response, entry: Optional[DiskCacheEntry]) -> bytes:
+    """根据响应更新磁盘缓存，并返回最终的响应内容
+
+    服务器返回 304 时使用缓存内容，返回成功状态码时写入缓存
+
+    Args:
+        key (Tuple): 请求标识
+        url (str): 请求 URL
+        params (Optional[Dict[str, Any]]): 查询参数
+        response (Response): 响应
+        entry (Optional[DiskCacheEntry]): 发送请求前读取的缓存条目
+
+    Returns:
+        bytes: 响应内容
+    """
+    disk_cache = _disk_cache
+    if disk_cache is None:
+        return response.content
+    disk_key = GetDiskCacheKey(key)
+    ttl = GetResponseTTL(url, params)
+    if response.status_code == 304 and entry is not None:
+        disk_cache._Count("revalidations")
+        disk_cache.touch(disk_key, ttl)
+        return entry.content
+    if entry is not None and not entry.is_fresh():
+        disk_cache._Count("misses")  # 重新验证失败
+    if response.is_success and ttl != 0:
+        disk_cache.set(disk_key, url, response.content, response.headers.get("ETag"),
+                       response.headers.get("Last-Modified"), ttl)
+    return response.content
@@ -0,0 +1,313 @@
+from array import array
+from json import dump as json_dump
+from json import load as json_load
+from mmap import ACCESS_READ, mmap
+from os import makedirs, path
+from sys import byteorder
+from typing import Dict, List, Optional, Tuple, Union
+
+from .exceptions import InputError
+
+__all__ = ["USER_GRAPH_FORMAT_VERSION", "BuildUserGraph", "UserGraph"]
+
+USER_GRAPH_FORMAT_VERSION = 1
+# 用户 Slug 最长为 12 个字符，按固定宽度排序保存，不足的部分用 \0 补齐
+_SLUG_WIDTH = 12
+_OFFSET_TYPECODE = "Q"  # 邻接表偏移量，支持超过 2^32 条边
+_ID_TYPECODE = "I"  # 用户 ID，即用户 Slug 在排序后的位置
+
+_META_FILE_NAME = "meta.json"
+_SLUGS_FILE_NAME = "slugs.bin"
+_OUT_OFFSETS_FILE_NAME = "out_offsets.bin"
+_OUT_TARGETS_FILE_NAME = "out_targets.bin"
+_IN_OFFSETS_FILE_NAME = "in_offsets.bin"
+_IN_SOURCES_FILE_NAME = "in_sources.bin"
+
+
+def _BuildCSR(nodes_count: int, sources: array, targets: array) -> Tuple[array, array]:
+    """使用计数排序构建 CSR 格式的邻接表，每个节点的邻居按 ID 升序排列并去重
+
+    Args:
+        nodes_count (int): 节点数
+        sources (array): 每条边的起点
+        targets (array): 每条边的终点
+
+    Returns:
+        Tuple[array, array]: (偏移量，长度为节点数加一, 邻居)
+    """
+    offsets = array(_OFFSET_TYPECODE, bytes(8 * (nodes_count + 1)))
+    for source in sources:
+        offsets[source + 1] += 1
+    for i in range(nodes_count):
+        offsets[i + 1] += offsets[i]
+
+    neighbors = array(_ID_TYPECODE, bytes(targets.itemsize * len(targets)))
+    cursors = offsets[:-1]
+    for source, target in zip(sources, targets):
+        neighbors[cursors[source]] = target
+        cursors[source] += 1
+
+    # 逐行排序去重，同时压缩存储
+    result_offsets = array(_OFFSET_TYPECODE, [0])
+    result_neighbors = array(_ID_TYPECODE)
+    for i in range(nodes_count):
+        result_neighbors.extend(sorted(set(neighbors[offsets[i]:offsets[i + 1]])))
+        result_offsets.append(len(result_neighbors))
+    return result_offsets, result_neighbors
+
+
+def BuildUserGraph(edges_path: str, graph_dir: str) -> Dict[str, int]:
+    """将边文件转换为紧凑的图存储格式
+
+    边文件每行为一条 “关注者 Slug<Tab>被关注者 Slug”，与 crawler.CrawlUserGraph 的输出格式一致；
+    重复的边只保留一条
+
+    Args:
+        edges_path (str): 边文件路径
+        graph_dir (str): 图存储目录，不存在时会自动创建，已有的图会被覆盖
+
+    Raises:
+        InputError: 边文件格式错误或用户 Slug 过长时抛出此错误
+
+    Returns:
+        Dict[str, int]: 包含节点数与去重后的边数
+    """
+    slugs_set = set()
+    with open(edges_path, "rb") as f:
+        for line_number, line in enumerate(f, 1):
+            parts = line.split()
+            if not parts:
+                continue
+            if len(parts) != 2 or max(len(parts[0]), len(parts[1])) > _SLUG_WIDTH:
+                raise InputError(f"边文件第 {line_number} 行格式错误：{line!r}")
+            slugs_set.update(parts)
+    slugs = sorted(slugs_set)
+    del slugs_set
+    slug_to_id = {slug: user_id for user_id, slug in enumerate(slugs)}
+
+    sources = array(_ID_TYPECODE)
+    targets = array(_ID_TYPECODE)
+    with open(edges_path, "rb") as f:
+        for line in f:
+            parts = line.split()
+            if parts:
+                sources.append(slug_to_id[parts[0]])
+                targets.append(slug_to_id[parts[1]])
+    del slug_to_id
+
+    out_offsets, out_targets = _BuildCSR(len(slugs), sources, targets)
+    del sources, targets
+    # 按起点升序遍历去重后的边，反向邻接表的每一行也是有序且无重复的
+    in_sources = array(_ID_TYPECODE)
+    for source in range(len(slugs)):
+        in_sources.extend([source] * (out_offsets[source + 1] - out_offsets[source]))
+    in_offsets, in_sources = _BuildCSR(len(slugs), out_targets, in_sources)
+
+    makedirs(graph_dir, exist_ok=True)
+    with open(path.join(graph_dir, _SLUGS_FILE_NAME), "wb") as f:
+        f.writelines(slug.ljust(_SLUG_WIDTH, b"\0") for slug in slugs)
+    for file_name, data in ((_OUT_OFFSETS_FILE_NAME, out_offsets), (_OUT_TARGETS_FILE_NAME, out_targets),
+                            (_IN_OFFSETS_FILE_NAME, in_offsets), (_IN_SOURCES_FILE_NAME, in_sources)):
+        with open(path.join(graph_dir, file_name), "wb") as f:
+            data.tofile(f)
+    meta = {
+        "version": USER_GRAPH_FORMAT_VERSION,
+        "byteorder": byteorder,
+        "nodes_count": len(slugs),
+        "edges_count": len(out_targets)
+    }
+    with open(path.join(graph_dir, _META_FILE_NAME), "w", encoding="utf-8") as f:
+        json_dump(meta, f)
+    return {"nodes_count": meta["nodes_count"], "edges_count": meta["edges_count"]}
+
+
+class UserGraph:
+    """以内存映射方式打开的用户关注关系图
+
+    数据文件不会被完整读入内存，打开速度与图的大小基本无关；
+    用户 ID 为用户 Slug 在排序后的位置，*_ids 方法返回的 memoryview 可通过 numpy.frombuffer 零拷贝转换为数组
+    """
+    def __init__(self, graph_dir: str):
+        """打开图存储目录
+
+        Args:
+            graph_dir (str): 由 BuildUserGraph 生成的图存储目录
+
+        Raises:
+            InputError: 图存储格式版本或字节序不受支持时抛出此错误
+        """
+        self.graph_dir = graph_dir
+        with open(path.join(graph_dir, _META_FILE_NAME), "r", encoding="utf-8") as f:
+            meta = json_load(f)
+        if meta["version"] != USER_GRAPH_FORMAT_VERSION or meta["byteorder"] != byteorder:
+            raise InputError(f"不支持的图存储格式：版本 {meta['version']}，字节序 {meta['byteorder']}")
+        self.nodes_count: int = meta["nodes_count"]
+        self.edges_count: int = meta["edges_count"]
+
+        self._mmaps: List[mmap] = []
+        self._slugs = self._Map(_SLUGS_FILE_NAME, "B")
+        self._out_offsets = self._Map(_OUT_OFFSETS_FILE_NAME, _OFFSET_TYPECODE)
+        self._out_targets = self._Map(_OUT_TARGETS_FILE_NAME, _ID_TYPECODE)
+        self._in_offsets = self._Map(_IN_OFFSETS_FILE_NAME, _OFFSET_TYPECODE)
+        self._in_sources = self._Map(_IN_SOURCES_FILE_NAME, _ID_TYPECODE)
+
+    def _Map(self, file_name: str, typecode: str) -> memoryview:
+        """以只读方式映射数据文件
+
+        Args:
+            file_name (str): 文件名
+            typecode (str): 元素类型
+
+        Returns:
+            memoryview: 文件内容
+        """
+        with open(path.join(self.graph_dir, file_name), "rb") as f:
+            if path.getsize(f.name) == 0:  # 无法映射空文件
+                return memoryview(b"").cast(typecode)
+            mapped = mmap(f.fileno(), 0, access=ACCESS_READ)
+        self._mmaps.append(mapped)
+        return memoryview(mapped).cast(typecode)
+
+    def get_slug(self, user_id: int) -> str:
+        """根据用户 ID 获取用户 Slug
+
+        Args:
+            user_id (int): 用户 ID
+
+        Returns:
+            str: 用户 Slug
+        """
+        if not 0 <= user_id < self.nodes_count:
+            raise InputError(f"用户 ID {user_id} 不在图中")
+        start = user_id * _SLUG_WIDTH
+        return bytes(self._slugs[start:start + _SLUG_WIDTH]).rstrip(b"\0").decode()
+
+    def get_id(self, user_slug: str) -> Optional[int]:
+        """根据用户 Slug 获取用户 ID，使用二分查找
+
+        Args:
+            user_slug (str): 用户 Slug
+
+        Returns:
+            Optional[int]: 用户 ID，用户不在图中时为 None
+        """
+        key = user_slug.encode().ljust(_SLUG_WIDTH, b"\0")
+        low, high = 0, self.nodes_count
+        while low < high:
+            middle = (low + high) // 2
+            start = middle * _SLUG_WIDTH
+            if self._slugs[start:start + _SLUG_WIDTH].tobytes() < key:  # memoryview 不支持比较大小
+                low = middle + 1
+            else:
+                high = middle
+        if low < self.nodes_count and self._slugs[low * _SLUG_WIDTH:(low + 1) * _SLUG_WIDTH] == key:
+            return low
+        return None
+
+    def _ToId(self, user: Union[str, int]) -> int:
+        """将用户 Slug 或用户 ID 转换为用户 ID
+
+        Args:
+            user (Union[str, int]): 用户 Slug 或用户 ID
+
+        Raises:
+            InputError: 用户不在图中时抛出此错误
+
+        Returns:
+            int: 用户 ID
+        """
+        if isinstance(user, int):
+            if not 0 <= user < self.nodes_count:
+                raise InputError(f"用户 ID {user} 不在图中")
+            return user
+        result = self.get_id(user)
+        if result is None:
+            raise InputError(f"用户 {user} 不在图中")
+        return result
+
+    def out_neighbor_ids(self, user: Union[str, int]) -> memoryview:
+        """获取用户关注的用户 ID
+
+        Args:
+            user (Union[str, int]): 用户 Slug 或用户 ID
+
+        Returns:
+            memoryview: 按升序排列的用户 ID，不会复制数据
+        """
+        user_id = self._ToId(user)
+        return self._out_targets[self._out_offsets[user_id]:self._out_offsets[user_id + 1]]
+
+    def in_neighbor_ids(self, user: Union[str, int]) -> memoryview:
+        """获取用户的粉丝的用户 ID
+
+        Args:
+            user (Union[str, int]): 用户 Slug 或用户 ID
+
+        Returns:
+            memoryview: 按升序排列的用户 ID，不会复制数据
+        """
+        user_id = self._ToId(user)
+        return self._in_sources[self._in_offsets[user_id]:self._in_offsets[user_id + 1]]
+
+    def out_neighbors(self, user: Union[str, int]) -> List[str]:
+        """获取用户关注的用户 Slug
+
+        Args:
+            user (Union[str, int]): 用户 Slug 或用户 ID
+
+        Returns:
+            List[str]: 用户 Slug
+        """
+        return [self.get_slug(user_id) for user_id in self.out_neighbor_ids(user)]
+
+    def in_neighbors(self, user: Union[str, int]) -> List[str]:
+        """获取用户的粉丝的用户 Slug
+
+        Args:
+            user (Union[str, int]): 用户 Slug 或用户 ID
+
+        Returns:
+            List[str]: 用户 Slug
+        """
+        return [self.get_slug(user_id) for user_id in self.in_neighbor_ids(user)]
+
+    def out_degree(self, user: Union[str, int]) -> int:
+        """获取用户的出度，即关注的用户数
+
+        Args:
+            user (Union[str, int]): 用户 Slug 或用户 ID
+
+        Returns:
+            int: 出度
+        """
+        user_id = self._ToId(user)
+        return self._out_offsets[user_id + 1] - self._out_offsets[user_id]
+
+    def in_degree(self, user: Union[str, int]) -> int:
+        """获取用户的入度，即粉丝数
+
+        Args:
+            user (Union[str, int]): 用户 Slug 或用户 ID
+
+        Returns:
+            int: 入度
+        """
+        user_id = self._ToId(user)
+        return self._in_offsets[user_id + 1] - self._in_offsets[user_id]
+
+    def close(self) -> None:
+        """释放内存映射，之后不能再查询
+
+        调用前需要先释放 *_ids 方法返回的 memoryview
+        """
+        for view in (self._slugs, self._out_offsets, self._out_targets, self._in_offsets, self._in_sources):
+            view.release()
+        for mapped in self._mmaps:
+            mapped.close()
+        self._mmaps.clear()
+
+    def __len__(self) -> int:
+        return self.nodes_count
+
+    def __contains__(self, user_slug: str) -> bool:
+        return self.get_id(user_slug) is not None
@@ -1,12 +1,14 @@
-from datetime import datetime
-from typing import Dict, Generator, List
+from typing import Dict, Generator, List, Union
 
-from .assert_funcs import (AssertIslandPostUrl, AssertIslandStatusNormal,
-                           AssertIslandUrl)
+from .assert_funcs import (AssertCachedStatusNormal,
+                           AssertIslandJsonDataNormal, AssertIslandPostUrl,
+                           AssertIslandStatusNormal, AssertIslandUrl)
 from .basic_apis import (GetIslandJsonDataApi, GetIslandPostJsonDataApi,
                          GetIslandPostsJsonDataApi)
 from .convert import (IslandPostSlugToIslandPostUrl,
                       IslandPostUrlToIslandPostSlug, IslandUrlToIslandSlug)
+from .parsers import ParseIslandPostJson
+from .records import IslandPostRecord
 
 __all__ = [
     "GetIslandName", "GetIslandAvatarUrl", "GetIslandIntroduction",
@@ -28,8 +30,10 @@ def GetIslandName(island_url: str, disable_check: bool = False) -> str:
     """
     if not disable_check:
         AssertIslandUrl(island_url)
-        AssertIslandStatusNormal(island_url)
+        AssertCachedStatusNormal(island_url)
     json_obj = GetIslandJsonDataApi(island_url)
+    if not disable_check:
+        AssertIslandJsonDataNormal(island_url, json_obj)
     result = json_obj["name"]
     return result
 
@@ -46,8 +50,10 @@ def GetIslandAvatarUrl(island_url: str, disable_check: bool = False) -> str:
     """
     if not disable_check:
         AssertIslandUrl(island_url)
-        AssertIslandStatusNormal(island_url)
+        AssertCachedStatusNormal(island_url)
     json_obj = GetIslandJsonDataApi(island_url)
+    if not disable_check:
+        AssertIslandJsonDataNormal(island_url, json_obj)
     result = json_obj["image"]
     return result
 
@@ -64,8 +70,10 @@ def GetIslandIntroduction(island_url: str, disable_check: bool = False) -> str:
     """
     if not disable_check:
         AssertIslandUrl(island_url)
-        AssertIslandStatusNormal(island_url)
+        AssertCachedStatusNormal(island_url)
     json_obj = GetIslandJsonDataApi(island_url)
+    if not disable_check:
+        AssertIslandJsonDataNormal(island_url, json_obj)
     result = json_obj["intro"]
     return result
 
@@ -82,8 +90,10 @@ def GetIslandMembersCount(island_url: str, disable_check: bool = False) -> int:
     """
     if not disable_check:
         AssertIslandUrl(island_url)
-        AssertIslandStatusNormal(island_url)
+        AssertCachedStatusNormal(island_url)
     json_obj = GetIslandJsonDataApi(island_url)
+    if not disable_check:
+        AssertIslandJsonDataNormal(island_url, json_obj)
     result = json_obj["members_count"]
     return result
 
@@ -100,8 +110,10 @@ def GetIslandPostsCount(island_url: str, disable_check: bool = False) -> int:
     """
     if not disable_check:
         AssertIslandUrl(island_url)
-        AssertIslandStatusNormal(island_url)
+        AssertCachedStatusNormal(island_url)
     json_obj = GetIslandJsonDataApi(island_url)
+    if not disable_check:
+        AssertIslandJsonDataNormal(island_url, json_obj)
     result = json_obj["posts_count"]
     return result
 
@@ -118,8 +130,10 @@ def GetIslandCategory(island_url: str, disable_check: bool = False) -> str:
     """
     if not disable_check:
         AssertIslandUrl(island_url)
-        AssertIslandStatusNormal(island_url)
+        AssertCachedStatusNormal(island_url)
     json_obj = GetIslandJsonDataApi(island_url)
+    if not disable_check:
+        AssertIslandJsonDataNormal(island_url, json_obj)
     result = json_obj["category"]["name"]
     return result
 
@@ -144,7 +158,8 @@ def GetIslandPostFullContent(post_url: str, disable_check: bool = False) -> str:
 
 def GetIslandPosts(island_url: str, start_sort_id: int = None, count: int = 10,
                    topic_id: int = None, sorting_method: str = "time",
-                   get_full_content: bool = False, disable_check: bool = False) -> List[Dict]:
+                   get_full_content: bool = False, disable_check: bool = False,
+                   as_record: bool = False) -> List[Union[Dict, IslandPostRecord]]:
     """获取小岛帖子信息
 
         Args:
@@ -157,6 +172,7 @@ def GetIslandPosts(island_url: str, start_sort_id: int = None, count: int = 10,
             get_full_content (bool, optional): 为 True 时，当检测到获取的帖子内容不全时，
             自动调用 GetIslandPostFullContent 函数获取完整内容并替换. Defaults to False.
             disable_check (bool): 禁用参数有效性检查. Defaults to False.
+            as_record (bool, optional): 为 True 时返回 IslandPostRecord 而不是字典，占用内存更少，可通过 to_dict 方法转换为字典. Defaults to False.
 
         Returns:
             List[Dict]: 帖子信息
@@ -173,61 +189,19 @@ def GetIslandPosts(island_url: str, start_sort_id: int = None, count: int = 10,
                                          max_id=start_sort_id, count=count, topic_id=topic_id,
                                          order_by=order_by)
 
+    if as_record:
+        result = []
+        for item in json_obj:
+            item_data = IslandPostRecord.from_json(item)
+            if get_full_content and "..." in item_data.content:  # 获取到的帖子内容不全
+                content = GetIslandPostFullContent(IslandPostSlugToIslandPostUrl(item_data.pslug), disable_check=True)
+                item_data = item_data._replace(content=content)
+            result.append(item_data)
+        return result
+
     result = []
     for item in json_obj:
-        item_data = {
-            "sorted_id": item["sorted_id"],
-            "pid": item["id"],
-            "pslug": item["slug"],
-            "title": item["title"],
-            "content": item["content"],
-            # "images": item["images"]
-            "likes_count": item["likes_count"],
-            "comments_count": item["comments_count"],
-            "release_time": datetime.fromtimestamp(item["created_at"]),
-            "is_hot": item["is_hot"],
-            "is_most_valuable": item["is_best"],
-            "is_topped": item["is_top"],
-            "is_new": item["is_new"],
-            "island": {
-                "iid": item["group"]["id"],
-                "islug": item["group"]["slug"],
-                "island_name": item["group"]["name"]
-            },
-            "user": {
-                "uid": item["user"]["id"],
-                "uslug": item["user"]["slug"],
-                "user_name": item["user"]["nickname"],
-                "avatar_url": item["user"]["avatar"]
-                # "badge": item["user"]["badge"]["text"]
-                # 有个 member 不知道干什么用的，没解析
-            }
-            # "topic": {
-            #     "tid": item["topic"]["id"],
-            #     "tslug": item["topic"]["slug"],
-            #     "topic_name": item["topic"]["name"]
-            #     # 有个 group_role 不知道干什么用的，没解析
-            # }
-        }
-        try:
-            image_urls = []
-            for image in item["images"]:
-                image_urls.append(image["url"])
-        except KeyError:
-            pass  # 没有图片则跳过
-        try:
-            item_data["user"]["badge"] = item["user"]["badge"]["text"]
-        except KeyError:
-            pass  # 没有徽章则跳过
-        try:
-            item_data["topic"] = {
-                "tid": item["topic"]["id"],
-                "tslug": item["topic"]["slug"],
-                "topic_name": item["topic"]["name"]
-                # 有个 group_role 不知道干什么用的，没解析
-            }
-        except KeyError:
-            pass  # 没有话题则跳过
+        item_data = ParseIslandPostJson(item)
         if get_full_content and "..." in item_data["content"]:  # 获取到的帖子内容不全
             item_data["content"] = GetIslandPostFullContent(IslandPostSlugToIslandPostUrl(item_data["pslug"]),
                                                             disable_check=True)
@@ -247,9 +221,11 @@ def GetIslandAllBasicData(island_url: str, disable_check: bool = False) -> Dict:
     """
     if not disable_check:
         AssertIslandPostUrl(island_url)
-        AssertIslandStatusNormal(island_url)
+        AssertCachedStatusNormal(island_url)
     result = {}
     json_obj = GetIslandJsonDataApi(island_url)
+    if not disable_check:
+        AssertIslandJsonDataNormal(island_url, json_obj)
 
     result["name"] = json_obj["name"]
     result["avatar_url"] = json_obj["image"]
@@ -263,7 +239,8 @@ def GetIslandAllBasicData(island_url: str, disable_check: bool = False) -> Dict:
 def GetIslandAllPostsData(island_url: str, count: int = 10,
                           topic_id: int = None, sorting_method: str = "time",
                           get_full_content: bool = False, max_count: int = None,
-                          disable_check: bool = False) -> Generator[Dict, None, None]:
+                          disable_check: bool = False,
+                          as_record: bool = False) -> Generator[Union[Dict, IslandPostRecord], None, None]:
     """获取小岛的所有帖子信息
 
     Args:
@@ -276,6 +253,7 @@ def GetIslandAllPostsData(island_url: str, count: int = 10,
         自动调用 GetIslandPostFullContent 函数获取完整内容并替换. Defaults to False.
         max_count (int, optional): 获取的小岛帖子信息数量上限，Defaults to None.
         disable_check (bool): 禁用参数有效性检查. Defaults to False.
+        as_record (bool, optional): 为 True 时返回 IslandPostRecord 而不是字典，占用内存更少，可通过 to_dict 方法转换为字典. Defaults to False.
 
     Yields:
         Iterator[Dict], None, None]: 帖子信息
@@ -287,9 +265,9 @@ def GetIslandAllPostsData(island_url: str, count: int = 10,
     now_count = 0
     while True:
         result = GetIslandPosts(island_url, start_sort_id, count, topic_id,
-                                sorting_method, get_full_content, disable_check=True)
+                                sorting_method, get_full_content, disable_check=True, as_record=as_record)
         if result:
-            start_sort_id = result[-1]["sorted_id"]
+            start_sort_id = result[-1].sorted_id if as_record else result[-1]["sorted_id"]
         else:
             return
         for item in result:
@@ -1,8 +1,14 @@
 from datetime import datetime
-from typing import Dict, Generator, List
+from math import ceil
+from typing import Dict, Generator, List, Union
 
-from .assert_funcs import AssertNotebookStatusNormal, AssertNotebookUrl
+from .assert_funcs import (AssertCachedStatusNormal,
+                           AssertNotebookJsonDataNormal,
+                           AssertNotebookStatusNormal, AssertNotebookUrl)
 from .basic_apis import GetNotebookArticlesJsonDataApi, GetNotebookJsonDataApi
+from .parsers import ParseArticlesListJson
+from .records import ArticleBriefRecord
+from .utils import IterPages
 
 __all__ = [
     "GetNotebookName", "GetNotebookArticlesCount", "GetNotebookAuthorInfo",
@@ -24,8 +30,10 @@ def GetNotebookName(notebook_url: str, disable_check: bool = False) -> str:
     """
     if not disable_check:
         AssertNotebookUrl(notebook_url)
-        AssertNotebookStatusNormal(notebook_url)
+        AssertCachedStatusNormal(notebook_url)
     json_obj = GetNotebookJsonDataApi(notebook_url)
+    if not disable_check:
+        AssertNotebookJsonDataNormal(notebook_url, json_obj)
     result = json_obj["name"]
     return result
 
@@ -42,8 +50,10 @@ def GetNotebookArticlesCount(notebook_url: str, disable_check: bool = False) ->
     """
     if not disable_check:
         AssertNotebookUrl(notebook_url)
-        AssertNotebookStatusNormal(notebook_url)
+        AssertCachedStatusNormal(notebook_url)
     json_obj = GetNotebookJsonDataApi(notebook_url)
+    if not disable_check:
+        AssertNotebookJsonDataNormal(notebook_url, json_obj)
     result = json_obj["notes_count"]
     return result
 
@@ -60,8 +70,10 @@ def GetNotebookAuthorInfo(notebook_url: str, disable_check: bool = False) -> Dic
     """
     if not disable_check:
         AssertNotebookUrl(notebook_url)
-        AssertNotebookStatusNormal(notebook_url)
+        AssertCachedStatusNormal(notebook_url)
     json_obj = GetNotebookJsonDataApi(notebook_url)
+    if not disable_check:
+        AssertNotebookJsonDataNormal(notebook_url, json_obj)
     result = {
         "name": json_obj["user"]["nickname"],
         "uslug": json_obj["user"]["slug"],
@@ -82,8 +94,10 @@ def GetNotebookWordage(notebook_url: str, disable_check: bool = False) -> int:
     """
     if not disable_check:
         AssertNotebookUrl(notebook_url)
-        AssertNotebookStatusNormal(notebook_url)
+        AssertCachedStatusNormal(notebook_url)
     json_obj = GetNotebookJsonDataApi(notebook_url)
+    if not disable_check:
+        AssertNotebookJsonDataNormal(notebook_url, json_obj)
     result = json_obj["wordage"]
     return result
 
@@ -100,8 +114,10 @@ def GetNotebookSubscribersCount(notebook_url: str, disable_check: bool = False)
     """
     if not disable_check:
         AssertNotebookUrl(notebook_url)
-        AssertNotebookStatusNormal(notebook_url)
+        AssertCachedStatusNormal(notebook_url)
     json_obj = GetNotebookJsonDataApi(notebook_url)
+    if not disable_check:
+        AssertNotebookJsonDataNormal(notebook_url, json_obj)
     result = json_obj["subscribers_count"]
     return result
 
@@ -118,15 +134,18 @@ def GetNotebookUpdateTime(notebook_url: str, disable_check: bool = False) -> dat
     """
     if not disable_check:
         AssertNotebookUrl(notebook_url)
-        AssertNotebookStatusNormal(notebook_url)
+        AssertCachedStatusNormal(notebook_url)
     json_obj = GetNotebookJsonDataApi(notebook_url)
+    if not disable_check:
+        AssertNotebookJsonDataNormal(notebook_url, json_obj)
     result = datetime.fromtimestamp(json_obj["last_updated_at"])
     return result
 
 
 def GetNotebookArticlesInfo(notebook_url: str, page: int = 1,
                             count: int = 10, sorting_method: str = "time",
-                            disable_check: bool = False) -> List[Dict]:
+                            disable_check: bool = False,
+                            as_record: bool = False) -> List[Union[Dict, ArticleBriefRecord]]:
     """获取文集中的文章信息
 
     Args:
@@ -136,6 +155,7 @@ def GetNotebookArticlesInfo(notebook_url: str, page: int = 1,
         sorting_method (str, optional): 排序方法，"time" 为按照发布时间排序，
         "comment_time" 为按照最近评论时间排序，"hot" 为按照热度排序. Defaults to "time".
         disable_check (bool): 禁用参数有效性检查. Defaults to False.
+        as_record (bool, optional): 为 True 时返回 ArticleBriefRecord 而不是字典，占用内存更少，可通过 to_dict 方法转换为字典. Defaults to False.
 
     Returns:
         List[Dict]: 文章信息
@@ -150,32 +170,9 @@ def GetNotebookArticlesInfo(notebook_url: str, page: int = 1,
     }[sorting_method]
     json_obj = GetNotebookArticlesJsonDataApi(notebook_url=notebook_url,
                                               page=page, count=count, order_by=order_by)
-    result = []
-    for item in json_obj:
-        item_data = {
-            "aid": item["object"]["data"]["id"],
-            "title": item["object"]["data"]["title"],
-            "aslug": item["object"]["data"]["slug"],
-            "release_time": datetime.fromisoformat(item["object"]["data"]["first_shared_at"]),
-            "first_image_url": item["object"]["data"]["list_image_url"],
-            "summary": item["object"]["data"]["public_abbr"],
-            "views_count": item["object"]["data"]["views_count"],
-            "likes_count": item["object"]["data"]["likes_count"],
-            "is_top": item["object"]["data"]["is_top"],
-            "paid": item["object"]["data"]["paid"],
-            "commentable": item["object"]["data"]["commentable"],
-            "user": {
-                "uid": item["object"]["data"]["user"]["id"],
-                "name": item["object"]["data"]["user"]["nickname"],
-                "uslug": item["object"]["data"]["user"]["slug"],
-                "avatar_url": item["object"]["data"]["user"]["avatar"]
-            },
-            "total_fp_amount": item["object"]["data"]["total_fp_amount"] / 1000,
-            "comments_count": item["object"]["data"]["public_comments_count"],
-            "rewards_count": item["object"]["data"]["total_rewards_count"]
-        }
-        result.append(item_data)
-    return result
+    if as_record:
+        return [ArticleBriefRecord.from_json(item["object"]["data"]) for item in json_obj]
+    return ParseArticlesListJson(json_obj)
 
 
 def GetNotebookAllBasicData(notebook_url: str, disable_check: bool = False) -> Dict:
@@ -190,9 +187,11 @@ def GetNotebookAllBasicData(notebook_url: str, disable_check: bool = False) -> D
     """
     if not disable_check:
         AssertNotebookUrl(notebook_url)
-        AssertNotebookStatusNormal(notebook_url)
+        AssertCachedStatusNormal(notebook_url)
     result = {}
     json_obj = GetNotebookJsonDataApi(notebook_url)
+    if not disable_check:
+        AssertNotebookJsonDataNormal(notebook_url, json_obj)
 
     result["name"] = json_obj["name"]
     result["author_info"] = {
@@ -208,7 +207,9 @@ def GetNotebookAllBasicData(notebook_url: str, disable_check: bool = False) -> D
 
 
 def GetNotebookAllArticlesInfo(notebook_url: str, count: int = 10, sorting_method: str = "time",
-                               max_count: int = None, disable_check: bool = False) -> Generator[Dict, None, None]:
+                               max_count: int = None, disable_check: bool = False,
+                               prefetch: int = 0,
+                               as_record: bool = False) -> Generator[Union[Dict, ArticleBriefRecord], None, None]:
     """获取文集中的全部文章信息
 
     Args:
@@ -218,24 +219,23 @@ def GetNotebookAllArticlesInfo(notebook_url: str, count: int = 10, sorting_metho
         comment_time 为按照最近评论时间排序，hot 为按照热度排序. Defaults to "time".
         max_count (int, optional): 获取的文集文章信息数量上限，Defaults to None.
         disable_check (bool): 禁用参数有效性检查. Defaults to False.
+        prefetch (int, optional): 预取页数，大于 0 时会在后台并发获取后续页面. Defaults to 0.
+        as_record (bool, optional): 为 True 时返回 ArticleBriefRecord 而不是字典，占用内存更少，可通过 to_dict 方法转换为字典. Defaults to False.
 
     Yields:
         Iterator[Dict], None, None]: 文章信息
     """
     if not disable_check:
         AssertNotebookUrl(notebook_url)
+        AssertCachedStatusNormal(notebook_url)
+    total_pages = None
+    if prefetch:  # 根据文集文章数计算总页数，以便并发获取全部页面
+        json_obj = GetNotebookJsonDataApi(notebook_url)
+        if not disable_check:
+            AssertNotebookJsonDataNormal(notebook_url, json_obj)
+        total_pages = ceil(min(json_obj["notes_count"], max_count or json_obj["notes_count"]) / count)
+    elif not disable_check:
         AssertNotebookStatusNormal(notebook_url)
-    page = 1
-    now_count = 0
-    while True:
-        result = GetNotebookArticlesInfo(notebook_url, page, count, sorting_method, disable_check=True)
-        if result:
-            page += 1
-        else:
-            return
-        for item in result:
-            yield item
-            if max_count:
-                now_count += 1
-                if max_count == now_count:
-                    return
+    yield from IterPages(lambda page: GetNotebookArticlesInfo(notebook_url, page, count, sorting_method, disable_check=True,
+                                                              as_record=as_record),
+                         prefetch, total_pages, max_count)
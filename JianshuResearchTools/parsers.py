@@ -0,0 +1,440 @@
+from datetime import datetime
+from re import compile as re_compile
+from typing import Callable, Dict, List, Tuple
+
+from lxml import etree
+from lxml.etree import _Element
+
+from .convert import (ArticleSlugToArticleUrl, CollectionSlugToCollectionUrl,
+                      NotebookSlugToNotebookUrl, UserSlugToUserUrl)
+from .records import _COMMENT_VIP_TYPE_TO_NAME
+
+__all__ = [
+    "ParseUserFollowListHtml", "ParseUserTimelineHtml", "ParseArticlesListJson",
+    "ParseArticleCommentsJson", "ParseIslandPostJson", "ParseBeikeIslandTradeListJson"
+]
+
+_NUMBER_REGEX = re_compile(r"\d+")
+
+# 第一个用户名为页面所属用户，需要跳过
+_FOLLOW_LIST_NAMES_XPATH = etree.XPath("(//a[@class='name'])[position() > 1]")
+# 以下 XPath 相对于用户名所在的元素
+_FOLLOW_LIST_COUNTS_XPATH = etree.XPath("div[@class='meta'][1]/span/text()")
+_FOLLOW_LIST_WORDS_AND_LIKES_XPATH = etree.XPath("div[@class='meta'][2]")
+
+
+def ParseUserFollowListHtml(html_obj: _Element) -> List[Dict]:
+    """解析用户关注列表或粉丝列表页面
+
+    只遍历一次列表项，所有 XPath 均预先编译，页面为空时返回空列表
+
+    Args:
+        html_obj (_Element): 关注列表或粉丝列表页面
+
+    Returns:
+        List[Dict]: 用户信息
+    """
+    result = []
+    for name_element in _FOLLOW_LIST_NAMES_XPATH(html_obj):
+        info_element = name_element.getparent()
+        followers_text, fans_text, articles_text = _FOLLOW_LIST_COUNTS_XPATH(info_element)[:3]
+        words_count, likes_count = _NUMBER_REGEX.findall(_FOLLOW_LIST_WORDS_AND_LIKES_XPATH(info_element)[0].text)[:2]
+        result.append({
+            "name": name_element.text,
+            "uslug": name_element.get("href")[3:],
+            "followers_count": int(followers_text.replace("关注 ", "")),
+            "fans_count": int(fans_text.replace("粉丝", "")),
+            "articles_count": int(articles_text.replace("文章 ", "")),
+            "words_count": int(words_count),
+            "likes_count": int(likes_count)
+        })
+    return result
+
+
+_TIMELINE_BLOCKS_XPATH = etree.XPath("//li[starts-with(@id, 'feed-')]")
+# 以下 XPath 相对于单条动态所在的元素
+_TIMELINE_TIME_XPATH = etree.XPath(".//span[starts-with(@data-datetime, '20')]")
+_TIMELINE_NICKNAME_XPATH = etree.XPath(".//a[@class='nickname']")
+_TIMELINE_AVATAR_XPATH = etree.XPath(".//a[@class='avatar']/img/@src")
+_TIMELINE_TITLE_XPATH = etree.XPath(".//a[@class='title']")
+_TIMELINE_ORIGIN_AUTHOR_NAME_XPATH = etree.XPath(".//div[@class='origin-author']/a/text()")
+_TIMELINE_META_LINK_HREFS_XPATH = etree.XPath(".//div[@class='meta']/a/@href")
+_TIMELINE_META_LINK_TEXTS_XPATH = etree.XPath(".//div[@class='meta']/a/text()")
+_TIMELINE_META_SPAN_TEXTS_XPATH = etree.XPath(".//div[@class='meta']/span/text()")
+_TIMELINE_ABSTRACT_XPATH = etree.XPath(".//p[@class='abstract']/text()")
+_TIMELINE_COMMENT_XPATH = etree.XPath(".//p[@class='comment']/text()")
+_TIMELINE_BLOCKQUOTE_ARTICLE_XPATH = etree.XPath(".//blockquote/div/span/a")
+_TIMELINE_BLOCKQUOTE_USER_XPATH = etree.XPath(".//blockquote/div/a")
+_TIMELINE_FOLLOW_DETAIL_AVATAR_XPATH = etree.XPath(".//div[@class='follow-detail']/div/a/img/@src")
+_TIMELINE_CREATER_XPATH = etree.XPath(".//a[@class='creater']")
+_TIMELINE_FIRST_INFO_TEXTS_XPATH = etree.XPath(".//div[@class='info'][1]/p/text()")
+_TIMELINE_USER_TITLE_XPATH = etree.XPath(".//div[@class='info']/a[@class='title']")
+_TIMELINE_USER_INFO_TEXTS_XPATH = etree.XPath(".//div[@class='follow-detail']/div[@class='info']/p/text()")
+_TIMELINE_SIGNATURE_XPATH = etree.XPath(".//div[@class='signature']/text()")
+
+
+def _ParseTimelineOperator(block: _Element, item_data: Dict, slug_start: int) -> None:
+    """解析动态发起者信息，slug_start 为用户 slug 在链接中的起始位置"""
+    nickname_element = _TIMELINE_NICKNAME_XPATH(block)[0]
+    item_data["operator_name"] = nickname_element.text
+    item_data["operator_url"] = UserSlugToUserUrl(nickname_element.get("href")[slug_start:])
+    item_data["operator_avatar_url"] = _TIMELINE_AVATAR_XPATH(block)[0]
+
+
+def _ParseTimelineTargetArticle(block: _Element, item_data: Dict) -> None:
+    """解析动态中的目标文章信息"""
+    title_element = _TIMELINE_TITLE_XPATH(block)[0]
+    meta_link_texts = _TIMELINE_META_LINK_TEXTS_XPATH(block)
+    item_data["target_article_title"] = title_element.text
+    item_data["target_article_url"] = ArticleSlugToArticleUrl(title_element.get("href")[3:])
+    item_data["target_user_name"] = _TIMELINE_ORIGIN_AUTHOR_NAME_XPATH(block)[0]
+    item_data["target_user_url"] = UserSlugToUserUrl(_TIMELINE_META_LINK_HREFS_XPATH(block)[0][3:])
+    item_data["target_article_reads_count"] = int(meta_link_texts[1])
+    item_data["target_article_likes_count"] = int(_TIMELINE_META_SPAN_TEXTS_XPATH(block)[0])
+    # 文章没有评论或评论区关闭时没有评论数
+    item_data["target_article_comments_count"] = int(meta_link_texts[3]) if len(meta_link_texts) > 3 else 0
+    abstract = _TIMELINE_ABSTRACT_XPATH(block)
+    item_data["target_article_description"] = abstract[0] if abstract else ""  # 文章可能没有摘要
+
+
+def _ParseTimelineRewardsCount(block: _Element, item_data: Dict) -> None:
+    """解析动态中目标文章的赞赏数，没有赞赏数据时为 0"""
+    meta_span_texts = _TIMELINE_META_SPAN_TEXTS_XPATH(block)
+    item_data["target_article_rewards_count"] = int(meta_span_texts[1]) if len(meta_span_texts) > 1 else 0
+
+
+def _ParseTimelineLikeArticle(block: _Element, item_data: Dict) -> None:
+    """解析对文章点赞的动态"""
+    _ParseTimelineOperator(block, item_data, 3)
+    _ParseTimelineTargetArticle(block, item_data)
+
+
+def _ParseTimelineLikeComment(block: _Element, item_data: Dict) -> None:
+    """解析对评论点赞的动态"""
+    _ParseTimelineOperator(block, item_data, 3)
+    article_element = _TIMELINE_BLOCKQUOTE_ARTICLE_XPATH(block)[0]
+    user_element = _TIMELINE_BLOCKQUOTE_USER_XPATH(block)[0]
+    item_data["comment_content"] = "\n".join(_TIMELINE_COMMENT_XPATH(block))
+    item_data["target_article_title"] = article_element.text
+    item_data["target_article_url"] = ArticleSlugToArticleUrl(article_element.get("href")[3:])
+    item_data["target_user_name"] = user_element.text
+    item_data["target_user_url"] = UserSlugToUserUrl(user_element.get("href")[3:])
+
+
+def _ParseTimelinePublishArticle(block: _Element, item_data: Dict) -> None:
+    """解析发表文章的动态"""
+    _ParseTimelineOperator(block, item_data, 3)
+    title_element = _TIMELINE_TITLE_XPATH(block)[0]
+    meta_link_texts = _TIMELINE_META_LINK_TEXTS_XPATH(block)
+    item_data["target_article_title"] = title_element.text
+    item_data["target_article_url"] = ArticleSlugToArticleUrl(title_element.get("href")[3:])
+    item_data["target_article_reads_count"] = int(meta_link_texts[1])
+    item_data["target_article_likes_count"] = int(_TIMELINE_META_SPAN_TEXTS_XPATH(block)[0])
+    item_data["target_article_description"] = "\n".join(_TIMELINE_ABSTRACT_XPATH(block))
+    item_data["target_article_comments_count"] = int(meta_link_texts[3]) if len(meta_link_texts) > 3 else 0
+
+
+def _ParseTimelineComment(block: _Element, item_data: Dict) -> None:
+    """解析发表评论的动态"""
+    _ParseTimelineOperator(block, item_data, 3)
+    item_data["comment_content"] = "\n".join(_TIMELINE_COMMENT_XPATH(block))
+    _ParseTimelineTargetArticle(block, item_data)
+    _ParseTimelineRewardsCount(block, item_data)
+
+
+def _ParseTimelineRewardArticle(block: _Element, item_data: Dict) -> None:
+    """解析赞赏文章的动态"""
+    _ParseTimelineOperator(block, item_data, 4)
+    _ParseTimelineTargetArticle(block, item_data)
+    _ParseTimelineRewardsCount(block, item_data)
+
+
+def _ParseTimelineFollowSubscribable(block: _Element, item_data: Dict, name: str, slug_to_url: Callable) -> None:
+    """解析关注文集或专题的动态，name 为 notebook 或 collection"""
+    _ParseTimelineOperator(block, item_data, 4)
+    title_element = _TIMELINE_TITLE_XPATH(block)[0]
+    creater_element = _TIMELINE_CREATER_XPATH(block)[0]
+    articles_count, subscribers_count = _NUMBER_REGEX.findall(_TIMELINE_FIRST_INFO_TEXTS_XPATH(block)[1])[:2]
+    item_data[f"target_{name}_title"] = title_element.text
+    item_data[f"target_{name}_url"] = slug_to_url(title_element.get("href")[3:])
+    item_data[f"target_{name}_avatar_url"] = _TIMELINE_FOLLOW_DETAIL_AVATAR_XPATH(block)[0]
+    item_data["target_user_name"] = creater_element.text
+    item_data["target_user_url"] = UserSlugToUserUrl(creater_element.get("href")[3:])
+    item_data[f"target_{name}_articles_count"] = int(articles_count)
+    item_data[f"target_{name}_subscribers_count"] = int(subscribers_count)
+
+
+def _ParseTimelineFollowNotebook(block: _Element, item_data: Dict) -> None:
+    """解析关注文集的动态"""
+    _ParseTimelineFollowSubscribable(block, item_data, "notebook", NotebookSlugToNotebookUrl)
+
+
+def _ParseTimelineFollowCollection(block: _Element, item_data: Dict) -> None:
+    """解析关注专题的动态"""
+    item_data["operator_type"] = "follow_collection"  # 与旧版返回值保持一致，operation_type 仍为 like_collection
+    _ParseTimelineFollowSubscribable(block, item_data, "collection", CollectionSlugToCollectionUrl)
+
+
+def _ParseTimelineFollowUser(block: _Element, item_data: Dict) -> None:
+    """解析关注用户的动态"""
+    _ParseTimelineOperator(block, item_data, 4)
+    title_element = _TIMELINE_USER_TITLE_XPATH(block)[0]
+    wordage, fans_count, likes_count = _NUMBER_REGEX.findall(_TIMELINE_USER_INFO_TEXTS_XPATH(block)[0])[:3]
+    item_data["target_user_name"] = title_element.text
+    item_data["target_user_url"] = UserSlugToUserUrl(title_element.get("href")[3:])
+    item_data["target_user_wordage"] = int(wordage)
+    item_data["target_user_fans_count"] = int(fans_count)
+    item_data["target_user_likes_count"] = int(likes_count)
+    item_data["target_user_description"] = "\n".join(_TIMELINE_SIGNATURE_XPATH(block))
+
+
+def _ParseTimelineJoinJianshu(block: _Element, item_data: Dict) -> None:
+    """解析加入简书的动态"""
+    _ParseTimelineOperator(block, item_data, 4)
+
+
+# 键为页面中的 data-type，值为 (返回值中的 operation_type, 解析函数)
+_TIMELINE_PARSERS: Dict[str, Tuple[str, Callable]] = {
+    "like_note": ("like_article", _ParseTimelineLikeArticle),  # 鬼知道谁把对文章点赞写成 like_note 的
+    "like_comment": ("like_comment", _ParseTimelineLikeComment),
+    "share_note": ("publish_article", _ParseTimelinePublishArticle),  # 鬼知道谁把发表文章写成 share_note 的
+    "comment_note": ("comment_note", _ParseTimelineComment),
+    "like_notebook": ("follow_notebook", _ParseTimelineFollowNotebook),  # 鬼知道谁把关注文集写成 like_notebook 的
+    "like_collection": ("like_collection", _ParseTimelineFollowCollection),
+    "like_user": ("follow_user", _ParseTimelineFollowUser),  # 鬼知道谁把关注用户写成 like_user 的
+    "reward_note": ("reward_article", _ParseTimelineRewardArticle),  # 鬼知道谁把赞赏文章写成 reward_note 的
+    "join_jianshu": ("join_jianshu", _ParseTimelineJoinJianshu)
+}
+
+
+def ParseUserTimelineHtml(html_obj: _Element) -> List[Dict]:
+    """解析用户动态页面
+
+    直接在原页面上使用预先编译的相对 XPath，不复制动态所在的元素，并根据动态类型查表选择解析函数；
+    不在可解析列表中的动态只包含 operation_id、operation_type 与 operation_time
+
+    Args:
+        html_obj (_Element): 用户动态页面
+
+    Returns:
+        List[Dict]: 用户动态信息
+    """
+    result = []
+    for block in _TIMELINE_BLOCKS_XPATH(html_obj):
+        time_element = _TIMELINE_TIME_XPATH(block)[0]
+        operation_type = time_element.get("data-type")
+        item_data = {
+            "operation_id": int(block.get("id")[5:]),
+            "operation_type": operation_type,
+            "operation_time": datetime.fromisoformat(time_element.get("data-datetime"))
+        }
+        if operation_type in _TIMELINE_PARSERS:
+            item_data["operation_type"], parser = _TIMELINE_PARSERS[operation_type]
+            parser(block, item_data)
+        result.append(item_data)
+    return result
+
+
+def ParseArticlesListJson(json_obj: List[Dict], with_is_top: bool = True) -> List[Dict]:
+    """解析用户、文集与专题的文章列表接口返回的数据
+
+    同步与异步版本共用此函数，只在获取数据的方式上有所不同
+
+    Args:
+        json_obj (List[Dict]): 文章列表接口返回的数据
+        with_is_top (bool, optional): 是否包含置顶状态，专题文章列表中没有此字段. Defaults to True.
+
+    Returns:
+        List[Dict]: 文章信息
+    """
+    result = []
+    for item in json_obj:
+        data = item["object"]["data"]
+        item_data = {
+            "aid": data["id"],
+            "title": data["title"],
+            "aslug": data["slug"],
+            "release_time": datetime.fromisoformat(data["first_shared_at"]),
+            "first_image_url": data["list_image_url"],
+            "summary": data["public_abbr"],
+            "views_count": data["views_count"],
+            "likes_count": data["likes_count"]
+        }
+        if with_is_top:
+            item_data["is_top"] = data["is_top"]
+        item_data.update({
+            "paid": data["paid"],
+            "commentable": data["commentable"],
+            "user": {
+                "uid": data["user"]["id"],
+                "name": data["user"]["nickname"],
+                "uslug": data["user"]["slug"],
+                "avatar_url": data["user"]["avatar"]
+            },
+            "total_fp_amount": data["total_fp_amount"] / 1000,
+            "comments_count": data["public_comments_count"],
+            "rewards_count": data["total_rewards_count"]
+        })
+        result.append(item_data)
+    return result
+
+
+def _ParseCommentUser(user: Dict) -> Dict:
+    """解析评论或子评论的发布者，开通会员时包含会员类型与到期时间
+
+    Args:
+        user (Dict): 评论中的用户数据
+
+    Returns:
+        Dict: 用户信息
+    """
+    result = {
+        "uid": user["id"],
+        "name": user["nickname"],
+        "uslug": user["slug"],
+        "avatar_url": user["avatar"]
+    }
+    if "member" in user:
+        result["vip_type"] = _COMMENT_VIP_TYPE_TO_NAME[user["member"]["type"]]
+        result["vip_expire_date"] = datetime.fromtimestamp(user["member"]["expires_at"])
+    return result
+
+
+def ParseArticleCommentsJson(json_obj: Dict) -> List[Dict]:
+    """解析文章评论接口返回的数据
+
+    同步与异步版本共用此函数，只在获取数据的方式上有所不同
+
+    Args:
+        json_obj (Dict): 文章评论接口返回的数据
+
+    Returns:
+        List[Dict]: 文章评论信息，有子评论时包含 sub_comments
+    """
+    result = []
+    for item in json_obj["comments"]:
+        item_data = {
+            "cmid": item["id"],
+            "publish_time": datetime.fromisoformat(item["created_at"]),
+            "content": item["compiled_content"],
+            "floor": item["floor"],
+            "images": [image["url"] for image in item["images"]],
+            "likes_count": item["likes_count"],
+            "sub_comments_count": item["children_count"],
+            "user": _ParseCommentUser(item["user"])
+        }
+        if "children" in item:
+            item_data["sub_comments"] = [
+                {
+                    "cmid": sub_comment["id"],
+                    "publish_time": datetime.fromisoformat(sub_comment["created_at"]),
+                    "content": sub_comment["compiled_content"],
+                    "images": [image["url"] for image in sub_comment["images"]],
+                    "parent_comment_id": sub_comment["parent_id"],
+                    "user": _ParseCommentUser(sub_comment["user"])
+                }
+                for sub_comment in item["children"]
+            ]
+        result.append(item_data)
+    return result
+
+
+def ParseIslandPostJson(item: Dict) -> Dict:
+    """解析小岛帖子列表接口返回的单个帖子
+
+    不会获取不完整帖子的全部内容，由调用方按需获取
+
+    Args:
+        item (Dict): 帖子数据
+
+    Returns:
+        Dict: 帖子信息
+    """
+    result = {
+        "sorted_id": item["sorted_id"],
+        "pid": item["id"],
+        "pslug": item["slug"],
+        "title": item["title"],
+        "content": item["content"],
+        "likes_count": item["likes_count"],
+        "comments_count": item["comments_count"],
+        "release_time": datetime.fromtimestamp(item["created_at"]),
+        "is_hot": item["is_hot"],
+        "is_most_valuable": item["is_best"],
+        "is_topped": item["is_top"],
+        "is_new": item["is_new"],
+        "island": {
+            "iid": item["group"]["id"],
+            "islug": item["group"]["slug"],
+            "island_name": item["group"]["name"]
+        },
+        "user": {
+            "uid": item["user"]["id"],
+            "uslug": item["user"]["slug"],
+            "user_name": item["user"]["nickname"],
+            "avatar_url": item["user"]["avatar"]
+            # 有个 member 不知道干什么用的，没解析
+        }
+    }
+    try:
+        result["user"]["badge"] = item["user"]["badge"]["text"]
+    except KeyError:
+        pass  # 没有徽章则跳过
+    try:
+        result["topic"] = {
+            "tid": item["topic"]["id"],
+            "tslug": item["topic"]["slug"],
+            "topic_name": item["topic"]["name"]
+            # 有个 group_role 不知道干什么用的，没解析
+        }
+    except KeyError:
+        pass  # 没有话题则跳过
+    return result
+
+
+def ParseBeikeIslandTradeListJson(json_obj: Dict) -> List[Dict]:
+    """解析贝壳小岛交易列表接口返回的数据
+
+    同步与异步版本共用此函数，只在获取数据的方式上有所不同
+
+    Args:
+        json_obj (Dict): 交易列表接口返回的数据
+
+    Returns:
+        List[Dict]: 挂单信息
+    """
+    result = []
+    for item in json_obj["data"]["tradelist"]:
+        item_data = {
+            "trade_id": item["id"],
+            "trade_slug": item["tradeno"],
+            "publish_time": datetime.fromisoformat(item["releasetime"]),
+            "status": {
+                "code": item["statuscode"],
+                "text": item["statustext"]
+            },
+            "trade": {
+                "total": item["recount"],
+                "traded": item["recount"] - item["cantradenum"],
+                "remaining": item["cantradenum"],
+                "minimum_trade_limit": item["minlimit"],
+                "traded_percentage": round(float(item["compeletper"]) / 100, 3),
+                "price": item["reprice"],
+            }
+        }
+        if item["anonymity"]:
+            item_data["user"] = {
+                "is_anonymity": True
+            }
+        else:
+            item_data["user"] = {
+                "is_anonymity": False,
+                "name": item["reusername"],
+                "avatar_url": item["avatarurl"],
+                "level": {
+                    "code": item["levelnum"],
+                    "text": item["userlevel"]
+                }
+            }
+        result.append(item_data)
+    return result
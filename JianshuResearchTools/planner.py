@@ -0,0 +1,215 @@
+from datetime import datetime
+from re import findall
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from lxml import etree
+
+from .convert import UserUrlToUserSlug
+from .exceptions import InputError
+
+__all__ = [
+    "USER_JSON_SOURCE", "USER_PC_HTML_SOURCE", "USER_ANNIVERSARY_HTML_SOURCE",
+    "USER_DATA_SOURCES", "USER_DATA_FIELDS", "CalculateFTNCount",
+    "PlanUserDataSources", "ParseUserData"
+]
+
+# 用户数据来源
+USER_JSON_SOURCE = "json"  # /asimov/users/slug/ 接口返回的 JSON 数据
+USER_PC_HTML_SOURCE = "pc_html"  # 电脑版个人主页
+USER_ANNIVERSARY_HTML_SOURCE = "anniversary_html"  # 移动版周年纪念日页面
+# 用户 JSON 数据排在第一位，以便最先根据其判断账号状态
+USER_DATA_SOURCES = (USER_JSON_SOURCE, USER_PC_HTML_SOURCE, USER_ANNIVERSARY_HTML_SOURCE)
+
+_VIP_TYPE_TO_NAME = {
+    "bronze": "铜牌",
+    "silver": "银牌",
+    "gold": "黄金",
+    "platina": "白金"
+}
+
+
+def _ParseArticlesCount(user_url: str, payloads: Dict[str, Any]) -> int:
+    """解析用户文章数"""
+    return int(payloads[USER_PC_HTML_SOURCE].xpath("//div[@class='info']/ul/li[3]/div[@class='meta-block']/a/p")[0].text)
+
+
+def _ParseAssetsCount(user_url: str, payloads: Dict[str, Any]) -> Optional[float]:
+    """解析用户总资产，用户无文章时为 None"""
+    try:
+        result = payloads[USER_PC_HTML_SOURCE].xpath("//div[@class='info']/ul/li[6]/div[@class='meta-block']/p")[0].text
+    except IndexError:  # 用户无文章时无法获取总资产
+        return None
+    return float(result.replace(".", "").replace("w", "000"))
+
+
+def _ParseFPCount(user_url: str, payloads: Dict[str, Any]) -> Optional[float]:
+    """解析用户简书钻数量，用户无文章时为 None"""
+    json_obj = payloads[USER_JSON_SOURCE]
+    if json_obj["total_wordage"] == 0 and json_obj["jsd_balance"] == 0:  # 用户无文章时无法获取简书钻数量
+        return None
+    return json_obj["jsd_balance"] / 1000
+
+
+def _ParseBadgesList(user_url: str, payloads: Dict[str, Any]) -> List[str]:
+    """解析用户徽章列表"""
+    result = payloads[USER_PC_HTML_SOURCE].xpath("//li[@class='badge-icon']/a/text()")
+    result = [item.replace(" ", "").replace("\n", "") for item in result]  # 移除空格和换行符
+    return [item for item in result if item != ""]  # 去除空值
+
+
+def _ParseVIPInfo(user_url: str, payloads: Dict[str, Any]) -> Dict:
+    """解析用户会员信息"""
+    try:
+        member = payloads[USER_JSON_SOURCE]["member"]
+        return {
+            "vip_type": _VIP_TYPE_TO_NAME[member["type"]],
+            "expire_date": datetime.fromtimestamp(member["expires_at"])
+        }
+    except KeyError:
+        return {
+            "vip_type": None,
+            "expire_date": None
+        }
+
+
+def _ParseIntroductionText(user_url: str, payloads: Dict[str, Any]) -> str:
+    """解析纯文本格式的用户简介"""
+    introduction_html = payloads[USER_JSON_SOURCE]["intro"]
+    if not introduction_html:
+        return ""
+    return "\n".join(etree.HTML(introduction_html).xpath("//*/text()"))
+
+
+def _ParseNextAnniversaryDay(user_url: str, payloads: Dict[str, Any]) -> datetime:
+    """解析用户的下一次简书周年纪念日"""
+    result = payloads[USER_ANNIVERSARY_HTML_SOURCE].xpath('//*[@id="app"]/div[1]/div/text()')[0]
+    return datetime.fromisoformat("-".join(findall(r"\d+", result)))
+
+
+def CalculateFTNCount(assets_count: float, FP_count: float) -> float:
+    """根据总资产与简书钻数量计算简书贝数量
+
+    Args:
+        assets_count (float): 总资产
+        FP_count (float): 简书钻数量
+
+    Returns:
+        float: 简书贝数量
+    """
+    return round(abs(assets_count - FP_count), 3)  # 处理简书贝数量较少导致结果为负的情况与浮点数精度问题
+
+
+def _JsonField(key: str) -> Tuple[Tuple[str, ...], Tuple[str, ...], Callable]:
+    """生成直接读取用户 JSON 数据中某个键的字段定义
+
+    Args:
+        key (str): JSON 数据中的键名
+
+    Returns:
+        Tuple[Tuple[str, ...], Tuple[str, ...], Callable]: 字段定义
+    """
+    return (USER_JSON_SOURCE, ), (), lambda user_url, payloads: payloads[USER_JSON_SOURCE][key]
+
+
+# 键为字段名，值为 (所需的数据来源, 依赖的字段, 解析函数)，顺序与 GetUserAllBasicData 的返回值一致
+# 没有依赖字段时，解析函数接收用户 URL 与已获取的数据；有依赖字段时为派生字段，解析函数按顺序接收依赖字段的值，
+# 任一依赖字段为 None 时派生字段也为 None
+USER_DATA_FIELDS: Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...], Callable]] = {
+    "name": _JsonField("nickname"),
+    "url": ((), (), lambda user_url, payloads: user_url),
+    "uslug": ((), (), lambda user_url, payloads: UserUrlToUserSlug(user_url)),
+    "gender": _JsonField("gender"),
+    "followers_count": _JsonField("following_users_count"),
+    "fans_count": _JsonField("followers_count"),
+    "articles_count": ((USER_PC_HTML_SOURCE, ), (), _ParseArticlesCount),
+    "wordage": _JsonField("total_wordage"),
+    "likes_count": _JsonField("total_likes_count"),
+    "assets_count": ((USER_PC_HTML_SOURCE, ), (), _ParseAssetsCount),
+    "FP_count": ((USER_JSON_SOURCE, ), (), _ParseFPCount),
+    "FTN_count": ((), ("assets_count", "FP_count"), CalculateFTNCount),
+    "badges_list": ((USER_PC_HTML_SOURCE, ), (), _ParseBadgesList),
+    "last_update_time": ((USER_JSON_SOURCE, ), (),
+                         lambda user_url, payloads: datetime.fromtimestamp(payloads[USER_JSON_SOURCE]["last_updated_at"])),
+    "vip_info": ((USER_JSON_SOURCE, ), (), _ParseVIPInfo),
+    "introduction_html": _JsonField("intro"),
+    "introduction_text": ((USER_JSON_SOURCE, ), (), _ParseIntroductionText),
+    "next_anniversary_day": ((USER_ANNIVERSARY_HTML_SOURCE, ), (), _ParseNextAnniversaryDay)
+}
+
+
+def _CollectSources(field: str, sources: Set[str]) -> None:
+    """将字段及其依赖字段所需的数据来源加入集合
+
+    Args:
+        field (str): 字段名
+        sources (Set[str]): 数据来源集合
+    """
+    field_sources, dependencies, _ = USER_DATA_FIELDS[field]
+    sources.update(field_sources)
+    for dependency in dependencies:
+        _CollectSources(dependency, sources)
+
+
+def PlanUserDataSources(fields: Optional[Iterable[str]] = None) -> Tuple[List[str], List[str]]:
+    """根据需要的字段计算最少需要获取的数据来源
+
+    派生字段所需的数据来源由其依赖的字段决定，同一数据来源只会出现一次
+
+    Args:
+        fields (Optional[Iterable[str]], optional): 字段列表，为 None 时获取全部字段. Defaults to None.
+
+    Raises:
+        InputError: 存在不支持的字段时抛出此错误
+
+    Returns:
+        Tuple[List[str], List[str]]: (去重后的字段列表, 需要获取的数据来源列表，顺序与 USER_DATA_SOURCES 一致)
+    """
+    if fields is None:
+        fields = list(USER_DATA_FIELDS)
+    else:
+        fields = list(dict.fromkeys(fields))  # 去除重复字段，保持顺序
+    sources: Set[str] = set()
+    for field in fields:
+        if field not in USER_DATA_FIELDS:
+            raise InputError(f"不支持的用户数据字段 {field}，可用字段为 {'、'.join(USER_DATA_FIELDS)}")
+        _CollectSources(field, sources)
+    return fields, [source for source in USER_DATA_SOURCES if source in sources]
+
+
+def _ResolveField(user_url: str, field: str, payloads: Dict[str, Any], values: Dict[str, Any]) -> Any:
+    """解析单个字段，已解析的字段会记录在 values 中，不会重复解析
+
+    Args:
+        user_url (str): 用户个人主页 URL
+        field (str): 字段名
+        payloads (Dict[str, Any]): 键为数据来源，值为对应的数据
+        values (Dict[str, Any]): 本次调用中已解析的字段
+
+    Returns:
+        Any: 字段值
+    """
+    if field in values:
+        return values[field]
+    _, dependencies, parser = USER_DATA_FIELDS[field]
+    if dependencies:
+        args = [_ResolveField(user_url, dependency, payloads, values) for dependency in dependencies]
+        result = None if any(arg is None for arg in args) else parser(*args)
+    else:
+        result = parser(user_url, payloads)
+    values[field] = result
+    return result
+
+
+def ParseUserData(user_url: str, fields: List[str], payloads: Dict[str, Any]) -> Dict:
+    """从已获取的数据中解析需要的字段
+
+    Args:
+        user_url (str): 用户个人主页 URL
+        fields (List[str]): 字段列表
+        payloads (Dict[str, Any]): 键为数据来源，值为对应的数据
+
+    Returns:
+        Dict: 用户数据
+    """
+    values: Dict[str, Any] = {}
+    return {field: _ResolveField(user_url, field, payloads, values) for field in fields}
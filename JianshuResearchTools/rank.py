@@ -1,12 +1,17 @@
 from datetime import datetime, timedelta, date
-from typing import Dict, List
+from functools import partial
+from typing import Dict, List, Union
 
 from .basic_apis import (GetArticlesFPRankListJsonDataApi,
                          GetAssetsRankJsonDataApi,
                          GetDailyArticleRankListJsonDataApi)
 from .convert import UserSlugToUserUrl
-from .exceptions import APIError, ResourceError
-from .user import GetUserAssetsCount
+from .exceptions import ResourceError
+from .planner import CalculateFTNCount
+from .records import (ArticleFPRankRecord, AssetsRankRecord,
+                      DailyArticleRankRecord, UserFPRankRecord)
+from .user import GetUserData
+from .utils import RunConcurrently
 
 __all__ = [
     "GetAssetsRankData", "GetDailyArticleRankData", "GetUserFPRankData",
@@ -14,46 +19,65 @@ __all__ = [
 ]
 
 
-def GetAssetsRankData(start_id: int = 1, get_full: bool = False) -> List[Dict]:
+def GetAssetsRankData(start_id: int = 1, get_full: bool = False,
+                      as_record: bool = False) -> List[Union[Dict, AssetsRankRecord]]:
     """获取资产排行榜信息
 
     Args:
         start_id (int, optional): 起始位置. Defaults to 1.
         get_full (bool, optional): 为 True 时获取简书贝和总资产数据. Defaults to False.
+        as_record (bool, optional): 为 True 时返回 AssetsRankRecord 而不是字典，占用内存更少，可通过 to_dict 方法转换为字典. Defaults to False.
 
     Returns:
         List[Dict]: 资产排行榜信息
     """
     since_id = start_id - 1  # 索引下标为 0
     json_obj = GetAssetsRankJsonDataApi(max_id=1000000000, since_id=since_id)
-    result = []
-    for item in json_obj["rankings"]:
-        item_data = {
-            "ranking": item["ranking"],
-            "uid": item["user"]["id"],
-            "uslug": item["user"]["slug"],
-            "name": item["user"]["nickname"],
-            "avatar_url": item["user"]["avatar"],
-            "FP": item["amount"] / 1000
-        }
-        if get_full:
-            user_url = UserSlugToUserUrl(item_data["uslug"])
-            try:
-                item_data["Assets"] = GetUserAssetsCount(user_url, disable_check=True)
-                item_data["FTN"] = round(item_data["Assets"] - item_data["FP"], 3)  # 处理浮点数精度问题
-            except APIError:
-                pass
-        result.append(item_data)
+    if as_record:
+        result = [AssetsRankRecord.from_json(item) for item in json_obj["rankings"]]
+    else:
+        result = []
+        for item in json_obj["rankings"]:
+            item_data = {
+                "ranking": item["ranking"],
+                "uid": item["user"]["id"],
+                "uslug": item["user"]["slug"],
+                "name": item["user"]["nickname"],
+                "avatar_url": item["user"]["avatar"],
+                "FP": item["amount"] / 1000
+            }
+            result.append(item_data)
+
+    if get_full:
+        # 简书钻数量已包含在排行榜数据中，只需并发获取各用户的总资产
+        users_data = RunConcurrently([
+            partial(GetUserData, UserSlugToUserUrl(item["user"]["slug"]), ["assets_count"], disable_check=True)
+            for item in json_obj["rankings"]
+        ])
+        for index, user_data in enumerate(users_data):
+            if user_data["assets_count"] is None:  # 用户无文章时无法获取总资产
+                continue
+            assets = user_data["assets_count"]
+            if as_record:
+                result[index] = result[index]._replace(Assets=assets, FTN=CalculateFTNCount(assets, result[index].FP))
+            else:
+                result[index]["Assets"] = assets
+                result[index]["FTN"] = CalculateFTNCount(assets, result[index]["FP"])
     return result
 
 
-def GetDailyArticleRankData() -> List[Dict]:
+def GetDailyArticleRankData(as_record: bool = False) -> List[Union[Dict, DailyArticleRankRecord]]:
     """获取日更排行榜信息
 
+    Args:
+        as_record (bool, optional): 为 True 时返回 DailyArticleRankRecord 而不是字典，占用内存更少，可通过 to_dict 方法转换为字典. Defaults to False.
+
     Returns:
         List[Dict]: 日更排行榜信息
     """
     json_obj = GetDailyArticleRankListJsonDataApi()
+    if as_record:
+        return [DailyArticleRankRecord.from_json(item) for item in json_obj["daps"]]
     result = []
     for item in json_obj["daps"]:
         item_data = {
@@ -67,13 +91,15 @@ def GetDailyArticleRankData() -> List[Dict]:
     return result
 
 
-def GetArticleFPRankData(target_date: str = "latest") -> List[Dict]:
+def GetArticleFPRankData(target_date: str = "latest",
+                         as_record: bool = False) -> List[Union[Dict, ArticleFPRankRecord]]:
     """获取文章收益排行榜信息
 
     目前只能获取 2020 年 6 月 20 日之后的数据。
 
     Args:
         target_date (str, optional): 日期，格式“YYYYMMDD”. Defaults to "latest".
+        as_record (bool, optional): 为 True 时返回 ArticleFPRankRecord 而不是字典，占用内存更少，可通过 to_dict 方法转换为字典. Defaults to False.
 
     Raises:
         ResourceError: 对应日期的排行榜数据为空时抛出此异常
@@ -86,6 +112,8 @@ def GetArticleFPRankData(target_date: str = "latest") -> List[Dict]:
     json_obj = GetArticlesFPRankListJsonDataApi(date=target_date, type_=None)
     if json_obj["notes"] == []:
         raise ResourceError(f"对应日期 {date} 的排行榜数据为空")
+    if as_record:
+        return [ArticleFPRankRecord.from_json(item, ranking + 1) for ranking, item in enumerate(json_obj["notes"])]
     result = []
     for ranking, item in enumerate(json_obj["notes"]):
         item_data = {
@@ -129,7 +157,8 @@ def GetArticleFPRankBasicInfo(target_date: str = "latest") -> Dict:
     return result
 
 
-def GetUserFPRankData(target_date: str = "latest", rank_type: str = "all") -> List[Dict]:
+def GetUserFPRankData(target_date: str = "latest", rank_type: str = "all",
+                      as_record: bool = False) -> List[Union[Dict, UserFPRankRecord]]:
     """获取用户收益排行榜信息
 
     目前只能获取 2020 年 6 月 20 日之后的数据。
@@ -137,6 +166,7 @@ def GetUserFPRankData(target_date: str = "latest", rank_type: str = "all") -> Li
     Args:
         target_date (str, optional): 日期，格式“YYYYMMDD”. Defaults to "latest".
         rank_type (str, optional): 排行榜分类，"all" 为总收益榜，"write" 为内容收益榜，"vote" 为投票收益榜
+        as_record (bool, optional): 为 True 时返回 UserFPRankRecord 而不是字典，占用内存更少，可通过 to_dict 方法转换为字典. Defaults to False.
 
     Raises:
         ResourceError: 对应日期的排行榜数据为空时抛出此异常
@@ -152,6 +182,8 @@ def GetUserFPRankData(target_date: str = "latest", rank_type: str = "all") -> Li
     json_obj = GetArticlesFPRankListJsonDataApi(date=target_date, type_=type_)
     if json_obj["users"] == []:
         raise ResourceError(f"对应日期 {target_date} 的排行榜数据为空")
+    if as_record:
+        return [UserFPRankRecord.from_json(item, ranking) for ranking, item in enumerate(json_obj["users"])]
     result = []
     for ranking, item in enumerate(json_obj["users"]):
         item_data = {
@@ -0,0 +1,215 @@
+from asyncio import CancelledError
+from asyncio import sleep as asyncio_sleep
+from threading import Lock
+from time import monotonic, sleep
+from typing import Dict, Optional, Union
+
+from .exceptions import InputError
+
+__all__ = [
+    "TokenBucket", "RATE_LIMIT_BUCKETS", "configure_rate_limit",
+    "get_rate_limit_stats", "reset_rate_limit_stats"
+]
+
+
+class TokenBucket:
+    """令牌桶限速器
+
+    令牌以固定速率生成，最多积累 burst 个。令牌不足时，调用方按到达顺序预约未来的令牌并等待
+    """
+    def __init__(self, rate: float, burst: int = 1):
+        """构建新的令牌桶
+
+        Args:
+            rate (float): 每秒生成的令牌数
+            burst (int, optional): 令牌桶容量，即允许的突发请求数. Defaults to 1.
+        """
+        if rate <= 0 or burst < 1:
+            raise InputError("令牌生成速率必须大于 0，令牌桶容量必须不小于 1")
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last_time = monotonic()
+        self._lock = Lock()
+
+        self.requests_count = 0
+        self.waited_requests_count = 0
+        self.total_wait_time = 0.0
+        self.max_wait_time = 0.0
+        self.queue_depth = 0  # 正在等待令牌的调用方数量
+        self.max_queue_depth = 0
+
+    def _Reserve(self) -> float:
+        """预约一个令牌
+
+        Returns:
+            float: 需要等待的时间（秒）
+        """
+        with self._lock:
+            now = monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last_time) * self.rate)
+            self._last_time = now
+            self._tokens -= 1
+            wait_time = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+            self.requests_count += 1
+            if wait_time > 0:
+                self.waited_requests_count += 1
+                self.total_wait_time += wait_time
+                self.max_wait_time = max(self.max_wait_time, wait_time)
+                self.queue_depth += 1
+                self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+            return wait_time
+
+    def _Release(self) -> None:
+        """结束等待
+        """
+        with self._lock:
+            self.queue_depth -= 1
+
+    def _Refund(self) -> None:
+        """归还一个已预约但未使用的令牌
+        """
+        with self._lock:
+            self._tokens = min(self.burst, self._tokens + 1)
+
+    def acquire(self) -> float:
+        """获取一个令牌，令牌不足时阻塞等待
+
+        Returns:
+            float: 等待的时间（秒）
+        """
+        wait_time = self._Reserve()
+        if wait_time > 0:
+            try:
+                sleep(wait_time)
+            finally:
+                self._Release()
+        return wait_time
+
+    async def async_acquire(self) -> float:
+        """获取一个令牌，令牌不足时异步等待
+
+        Returns:
+            float: 等待的时间（秒）
+        """
+        wait_time = self._Reserve()
+        if wait_time > 0:
+            try:
+                await asyncio_sleep(wait_time)
+            except CancelledError:  # 任务被取消时不会发送请求，归还预约的令牌，避免后续请求多等待
+                self._Refund()
+                raise
+            finally:
+                self._Release()
+        return wait_time
+
+    def stats(self) -> Dict[str, Union[int, float]]:
+        """获取限速统计信息
+
+        Returns:
+            Dict[str, Union[int, float]]: 包含请求数、等待次数、等待时间与队列深度
+        """
+        with self._lock:
+            return {
+                "rate": self.rate,
+                "burst": self.burst,
+                "requests_count": self.requests_count,
+                "waited_requests_count": self.waited_requests_count,
+                "total_wait_time": self.total_wait_time,
+                "average_wait_time": self.total_wait_time / self.requests_count if self.requests_count else 0.0,
+                "max_wait_time": self.max_wait_time,
+                "queue_depth": self.queue_depth,
+                "max_queue_depth": self.max_queue_depth
+            }
+
+    def reset_stats(self) -> None:
+        """重置统计信息，不影响当前的令牌数量
+        """
+        with self._lock:
+            self.requests_count = 0
+            self.waited_requests_count = 0
+            self.total_wait_time = 0.0
+            self.max_wait_time = 0.0
+            self.max_queue_depth = self.queue_depth
+
+
+# jianshu_api：简书 JSON 接口，jianshu_html：简书网页，beikeisland：贝壳小岛接口
+RATE_LIMIT_BUCKETS = ("jianshu_api", "jianshu_html", "beikeisland")
+
+_buckets: Dict[str, Optional[TokenBucket]] = {name: None for name in RATE_LIMIT_BUCKETS}  # 默认不限速
+
+
+def configure_rate_limit(bucket: str, rate: Optional[float], burst: int = 1) -> None:
+    """设置某类请求的限速
+
+    Args:
+        bucket (str): 请求类别，"jianshu_api" 为简书 JSON 接口，"jianshu_html" 为简书网页，
+        "beikeisland" 为贝壳小岛接口
+        rate (Optional[float]): 每秒允许的请求数，为 None 时不限速
+        burst (int, optional): 允许的突发请求数. Defaults to 1.
+
+    Raises:
+        InputError: 请求类别不存在时抛出此异常
+    """
+    if bucket not in _buckets:
+        raise InputError(f"{bucket} 不是有效的请求类别，可用的类别为 {', '.join(RATE_LIMIT_BUCKETS)}")
+    _buckets[bucket] = None if rate is None else TokenBucket(rate, burst)
+
+
+def get_rate_limit_stats() -> Dict[str, Optional[Dict[str, Union[int, float]]]]:
+    """获取各类请求的限速统计信息
+
+    Returns:
+        Dict[str, Optional[Dict[str, Union[int, float]]]]: 键为请求类别，未限速的类别值为 None
+    """
+    return {name: (bucket.stats() if bucket else None) for name, bucket in _buckets.items()}
+
+
+def reset_rate_limit_stats() -> None:
+    """重置各类请求的限速统计信息
+    """
+    for bucket in _buckets.values():
+        if bucket:
+            bucket.reset_stats()
+
+
+def GetBucketName(url: str, headers: Dict[str, str]) -> str:
+    """判断请求所属的类别
+
+    Args:
+        url (str): 请求 URL
+        headers (Dict[str, str]): 请求头
+
+    Returns:
+        str: 请求类别
+    """
+    if url.startswith("https://www.beikeisland.com"):
+        return "beikeisland"
+    if "X-Requested-With" in headers:  # 简书 JSON 接口均使用 api_request_header
+        return "jianshu_api"
+    return "jianshu_html"
+
+
+def WaitForToken(url: str, headers: Dict[str, str]) -> None:
+    """等待请求所属类别的令牌，该类别未限速时立即返回
+
+    Args:
+        url (str): 请求 URL
+        headers (Dict[str, str]): 请求头
+    """
+    bucket = _buckets[GetBucketName(url, headers)]
+    if bucket:
+        bucket.acquire()
+
+
+async def AsyncWaitForToken(url: str, headers: Dict[str, str]) -> None:
+    """异步等待请求所属类别的令牌，该类别未限速时立即返回
+
+    Args:
+        url (str): 请求 URL
+        headers (Dict[str, str]): 请求头
+    """
+    bucket = _buckets[GetBucketName(url, headers)]
+    if bucket:
+        await bucket.async_acquire()
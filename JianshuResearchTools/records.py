@@ -0,0 +1,322 @@
+from datetime import datetime
+from typing import Any, Dict, List, NamedTuple, Optional
+
+__all__ = [
+    "UserBriefRecord", "ArticleBriefRecord", "SubCommentRecord",
+    "CommentRecord", "IslandBriefRecord", "IslandPostUserRecord",
+    "IslandTopicRecord", "IslandPostRecord", "AssetsRankRecord",
+    "DailyArticleRankRecord", "ArticleFPRankRecord", "UserFPRankRecord"
+]
+
+_COMMENT_VIP_TYPE_TO_NAME = {
+    "bronze": "铜牌",
+    "silver": "银牌",
+    "gold": "黄金",
+    "platina": "白金",
+    "ordinary": "普通（旧会员）",
+    "distinguished": "至尊（旧会员）"
+}
+
+
+def _ValueToDict(value: Any) -> Any:
+    """将嵌套的记录转换为字典
+
+    Args:
+        value (Any): 字段值
+
+    Returns:
+        Any: 转换后的字段值
+    """
+    if hasattr(value, "to_dict"):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [_ValueToDict(item) for item in value]
+    return value
+
+
+def _RecordToDict(record: NamedTuple, optional_fields: tuple = ()) -> Dict:
+    """将记录转换为字典，结果与不使用记录时的返回值相同
+
+    Args:
+        record (NamedTuple): 记录
+        optional_fields (tuple, optional): 可选字段，值为 None 时不会出现在字典中. Defaults to ().
+
+    Returns:
+        Dict: 转换后的字典
+    """
+    return {
+        name: _ValueToDict(value)
+        for name, value in zip(record._fields, record)
+        if not (value is None and name in optional_fields)
+    }
+
+
+class UserBriefRecord(NamedTuple):
+    """文章与评论列表中的用户信息
+
+    vip_type 与 vip_expire_date 只在评论列表中出现，用户没有开通会员时为 None
+    """
+    uid: int
+    name: str
+    uslug: str
+    avatar_url: str
+    vip_type: Optional[str]
+    vip_expire_date: Optional[datetime]
+
+    @classmethod
+    def from_json(cls, json_obj: Dict, with_vip_info: bool = False) -> "UserBriefRecord":
+        member = json_obj.get("member") if with_vip_info else None
+        return cls(
+            json_obj["id"], json_obj["nickname"], json_obj["slug"], json_obj["avatar"],
+            _COMMENT_VIP_TYPE_TO_NAME[member["type"]] if member else None,
+            datetime.fromtimestamp(member["expires_at"]) if member else None
+        )
+
+    def to_dict(self) -> Dict:
+        return _RecordToDict(self, ("vip_type", "vip_expire_date"))
+
+
+class ArticleBriefRecord(NamedTuple):
+    """用户、专题与文集文章列表中的文章信息
+
+    专题文章列表中没有 is_top 字段，此时为 None
+    """
+    aid: int
+    title: str
+    aslug: str
+    release_time: datetime
+    first_image_url: str
+    summary: str
+    views_count: int
+    likes_count: int
+    is_top: Optional[bool]
+    paid: bool
+    commentable: bool
+    user: UserBriefRecord
+    total_fp_amount: float
+    comments_count: int
+    rewards_count: int
+
+    @classmethod
+    def from_json(cls, json_obj: Dict, with_is_top: bool = True) -> "ArticleBriefRecord":
+        return cls(
+            json_obj["id"], json_obj["title"], json_obj["slug"],
+            datetime.fromisoformat(json_obj["first_shared_at"]), json_obj["list_image_url"],
+            json_obj["public_abbr"], json_obj["views_count"], json_obj["likes_count"],
+            json_obj["is_top"] if with_is_top else None, json_obj["paid"], json_obj["commentable"],
+            UserBriefRecord.from_json(json_obj["user"]), json_obj["total_fp_amount"] / 1000,
+            json_obj["public_comments_count"], json_obj["total_rewards_count"]
+        )
+
+    def to_dict(self) -> Dict:
+        return _RecordToDict(self, ("is_top", ))
+
+
+class SubCommentRecord(NamedTuple):
+    """文章子评论信息
+    """
+    cmid: int
+    publish_time: datetime
+    content: str
+    images: List[str]
+    parent_comment_id: int
+    user: UserBriefRecord
+
+    @classmethod
+    def from_json(cls, json_obj: Dict) -> "SubCommentRecord":
+        return cls(
+            json_obj["id"], datetime.fromisoformat(json_obj["created_at"]), json_obj["compiled_content"],
+            [image["url"] for image in json_obj["images"]], json_obj["parent_id"],
+            UserBriefRecord.from_json(json_obj["user"], with_vip_info=True)
+        )
+
+    def to_dict(self) -> Dict:
+        return _RecordToDict(self)
+
+
+class CommentRecord(NamedTuple):
+    """文章评论信息
+
+    没有子评论时 sub_comments 为 None
+    """
+    cmid: int
+    publish_time: datetime
+    content: str
+    floor: int
+    images: List[str]
+    likes_count: int
+    sub_comments_count: int
+    user: UserBriefRecord
+    sub_comments: Optional[List[SubCommentRecord]]
+
+    @classmethod
+    def from_json(cls, json_obj: Dict) -> "CommentRecord":
+        children = json_obj.get("children")
+        return cls(
+            json_obj["id"], datetime.fromisoformat(json_obj["created_at"]), json_obj["compiled_content"],
+            json_obj["floor"], [image["url"] for image in json_obj["images"]], json_obj["likes_count"],
+            json_obj["children_count"], UserBriefRecord.from_json(json_obj["user"], with_vip_info=True),
+            [SubCommentRecord.from_json(item) for item in children] if children is not None else None
+        )
+
+    def to_dict(self) -> Dict:
+        return _RecordToDict(self, ("sub_comments", ))
+
+
+class IslandBriefRecord(NamedTuple):
+    """小岛帖子所属的小岛信息
+    """
+    iid: int
+    islug: str
+    island_name: str
+
+    def to_dict(self) -> Dict:
+        return _RecordToDict(self)
+
+
+class IslandPostUserRecord(NamedTuple):
+    """小岛帖子的发布者信息
+
+    用户没有徽章时 badge 为 None
+    """
+    uid: int
+    uslug: str
+    user_name: str
+    avatar_url: str
+    badge: Optional[str]
+
+    def to_dict(self) -> Dict:
+        return _RecordToDict(self, ("badge", ))
+
+
+class IslandTopicRecord(NamedTuple):
+    """小岛帖子所属的话题信息
+    """
+    tid: int
+    tslug: str
+    topic_name: str
+
+    def to_dict(self) -> Dict:
+        return _RecordToDict(self)
+
+
+class IslandPostRecord(NamedTuple):
+    """小岛帖子信息
+
+    帖子没有话题时 topic 为 None
+    """
+    sorted_id: int
+    pid: int
+    pslug: str
+    title: str
+    content: str
+    likes_count: int
+    comments_count: int
+    release_time: datetime
+    is_hot: bool
+    is_most_valuable: bool
+    is_topped: bool
+    is_new: bool
+    island: IslandBriefRecord
+    user: IslandPostUserRecord
+    topic: Optional[IslandTopicRecord]
+
+    @classmethod
+    def from_json(cls, json_obj: Dict) -> "IslandPostRecord":
+        user, topic = json_obj["user"], json_obj.get("topic")
+        badge = user.get("badge")
+        return cls(
+            json_obj["sorted_id"], json_obj["id"], json_obj["slug"], json_obj["title"], json_obj["content"],
+            json_obj["likes_count"], json_obj["comments_count"], datetime.fromtimestamp(json_obj["created_at"]),
+            json_obj["is_hot"], json_obj["is_best"], json_obj["is_top"], json_obj["is_new"],
+            IslandBriefRecord(json_obj["group"]["id"], json_obj["group"]["slug"], json_obj["group"]["name"]),
+            IslandPostUserRecord(user["id"], user["slug"], user["nickname"], user["avatar"],
+                                 badge["text"] if badge else None),
+            IslandTopicRecord(topic["id"], topic["slug"], topic["name"]) if topic else None
+        )
+
+    def to_dict(self) -> Dict:
+        return _RecordToDict(self, ("topic", ))
+
+
+class AssetsRankRecord(NamedTuple):
+    """资产排行榜信息
+
+    未获取或无法获取总资产时 Assets 与 FTN 为 None
+    """
+    ranking: int
+    uid: int
+    uslug: str
+    name: str
+    avatar_url: str
+    FP: float
+    Assets: Optional[float]
+    FTN: Optional[float]
+
+    @classmethod
+    def from_json(cls, json_obj: Dict) -> "AssetsRankRecord":
+        user = json_obj["user"]
+        return cls(json_obj["ranking"], user["id"], user["slug"], user["nickname"], user["avatar"],
+                   json_obj["amount"] / 1000, None, None)
+
+    def to_dict(self) -> Dict:
+        return _RecordToDict(self, ("Assets", "FTN"))
+
+
+class DailyArticleRankRecord(NamedTuple):
+    """日更排行榜信息
+    """
+    ranking: int
+    uslug: str
+    name: str
+    avatar_url: str
+    check_in_count: int
+
+    @classmethod
+    def from_json(cls, json_obj: Dict) -> "DailyArticleRankRecord":
+        return cls(json_obj["rank"], json_obj["slug"], json_obj["nickname"], json_obj["avatar"],
+                   json_obj["checkin_count"])
+
+    def to_dict(self) -> Dict:
+        return _RecordToDict(self)
+
+
+class ArticleFPRankRecord(NamedTuple):
+    """文章收益排行榜信息
+    """
+    ranking: int
+    aslug: str
+    title: str
+    author_name: str
+    author_avatar_url: str
+    fp_to_author: float
+    fp_to_voter: float
+    total_fp: float
+
+    @classmethod
+    def from_json(cls, json_obj: Dict, ranking: int) -> "ArticleFPRankRecord":
+        return cls(ranking, json_obj["slug"], json_obj["title"], json_obj["author_nickname"],
+                   json_obj["author_avatar"], json_obj["author_fp"] / 1000, json_obj["voter_fp"] / 1000,
+                   json_obj["fp"] / 1000)
+
+    def to_dict(self) -> Dict:
+        return _RecordToDict(self)
+
+
+class UserFPRankRecord(NamedTuple):
+    """用户收益排行榜信息
+    """
+    ranking: int
+    uslug: str
+    name: str
+    avatar_url: str
+    fp_from_write: int
+    fp_from_vote: int
+
+    @classmethod
+    def from_json(cls, json_obj: Dict, ranking: int) -> "UserFPRankRecord":
+        return cls(ranking, json_obj["slug"], json_obj["nickname"], json_obj["avatar"],
+                   json_obj["author_fp"], json_obj["voter_fp"])
+
+    def to_dict(self) -> Dict:
+        return _RecordToDict(self)
@@ -0,0 +1,285 @@
+from random import uniform
+from threading import Lock
+from time import monotonic
+from typing import Any, Dict, Optional, Union
+from urllib.parse import urlsplit
+
+from httpx import Response, TransportError
+
+from .exceptions import APIError, InputError
+
+__all__ = [
+    "CircuitBreaker", "configure_retry", "get_retry_config", "get_retry_stats",
+    "reset_retry_stats"
+]
+
+_retry_config: Dict[str, Any] = {
+    "max_retries": 3,  # 仅对 GET 请求重试
+    "backoff_base": 0.5,
+    "backoff_max": 10.0,
+    "failure_threshold": 5,  # 连续失败多少次后熔断
+    "recovery_timeout": 30.0  # 熔断后多少秒尝试恢复
+}
+_RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+_stats_lock = Lock()
+_retries_count = 0
+_failures_count = 0
+
+
+class CircuitBreaker:
+    """熔断器
+
+    连续失败达到阈值后进入熔断状态，此时请求会直接失败；
+    经过恢复时间后允许一次试探请求，成功则恢复，失败则继续熔断；
+    试探请求的结果未被记录时（例如请求被取消），再经过恢复时间后会放行新的试探请求
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int, recovery_timeout: float):
+        """构建新的熔断器
+
+        Args:
+            failure_threshold (int): 连续失败次数阈值
+            recovery_timeout (float): 熔断持续时间（秒）
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.open_count = 0  # 进入熔断状态的次数
+        self._opened_time = 0.0  # 进入熔断状态或放行试探请求的时间
+        self._lock = Lock()
+
+    def allow_request(self) -> bool:
+        """判断是否允许发送请求
+
+        Returns:
+            bool: 是否允许
+        """
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            now = monotonic()
+            if now - self._opened_time >= self.recovery_timeout:
+                self.state = self.HALF_OPEN  # 放行一次试探请求
+                self._opened_time = now
+                return True
+            return False
+
+    def record_success(self) -> None:
+        """记录一次成功的请求
+        """
+        with self._lock:
+            self.state = self.CLOSED
+            self.consecutive_failures = 0
+
+    def record_failure(self) -> None:
+        """记录一次失败的请求
+        """
+        with self._lock:
+            self.consecutive_failures += 1
+            if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    self.open_count += 1
+                self.state = self.OPEN
+                self._opened_time = monotonic()
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = Lock()
+
+
+def configure_retry(**kwargs: Any) -> None:
+    """修改重试与熔断配置
+
+    可用的配置项：max_retries、backoff_base、backoff_max、failure_threshold、recovery_timeout
+
+    Raises:
+        InputError: 配置项不存在时抛出此异常
+    """
+    for key in kwargs:
+        if key not in _retry_config:
+            raise InputError(f"{key} 不是有效的重试配置项")
+    _retry_config.update(kwargs)
+    with _breakers_lock:
+        _breakers.clear()  # 使用新配置重新创建熔断器
+
+
+def get_retry_config() -> Dict[str, Any]:
+    """获取当前的重试与熔断配置
+
+    Returns:
+        Dict[str, Any]: 重试与熔断配置
+    """
+    return _retry_config.copy()
+
+
+def get_retry_stats() -> Dict[str, Any]:
+    """获取重试与熔断统计信息
+
+    Returns:
+        Dict[str, Any]: 包含重试次数、失败次数与各接口的熔断器状态
+    """
+    with _breakers_lock:
+        breakers = {
+            name: {
+                "state": breaker.state,
+                "consecutive_failures": breaker.consecutive_failures,
+                "open_count": breaker.open_count
+            }
+            for name, breaker in _breakers.items()
+        }
+    return {
+        "retries_count": _retries_count,
+        "failures_count": _failures_count,
+        "circuit_breakers": breakers
+    }
+
+
+def reset_retry_stats() -> None:
+    """重置重试统计信息与所有熔断器
+    """
+    global _retries_count, _failures_count
+    with _stats_lock:
+        _retries_count = 0
+        _failures_count = 0
+    with _breakers_lock:
+        _breakers.clear()
+
+
+def GetEndpointName(url: str) -> str:
+    """获取请求 URL 对应的接口名称，用于区分熔断器
+
+    Args:
+        url (str): 请求 URL
+
+    Returns:
+        str: 接口名称，例如 www.jianshu.com/asimov/users
+    """
+    parts = urlsplit(url)
+    segments = [segment for segment in parts.path.split("/") if segment]
+    # asimov 下的接口使用前两级路径区分，其余接口使用第一级路径区分
+    depth = 2 if segments and segments[0] == "asimov" else 1
+    return "/".join([parts.netloc] + segments[:depth])
+
+
+def GetCircuitBreaker(url: str) -> CircuitBreaker:
+    """获取请求 URL 对应接口的熔断器
+
+    Args:
+        url (str): 请求 URL
+
+    Returns:
+        CircuitBreaker: 熔断器
+    """
+    name = GetEndpointName(url)
+    breaker = _breakers.get(name)
+    if breaker is None:
+        with _breakers_lock:
+            breaker = _breakers.setdefault(name, CircuitBreaker(_retry_config["failure_threshold"],
+                                                                _retry_config["recovery_timeout"]))
+    return breaker
+
+
+def AssertCircuitClosed(url: str) -> CircuitBreaker:
+    """判断请求 URL 对应接口的熔断器是否允许请求
+
+    Args:
+        url (str): 请求 URL
+
+    Raises:
+        APIError: 接口处于熔断状态时抛出此异常
+
+    Returns:
+        CircuitBreaker: 熔断器
+    """
+    breaker = GetCircuitBreaker(url)
+    if not breaker.allow_request():
+        raise APIError(f"接口 {GetEndpointName(url)} 连续请求失败，已暂时熔断")
+    return breaker
+
+
+def IsRetriable(result: Union[Response, BaseException]) -> bool:
+    """判断请求结果是否属于可重试的暂时性错误
+
+    Args:
+        result (Union[Response, BaseException]): 响应或请求时抛出的异常
+
+    Returns:
+        bool: 是否可重试
+    """
+    if isinstance(result, BaseException):
+        return isinstance(result, TransportError)
+    return result.status_code in _RETRY_STATUS_CODES
+
+
+def GetMaxRetries(method: str) -> int:
+    """获取请求的最大重试次数，非 GET 请求不重试
+
+    Args:
+        method (str): 请求方法
+
+    Returns:
+        int: 最大重试次数
+    """
+    return _retry_config["max_retries"] if method == "GET" else 0
+
+
+def GetBackoffTime(attempt: int, response: Optional[Response] = None) -> float:
+    """计算第 attempt 次重试前的等待时间，使用带完全抖动的指数退避
+
+    如果响应中带有 Retry-After 头，则至少等待其指定的秒数，但不超过 backoff_max
+
+    Args:
+        attempt (int): 重试次数，从 1 开始
+        response (Optional[Response], optional): 上一次请求的响应. Defaults to None.
+
+    Returns:
+        float: 等待时间（秒）
+    """
+    backoff_time = uniform(0, min(_retry_config["backoff_max"], _retry_config["backoff_base"] * 2 ** (attempt - 1)))
+    if response is not None:
+        try:
+            backoff_time = max(backoff_time, float(response.headers.get("Retry-After", 0)))
+        except ValueError:  # Retry-After 为日期格式
+            pass
+    return min(backoff_time, _retry_config["backoff_max"])
+
+
+def RecordResult(breaker: CircuitBreaker, result: Union[Response, BaseException], will_retry: bool) -> None:
+    """记录一次请求结果，更新熔断器与统计信息
+
+    Args:
+        breaker (CircuitBreaker): 熔断器
+        result (Union[Response, BaseException]): 响应或请求时抛出的异常
+        will_retry (bool): 是否将进行重试
+    """
+    global _retries_count, _failures_count
+    if not IsRetriable(result):
+        breaker.record_success()
+        return
+    breaker.record_failure()
+    with _stats_lock:
+        _failures_count += 1
+        if will_retry:
+            _retries_count += 1
+
+
+def RaiseForFailure(url: str, result: Union[Response, BaseException]) -> None:
+    """在重试次数用尽后抛出异常
+
+    Args:
+        url (str): 请求 URL
+        result (Union[Response, BaseException]): 最后一次请求的响应或抛出的异常
+
+    Raises:
+        BaseException: 最后一次请求抛出的异常
+        APIError: 最后一次请求的状态码表示暂时性错误时抛出此异常
+    """
+    if isinstance(result, BaseException):
+        raise result
+    if IsRetriable(result):
+        raise APIError(f"请求 {url} 失败，状态码 {result.status_code}")
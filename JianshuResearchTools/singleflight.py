@@ -0,0 +1,125 @@
+from asyncio import Task, get_running_loop, shield
+from threading import Event, Lock
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+__all__ = ["SingleFlight", "AsyncSingleFlight"]
+
+
+class _Call:
+    """正在进行的请求
+    """
+    __slots__ = ("event", "result", "exception")
+
+    def __init__(self):
+        self.event = Event()
+        self.result: Any = None
+        self.exception: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """合并并发的相同请求
+
+    同一时刻，相同标识的调用只会执行一次，其它线程等待并共享其结果或异常
+    """
+    def __init__(self):
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = Lock()
+        self.shared_count = 0  # 被合并的调用次数
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """执行调用，如果已有相同标识的调用正在进行，则等待其结果
+
+        Args:
+            key (Hashable): 调用标识
+            func (Callable[[], Any]): 需要执行的函数
+
+        Returns:
+            Any: 函数返回值
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = _Call()
+                self._calls[key] = call
+                is_leader = True
+            else:
+                self.shared_count += 1
+                is_leader = False
+
+        if not is_leader:
+            call.event.wait()
+            if call.exception is not None:
+                raise call.exception
+            return call.result
+
+        try:
+            call.result = func()
+        except BaseException as e:
+            call.exception = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+        return call.result
+
+
+class _AsyncCall:
+    """正在进行的异步请求
+    """
+    __slots__ = ("task", "waiters_count")
+
+    def __init__(self, task: Task):
+        self.task = task
+        self.waiters_count = 0
+
+
+class AsyncSingleFlight:
+    """合并并发的相同请求（异步版本）
+
+    同一事件循环中，相同标识的调用只会执行一次，其它协程等待并共享其结果或异常
+    调用在独立的任务中执行，发起调用的协程被取消时，其它等待者仍能得到结果；所有等待者都被取消后才会取消调用
+    """
+    def __init__(self):
+        self._calls: Dict[Hashable, _AsyncCall] = {}
+        self.shared_count = 0  # 被合并的调用次数
+
+    def _Forget(self, key: Hashable, call: _AsyncCall) -> None:
+        """调用结束或被取消后移除记录，之后的相同调用会重新执行
+
+        Args:
+            key (Hashable): 调用标识
+            call (_AsyncCall): 调用
+        """
+        if self._calls.get(key) is call:
+            del self._calls[key]
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        """执行调用，如果已有相同标识的调用正在进行，则等待其结果
+
+        Args:
+            key (Hashable): 调用标识
+            func (Callable[[], Awaitable[Any]]): 需要执行的协程函数
+
+        Returns:
+            Any: 协程返回值
+        """
+        loop = get_running_loop()
+        call = self._calls.get(key)
+        if call is not None and call.task.get_loop() is loop:
+            self.shared_count += 1
+        else:
+            call = _AsyncCall(loop.create_task(func()))
+            self._calls[key] = call
+            call.task.add_done_callback(lambda _: self._Forget(key, call))
+
+        call.waiters_count += 1
+        try:
+            # 使用 shield 避免某个等待者被取消时取消调用本身
+            return await shield(call.task)
+        finally:
+            call.waiters_count -= 1
+            if call.waiters_count == 0 and not call.task.done():
+                # 所有等待者都已被取消，不再需要结果
+                self._Forget(key, call)
+                call.task.cancel()
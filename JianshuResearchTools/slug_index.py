@@ -0,0 +1,310 @@
+from atexit import register as atexit_register
+from sqlite3 import Connection
+from sqlite3 import connect as sqlite_connect
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+__all__ = [
+    "SlugIndex", "INDEXED_RESOURCE_TYPES", "set_slug_index_status",
+    "get_slug_index_status", "get_slug_index_stats", "clear_slug_index"
+]
+
+# 文集 Slug 即为文集 ID，无需建立索引
+INDEXED_RESOURCE_TYPES = ("user", "article", "collection")
+# 新条目积累到此数量后才写入数据库，避免每次请求都提交事务
+FLUSH_THRESHOLD = 1000
+
+
+def ExtractIdSlugPairs(json_obj: Any, resource_type: str, path: Tuple[str, ...] = ()) -> List[Tuple[str, int, str]]:
+    """从 JSON 数据中提取指定位置的资源 ID 与 Slug
+
+    只提取调用方明确指定的位置，不根据键名推断资源类型，避免 id 字段不是资源 ID 时写入错误的索引
+
+    Args:
+        json_obj (Any): JSON 数据
+        resource_type (str): 指定位置的资源类型
+        path (Tuple[str, ...], optional): 资源在 JSON 数据中的位置，由键名组成，"*" 表示列表中的每一项. Defaults to ().
+
+    Returns:
+        List[Tuple[str, int, str]]: 由 (资源类型, ID, Slug) 组成的列表，数据结构与位置不符时跳过
+    """
+    objs = [json_obj]
+    for key in path:
+        next_objs = []
+        for obj in objs:
+            if key == "*":
+                if isinstance(obj, list):
+                    next_objs.extend(obj)
+            elif isinstance(obj, dict) and key in obj:
+                next_objs.append(obj[key])
+        objs = next_objs
+    return [
+        (resource_type, obj["id"], obj["slug"]) for obj in objs
+        if isinstance(obj, dict) and isinstance(obj.get("id"), int) and isinstance(obj.get("slug"), str)
+    ]
+
+
+class SlugIndex:
+    """资源 ID 与 Slug 的双向索引
+
+    数据保存在内存中，指定数据库路径后同时保存到 SQLite 数据库，程序重启后仍然有效
+    新条目积累到 FLUSH_THRESHOLD 条后批量写入数据库，调用 flush 或 close 时写入剩余条目
+    """
+    def __init__(self, path: Optional[str] = None):
+        """构建新的索引
+
+        Args:
+            path (Optional[str], optional): 数据库文件路径，为 None 时只保存在内存中. Defaults to None.
+        """
+        self.path = path
+        self._ids: Dict[str, Dict[str, int]] = {name: {} for name in INDEXED_RESOURCE_TYPES}
+        self._slugs: Dict[str, Dict[int, str]] = {name: {} for name in INDEXED_RESOURCE_TYPES}
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self._pending: List[Tuple[str, int, str]] = []  # 尚未写入数据库的条目
+
+        self._connection: Optional[Connection] = None
+        if path is not None:
+            self._connection = sqlite_connect(path, check_same_thread=False)
+            self._connection.execute("""
+                CREATE TABLE IF NOT EXISTS id_slug_index (
+                    type TEXT NOT NULL,
+                    id INTEGER NOT NULL,
+                    slug TEXT NOT NULL,
+                    PRIMARY KEY (type, id)
+                )
+            """)
+            self._connection.execute("CREATE INDEX IF NOT EXISTS slug_index ON id_slug_index (type, slug)")
+            self._connection.commit()
+
+    def add_many(self, pairs: List[Tuple[str, int, str]]) -> None:
+        """添加多组 ID 与 Slug，不在索引范围内的资源类型会被忽略
+
+        Args:
+            pairs (List[Tuple[str, int, str]]): 由 (资源类型, ID, Slug) 组成的列表
+        """
+        new_pairs = []
+        with self._lock:
+            for resource_type, resource_id, resource_slug in pairs:
+                ids = self._ids.get(resource_type)
+                if ids is None or ids.get(resource_slug) == resource_id:
+                    continue
+                ids[resource_slug] = resource_id
+                self._slugs[resource_type][resource_id] = resource_slug
+                new_pairs.append((resource_type, resource_id, resource_slug))
+            if new_pairs and self._connection is not None:
+                self._pending.extend(new_pairs)
+                if len(self._pending) >= FLUSH_THRESHOLD:
+                    self._Flush()
+
+    def _Flush(self) -> None:
+        """将尚未写入的条目写入数据库，需要在持有锁时调用
+        """
+        if self._pending and self._connection is not None:
+            self._connection.executemany("INSERT OR REPLACE INTO id_slug_index VALUES (?, ?, ?)", self._pending)
+            self._connection.commit()
+        self._pending.clear()
+
+    def flush(self) -> None:
+        """将尚未写入的条目写入数据库
+        """
+        with self._lock:
+            self._Flush()
+
+    def _Query(self, sql: str, args: Tuple) -> Optional[Union[int, str]]:
+        """在数据库中查询，需要在持有锁时调用
+
+        Args:
+            sql (str): SQL 语句
+            args (Tuple): 参数
+
+        Returns:
+            Optional[Union[int, str]]: 查询结果，不存在时为 None
+        """
+        if self._connection is None:
+            return None
+        row = self._connection.execute(sql, args).fetchone()
+        return row[0] if row else None
+
+    def get_id(self, resource_type: str, resource_slug: str) -> Optional[int]:
+        """根据 Slug 查找 ID
+
+        Args:
+            resource_type (str): 资源类型
+            resource_slug (str): 资源 Slug
+
+        Returns:
+            Optional[int]: 资源 ID，不存在时为 None
+        """
+        with self._lock:
+            result = self._ids[resource_type].get(resource_slug)
+            if result is None:
+                result = self._Query("SELECT id FROM id_slug_index WHERE type = ? AND slug = ?",
+                                     (resource_type, resource_slug))
+                if result is not None:
+                    self._ids[resource_type][resource_slug] = result
+                    self._slugs[resource_type][result] = resource_slug
+            if result is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return result
+
+    def get_slug(self, resource_type: str, resource_id: int) -> Optional[str]:
+        """根据 ID 查找 Slug
+
+        Args:
+            resource_type (str): 资源类型
+            resource_id (int): 资源 ID
+
+        Returns:
+            Optional[str]: 资源 Slug，不存在时为 None
+        """
+        with self._lock:
+            result = self._slugs[resource_type].get(resource_id)
+            if result is None:
+                result = self._Query("SELECT slug FROM id_slug_index WHERE type = ? AND id = ?",
+                                     (resource_type, resource_id))
+                if result is not None:
+                    self._slugs[resource_type][resource_id] = result
+                    self._ids[resource_type][result] = resource_id
+            if result is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return result
+
+    def clear(self) -> None:
+        """清空索引与统计信息
+        """
+        with self._lock:
+            for name in INDEXED_RESOURCE_TYPES:
+                self._ids[name].clear()
+                self._slugs[name].clear()
+            self._pending.clear()
+            if self._connection is not None:
+                self._connection.execute("DELETE FROM id_slug_index")
+                self._connection.commit()
+            self.hits = 0
+            self.misses = 0
+
+    def close(self) -> None:
+        """写入剩余条目并关闭数据库连接
+        """
+        with self._lock:
+            if self._connection is not None:
+                self._Flush()
+                self._connection.close()
+                self._connection = None
+
+    def stats(self) -> Dict[str, Any]:
+        """获取索引统计信息
+
+        Returns:
+            Dict[str, Any]: 包含命中次数、未命中次数、命中率与各类资源的条目数
+        """
+        with self._lock:
+            if self._connection is not None:
+                self._Flush()
+                sizes = dict(self._connection.execute("SELECT type, COUNT(*) FROM id_slug_index GROUP BY type"))
+            else:
+                sizes = {name: len(ids) for name, ids in self._ids.items()}
+            total = self.hits + self.misses
+            return {
+                "path": self.path,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / total if total else 0.0,
+                "size": {name: sizes.get(name, 0) for name in INDEXED_RESOURCE_TYPES}
+            }
+
+
+_slug_index: Optional[SlugIndex] = None  # 默认关闭，开启后条目数随请求数增长
+
+
+def set_slug_index_status(status: bool, path: Optional[str] = None) -> None:
+    """设置 ID 与 Slug 索引状态
+
+    开启后，结构已知的接口数据中的用户、文章与专题 ID 与 Slug 会被记录，
+    ID 转换函数会优先从索引中查找，找不到时才发送请求
+
+    # ! 索引在内存中保存全部条目且不会自动淘汰，长时间抓取时可调用 clear_slug_index 释放内存
+
+    Args:
+        status (bool): True 为开启，False 为关闭
+        path (Optional[str], optional): 数据库文件路径，为 None 时只保存在内存中. Defaults to None.
+    """
+    if not isinstance(status, bool):
+        raise TypeError(f"{status} 不是 bool 类型，而是 {type(status).__name__} 类型")
+
+    global _slug_index
+    if _slug_index is not None:
+        _slug_index.close()
+        _slug_index = None
+    if status:
+        _slug_index = SlugIndex(path)
+        atexit_register(_slug_index.close)  # 程序退出时写入剩余条目
+
+
+def get_slug_index_status() -> bool:
+    """查询 ID 与 Slug 索引状态
+
+    Returns:
+        bool: True 为开启，False 为关闭
+    """
+    return _slug_index is not None
+
+
+def get_slug_index_stats() -> Optional[Dict[str, Any]]:
+    """获取 ID 与 Slug 索引统计信息
+
+    Returns:
+        Optional[Dict[str, Any]]: 包含命中次数、未命中次数、命中率与各类资源的条目数，索引关闭时为 None
+    """
+    return _slug_index.stats() if _slug_index else None
+
+
+def clear_slug_index() -> None:
+    """清空 ID 与 Slug 索引
+    """
+    if _slug_index:
+        _slug_index.clear()
+
+
+def IndexPayload(json_obj: Any, resource_type: str, path: Tuple[str, ...] = ()) -> None:
+    """将 JSON 数据中指定位置的 ID 与 Slug 写入索引，索引关闭时不进行任何操作
+
+    Args:
+        json_obj (Any): JSON 数据
+        resource_type (str): 指定位置的资源类型
+        path (Tuple[str, ...], optional): 资源在 JSON 数据中的位置，格式与 ExtractIdSlugPairs 相同. Defaults to ().
+    """
+    if _slug_index is not None:
+        _slug_index.add_many(ExtractIdSlugPairs(json_obj, resource_type, path))
+
+
+def GetIndexedId(resource_type: str, resource_slug: str) -> Optional[int]:
+    """从索引中查找资源 ID，索引关闭或不存在时返回 None
+
+    Args:
+        resource_type (str): 资源类型
+        resource_slug (str): 资源 Slug
+
+    Returns:
+        Optional[int]: 资源 ID
+    """
+    return _slug_index.get_id(resource_type, resource_slug) if _slug_index else None
+
+
+def GetIndexedSlug(resource_type: str, resource_id: int) -> Optional[str]:
+    """从索引中查找资源 Slug，索引关闭或不存在时返回 None
+
+    Args:
+        resource_type (str): 资源类型
+        resource_id (int): 资源 ID
+
+    Returns:
+        Optional[str]: 资源 Slug
+    """
+    return _slug_index.get_slug(resource_type, resource_id) if _slug_index else None
@@ -0,0 +1,207 @@
+from asyncio import sleep as asyncio_sleep
+from base64 import b64decode, b64encode
+from hashlib import sha1
+from os import makedirs, path
+from random import uniform
+from threading import Lock
+from time import sleep
+from typing import Any, Dict, Optional
+
+from httpx import (AsyncBaseTransport, AsyncHTTPTransport, BaseTransport,
+                   HTTPTransport, Request, Response)
+
+from .exceptions import APIError
+
+try:
+    from ujson import dump as json_dump
+    from ujson import load as json_load
+except ImportError:
+    from json import dump as json_dump
+    from json import load as json_load
+
+__all__ = ["GetRequestCorpusKey", "RecordTransport", "ReplayTransport"]
+
+# 录制时已解压响应内容，回放时不能再携带这些响应头
+_SKIPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection"}
+
+
+def GetRequestCorpusKey(request: Request) -> str:
+    """根据请求方法、URL、排序后的查询参数与请求体生成语料文件名
+
+    Args:
+        request (Request): 请求
+
+    Returns:
+        str: 语料文件名（不含扩展名）
+    """
+    query = "&".join(f"{key}={value}" for key, value in sorted(request.url.params.multi_items()))
+    raw = "\n".join((request.method, str(request.url.copy_with(query=None)), query))
+    return sha1(raw.encode("utf-8") + b"\n" + request.content).hexdigest()
+
+
+def _DumpResponse(request: Request, response: Response) -> Dict[str, Any]:
+    """将响应转换为可保存的字典
+
+    Args:
+        request (Request): 请求
+        response (Response): 已读取内容的响应
+
+    Returns:
+        Dict[str, Any]: 语料数据
+    """
+    return {
+        "method": request.method,
+        "url": str(request.url),
+        "status_code": response.status_code,
+        "headers": [(key, value) for key, value in response.headers.items()
+                    if key.lower() not in _SKIPPED_HEADERS],
+        "content": b64encode(response.content).decode("ascii")
+    }
+
+
+def _LoadResponse(data: Dict[str, Any]) -> Response:
+    """根据语料数据构建响应
+
+    Args:
+        data (Dict[str, Any]): 语料数据
+
+    Returns:
+        Response: 响应
+    """
+    return Response(data["status_code"], headers=data["headers"], content=b64decode(data["content"]))
+
+
+class RecordTransport(BaseTransport, AsyncBaseTransport):
+    """录制传输层
+
+    通过真实网络发送请求，并将原始响应保存到语料目录中，供 ReplayTransport 回放
+    """
+    def __init__(self, corpus_dir: str, http2: bool = False):
+        """构建新的录制传输层
+
+        Args:
+            corpus_dir (str): 语料目录，不存在时自动创建
+            http2 (bool, optional): 是否使用 HTTP/2. Defaults to False.
+        """
+        makedirs(corpus_dir, exist_ok=True)
+        self.corpus_dir = corpus_dir
+        self.http2 = http2
+        self.recorded_count = 0
+        self._transport: Optional[HTTPTransport] = None
+        self._async_transport: Optional[AsyncHTTPTransport] = None
+        self._lock = Lock()
+
+    def _Save(self, request: Request, response: Response) -> Response:
+        """保存响应，并返回可再次读取的新响应
+
+        Args:
+            request (Request): 请求
+            response (Response): 已读取内容的响应
+
+        Returns:
+            Response: 新响应
+        """
+        data = _DumpResponse(request, response)
+        with self._lock:
+            with open(path.join(self.corpus_dir, f"{GetRequestCorpusKey(request)}.json"),
+                      "w", encoding="utf-8") as f:
+                json_dump(data, f)
+            self.recorded_count += 1
+        return _LoadResponse(data)
+
+    def handle_request(self, request: Request) -> Response:
+        if self._transport is None:
+            self._transport = HTTPTransport(http2=self.http2)
+        response = self._transport.handle_request(request)
+        try:
+            response.read()
+        finally:
+            response.close()
+        return self._Save(request, response)
+
+    async def handle_async_request(self, request: Request) -> Response:
+        if self._async_transport is None:
+            self._async_transport = AsyncHTTPTransport(http2=self.http2)
+        response = await self._async_transport.handle_async_request(request)
+        try:
+            await response.aread()
+        finally:
+            await response.aclose()
+        return self._Save(request, response)
+
+    def close(self) -> None:
+        # 客户端关闭后可能会使用同一个传输层重新创建，此处只关闭底层连接池
+        transport, self._transport = self._transport, None
+        if transport is not None:
+            transport.close()
+
+    async def aclose(self) -> None:
+        transport, self._async_transport = self._async_transport, None
+        if transport is not None:
+            await transport.aclose()
+
+
+class ReplayTransport(BaseTransport, AsyncBaseTransport):
+    """回放传输层
+
+    从语料目录中读取 RecordTransport 录制的响应，不发送任何网络请求，可模拟网络延迟
+    """
+    def __init__(self, corpus_dir: str, latency: float = 0.0, jitter: float = 0.0):
+        """构建新的回放传输层
+
+        Args:
+            corpus_dir (str): 语料目录
+            latency (float, optional): 每个请求的模拟延迟（秒）. Defaults to 0.0.
+            jitter (float, optional): 在模拟延迟基础上增加的随机延迟上限（秒）. Defaults to 0.0.
+        """
+        self.corpus_dir = corpus_dir
+        self.latency = latency
+        self.jitter = jitter
+        self.replayed_count = 0
+        self._corpus: Dict[str, Dict[str, Any]] = {}  # 已读取的语料
+        self._lock = Lock()
+
+    def _GetDelay(self) -> float:
+        """获取本次请求的模拟延迟
+
+        Returns:
+            float: 模拟延迟（秒）
+        """
+        return self.latency + (uniform(0, self.jitter) if self.jitter else 0.0)
+
+    def _Load(self, request: Request) -> Response:
+        """读取请求对应的语料
+
+        Args:
+            request (Request): 请求
+
+        Raises:
+            APIError: 语料中不存在该请求时抛出此异常
+
+        Returns:
+            Response: 响应
+        """
+        key = GetRequestCorpusKey(request)
+        data = self._corpus.get(key)
+        if data is None:
+            try:
+                with open(path.join(self.corpus_dir, f"{key}.json"), "r", encoding="utf-8") as f:
+                    data = json_load(f)
+            except FileNotFoundError:
+                raise APIError(f"回放语料中不存在请求 {request.method} {request.url}")
+            self._corpus[key] = data
+        with self._lock:
+            self.replayed_count += 1
+        return _LoadResponse(data)
+
+    def handle_request(self, request: Request) -> Response:
+        delay = self._GetDelay()
+        if delay:
+            sleep(delay)
+        return self._Load(request)
+
+    async def handle_async_request(self, request: Request) -> Response:
+        delay = self._GetDelay()
+        if delay:
+            await asyncio_sleep(delay)
+        return self._Load(request)
@@ -1,20 +1,28 @@
+from collections import deque
 from datetime import datetime
+from math import ceil
 from re import findall
-from typing import Dict, Generator, List
+from typing import Dict, Generator, Iterable, List, Optional, Tuple, Union
 
 from lxml import etree
 
-from .assert_funcs import AssertUserStatusNormal, AssertUserUrl
+from .assert_funcs import (AssertCachedStatusNormal, AssertUserJsonDataNormal,
+                           AssertUserStatusNormal, AssertUserUrl)
 from .basic_apis import (GetUserArticlesListJsonDataApi,
                          GetUserCollectionsAndNotebooksJsonDataApi,
                          GetUserFollowersListHtmlDataApi,
                          GetUserFollowingListHtmlDataApi, GetUserJsonDataApi,
                          GetUserNextAnniversaryDayHtmlDataApi,
                          GetUserPCHtmlDataApi, GetUserTimelineHtmlDataApi)
-from .convert import (ArticleSlugToArticleUrl, CollectionSlugToCollectionUrl,
-                      NotebookSlugToNotebookUrl, UserSlugToUserUrl,
-                      UserUrlToUserSlug)
+from .checkpoint import CheckpointStore
+from .convert import UserUrlToUserSlug
 from .exceptions import APIError
+from .parsers import (ParseArticlesListJson, ParseUserFollowListHtml,
+                      ParseUserTimelineHtml)
+from .planner import (USER_ANNIVERSARY_HTML_SOURCE, USER_JSON_SOURCE,
+                      USER_PC_HTML_SOURCE, ParseUserData, PlanUserDataSources)
+from .records import ArticleBriefRecord
+from .utils import BatchCall, IterPages, RunConcurrently
 
 __all__ = [
     "GetUserName", "GetUserGender", "GetUserFollowersCount",
@@ -25,8 +33,9 @@ __all__ = [
     "GetUserNextAnniversaryDay", "GetUserNotebooksInfo",
     "GetUserOwnCollectionsInfo", "GetUserManageableCollectionsInfo",
     "GetUserArticlesInfo", "GetUserFollowingInfo", "GetUserFansInfo",
-    "GetUserAllBasicData", "GetUserTimelineInfo", "GetUserAllArticlesInfo",
-    "GetUserAllFollowingInfo", "GetUserAllFansInfo", "GetUserAllTimelineInfo"
+    "GetUserAllBasicData", "GetUsersAllBasicData", "GetUserData",
+    "GetUserTimelineInfo", "GetUserAllArticlesInfo", "GetUserAllFollowingInfo",
+    "GetUserAllFansInfo", "GetUserAllTimelineInfo", "GetUserNewTimelineInfo"
 ]
 
 
@@ -42,8 +51,10 @@ def GetUserName(user_url: str, disable_check: bool = False) -> str:
     """
     if not disable_check:
         AssertUserUrl(user_url)
-        AssertUserStatusNormal(user_url)
+        AssertCachedStatusNormal(user_url)
     json_obj = GetUserJsonDataApi(user_url)
+    if not disable_check:
+        AssertUserJsonDataNormal(user_url, json_obj)
     result = json_obj["nickname"]
     return result
 
@@ -60,8 +71,10 @@ def GetUserGender(user_url: str, disable_check: bool = False) -> int:
     """
     if not disable_check:
         AssertUserUrl(user_url)
-        AssertUserStatusNormal(user_url)
+        AssertCachedStatusNormal(user_url)
     json_obj = GetUserJsonDataApi(user_url)
+    if not disable_check:
+        AssertUserJsonDataNormal(user_url, json_obj)
     result = json_obj["gender"]
     if result == 3:  # 某些未设置性别的账号性别值为 3，怀疑为简书系统遗留问题
         result = 0  # 3 也代表性别未知
@@ -80,8 +93,10 @@ def GetUserFollowersCount(user_url: str, disable_check: bool = False) -> int:
     """
     if not disable_check:
         AssertUserUrl(user_url)
-        AssertUserStatusNormal(user_url)
+        AssertCachedStatusNormal(user_url)
     json_obj = GetUserJsonDataApi(user_url)
+    if not disable_check:
+        AssertUserJsonDataNormal(user_url, json_obj)
     result = json_obj["following_users_count"]
     return result
 
@@ -98,8 +113,10 @@ def GetUserFansCount(user_url: str, disable_check: bool = False) -> int:
     """
     if not disable_check:
         AssertUserUrl(user_url)
-        AssertUserStatusNormal(user_url)
+        AssertCachedStatusNormal(user_url)
     json_obj = GetUserJsonDataApi(user_url)
+    if not disable_check:
+        AssertUserJsonDataNormal(user_url, json_obj)
     result = json_obj["followers_count"]
     return result
 
@@ -135,8 +152,10 @@ def GetUserWordage(user_url: str, disable_check: bool = False) -> int:
     """
     if not disable_check:
         AssertUserUrl(user_url)
-        AssertUserStatusNormal(user_url)
+        AssertCachedStatusNormal(user_url)
     json_obj = GetUserJsonDataApi(user_url)
+    if not disable_check:
+        AssertUserJsonDataNormal(user_url, json_obj)
     result = json_obj["total_wordage"]
     return result
 
@@ -153,8 +172,10 @@ def GetUserLikesCount(user_url: str, disable_check: bool = False) -> int:
     """
     if not disable_check:
         AssertUserUrl(user_url)
-        AssertUserStatusNormal(user_url)
+        AssertCachedStatusNormal(user_url)
     json_obj = GetUserJsonDataApi(user_url)
+    if not disable_check:
+        AssertUserJsonDataNormal(user_url, json_obj)
     result = json_obj["total_likes_count"]
     return result
 
@@ -175,16 +196,11 @@ def GetUserAssetsCount(user_url: str, disable_check: bool = False) -> float:
     Returns:
         float: 用户总资产
     """
-    if not disable_check:
-        AssertUserUrl(user_url)
-        AssertUserStatusNormal(user_url)
-    html_obj = GetUserPCHtmlDataApi(user_url)
-    try:
-        result = html_obj.xpath("//div[@class='info']/ul/li[6]/div[@class='meta-block']/p")[0].text
-    except IndexError:
+    # 判断账号状态所需的用户 JSON 数据会与个人主页并发获取
+    result = GetUserData(user_url, ["assets_count"], disable_check=disable_check)
+    if result["assets_count"] is None:
         raise APIError("受简书 API 限制，用户无文章时无法获取其总资产数据")
-    result = float(result.replace(".", "").replace("w", "000"))
-    return result
+    return result["assets_count"]
 
 
 def GetUserFPCount(user_url: str, disable_check: bool = False) -> float:
@@ -204,8 +220,10 @@ def GetUserFPCount(user_url: str, disable_check: bool = False) -> float:
     """
     if not disable_check:
         AssertUserUrl(user_url)
-        AssertUserStatusNormal(user_url)
+        AssertCachedStatusNormal(user_url)
     json_obj = GetUserJsonDataApi(user_url)
+    if not disable_check:
+        AssertUserJsonDataNormal(user_url, json_obj)
     result = json_obj["jsd_balance"] / 1000
     if json_obj["total_wordage"] == 0 and result == 0:
         raise APIError("受简书 API 限制，用户无文章时无法获取其简书钻数据")
@@ -221,18 +239,19 @@ def GetUserFTNCount(user_url: str, disable_check: bool = False) -> float:
         user_url (str): 用户个人主页 URL
         disable_check (bool): 禁用参数有效性检查. Defaults to False.
 
+    Raises:
+        APIError: 由于用户没有文章导致无法获取简书钻或总资产信息时抛出此异常
+
     Returns:
         float: 用户简书贝数量
     """
-    if not disable_check:
-        AssertUserUrl(user_url)
-        AssertUserStatusNormal(user_url)
-    assets = GetUserAssetsCount(user_url)
-    FTN = GetUserFPCount(user_url)
-    result = assets - FTN
-    result = abs(result)  # 处理用户简书贝数量较少导致结果为负的情况
-    result = round(result, 3)  # 处理浮点数精度问题
-    return result
+    # 简书贝数量由简书钻数量与总资产计算得出，所需的用户 JSON 数据与个人主页各只获取一次
+    result = GetUserData(user_url, ["FP_count", "assets_count", "FTN_count"], disable_check=disable_check)
+    if result["FP_count"] is None:
+        raise APIError("受简书 API 限制，用户无文章时无法获取其简书钻数据")
+    if result["assets_count"] is None:
+        raise APIError("受简书 API 限制，用户无文章时无法获取其总资产数据")
+    return result["FTN_count"]
 
 
 def GetUserBadgesList(user_url: str, disable_check: bool = False) -> List[str]:
@@ -267,8 +286,10 @@ def GetUserLastUpdateTime(user_url: str, disable_check: bool = False) -> datetim
     """
     if not disable_check:
         AssertUserUrl(user_url)
-        AssertUserStatusNormal(user_url)
+        AssertCachedStatusNormal(user_url)
     json_obj = GetUserJsonDataApi(user_url)
+    if not disable_check:
+        AssertUserJsonDataNormal(user_url, json_obj)
     result = datetime.fromtimestamp(json_obj["last_updated_at"])
     return result
 
@@ -285,8 +306,10 @@ def GetUserVIPInfo(user_url: str, disable_check: bool = False) -> Dict:
     """
     if not disable_check:
         AssertUserUrl(user_url)
-        AssertUserStatusNormal(user_url)
+        AssertCachedStatusNormal(user_url)
     json_obj = GetUserJsonDataApi(user_url)
+    if not disable_check:
+        AssertUserJsonDataNormal(user_url, json_obj)
     try:
         result = {
             "vip_type": {
@@ -317,8 +340,10 @@ def GetUserIntroductionHtml(user_url: str, disable_check: bool = False) -> str:
     """
     if not disable_check:
         AssertUserUrl(user_url)
-        AssertUserStatusNormal(user_url)
+        AssertCachedStatusNormal(user_url)
     json_obj = GetUserJsonDataApi(user_url)
+    if not disable_check:
+        AssertUserJsonDataNormal(user_url, json_obj)
     result = json_obj["intro"]
     return result
 
@@ -335,8 +360,10 @@ def GetUserIntroductionText(user_url: str, disable_check: bool = False) -> str:
     """
     if not disable_check:
         AssertUserUrl(user_url)
-        AssertUserStatusNormal(user_url)
+        AssertCachedStatusNormal(user_url)
     json_obj = GetUserJsonDataApi(user_url)
+    if not disable_check:
+        AssertUserJsonDataNormal(user_url, json_obj)
     if json_obj["intro"] == "":   # 简介为空
         return ""
     html_obj = etree.HTML(json_obj["intro"])
@@ -446,7 +473,8 @@ def GetUserManageableCollectionsInfo(user_url: str, disable_check: bool = False)
 
 
 def GetUserArticlesInfo(user_url: str, page: int = 1, count: int = 10,
-                        sorting_method: str = "time", disable_check: bool = False) -> List[Dict]:
+                        sorting_method: str = "time", disable_check: bool = False,
+                        as_record: bool = False) -> List[Union[Dict, ArticleBriefRecord]]:
     """获取用户文章信息
 
     Args:
@@ -456,6 +484,7 @@ def GetUserArticlesInfo(user_url: str, page: int = 1, count: int = 10,
         sorting_method (str, optional): 排序方法，time 为按照发布时间排序，
         comment_time 为按照最近评论时间排序，hot 为按照热度排序. Defaults to "time".
         disable_check (bool): 禁用参数有效性检查. Defaults to False.
+        as_record (bool, optional): 为 True 时返回 ArticleBriefRecord 而不是字典，占用内存更少，可通过 to_dict 方法转换为字典. Defaults to False.
 
     Returns:
         List[Dict]: 用户文章信息
@@ -470,32 +499,9 @@ def GetUserArticlesInfo(user_url: str, page: int = 1, count: int = 10,
     }[sorting_method]
     json_obj = GetUserArticlesListJsonDataApi(user_url=user_url, page=page,
                                               count=count, order_by=order_by)
-    result = []
-    for item in json_obj:
-        item_data = {
-            "aid": item["object"]["data"]["id"],
-            "title": item["object"]["data"]["title"],
-            "aslug": item["object"]["data"]["slug"],
-            "release_time": datetime.fromisoformat(item["object"]["data"]["first_shared_at"]),
-            "first_image_url": item["object"]["data"]["list_image_url"],
-            "summary": item["object"]["data"]["public_abbr"],
-            "views_count": item["object"]["data"]["views_count"],
-            "likes_count": item["object"]["data"]["likes_count"],
-            "is_top": item["object"]["data"]["is_top"],
-            "paid": item["object"]["data"]["paid"],
-            "commentable": item["object"]["data"]["commentable"],
-            "user": {
-                "uid": item["object"]["data"]["user"]["id"],
-                "name": item["object"]["data"]["user"]["nickname"],
-                "uslug": item["object"]["data"]["user"]["slug"],
-                "avatar_url": item["object"]["data"]["user"]["avatar"]
-            },
-            "total_fp_amount": item["object"]["data"]["total_fp_amount"] / 1000,
-            "comments_count": item["object"]["data"]["public_comments_count"],
-            "rewards_count": item["object"]["data"]["total_rewards_count"]
-        }
-        result.append(item_data)
-    return result
+    if as_record:
+        return [ArticleBriefRecord.from_json(item["object"]["data"]) for item in json_obj]
+    return ParseArticlesListJson(json_obj)
 
 
 def GetUserFollowingInfo(user_url: str, page: int = 1, disable_check: bool = False) -> List[Dict]:
@@ -513,25 +519,7 @@ def GetUserFollowingInfo(user_url: str, page: int = 1, disable_check: bool = Fal
         AssertUserUrl(user_url)
         AssertUserStatusNormal(user_url)
     html_obj = GetUserFollowingListHtmlDataApi(user_url=user_url, page=page)
-    name_raw_data = html_obj.xpath("//a[@class='name']")[1:]
-    if not name_raw_data:  # 判断该页数据是否为空
-        return []
-    followers_raw_data = html_obj.xpath("//div[@class='meta'][1]/span[1]")
-    fans_raw_data = html_obj.xpath("//div[@class='meta'][1]/span[2]")
-    articles_raw_data = html_obj.xpath("//div[@class='meta'][1]/span[3]")
-    words_and_likes_raw_data = html_obj.xpath("//div[@class='meta'][2]")
-    result = []
-    for index in range(8):
-        item_data = {
-            "name": name_raw_data[index].text,
-            "followers_count": int(followers_raw_data[index].text.replace("关注 ", "")),
-            "fans_count": int(fans_raw_data[index].text.replace("粉丝", "")),
-            "articles_count": int(articles_raw_data[index].text.replace("文章 ", "")),
-            "words_count": int(findall(r"\d+", words_and_likes_raw_data[index].text)[0]),
-            "likes_count": int(findall(r"\d+", words_and_likes_raw_data[index].text)[1])
-        }
-        result.append(item_data)
-    return result
+    return ParseUserFollowListHtml(html_obj)
 
 
 def GetUserFansInfo(user_url: str, page: int = 1, disable_check: bool = False) -> List[Dict]:
@@ -549,30 +537,17 @@ def GetUserFansInfo(user_url: str, page: int = 1, disable_check: bool = False) -
         AssertUserUrl(user_url)
         AssertUserStatusNormal(user_url)
     html_obj = GetUserFollowersListHtmlDataApi(user_url=user_url, page=page)
-    name_raw_data = html_obj.xpath("//a[@class='name']")[1:]
-    if not name_raw_data:  # 判断该页数据是否为空
-        return []
-    followers_raw_data = html_obj.xpath("//div[@class='meta'][1]/span[1]")
-    fans_raw_data = html_obj.xpath("//div[@class='meta'][1]/span[2]")
-    articles_raw_data = html_obj.xpath("//div[@class='meta'][1]/span[3]")
-    words_and_likes_raw_data = html_obj.xpath("//div[@class='meta'][2]")
-    result = []
-    for index in range(8):
-        item_data = {
-            "name": name_raw_data[index].text,
-            "followers_count": int(followers_raw_data[index].text.replace("关注 ", "")),
-            "fans_count": int(fans_raw_data[index].text.replace("粉丝", "")),
-            "articles_count": int(articles_raw_data[index].text.replace("文章 ", "")),
-            "words_count": int(findall(r"\d+", words_and_likes_raw_data[index].text)[0]),
-            "likes_count": int(findall(r"\d+", words_and_likes_raw_data[index].text)[1])
-        }
-        result.append(item_data)
-    return result
+    return ParseUserFollowListHtml(html_obj)
 
 
 def GetUserAllBasicData(user_url: str, disable_check: bool = False) -> Dict:
     """获取用户的所有基础信息
 
+    包含 USER_DATA_FIELDS 中的全部字段，与调用 GetUserData 时不指定字段相同
+
+    # ! 旧版本中 articles_count 错误地返回了用户 JSON 数据本身，现在与 GetUserArticlesCount 相同，
+    # ! 为从个人主页解析出的文章数（int），依赖旧返回值的代码需要修改
+
     Args:
         user_url (str): 用户个人主页 URL
         disable_check (bool): 禁用参数有效性检查. Defaults to False.
@@ -580,64 +555,65 @@ def GetUserAllBasicData(user_url: str, disable_check: bool = False) -> Dict:
     Returns:
         Dict: 用户基础信息
     """
+    return GetUserData(user_url, disable_check=disable_check)
+
+
+def GetUsersAllBasicData(user_urls: Iterable[str], concurrency: int = 32, ordered: bool = True,
+                         disable_check: bool = False) -> Generator[Tuple[str, Union[Dict, Exception]], None, None]:
+    """批量获取用户的所有基础信息
+
+    单个用户获取失败时不会中断其它用户的获取，无效 URL、资源异常、接口受限与网络错误会以异常对象的形式返回
+
+    Args:
+        user_urls (Iterable[str]): 用户 URL 列表
+        concurrency (int, optional): 最大并发数. Defaults to 32.
+        ordered (bool, optional): 为 True 时按输入顺序返回结果，为 False 时按完成顺序返回结果. Defaults to True.
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Yields:
+        Iterator[Tuple[str, Union[Dict, Exception]]]: (用户 URL, 用户基础信息或异常对象)
+    """
+    yield from BatchCall(lambda user_url: GetUserAllBasicData(user_url, disable_check=disable_check),
+                         user_urls, concurrency, ordered)
+
+
+def GetUserData(user_url: str, fields: Optional[Iterable[str]] = None, disable_check: bool = False) -> Dict:
+    """获取用户的指定信息
+
+    只获取所需字段对应的数据来源，多个数据来源会并发获取
+    可用字段与 GetUserAllBasicData 的返回值相同
+
+    Args:
+        user_url (str): 用户个人主页 URL
+        fields (Optional[Iterable[str]], optional): 字段列表，为 None 时获取全部字段. Defaults to None.
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Raises:
+        InputError: 存在不支持的字段时抛出此错误
+
+    Returns:
+        Dict: 用户信息，键的顺序与字段列表相同
+    """
     if not disable_check:
         AssertUserUrl(user_url)
-        AssertUserStatusNormal(user_url)
-    result = {}
-    json_obj = GetUserJsonDataApi(user_url)
-    html_obj = GetUserPCHtmlDataApi(user_url)
-    anniversary_day_html_obj = GetUserNextAnniversaryDayHtmlDataApi(UserUrlToUserSlug(user_url))
-
-    result["name"] = json_obj["nickname"]
-    result["url"] = user_url
-    result["uslug"] = UserUrlToUserSlug(user_url)
-    result["gender"] = json_obj["gender"]
-    result["followers_count"] = json_obj["following_users_count"]
-    result["fans_count"] = json_obj["followers_count"]
-    result["articles_count"] = json_obj
-    result["wordage"] = json_obj["total_wordage"]
-    result["likes_count"] = json_obj["total_likes_count"]
-    try:
-        result["assets_count"] = html_obj.xpath("//div[@class='info']/ul/li[6]/div[@class='meta-block']/p")[0].text
-        result["assets_count"] = float(result["assets_count"].replace(".", "").replace("w", "000"))
-    except IndexError:
-        result["assets_count"] = None
-    if json_obj["total_wordage"] == 0 and json_obj["jsd_balance"] == 0:
-        result["FP_count"] = None
-    else:
-        result["FP_count"] = json_obj["jsd_balance"] / 1000
-    if result["assets_count"] and result["FP_count"]:
-        result["FTN_count"] = result["assets_count"] - result["FP_count"]
-        result["FTN_count"] = round(abs(result["FTN_count"]), 3)
-    else:
-        result["FTN_count"] = None
-    result["badges_list"] = html_obj.xpath("//li[@class='badge-icon']/a/text()")
-    result["badges_list"] = [item.replace(" ", "").replace("\n", "") for item in result["badges_list"]]  # 移除空格和换行符
-    result["badges_list"] = [item for item in result["badges_list"] if item != ""]  # 去除空值
-    result["last_update_time"] = datetime.fromtimestamp(json_obj["last_updated_at"])
-    try:
-        result["vip_info"] = {
-            "vip_type": {
-                "bronze": "铜牌",
-                "silver": "银牌",
-                "gold": "黄金",
-                "platina": "白金"
-            }[json_obj["member"]["type"]],
-            "expire_date": datetime.fromtimestamp(json_obj["member"]["expires_at"])
-        }
-    except KeyError:
-        result["vip_info"] = {
-            "vip_type": None,
-            "expire_date": None
-        }
-    result["introduction_html"] = json_obj["intro"]
-    if not result["introduction_html"]:
-        result["introduction_text"] = ""
-    else:
-        result["introduction_text"] = "\n".join(etree.HTML(result["introduction_html"]).xpath("//*/text()"))
-    result["next_anniversary_day"] = anniversary_day_html_obj.xpath('//*[@id="app"]/div[1]/div/text()')[0]
-    result["next_anniversary_day"] = datetime.fromisoformat("-".join(findall(r"\d+", result["next_anniversary_day"])))
-    return result
+    fields, sources = PlanUserDataSources(fields)
+    if not disable_check and USER_JSON_SOURCE not in sources and not AssertCachedStatusNormal(user_url):
+        sources.insert(0, USER_JSON_SOURCE)  # 需要根据用户 JSON 数据判断账号状态
+
+    def GetJsonData() -> Dict:
+        json_obj = GetUserJsonDataApi(user_url)
+        if not disable_check:
+            AssertUserJsonDataNormal(user_url, json_obj)
+        return json_obj
+
+    # 用户 JSON 数据排在第一位，账号状态异常时会优先抛出对应的异常
+    fetchers = {
+        USER_JSON_SOURCE: GetJsonData,
+        USER_PC_HTML_SOURCE: lambda: GetUserPCHtmlDataApi(user_url),
+        USER_ANNIVERSARY_HTML_SOURCE: lambda: GetUserNextAnniversaryDayHtmlDataApi(UserUrlToUserSlug(user_url))
+    }
+    payloads = dict(zip(sources, RunConcurrently([fetchers[source] for source in sources])))
+    return ParseUserData(user_url, fields, payloads)
 
 
 def GetUserTimelineInfo(user_url: str, max_id: int = 1000000000, disable_check: bool = False) -> List[Dict]:
@@ -658,158 +634,13 @@ def GetUserTimelineInfo(user_url: str, max_id: int = 1000000000, disable_check:
         AssertUserStatusNormal(user_url)
     user_slug = UserUrlToUserSlug(user_url)
     html_obj = GetUserTimelineHtmlDataApi(user_slug, max_id)
-    blocks = [x.__copy__() for x in html_obj.xpath("//li[starts-with(@id, 'feed-')]")]
-    result = []
-
-    for block in blocks:
-        item_data = {
-            "operation_id": int(block.xpath("//li/@id")[0][5:]),
-            "operation_type": block.xpath("//span[starts-with(@data-datetime, '20')]/@data-type")[0],
-            "operation_time": datetime.fromisoformat(block.xpath("//span[starts-with(@data-datetime, '20')]/@data-datetime")[0])
-        }
-
-        if item_data["operation_type"] == "like_note":  # 对文章点赞
-            item_data["operation_type"] = "like_article"  # 鬼知道谁把对文章点赞写成 like_note 的
-            item_data["operator_name"] = block.xpath("//a[@class='nickname']/text()")[0]
-            item_data["operator_url"] = UserSlugToUserUrl(block.xpath("//a[@class='nickname']/@href")[0][3:])
-            item_data["operator_avatar_url"] = block.xpath("//a[@class='avatar']/img/@src")[0]
-            item_data["target_article_title"] = block.xpath("//a[@class='title']/text()")[0]
-            item_data["target_article_url"] = ArticleSlugToArticleUrl(block.xpath("//a[@class='title']/@href")[0][3:])
-            item_data["target_user_name"] = block.xpath("//div[@class='origin-author']/a/text()")[0]
-            item_data["target_user_url"] = UserSlugToUserUrl(block.xpath("//div[@class='meta']/a/@href")[0][3:])
-            item_data["target_article_reads_count"] = int(block.xpath("//div[@class='meta']/a/text()")[1])
-            item_data["target_article_likes_count"] = int(block.xpath("//div[@class='meta']/span/text()")[0])
-            try:
-                item_data["target_article_comments_count"] = int(block.xpath("//div[@class='meta']/a/text()")[3])
-            except IndexError:  # 文章没有评论或评论区关闭
-                item_data["target_article_comments_count"] = 0
-            try:
-                item_data["target_article_description"] = block.xpath("//p[@class='abstract']/text()")[0]
-            except IndexError:  # 文章没有摘要
-                item_data["target_article_description"] = ""
-
-        elif item_data["operation_type"] == "like_comment":  # 对评论点赞
-            item_data["operator_name"] = block.xpath("//a[@class='nickname']/text()")[0]
-            item_data["operator_url"] = UserSlugToUserUrl(block.xpath("//a[@class='nickname']/@href")[0][3:])
-            item_data["operator_avatar_url"] = block.xpath("//a[@class='avatar']/img/@src")[0]
-            item_data["comment_content"] = "\n".join(block.xpath("//p[@class='comment']/text()"))
-            item_data["target_article_title"] = block.xpath("//blockquote/div/span/a/text()")[0]
-            item_data["target_article_url"] = ArticleSlugToArticleUrl(block.xpath("//blockquote/div/span/a/@href")[0][3:])
-            item_data["target_user_name"] = block.xpath("//blockquote/div/a/text()")[0]
-            item_data["target_user_url"] = UserSlugToUserUrl(block.xpath("//blockquote/div/a/@href")[0][3:])
-
-        elif item_data["operation_type"] == "share_note":  # 发表文章
-            item_data["operation_type"] = "publish_article"  # 鬼知道谁把发表文章写成 share_note 的
-            item_data["operator_name"] = block.xpath("//a[@class='nickname']/text()")[0]
-            item_data["operator_url"] = UserSlugToUserUrl(block.xpath("//a[@class='nickname']/@href")[0][3:])
-            item_data["operator_avatar_url"] = block.xpath("//a[@class='avatar']/img/@src")[0]
-            item_data["target_article_title"] = block.xpath("//a[@class='title']/text()")[0]
-            item_data["target_article_url"] = ArticleSlugToArticleUrl(block.xpath("//a[@class='title']/@href")[0][3:])
-            item_data["target_article_reads_count"] = int(block.xpath("//div[@class='meta']/a/text()")[1])
-            item_data["target_article_likes_count"] = int(block.xpath("//div[@class='meta']/span/text()")[0])
-            item_data["target_article_description"] = "\n".join(block.xpath("//p[@class='abstract']/text()"))
-            try:
-                item_data["target_article_comments_count"] = int(block.xpath("//div[@class='meta']/a/text()")[3])
-            except IndexError:
-                item_data["target_article_comments_count"] = 0
-
-        elif item_data["operation_type"] == "comment_note":  # 发表评论
-            item_data["operator_name"] = block.xpath("//a[@class='nickname']/text()")[0]
-            item_data["operator_url"] = UserSlugToUserUrl(block.xpath("//a[@class='nickname']/@href")[0][3:])
-            item_data["operator_avatar_url"] = block.xpath("//a[@class='avatar']/img/@src")[0]
-            item_data["comment_content"] = "\n".join(block.xpath("//p[@class='comment']/text()"))
-            item_data["target_article_title"] = block.xpath("//a[@class='title']/text()")[0]
-            item_data["target_article_url"] = ArticleSlugToArticleUrl(block.xpath("//a[@class='title']/@href")[0][3:])
-            item_data["target_user_name"] = block.xpath("//div[@class='origin-author']/a/text()")[0]
-            item_data["target_user_url"] = UserSlugToUserUrl(block.xpath("//div[@class='meta']/a/@href")[0][3:])
-            item_data["target_article_reads_count"] = int(block.xpath("//div[@class='meta']/a/text()")[1])
-            item_data["target_article_likes_count"] = int(block.xpath("//div[@class='meta']/span/text()")[0])
-            try:
-                item_data["target_article_comments_count"] = int(block.xpath("//div[@class='meta']/a/text()")[3])
-            except IndexError:  # 文章没有评论或评论区关闭
-                item_data["target_article_comments_count"] = 0
-            try:
-                item_data["target_article_description"] = block.xpath("//p[@class='abstract']/text()")[0]
-            except IndexError:  # 文章没有描述
-                item_data["target_article_description"] = ""
-            try:
-                item_data["target_article_rewards_count"] = int(block.xpath("//div[@class='meta']/span/text()")[1])
-            except IndexError:  # 没有赞赏数据
-                item_data["target_article_rewards_count"] = 0
-
-        elif item_data["operation_type"] == "like_notebook":  # 关注文集
-            item_data["operation_type"] = "follow_notebook"  # 鬼知道谁把关注文集写成 like_notebook 的
-            item_data["operator_name"] = block.xpath("//a[@class='nickname']/text()")[0]
-            item_data["operator_url"] = UserSlugToUserUrl(block.xpath("//a[@class='nickname']/@href")[0][4:])
-            item_data["operator_avatar_url"] = block.xpath("//a[@class='avatar']/img/@src")[0]
-            item_data["target_notebook_title"] = block.xpath("//a[@class='title']/text()")[0]
-            item_data["target_notebook_url"] = NotebookSlugToNotebookUrl(block.xpath("//a[@class='title']/@href")[0][3:])
-            item_data["target_notebook_avatar_url"] = block.xpath("//div[@class='follow-detail']/div/a/img/@src")[0]
-            item_data["target_user_name"] = block.xpath("//a[@class='creater']/text()")[0]
-            item_data["target_user_url"] = UserSlugToUserUrl(block.xpath("//a[@class='creater']/@href")[0][3:])
-            item_data["target_notebook_articles_count"] = int(findall(r"\d+", block.xpath("//div[@class='info'][1]/p/text()")[1])[0])
-            item_data["target_notebook_subscribers_count"] = int(findall(r"\d+", block.xpath("//div[@class='info'][1]/p/text()")[1])[1])
-
-        elif item_data["operation_type"] == "like_collection":  # 关注专题
-            item_data["operator_type"] = "follow_collection"  # 鬼知道谁把关注专题写成 like_collection 的
-            item_data["operator_name"] = block.xpath("//a[@class='nickname']/text()")[0]
-            item_data["operator_url"] = UserSlugToUserUrl(block.xpath("//a[@class='nickname']/@href")[0][4:])
-            item_data["operator_avatar_url"] = block.xpath("//a[@class='avatar']/img/@src")[0]
-            item_data["target_collection_title"] = block.xpath("//a[@class='title']/text()")[0]
-            item_data["target_collection_url"] = CollectionSlugToCollectionUrl(block.xpath("//a[@class='title']/@href")[0][3:])
-            item_data["target_collection_avatar_url"] = block.xpath("//div[@class='follow-detail']/div/a/img/@src")[0]
-            item_data["target_user_name"] = block.xpath("//a[@class='creater']/text()")[0]
-            item_data["target_user_url"] = UserSlugToUserUrl(block.xpath("//a[@class='creater']/@href")[0][3:])
-            item_data["target_collection_articles_count"] = int(findall(r"\d+", block.xpath("//div[@class='info'][1]/p/text()")[1])[0])
-            item_data["target_collection_subscribers_count"] = int(findall(r"\d+", block.xpath("//div[@class='info'][1]/p/text()")[1])[1])
-
-        elif item_data["operation_type"] == "like_user":  # 关注用户
-            item_data["operation_type"] = "follow_user"  # 鬼知道谁把关注用户写成 like_user 的
-            item_data["operator_name"] = block.xpath("//a[@class='nickname']/text()")[0]
-            item_data["operator_url"] = UserSlugToUserUrl(block.xpath("//a[@class='nickname']/@href")[0][4:])
-            item_data["operator_avatar_url"] = block.xpath("//a[@class='avatar']/img/@src")[0]
-            item_data["target_user_name"] = block.xpath("//div[@class='info']/a[@class='title']/text()")[0]
-            item_data["target_user_url"] = UserSlugToUserUrl(block.xpath("//div[@class='info']/a[@class='title']/@href")[0][3:])
-            item_data["target_user_wordage"] = int(findall(r"\d+", block.xpath("//div[@class='follow-detail']/div[@class='info']/p/text()")[0])[0])
-            item_data["target_user_fans_count"] = int(findall(r"\d+", block.xpath("//div[@class='follow-detail']/div[@class='info']/p/text()")[0])[1])
-            item_data["target_user_likes_count"] = int(findall(r"\d+", block.xpath("//div[@class='follow-detail']/div[@class='info']/p/text()")[0])[2])
-            item_data["target_user_description"] = "\n".join(block.xpath("//div[@class='signature']/text()"))
-
-        elif item_data["operation_type"] == "reward_note":  # 赞赏文章
-            item_data["operation_type"] = "reward_article"  # 鬼知道谁把赞赏文章写成 reward_note 的
-            item_data["operator_name"] = block.xpath("//a[@class='nickname']/text()")[0]
-            item_data["operator_url"] = UserSlugToUserUrl(block.xpath("//a[@class='nickname']/@href")[0][4:])
-            item_data["operator_avatar_url"] = block.xpath("//a[@class='avatar']/img/@src")[0]
-            item_data["target_article_title"] = block.xpath("//a[@class='title']/text()")[0]
-            item_data["target_article_url"] = ArticleSlugToArticleUrl(block.xpath("//a[@class='title']/@href")[0][3:])
-            item_data["target_user_name"] = block.xpath("//div[@class='origin-author']/a/text()")[0]
-            item_data["target_user_url"] = UserSlugToUserUrl(block.xpath("//div[@class='meta']/a/@href")[0][3:])
-            item_data["target_article_reads_count"] = int(block.xpath("//div[@class='meta']/a/text()")[1])
-            item_data["target_article_likes_count"] = int(block.xpath("//div[@class='meta']/span/text()")[0])
-            try:
-                item_data["target_article_comments_count"] = int(block.xpath("//div[@class='meta']/a/text()")[3])
-            except IndexError:  # 文章没有评论或评论区关闭
-                item_data["target_article_comments_count"] = 0
-            try:
-                item_data["target_article_description"] = block.xpath("//p[@class='abstract']/text()")[0]
-            except IndexError:  # 文章没有描述
-                item_data["target_article_description"] = ""
-            try:
-                item_data["target_article_rewards_count"] = int(block.xpath("//div[@class='meta']/span/text()")[1])
-            except IndexError:  # 没有赞赏数据
-                item_data["target_article_rewards_count"] = 0
-
-        elif item_data["operation_type"] == "join_jianshu":  # 加入简书
-            item_data["operator_name"] = block.xpath("//a[@class='nickname']/text()")[0]
-            item_data["operator_url"] = UserSlugToUserUrl(block.xpath("//a[@class='nickname']/@href")[0][4:])
-            item_data["operator_avatar_url"] = block.xpath("//a[@class='avatar']/img/@src")[0]
-
-        result.append(item_data)
-    return result
+    return ParseUserTimelineHtml(html_obj)
 
 
 def GetUserAllArticlesInfo(user_url: str, count: int = 10, sorting_method: str = "time",
-                           max_count: int = None, disable_check: bool = False) -> Generator[Dict, None, None]:
+                           max_count: int = None, disable_check: bool = False,
+                           prefetch: int = 0,
+                           as_record: bool = False) -> Generator[Union[Dict, ArticleBriefRecord], None, None]:
     """获取用户的所有文章信息
 
     Args:
@@ -819,27 +650,28 @@ def GetUserAllArticlesInfo(user_url: str, count: int = 10, sorting_method: str =
         comment_time 为按照最近评论时间排序，hot 为按照热度排序. Defaults to "time".
         max_count (int, optional): 获取的文章信息数量上限，Defaults to None.
         disable_check (bool): 禁用参数有效性检查. Defaults to False.
+        prefetch (int, optional): 预取页数，大于 0 时会在后台并发获取后续页面. Defaults to 0.
+        as_record (bool, optional): 为 True 时返回 ArticleBriefRecord 而不是字典，占用内存更少，可通过 to_dict 方法转换为字典. Defaults to False.
 
     Yields:
         Iterator[Dict], None, None]: 文章信息
     """
     if not disable_check:
         AssertUserUrl(user_url)
+        AssertCachedStatusNormal(user_url)
+    total_pages = None
+    if prefetch:  # 根据用户的公开文章数计算总页数，省去最后一次空页请求；缺少该字段时逐页判断
+        json_obj = GetUserJsonDataApi(user_url)
+        if not disable_check:
+            AssertUserJsonDataNormal(user_url, json_obj)
+        articles_count = json_obj.get("public_notes_count")
+        if articles_count is not None:
+            total_pages = ceil(min(articles_count, max_count or articles_count) / count)
+    elif not disable_check:
         AssertUserStatusNormal(user_url)
-    page = 1
-    now_count = 0
-    while True:
-        result = GetUserArticlesInfo(user_url, page, count, sorting_method, disable_check=True)
-        if result:
-            page += 1
-        else:  # 没有新的数据
-            return
-        for item in result:
-            yield item
-            if max_count:  # 如果有上限
-                now_count += 1
-                if now_count == max_count:  # 达到上限
-                    return
+    yield from IterPages(lambda page: GetUserArticlesInfo(user_url, page, count, sorting_method, disable_check=True,
+                                                          as_record=as_record),
+                         prefetch, total_pages, max_count)
 
 
 def GetUserAllFollowingInfo(user_url: str, max_count: int = None, disable_check: bool = False) -> Generator[Dict, None, None]:
@@ -930,3 +762,61 @@ def GetUserAllTimelineInfo(user_url: str, max_count: int = None, disable_check:
                 now_count += 1
                 if now_count == max_count:
                     return
+
+
+def GetUserNewTimelineInfo(user_url: str, checkpoint_store: Optional[CheckpointStore] = None,
+                           last_operation_id: Optional[int] = None, max_count: int = None,
+                           disable_check: bool = False) -> List[Dict]:
+    """获取用户在检查点之后产生的新动态
+
+    从最新的动态开始获取，遇到 operation_id 不大于检查点的动态时立即停止翻页，没有新动态时只需发送一次请求；
+    第一页为空时才请求用户账号状态，账号状态异常时抛出 ResourceError，而不是返回空列表
+
+    新动态数量超过 max_count 时返回其中最旧的 max_count 条，剩余的新动态会在之后的调用中返回；
+    检查点只会推进到已返回的最新一条动态，不会遗漏任何动态
+
+    # ! max_count 只限制返回数量，不减少请求数量：接口只能从最新的动态开始翻页，
+    # ! 因此每次调用都需要翻页至检查点处，没有检查点时需要翻完用户的全部动态。
+    # ! 积压 N 条新动态时，分批获取完毕共需翻阅约 N * N / (2 * max_count) 条动态，积压较多时应增大 max_count 或不设置上限
+
+    Args:
+        user_url (str): 用户个人主页 URL
+        checkpoint_store (Optional[CheckpointStore], optional): 检查点存储，为 None 时不读取和保存检查点. Defaults to None.
+        last_operation_id (Optional[int], optional): 上一次获取到的最新动态的 operation_id，
+        不为 None 时忽略检查点存储中已有的值，两者均为空时获取全部动态. Defaults to None.
+        max_count (int, optional): 返回的动态信息数量上限，不减少请求数量. Defaults to None.
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Raises:
+        ResourceError: 用户账号状态异常时抛出此异常
+
+    Returns:
+        List[Dict]: 新动态信息，按时间从新到旧排列
+    """
+    if not disable_check:
+        AssertUserUrl(user_url)
+        AssertCachedStatusNormal(user_url)
+    user_slug = UserUrlToUserSlug(user_url)
+    if last_operation_id is None and checkpoint_store is not None:
+        last_operation_id = checkpoint_store.get(user_slug)
+
+    # 超过 max_count 时只保留最旧的部分，使检查点之后的动态连续且不被跳过
+    result = deque(maxlen=max_count or None)
+    max_id = None
+    finished = False
+    while not finished:
+        page = GetUserTimelineInfo(user_url, max_id, disable_check=True)
+        if not page:
+            if max_id is None and not disable_check:
+                AssertUserStatusNormal(user_url)  # 账号状态异常的用户动态为空，需要与没有动态区分
+            break
+        for item in page:
+            if last_operation_id is not None and item["operation_id"] <= last_operation_id:
+                finished = True  # 已到达检查点，之后的动态均已获取过
+                break
+            result.append(item)
+        max_id = page[-1]["operation_id"]
+
+    if result and checkpoint_store is not None:
+        checkpoint_store.set(user_slug, result[0]["operation_id"])
+    return list(result)
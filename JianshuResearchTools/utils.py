@@ -1,6 +1,32 @@
-from typing import Any, Dict, Tuple, Callable
+from asyncio import FIRST_COMPLETED, Semaphore, Task, ensure_future, gather
+from asyncio import wait as asyncio_wait
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED as FUTURES_FIRST_COMPLETED
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import wait as futures_wait
+from itertools import count, islice
+from threading import Lock, local
+from typing import (Any, AsyncGenerator, Awaitable, Callable, Deque, Dict,
+                    Generator, Iterable, List, Optional, Tuple, Union)
 
-__all__ = ["NameValueMappingToString", "CallWithoutCheck"]
+from httpx import TransportError
+
+from .exceptions import APIError, InputError, ResourceError
+
+__all__ = [
+    "NameValueMappingToString", "CallWithoutCheck", "RunConcurrently",
+    "AsyncRunConcurrently", "BatchCall", "AsyncBatchCall", "IterPages",
+    "AsyncIterPages", "BATCH_CALL_ERRORS"
+]
+
+# 批量调用时以异常对象形式返回的异常：参数无效、资源异常、接口受限与网络错误，其它异常通常是程序错误，会直接抛出
+BATCH_CALL_ERRORS = (InputError, ResourceError, APIError, TransportError)
+
+# 供 RunConcurrently 使用的共享线程池，首次使用时创建
+_SHARED_EXECUTOR_MAX_WORKERS = 16
+_shared_executor: Optional[ThreadPoolExecutor] = None
+_shared_executor_lock = Lock()
+_shared_executor_local = local()  # 记录当前线程是否为共享线程池中的线程
 
 
 def NameValueMappingToString(mapping: Dict[str, Tuple[Any, bool]], title: str = "") -> str:
@@ -45,3 +71,386 @@ def OnlyOne(*args: Any) -> bool:
         bool: 判断结果
     """
     return len([arg for arg in args if arg]) == 1
+
+
+def _GetSharedExecutor() -> ThreadPoolExecutor:
+    """获取共享线程池
+
+    Returns:
+        ThreadPoolExecutor: 共享线程池
+    """
+    global _shared_executor
+    with _shared_executor_lock:
+        if _shared_executor is None:
+            _shared_executor = ThreadPoolExecutor(max_workers=_SHARED_EXECUTOR_MAX_WORKERS,
+                                                  thread_name_prefix="jrt")
+        return _shared_executor
+
+
+def _CallInSharedExecutor(func: Callable[[], Any]) -> Any:
+    """在共享线程池中调用函数，并标记当前线程
+
+    Args:
+        func (Callable[[], Any]): 待调用的函数
+
+    Returns:
+        Any: 函数返回值
+    """
+    _shared_executor_local.in_shared_executor = True
+    return func()
+
+
+def RunConcurrently(funcs: List[Callable[[], Any]]) -> List[Any]:
+    """并发调用多个无参数函数，适用于同时发送多个互不依赖的请求
+
+    第一个函数在当前线程中调用，其余函数在共享线程池中调用
+    在共享线程池中再次调用本函数时会依次调用各函数，避免线程池耗尽导致死锁
+    如有函数出错，按传入顺序抛出第一个异常
+
+    Args:
+        funcs (List[Callable[[], Any]]): 待调用的函数列表
+
+    Returns:
+        List[Any]: 按传入顺序排列的函数返回值
+    """
+    if len(funcs) <= 1 or getattr(_shared_executor_local, "in_shared_executor", False):
+        return [func() for func in funcs]
+
+    executor = _GetSharedExecutor()
+    futures = [executor.submit(_CallInSharedExecutor, func) for func in funcs[1:]]
+    try:
+        first_result = funcs[0]()
+    except BaseException:
+        for future in futures:
+            future.cancel()
+        raise
+    return [first_result, *(future.result() for future in futures)]
+
+
+async def _LimitedAwait(semaphore: Semaphore, awaitable: Awaitable) -> Any:
+    """在信号量限制下等待协程
+
+    Args:
+        semaphore (Semaphore): 限制并发数的信号量
+        awaitable (Awaitable): 待等待的协程
+
+    Returns:
+        Any: 协程返回值
+    """
+    async with semaphore:
+        return await awaitable
+
+
+async def AsyncRunConcurrently(awaitables: List[Awaitable], concurrency: Optional[int] = None) -> List[Any]:
+    """并发等待多个协程，适用于同时发送多个互不依赖的请求
+
+    与 RunConcurrently 一致，如有协程出错，按传入顺序抛出第一个异常
+
+    Args:
+        awaitables (List[Awaitable]): 待等待的协程列表
+        concurrency (Optional[int], optional): 同时等待的最大协程数，为 None 时不限制. Defaults to None.
+
+    Returns:
+        List[Any]: 按传入顺序排列的协程返回值
+    """
+    if concurrency is not None:
+        semaphore = Semaphore(concurrency)
+        awaitables = [_LimitedAwait(semaphore, awaitable) for awaitable in awaitables]
+    result = await gather(*awaitables, return_exceptions=True)
+    for item in result:
+        if isinstance(item, BaseException):
+            raise item
+    return result
+
+
+def _CallForBatch(func: Callable, arg: Any) -> Union[Any, Exception]:
+    """调用函数，将 BATCH_CALL_ERRORS 中的异常作为返回值返回
+
+    Args:
+        func (Callable): 待调用的函数
+        arg (Any): 函数参数
+
+    Returns:
+        Union[Any, Exception]: 函数返回值或异常对象
+    """
+    try:
+        return func(arg)
+    except BATCH_CALL_ERRORS as e:
+        return e
+
+
+def BatchCall(func: Callable, args: Iterable[Any], concurrency: int = 32,
+              ordered: bool = True) -> Generator[Tuple[Any, Union[Any, Exception]], None, None]:
+    """使用线程池并发调用函数
+
+    单个调用出错时不会中断其它调用，BATCH_CALL_ERRORS 中的异常会以异常对象的形式返回，其它异常会直接抛出
+    参数按需从 args 中读取，同一时刻最多有 concurrency 个调用尚未返回结果，适用于很长的参数生成器
+
+    Args:
+        func (Callable): 待调用的函数，只接收一个参数
+        args (Iterable[Any]): 参数列表
+        concurrency (int, optional): 最大并发数. Defaults to 32.
+        ordered (bool, optional): 为 True 时按参数顺序返回结果，为 False 时按完成顺序返回结果. Defaults to True.
+
+    Yields:
+        Iterator[Tuple[Any, Union[Any, Exception]], None, None]: (参数, 函数返回值或异常对象)
+    """
+    args = iter(args)
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    futures: Dict[Future, Any] = {}  # 按提交顺序排列
+
+    def Submit(count: int) -> None:
+        for arg in islice(args, count):
+            futures[executor.submit(_CallForBatch, func, arg)] = arg
+
+    Submit(concurrency)
+    try:
+        while futures:
+            if ordered:
+                done = [next(iter(futures))]
+                done[0].result()
+            else:
+                done = futures_wait(futures, return_when=FUTURES_FIRST_COMPLETED)[0]
+            for future in done:
+                yield futures.pop(future), future.result()
+            # 每返回一个结果才读取下一个参数，避免参数与结果在内存中堆积
+            Submit(len(done))
+    finally:
+        # 提前结束迭代时取消尚未开始的调用
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+async def _AsyncCallForBatch(func: Callable[[Any], Awaitable], arg: Any) -> Union[Any, Exception]:
+    """调用协程函数，将 BATCH_CALL_ERRORS 中的异常作为返回值返回
+
+    Args:
+        func (Callable[[Any], Awaitable]): 待调用的协程函数
+        arg (Any): 函数参数
+
+    Returns:
+        Union[Any, Exception]: 函数返回值或异常对象
+    """
+    try:
+        return await func(arg)
+    except BATCH_CALL_ERRORS as e:
+        return e
+
+
+async def AsyncBatchCall(func: Callable[[Any], Awaitable], args: Iterable[Any], concurrency: int = 32,
+                         ordered: bool = True) -> AsyncGenerator[Tuple[Any, Union[Any, Exception]], None]:
+    """并发调用协程函数
+
+    单个调用出错时不会中断其它调用，BATCH_CALL_ERRORS 中的异常会以异常对象的形式返回，其它异常会直接抛出
+    参数按需从 args 中读取，同一时刻最多有 concurrency 个调用尚未返回结果，适用于很长的参数生成器
+
+    Args:
+        func (Callable[[Any], Awaitable]): 待调用的协程函数，只接收一个参数
+        args (Iterable[Any]): 参数列表
+        concurrency (int, optional): 最大并发数. Defaults to 32.
+        ordered (bool, optional): 为 True 时按参数顺序返回结果，为 False 时按完成顺序返回结果. Defaults to True.
+
+    Yields:
+        Iterator[Tuple[Any, Union[Any, Exception]], None]: (参数, 函数返回值或异常对象)
+    """
+    args = iter(args)
+    tasks: Dict[Task, Any] = {}  # 按创建顺序排列
+
+    def Submit(count: int) -> None:
+        for arg in islice(args, count):
+            tasks[ensure_future(_AsyncCallForBatch(func, arg))] = arg
+
+    Submit(concurrency)
+    try:
+        while tasks:
+            if ordered:
+                done = [next(iter(tasks))]
+                await done[0]
+            else:
+                done = (await asyncio_wait(tasks, return_when=FIRST_COMPLETED))[0]
+            for task in done:
+                yield tasks.pop(task), task.result()
+            # 每返回一个结果才读取下一个参数，避免参数与结果在内存中堆积
+            Submit(len(done))
+    finally:
+        # 提前结束迭代时取消尚未完成的调用
+        for task in tasks:
+            task.cancel()
+
+
+def _HasPage(page: int, total_pages: Optional[int]) -> bool:
+    """判断页码是否需要请求，已知总页数时不请求超出总页数的页面
+
+    Args:
+        page (int): 页码
+        total_pages (Optional[int]): 已知的总页数
+
+    Returns:
+        bool: 是否需要请求
+    """
+    return total_pages is None or page <= total_pages
+
+
+def _PrefetchPages(get_page: Callable[[int], List], prefetch: int,
+                   total_pages: Optional[int]) -> Generator[List, None, None]:
+    """在后台线程中预取分页数据，按页码顺序返回非空页面
+
+    Args:
+        get_page (Callable[[int], List]): 获取单页数据的函数
+        prefetch (int): 最大并发请求数
+        total_pages (Optional[int]): 已知的总页数
+
+    Yields:
+        Iterator[List, None, None]: 单页数据
+    """
+    executor = ThreadPoolExecutor(max_workers=prefetch)
+    futures: Deque[Future] = deque(executor.submit(get_page, page) for page in range(1, prefetch + 1)
+                                   if _HasPage(page, total_pages))
+    next_page = len(futures) + 1
+    try:
+        while futures:
+            result = futures.popleft().result()
+            if not result:  # 没有新的数据
+                return
+            yield result
+            # 每返回一页才提交下一页，最多领先调用方 prefetch 页，避免结果在内存中堆积
+            if _HasPage(next_page, total_pages):
+                futures.append(executor.submit(get_page, next_page))
+                next_page += 1
+    finally:
+        # 提前结束迭代时取消尚未开始的请求
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+def IterPages(get_page: Callable[[int], List], prefetch: int = 0, total_pages: Optional[int] = None,
+              max_count: Optional[int] = None) -> Generator[Any, None, None]:
+    """从第一页开始获取分页数据，并逐条返回，遇到空页时停止
+
+    prefetch 为 0 时，当前页的数据全部返回后才会请求下一页
+    prefetch 大于 0 时，会在后台最多领先调用方 prefetch 页获取数据，数据仍按页码顺序返回；
+    已知总页数时，不会请求超出总页数的页面，省去最后一次空页请求
+
+    Args:
+        get_page (Callable[[int], List]): 获取单页数据的函数，接收从 1 开始的页码，没有更多数据时返回空列表
+        prefetch (int, optional): 预取页数，即最大并发请求数. Defaults to 0.
+        total_pages (Optional[int], optional): 已知的总页数，仅在 prefetch 大于 0 时使用. Defaults to None.
+        max_count (Optional[int], optional): 获取的数据数量上限. Defaults to None.
+
+    Yields:
+        Iterator[Any, None, None]: 数据
+    """
+    if prefetch:
+        pages = _PrefetchPages(get_page, prefetch, total_pages)
+    else:
+        pages = (get_page(page) for page in count(1))
+    now_count = 0
+    try:
+        for result in pages:
+            if not result:  # 没有新的数据
+                return
+            for item in result:
+                yield item
+                if max_count:  # 如果有上限
+                    now_count += 1
+                    if now_count == max_count:  # 达到上限
+                        return
+    finally:
+        pages.close()
+
+
+async def _LimitedGetPage(semaphore: Semaphore, get_page: Callable[[int], Awaitable[List]], page: int) -> List:
+    """在并发数限制下获取单页数据
+
+    Args:
+        semaphore (Semaphore): 限制并发数的信号量
+        get_page (Callable[[int], Awaitable[List]]): 获取单页数据的协程函数
+        page (int): 页码
+
+    Returns:
+        List: 单页数据
+    """
+    async with semaphore:
+        return await get_page(page)
+
+
+async def _AsyncPrefetchPages(get_page: Callable[[int], Awaitable[List]], prefetch: int,
+                              total_pages: Optional[int]) -> AsyncGenerator[List, None]:
+    """并发预取分页数据，按页码顺序返回非空页面
+
+    Args:
+        get_page (Callable[[int], Awaitable[List]]): 获取单页数据的协程函数
+        prefetch (int): 最大并发请求数
+        total_pages (Optional[int]): 已知的总页数
+
+    Yields:
+        Iterator[List, None]: 单页数据
+    """
+    semaphore = Semaphore(prefetch)
+    tasks = deque(ensure_future(_LimitedGetPage(semaphore, get_page, page)) for page in range(1, prefetch + 1)
+                  if _HasPage(page, total_pages))
+    next_page = len(tasks) + 1
+    try:
+        while tasks:
+            result = await tasks.popleft()
+            if not result:
+                return
+            yield result
+            if _HasPage(next_page, total_pages):
+                tasks.append(ensure_future(_LimitedGetPage(semaphore, get_page, next_page)))
+                next_page += 1
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def _AsyncSequentialPages(get_page: Callable[[int], Awaitable[List]]) -> AsyncGenerator[List, None]:
+    """依次获取分页数据，当前页返回后才会请求下一页
+
+    Args:
+        get_page (Callable[[int], Awaitable[List]]): 获取单页数据的协程函数
+
+    Yields:
+        Iterator[List, None]: 单页数据
+    """
+    page = 1
+    while True:
+        yield await get_page(page)
+        page += 1
+
+
+async def AsyncIterPages(get_page: Callable[[int], Awaitable[List]], prefetch: int = 0,
+                         total_pages: Optional[int] = None,
+                         max_count: Optional[int] = None) -> AsyncGenerator[Any, None]:
+    """从第一页开始获取分页数据，并逐条返回，遇到空页时停止
+
+    参数与 IterPages 相同，get_page 为协程函数
+
+    Args:
+        get_page (Callable[[int], Awaitable[List]]): 获取单页数据的协程函数，接收从 1 开始的页码，没有更多数据时返回空列表
+        prefetch (int, optional): 预取页数，即最大并发请求数. Defaults to 0.
+        total_pages (Optional[int], optional): 已知的总页数，仅在 prefetch 大于 0 时使用. Defaults to None.
+        max_count (Optional[int], optional): 获取的数据数量上限. Defaults to None.
+
+    Yields:
+        Iterator[Any, None]: 数据
+    """
+    if prefetch:
+        pages = _AsyncPrefetchPages(get_page, prefetch, total_pages)
+    else:
+        pages = _AsyncSequentialPages(get_page)
+    now_count = 0
+    try:
+        async for result in pages:
+            if not result:
+                return
+            for item in result:
+                yield item
+                if max_count:
+                    now_count += 1
+                    if now_count == max_count:
+                        return
+    finally:
+        await pages.aclose()
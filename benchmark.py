@@ -0,0 +1,94 @@
+"""使用录制的语料离线进行性能测试
+
+先录制语料（需要网络）：
+
+    JRT_RECORD_DIR=corpus pytest test_all.py
+
+再离线回放，可模拟网络延迟并指定并发数：
+
+    python benchmark.py corpus --latency 0.05 --concurrency 8 --rounds 3
+"""
+
+from argparse import ArgumentParser
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+from typing import Callable, Dict, List, Tuple
+
+from yaml import FullLoader
+from yaml import load as yaml_load
+
+import JianshuResearchTools as jrt
+from JianshuResearchTools.exceptions import APIError
+from JianshuResearchTools.transport import ReplayTransport
+
+
+def GetBenchmarkTasks() -> List[Tuple[str, Callable, str]]:
+    """根据测试用例生成性能测试任务
+
+    Returns:
+        List[Tuple[str, Callable, str]]: 由 (任务名称, 函数, 参数) 组成的列表
+    """
+    with open("test_cases.yaml", "r", encoding="utf-8") as f:
+        test_cases = yaml_load(f, Loader=FullLoader)
+
+    tasks = []
+    for case in test_cases["user_cases"]["success_cases"]:
+        tasks.append(("user.GetUserAllBasicData", jrt.user.GetUserAllBasicData, case["url"]))
+    for case in test_cases["article_cases"]["success_cases"]:
+        tasks.append(("article.GetArticleAllBasicData", jrt.article.GetArticleAllBasicData, case["url"]))
+    return tasks
+
+
+def RunBenchmark(tasks: List[Tuple[str, Callable, str]], concurrency: int) -> Dict[str, List[float]]:
+    """执行一轮性能测试
+
+    Args:
+        tasks (List[Tuple[str, Callable, str]]): 性能测试任务
+        concurrency (int): 并发数
+
+    Returns:
+        Dict[str, List[float]]: 键为任务名称，值为每次调用的耗时（秒）
+    """
+    def Run(task: Tuple[str, Callable, str]) -> Tuple[str, float]:
+        name, func, arg = task
+        start_time = perf_counter()
+        try:
+            func(arg)
+        except APIError:  # 语料中缺少部分请求时跳过
+            pass
+        return name, perf_counter() - start_time
+
+    result: Dict[str, List[float]] = {}
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for name, cost in executor.map(Run, tasks):
+            result.setdefault(name, []).append(cost)
+    return result
+
+
+def main() -> None:
+    parser = ArgumentParser(description="使用录制的语料离线进行性能测试")
+    parser.add_argument("corpus_dir", help="语料目录")
+    parser.add_argument("--latency", type=float, default=0.0, help="模拟网络延迟（秒）")
+    parser.add_argument("--jitter", type=float, default=0.0, help="随机延迟上限（秒）")
+    parser.add_argument("--concurrency", type=int, default=1, help="并发数")
+    parser.add_argument("--rounds", type=int, default=3, help="测试轮数")
+    args = parser.parse_args()
+
+    transport = ReplayTransport(args.corpus_dir, latency=args.latency, jitter=args.jitter)
+    jrt.configure_client(transport=transport)
+    tasks = GetBenchmarkTasks()
+
+    for round_number in range(1, args.rounds + 1):
+        jrt.clear_response_cache()
+        start_time = perf_counter()
+        result = RunBenchmark(tasks, args.concurrency)
+        total_time = perf_counter() - start_time
+        print(f"第 {round_number} 轮：{len(tasks)} 个任务，耗时 {total_time:.3f} 秒，"
+              f"{len(tasks) / total_time:.1f} 任务/秒")
+        for name, costs in result.items():
+            print(f"    {name}：平均 {sum(costs) / len(costs) * 1000:.1f} 毫秒，最大 {max(costs) * 1000:.1f} 毫秒")
+    print(f"共回放 {transport.replayed_count} 个请求")
+
+
+if __name__ == "__main__":
+    main()
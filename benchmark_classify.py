@@ -0,0 +1,114 @@
+"""对比逐个尝试各资源类型的正则与一次匹配判断 URL 资源类型的耗时
+
+同时输出只进行正则匹配的耗时，即一次匹配方式的下限
+
+使用合成的 URL，不发送任何网络请求：
+
+    python benchmark_classify.py --urls 100000
+"""
+
+from argparse import ArgumentParser
+from random import Random
+from re import Pattern
+from time import perf_counter
+from typing import Callable, Iterable, List, Optional, Tuple
+
+from JianshuResearchTools.assert_funcs import (JIANSHU_ARTICLES_URL_REGEX,
+                                               JIANSHU_COLLECTION_URL_REGEX,
+                                               JIANSHU_ISLAND_POST_URL_REGEX,
+                                               JIANSHU_ISLAND_URL_REGEX,
+                                               JIANSHU_NOTEBOOK_URL_REGEX,
+                                               JIANSHU_URL_CLASSIFY_REGEX,
+                                               JIANSHU_USER_URL_REGEX)
+from JianshuResearchTools.convert import ClassifyJianshuUrls
+
+# 按资源类型逐个尝试的正则，顺序与 JIANSHU_URL_CLASSIFY_REGEX 中的分组一致
+LEGACY_REGEXES: List[Tuple[str, Pattern]] = [
+    ("user", JIANSHU_USER_URL_REGEX),
+    ("article", JIANSHU_ARTICLES_URL_REGEX),
+    ("notebook", JIANSHU_NOTEBOOK_URL_REGEX),
+    ("collection", JIANSHU_COLLECTION_URL_REGEX),
+    ("island", JIANSHU_ISLAND_URL_REGEX),
+    ("island_post", JIANSHU_ISLAND_POST_URL_REGEX)
+]
+
+
+def MakeUrls(count: int, seed: int = 0) -> List[str]:
+    """生成各资源类型数量相近的 URL，其中约七分之一不是简书资源 URL
+
+    Args:
+        count (int): URL 数量
+        seed (int, optional): 随机数种子. Defaults to 0.
+
+    Returns:
+        List[str]: URL 列表
+    """
+    random = Random(seed)
+    makers: List[Callable[[], str]] = [
+        lambda: f"https://www.jianshu.com/u/{random.getrandbits(48):012x}",
+        lambda: f"https://www.jianshu.com/p/{random.getrandbits(48):012x}",
+        lambda: f"https://www.jianshu.com/nb/{random.randint(1000000, 99999999)}",
+        lambda: f"https://www.jianshu.com/c/{random.getrandbits(48):012x}/",
+        lambda: f"https://www.jianshu.com/g/{random.getrandbits(64):016x}",
+        lambda: f"https://www.jianshu.com/gp/{random.getrandbits(64):016x}",
+        lambda: f"https://www.example.com/p/{random.getrandbits(48):012x}"
+    ]
+    return [random.choice(makers)() for _ in range(count)]
+
+
+def LegacyClassifyJianshuUrls(urls: Iterable[str]) -> List[Optional[Tuple[str, str]]]:
+    """逐个尝试各资源类型的正则，仅作为性能对照
+
+    Args:
+        urls (Iterable[str]): URL 列表
+
+    Returns:
+        List[Optional[Tuple[str, str]]]: (资源类型, Slug)，不是有效的简书资源 URL 时为 None
+    """
+    result = []
+    for url in urls:
+        for resource_type, regex in LEGACY_REGEXES:
+            if regex.match(url):
+                # 各正则只判断 URL 是否有效，Slug 需要另外截取
+                result.append((resource_type, url.rstrip("/").rsplit("/", 1)[1]))
+                break
+        else:
+            result.append(None)
+    return result
+
+
+def Measure(func: Callable[[], object], rounds: int) -> float:
+    """多次调用函数
+
+    Args:
+        func (Callable[[], object]): 待测试的函数
+        rounds (int): 轮数
+
+    Returns:
+        float: 平均每轮的耗时（秒）
+    """
+    start_time = perf_counter()
+    for _ in range(rounds):
+        func()
+    return (perf_counter() - start_time) / rounds
+
+
+def main() -> None:
+    parser = ArgumentParser(description="对比判断 URL 资源类型的耗时")
+    parser.add_argument("--urls", type=int, default=100000, help="URL 数量")
+    parser.add_argument("--rounds", type=int, default=5, help="测试轮数")
+    args = parser.parse_args()
+
+    urls = MakeUrls(args.urls)
+    if LegacyClassifyJianshuUrls(urls) != list(ClassifyJianshuUrls(urls)):
+        print("两种方式的结果不一致")
+    legacy_cost = Measure(lambda: LegacyClassifyJianshuUrls(urls), args.rounds)
+    cost = Measure(lambda: list(ClassifyJianshuUrls(urls)), args.rounds)
+    match_cost = Measure(lambda: list(map(JIANSHU_URL_CLASSIFY_REGEX.fullmatch, urls)), args.rounds)
+    print(f"{len(urls)} 个 URL，逐个尝试各正则 {legacy_cost * 1000:.1f} 毫秒，"
+          f"一次匹配 {cost * 1000:.1f} 毫秒（其中正则匹配 {match_cost * 1000:.1f} 毫秒），"
+          f"提升 {legacy_cost / cost:.2f} 倍")
+
+
+if __name__ == "__main__":
+    main()
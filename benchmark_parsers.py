@@ -0,0 +1,388 @@
+"""使用录制的页面对 HTML 解析函数进行性能测试
+
+先录制语料（需要网络）：
+
+    JRT_RECORD_DIR=corpus pytest test_all.py
+
+再对比新旧解析函数的耗时，不发送任何网络请求：
+
+    python benchmark_parsers.py corpus --rounds 200
+
+没有录制的语料时，可使用合成的页面，用户动态页面覆盖所有可解析的动态类型：
+
+    python benchmark_parsers.py --synthetic 20 --rounds 200
+"""
+
+from argparse import ArgumentParser
+from base64 import b64decode
+from datetime import datetime
+from json import load as json_load
+from os import listdir, path
+from re import findall
+from time import perf_counter
+from typing import Callable, Dict, List, Tuple
+
+from lxml import etree
+from lxml.etree import _Element
+
+from JianshuResearchTools.convert import (ArticleSlugToArticleUrl,
+                                          CollectionSlugToCollectionUrl,
+                                          NotebookSlugToNotebookUrl,
+                                          UserSlugToUserUrl)
+from JianshuResearchTools.parsers import (ParseUserFollowListHtml,
+                                          ParseUserTimelineHtml)
+
+
+def LegacyParseUserFollowListHtml(html_obj: _Element) -> List[Dict]:
+    """旧版关注列表与粉丝列表解析代码，仅作为性能对照
+
+    Args:
+        html_obj (_Element): 关注列表或粉丝列表页面
+
+    Returns:
+        List[Dict]: 用户信息
+    """
+    name_raw_data = html_obj.xpath("//a[@class='name']")[1:]
+    if not name_raw_data:
+        return []
+    followers_raw_data = html_obj.xpath("//div[@class='meta'][1]/span[1]")
+    fans_raw_data = html_obj.xpath("//div[@class='meta'][1]/span[2]")
+    articles_raw_data = html_obj.xpath("//div[@class='meta'][1]/span[3]")
+    words_and_likes_raw_data = html_obj.xpath("//div[@class='meta'][2]")
+    result = []
+    for index in range(len(name_raw_data)):  # 旧版代码固定为 range(8)，最后一页不足 8 项时会出错
+        item_data = {
+            "name": name_raw_data[index].text,
+            "uslug": name_raw_data[index].get("href")[3:],  # 旧版没有此字段，补充后便于比较结果
+            "followers_count": int(followers_raw_data[index].text.replace("关注 ", "")),
+            "fans_count": int(fans_raw_data[index].text.replace("粉丝", "")),
+            "articles_count": int(articles_raw_data[index].text.replace("文章 ", "")),
+            "words_count": int(findall(r"\d+", words_and_likes_raw_data[index].text)[0]),
+            "likes_count": int(findall(r"\d+", words_and_likes_raw_data[index].text)[1])
+        }
+        result.append(item_data)
+    return result
+
+
+def LegacyParseUserTimelineHtml(html_obj: _Element) -> List[Dict]:
+    """旧版用户动态解析代码，仅作为性能对照
+
+    Args:
+        html_obj (_Element): 用户动态页面
+
+    Returns:
+        List[Dict]: 用户动态信息
+    """
+    blocks = [x.__copy__() for x in html_obj.xpath("//li[starts-with(@id, 'feed-')]")]
+    result = []
+
+    for block in blocks:
+        item_data = {
+            "operation_id": int(block.xpath("//li/@id")[0][5:]),
+            "operation_type": block.xpath("//span[starts-with(@data-datetime, '20')]/@data-type")[0],
+            "operation_time": datetime.fromisoformat(block.xpath("//span[starts-with(@data-datetime, '20')]/@data-datetime")[0])
+        }
+
+        if item_data["operation_type"] == "like_note":  # 对文章点赞
+            item_data["operation_type"] = "like_article"  # 鬼知道谁把对文章点赞写成 like_note 的
+            item_data["operator_name"] = block.xpath("//a[@class='nickname']/text()")[0]
+            item_data["operator_url"] = UserSlugToUserUrl(block.xpath("//a[@class='nickname']/@href")[0][3:])
+            item_data["operator_avatar_url"] = block.xpath("//a[@class='avatar']/img/@src")[0]
+            item_data["target_article_title"] = block.xpath("//a[@class='title']/text()")[0]
+            item_data["target_article_url"] = ArticleSlugToArticleUrl(block.xpath("//a[@class='title']/@href")[0][3:])
+            item_data["target_user_name"] = block.xpath("//div[@class='origin-author']/a/text()")[0]
+            item_data["target_user_url"] = UserSlugToUserUrl(block.xpath("//div[@class='meta']/a/@href")[0][3:])
+            item_data["target_article_reads_count"] = int(block.xpath("//div[@class='meta']/a/text()")[1])
+            item_data["target_article_likes_count"] = int(block.xpath("//div[@class='meta']/span/text()")[0])
+            try:
+                item_data["target_article_comments_count"] = int(block.xpath("//div[@class='meta']/a/text()")[3])
+            except IndexError:  # 文章没有评论或评论区关闭
+                item_data["target_article_comments_count"] = 0
+            try:
+                item_data["target_article_description"] = block.xpath("//p[@class='abstract']/text()")[0]
+            except IndexError:  # 文章没有摘要
+                item_data["target_article_description"] = ""
+
+        elif item_data["operation_type"] == "like_comment":  # 对评论点赞
+            item_data["operator_name"] = block.xpath("//a[@class='nickname']/text()")[0]
+            item_data["operator_url"] = UserSlugToUserUrl(block.xpath("//a[@class='nickname']/@href")[0][3:])
+            item_data["operator_avatar_url"] = block.xpath("//a[@class='avatar']/img/@src")[0]
+            item_data["comment_content"] = "\n".join(block.xpath("//p[@class='comment']/text()"))
+            item_data["target_article_title"] = block.xpath("//blockquote/div/span/a/text()")[0]
+            item_data["target_article_url"] = ArticleSlugToArticleUrl(block.xpath("//blockquote/div/span/a/@href")[0][3:])
+            item_data["target_user_name"] = block.xpath("//blockquote/div/a/text()")[0]
+            item_data["target_user_url"] = UserSlugToUserUrl(block.xpath("//blockquote/div/a/@href")[0][3:])
+
+        elif item_data["operation_type"] == "share_note":  # 发表文章
+            item_data["operation_type"] = "publish_article"  # 鬼知道谁把发表文章写成 share_note 的
+            item_data["operator_name"] = block.xpath("//a[@class='nickname']/text()")[0]
+            item_data["operator_url"] = UserSlugToUserUrl(block.xpath("//a[@class='nickname']/@href")[0][3:])
+            item_data["operator_avatar_url"] = block.xpath("//a[@class='avatar']/img/@src")[0]
+            item_data["target_article_title"] = block.xpath("//a[@class='title']/text()")[0]
+            item_data["target_article_url"] = ArticleSlugToArticleUrl(block.xpath("//a[@class='title']/@href")[0][3:])
+            item_data["target_article_reads_count"] = int(block.xpath("//div[@class='meta']/a/text()")[1])
+            item_data["target_article_likes_count"] = int(block.xpath("//div[@class='meta']/span/text()")[0])
+            item_data["target_article_description"] = "\n".join(block.xpath("//p[@class='abstract']/text()"))
+            try:
+                item_data["target_article_comments_count"] = int(block.xpath("//div[@class='meta']/a/text()")[3])
+            except IndexError:
+                item_data["target_article_comments_count"] = 0
+
+        elif item_data["operation_type"] == "comment_note":  # 发表评论
+            item_data["operator_name"] = block.xpath("//a[@class='nickname']/text()")[0]
+            item_data["operator_url"] = UserSlugToUserUrl(block.xpath("//a[@class='nickname']/@href")[0][3:])
+            item_data["operator_avatar_url"] = block.xpath("//a[@class='avatar']/img/@src")[0]
+            item_data["comment_content"] = "\n".join(block.xpath("//p[@class='comment']/text()"))
+            item_data["target_article_title"] = block.xpath("//a[@class='title']/text()")[0]
+            item_data["target_article_url"] = ArticleSlugToArticleUrl(block.xpath("//a[@class='title']/@href")[0][3:])
+            item_data["target_user_name"] = block.xpath("//div[@class='origin-author']/a/text()")[0]
+            item_data["target_user_url"] = UserSlugToUserUrl(block.xpath("//div[@class='meta']/a/@href")[0][3:])
+            item_data["target_article_reads_count"] = int(block.xpath("//div[@class='meta']/a/text()")[1])
+            item_data["target_article_likes_count"] = int(block.xpath("//div[@class='meta']/span/text()")[0])
+            try:
+                item_data["target_article_comments_count"] = int(block.xpath("//div[@class='meta']/a/text()")[3])
+            except IndexError:  # 文章没有评论或评论区关闭
+                item_data["target_article_comments_count"] = 0
+            try:
+                item_data["target_article_description"] = block.xpath("//p[@class='abstract']/text()")[0]
+            except IndexError:  # 文章没有描述
+                item_data["target_article_description"] = ""
+            try:
+                item_data["target_article_rewards_count"] = int(block.xpath("//div[@class='meta']/span/text()")[1])
+            except IndexError:  # 没有赞赏数据
+                item_data["target_article_rewards_count"] = 0
+
+        elif item_data["operation_type"] == "like_notebook":  # 关注文集
+            item_data["operation_type"] = "follow_notebook"  # 鬼知道谁把关注文集写成 like_notebook 的
+            item_data["operator_name"] = block.xpath("//a[@class='nickname']/text()")[0]
+            item_data["operator_url"] = UserSlugToUserUrl(block.xpath("//a[@class='nickname']/@href")[0][4:])
+            item_data["operator_avatar_url"] = block.xpath("//a[@class='avatar']/img/@src")[0]
+            item_data["target_notebook_title"] = block.xpath("//a[@class='title']/text()")[0]
+            item_data["target_notebook_url"] = NotebookSlugToNotebookUrl(block.xpath("//a[@class='title']/@href")[0][3:])
+            item_data["target_notebook_avatar_url"] = block.xpath("//div[@class='follow-detail']/div/a/img/@src")[0]
+            item_data["target_user_name"] = block.xpath("//a[@class='creater']/text()")[0]
+            item_data["target_user_url"] = UserSlugToUserUrl(block.xpath("//a[@class='creater']/@href")[0][3:])
+            item_data["target_notebook_articles_count"] = int(findall(r"\d+", block.xpath("//div[@class='info'][1]/p/text()")[1])[0])
+            item_data["target_notebook_subscribers_count"] = int(findall(r"\d+", block.xpath("//div[@class='info'][1]/p/text()")[1])[1])
+
+        elif item_data["operation_type"] == "like_collection":  # 关注专题
+            item_data["operator_type"] = "follow_collection"  # 鬼知道谁把关注专题写成 like_collection 的
+            item_data["operator_name"] = block.xpath("//a[@class='nickname']/text()")[0]
+            item_data["operator_url"] = UserSlugToUserUrl(block.xpath("//a[@class='nickname']/@href")[0][4:])
+            item_data["operator_avatar_url"] = block.xpath("//a[@class='avatar']/img/@src")[0]
+            item_data["target_collection_title"] = block.xpath("//a[@class='title']/text()")[0]
+            item_data["target_collection_url"] = CollectionSlugToCollectionUrl(block.xpath("//a[@class='title']/@href")[0][3:])
+            item_data["target_collection_avatar_url"] = block.xpath("//div[@class='follow-detail']/div/a/img/@src")[0]
+            item_data["target_user_name"] = block.xpath("//a[@class='creater']/text()")[0]
+            item_data["target_user_url"] = UserSlugToUserUrl(block.xpath("//a[@class='creater']/@href")[0][3:])
+            item_data["target_collection_articles_count"] = int(findall(r"\d+", block.xpath("//div[@class='info'][1]/p/text()")[1])[0])
+            item_data["target_collection_subscribers_count"] = int(findall(r"\d+", block.xpath("//div[@class='info'][1]/p/text()")[1])[1])
+
+        elif item_data["operation_type"] == "like_user":  # 关注用户
+            item_data["operation_type"] = "follow_user"  # 鬼知道谁把关注用户写成 like_user 的
+            item_data["operator_name"] = block.xpath("//a[@class='nickname']/text()")[0]
+            item_data["operator_url"] = UserSlugToUserUrl(block.xpath("//a[@class='nickname']/@href")[0][4:])
+            item_data["operator_avatar_url"] = block.xpath("//a[@class='avatar']/img/@src")[0]
+            item_data["target_user_name"] = block.xpath("//div[@class='info']/a[@class='title']/text()")[0]
+            item_data["target_user_url"] = UserSlugToUserUrl(block.xpath("//div[@class='info']/a[@class='title']/@href")[0][3:])
+            item_data["target_user_wordage"] = int(findall(r"\d+", block.xpath("//div[@class='follow-detail']/div[@class='info']/p/text()")[0])[0])
+            item_data["target_user_fans_count"] = int(findall(r"\d+", block.xpath("//div[@class='follow-detail']/div[@class='info']/p/text()")[0])[1])
+            item_data["target_user_likes_count"] = int(findall(r"\d+", block.xpath("//div[@class='follow-detail']/div[@class='info']/p/text()")[0])[2])
+            item_data["target_user_description"] = "\n".join(block.xpath("//div[@class='signature']/text()"))
+
+        elif item_data["operation_type"] == "reward_note":  # 赞赏文章
+            item_data["operation_type"] = "reward_article"  # 鬼知道谁把赞赏文章写成 reward_note 的
+            item_data["operator_name"] = block.xpath("//a[@class='nickname']/text()")[0]
+            item_data["operator_url"] = UserSlugToUserUrl(block.xpath("//a[@class='nickname']/@href")[0][4:])
+            item_data["operator_avatar_url"] = block.xpath("//a[@class='avatar']/img/@src")[0]
+            item_data["target_article_title"] = block.xpath("//a[@class='title']/text()")[0]
+            item_data["target_article_url"] = ArticleSlugToArticleUrl(block.xpath("//a[@class='title']/@href")[0][3:])
+            item_data["target_user_name"] = block.xpath("//div[@class='origin-author']/a/text()")[0]
+            item_data["target_user_url"] = UserSlugToUserUrl(block.xpath("//div[@class='meta']/a/@href")[0][3:])
+            item_data["target_article_reads_count"] = int(block.xpath("//div[@class='meta']/a/text()")[1])
+            item_data["target_article_likes_count"] = int(block.xpath("//div[@class='meta']/span/text()")[0])
+            try:
+                item_data["target_article_comments_count"] = int(block.xpath("//div[@class='meta']/a/text()")[3])
+            except IndexError:  # 文章没有评论或评论区关闭
+                item_data["target_article_comments_count"] = 0
+            try:
+                item_data["target_article_description"] = block.xpath("//p[@class='abstract']/text()")[0]
+            except IndexError:  # 文章没有描述
+                item_data["target_article_description"] = ""
+            try:
+                item_data["target_article_rewards_count"] = int(block.xpath("//div[@class='meta']/span/text()")[1])
+            except IndexError:  # 没有赞赏数据
+                item_data["target_article_rewards_count"] = 0
+
+        elif item_data["operation_type"] == "join_jianshu":  # 加入简书
+            item_data["operator_name"] = block.xpath("//a[@class='nickname']/text()")[0]
+            item_data["operator_url"] = UserSlugToUserUrl(block.xpath("//a[@class='nickname']/@href")[0][4:])
+            item_data["operator_avatar_url"] = block.xpath("//a[@class='avatar']/img/@src")[0]
+
+        result.append(item_data)
+    return result
+
+
+def MakeFollowListPage(items_count: int) -> _Element:
+    """生成合成的关注列表页面
+
+    Args:
+        items_count (int): 用户数量
+
+    Returns:
+        _Element: 页面
+    """
+    items = "".join(
+        f"<li><div class='info'><a class='name' href='/u/{index:012x}'>用户{index}</a>"
+        f"<div class='meta'><span>关注 {index}</span><span>粉丝 {index * 2}</span><span>文章 {index % 50}</span></div>"
+        f"<div class='meta'>写了 {index * 1000} 字，获得了 {index * 3} 个喜欢</div></div></li>"
+        for index in range(items_count)
+    )
+    return etree.HTML(f"<html><body><div><a class='name' href='/u/ea36c8d8aa30'>主页用户</a></div>"
+                      f"<ul class='user-list'>{items}</ul></body></html>")
+
+
+def _MakeTimelineArticleHtml(index: int, with_comment: bool) -> str:
+    """生成动态中的目标文章，with_comment 为 False 时没有评论数与赞赏数"""
+    comment_links = f"<a>评论</a><a>{index % 9}</a>" if with_comment else ""
+    rewards = f"<span>{index % 4}</span>" if with_comment else ""
+    return (f"<div class='content'><a class='title' href='/p/{index:012x}'>文章标题 {index}</a>"
+            f"<p class='abstract'>文章摘要 {index}</p>"
+            f"<div class='origin-author'><a href='/u/{index + 1:012x}'>作者{index}</a></div>"
+            f"<div class='meta'><a href='/u/{index + 1:012x}'>作者{index}</a><a>{index * 7}</a>{comment_links}"
+            f"<span>{index * 2}</span>{rewards}</div></div>")
+
+
+def _MakeTimelineSubscribableHtml(index: int, slug: str) -> str:
+    """生成动态中关注的文集或专题"""
+    return (f"<div class='follow-detail'><div class='avatar'><a><img src='cover{index}.png'/></a></div>"
+            f"<div class='info'><a class='title' href='/x/{slug}'>标题 {index}</a>"
+            f"<p>作者：<a class='creater' href='/u/{index + 1:012x}'>作者{index}</a></p>"
+            f"<p>收录了 {index % 100} 篇文章，{index * 5} 人关注</p></div></div>")
+
+
+# 键为页面中的 data-type，值为 (发起者链接中用户 Slug 的起始位置, 生成动态内容的函数)
+# 解析函数按固定位置截取链接中的 Slug，合成页面中的链接只保证截取结果是有效的 Slug
+_TIMELINE_BODY_MAKERS: Dict[str, Tuple[int, Callable[[int], str]]] = {
+    "like_note": (3, lambda index: _MakeTimelineArticleHtml(index, index % 2 == 0)),
+    "like_comment": (3, lambda index: (
+        f"<p class='comment'>评论内容 {index}<br/>第二行</p>"
+        f"<blockquote><div><span><a href='/p/{index:012x}'>文章标题 {index}</a></span>"
+        f"<a href='/u/{index + 1:012x}'>作者{index}</a></div></blockquote>")),
+    "share_note": (3, lambda index: _MakeTimelineArticleHtml(index, index % 2 == 0)),
+    "comment_note": (3, lambda index: f"<p class='comment'>评论内容 {index}</p>" + _MakeTimelineArticleHtml(index, True)),
+    "like_notebook": (4, lambda index: _MakeTimelineSubscribableHtml(index, str(10000000 + index))),
+    "like_collection": (4, lambda index: _MakeTimelineSubscribableHtml(index, f"{index:012x}")),
+    "like_user": (4, lambda index: (
+        f"<div class='follow-detail'><div class='info'><a class='title' href='/u/{index + 1:012x}'>用户{index}</a>"
+        f"<p>写了 {index * 100} 字，被 {index * 3} 人关注，获得了 {index * 9} 个喜欢</p></div>"
+        f"<div class='signature'>个人简介 {index}</div></div>")),
+    "reward_note": (4, lambda index: _MakeTimelineArticleHtml(index, index % 2 == 0)),
+    "join_jianshu": (4, lambda index: "")
+}
+
+
+def MakeTimelinePage(items_count: int) -> _Element:
+    """生成合成的用户动态页面，依次循环使用所有可解析的动态类型
+
+    Args:
+        items_count (int): 动态数量
+
+    Returns:
+        _Element: 页面
+    """
+    operation_types = list(_TIMELINE_BODY_MAKERS)
+    items = []
+    for index in range(items_count):
+        operation_type = operation_types[index % len(operation_types)]
+        slug_start, make_body = _TIMELINE_BODY_MAKERS[operation_type]
+        items.append(f"<li id='feed-{1000000 - index}'><div class='author'>"
+                     f"<a class='avatar' href='/u/ea36c8d8aa30'><img src='avatar.png'/></a>"
+                     f"<a class='nickname' href='{'/u/x'[:slug_start]}ea36c8d8aa30'>用户</a>"
+                     f"<span data-type='{operation_type}' data-datetime='2022-01-01T08:00:00+08:00'></span>"
+                     f"</div>{make_body(index)}</li>")
+    return etree.HTML(f"<html><body><ul class='note-list'>{''.join(items)}</ul></body></html>")
+
+
+# 键为任务名称，值为 (URL 中需要包含的字符串, 旧版解析函数, 新版解析函数)
+BENCHMARK_TASKS: Dict[str, Tuple[Tuple[str, ...], Callable, Callable]] = {
+    "关注与粉丝列表": (("/following?", "/followers?"), LegacyParseUserFollowListHtml, ParseUserFollowListHtml),
+    "用户动态": (("/timeline",), LegacyParseUserTimelineHtml, ParseUserTimelineHtml)
+}
+
+
+# 键为任务名称，值为生成合成页面的函数，参数为页面中的条目数
+SYNTHETIC_PAGE_MAKERS: Dict[str, Callable[[int], _Element]] = {
+    "关注与粉丝列表": MakeFollowListPage,
+    "用户动态": MakeTimelinePage
+}
+# 关注列表每页 8 项，与旧版解析代码一致；用户动态中每种类型各 2 条
+SYNTHETIC_PAGE_ITEMS_COUNT = {"关注与粉丝列表": 8, "用户动态": 18}
+
+
+def LoadCorpusPages(corpus_dir: str, url_patterns: Tuple[str, ...]) -> List[_Element]:
+    """从语料目录中读取 URL 符合条件的页面
+
+    Args:
+        corpus_dir (str): 语料目录
+        url_patterns (Tuple[str, ...]): URL 中需要包含的字符串，满足其一即可
+
+    Returns:
+        List[_Element]: 解析后的页面
+    """
+    result = []
+    for file_name in sorted(listdir(corpus_dir)):
+        if not file_name.endswith(".json"):
+            continue
+        with open(path.join(corpus_dir, file_name), "r", encoding="utf-8") as f:
+            data = json_load(f)
+        if data["status_code"] == 200 and any(pattern in data["url"] for pattern in url_patterns):
+            result.append(etree.HTML(b64decode(data["content"])))
+    return result
+
+
+def RunBenchmark(func: Callable, pages: List[_Element], rounds: int) -> float:
+    """多次解析全部页面
+
+    Args:
+        func (Callable): 解析函数
+        pages (List[_Element]): 页面
+        rounds (int): 轮数
+
+    Returns:
+        float: 平均每个页面的耗时（秒）
+    """
+    start_time = perf_counter()
+    for _ in range(rounds):
+        for page in pages:
+            func(page)
+    return (perf_counter() - start_time) / (rounds * len(pages))
+
+
+def main() -> None:
+    parser = ArgumentParser(description="使用录制的页面对 HTML 解析函数进行性能测试")
+    parser.add_argument("corpus_dir", nargs="?", help="语料目录")
+    parser.add_argument("--synthetic", type=int, default=0, help="不使用语料，改为使用指定数量的合成页面")
+    parser.add_argument("--rounds", type=int, default=200, help="测试轮数")
+    args = parser.parse_args()
+    if args.corpus_dir is None and not args.synthetic:
+        parser.error("需要指定语料目录或 --synthetic")
+
+    for name, (url_patterns, legacy_func, func) in BENCHMARK_TASKS.items():
+        if args.synthetic:
+            pages = [SYNTHETIC_PAGE_MAKERS[name](SYNTHETIC_PAGE_ITEMS_COUNT[name]) for _ in range(args.synthetic)]
+        else:
+            pages = LoadCorpusPages(args.corpus_dir, url_patterns)
+        if not pages:
+            print(f"{name}：语料中没有对应的页面，已跳过")
+            continue
+        if [legacy_func(page) for page in pages] != [func(page) for page in pages]:
+            print(f"{name}：新旧解析函数的结果不一致")
+        legacy_cost = RunBenchmark(legacy_func, pages, args.rounds)
+        cost = RunBenchmark(func, pages, args.rounds)
+        print(f"{name}：{len(pages)} 个页面，旧版平均 {legacy_cost * 1000:.3f} 毫秒，"
+              f"新版平均 {cost * 1000:.3f} 毫秒，提升 {legacy_cost / cost:.2f} 倍")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+"""对比列表类函数返回字典与返回记录（as_record=True）时的耗时与内存占用
+
+使用合成的接口数据，不发送任何网络请求：
+
+    python benchmark_records.py --items 10000
+"""
+
+from argparse import ArgumentParser
+from gc import collect
+from time import perf_counter
+from tracemalloc import get_traced_memory
+from tracemalloc import start as tracemalloc_start
+from tracemalloc import stop as tracemalloc_stop
+from typing import Callable, Dict, List, Tuple
+
+import JianshuResearchTools.article
+import JianshuResearchTools.island
+import JianshuResearchTools.user
+from JianshuResearchTools.article import GetArticleCommentsData
+from JianshuResearchTools.island import GetIslandPosts
+from JianshuResearchTools.user import GetUserArticlesInfo
+
+USER_URL = "https://www.jianshu.com/u/ea36c8d8aa30"
+ISLAND_URL = "https://www.jianshu.com/g/f6ae2a0aa2d2ad1e"
+PAGE_SIZE = 20
+
+
+def _MakeUserJson(index: int) -> Dict:
+    return {
+        "id": 10000 + index,
+        "nickname": f"用户{index}",
+        "slug": f"{index:012x}",
+        "avatar": f"https://upload.jianshu.io/users/upload_avatars/{index}/avatar.png"
+    }
+
+
+def MakeArticlesListJson(count: int) -> List[Dict]:
+    """生成用户文章列表接口数据
+
+    Args:
+        count (int): 文章数量
+
+    Returns:
+        List[Dict]: 接口数据
+    """
+    return [{"object": {"data": {
+        "id": 90000000 + index,
+        "title": f"文章标题 {index}",
+        "slug": f"{index:012x}",
+        "first_shared_at": "2021-05-01T12:34:56.000+08:00",
+        "list_image_url": "",
+        "public_abbr": "文章摘要" * 20,
+        "views_count": index * 3,
+        "likes_count": index,
+        "is_top": index == 0,
+        "paid": False,
+        "commentable": True,
+        "user": _MakeUserJson(1),
+        "total_fp_amount": index * 1000,
+        "public_comments_count": index % 7,
+        "total_rewards_count": index % 3
+    }}} for index in range(count)]
+
+
+def MakeCommentsJson(count: int) -> Dict:
+    """生成文章评论接口数据，部分评论有子评论，部分用户开通了会员
+
+    Args:
+        count (int): 评论数量
+
+    Returns:
+        Dict: 接口数据
+    """
+    comments = []
+    for index in range(count):
+        user = _MakeUserJson(index)
+        if index % 2 == 0:
+            user["member"] = {"type": "gold", "expires_at": 1700000000}
+        item = {
+            "id": 50000000 + index,
+            "created_at": "2021-05-01T12:34:56+08:00",
+            "compiled_content": f"评论内容 {index}",
+            "floor": index + 1,
+            "images": [],
+            "likes_count": index % 11,
+            "children_count": 2 if index % 3 == 0 else 0,
+            "user": user
+        }
+        if index % 3 == 0:
+            item["children"] = [{
+                "id": 60000000 + index * 2 + offset,
+                "created_at": "2021-05-01T13:00:00+08:00",
+                "compiled_content": f"回复 {offset}",
+                "images": [],
+                "parent_id": item["id"],
+                "user": _MakeUserJson(index + offset + 1)
+            } for offset in range(2)]
+        comments.append(item)
+    return {"comments": comments}
+
+
+def MakeIslandPostsJson(count: int) -> List[Dict]:
+    """生成小岛帖子列表接口数据
+
+    Args:
+        count (int): 帖子数量
+
+    Returns:
+        List[Dict]: 接口数据
+    """
+    result = []
+    for index in range(count):
+        user = {"id": 10000 + index, "slug": f"{index:012x}", "nickname": f"用户{index}", "avatar": ""}
+        if index % 4 == 0:
+            user["badge"] = {"text": "岛主"}
+        item = {
+            "sorted_id": 1000000 - index,
+            "id": 30000000 + index,
+            "slug": f"{index:016x}",
+            "title": f"帖子标题 {index}",
+            "content": "帖子内容" * 10,
+            "images": [],
+            "likes_count": index % 13,
+            "comments_count": index % 5,
+            "created_at": 1620000000 + index,
+            "is_hot": False,
+            "is_best": index % 10 == 0,
+            "is_top": False,
+            "is_new": True,
+            "group": {"id": 1, "slug": "f6ae2a0aa2d2ad1e", "name": "小岛"},
+            "user": user
+        }
+        if index % 2 == 0:
+            item["topic"] = {"id": 7, "slug": "topic", "name": "话题"}
+        result.append(item)
+    return result
+
+
+def _PatchApi(module: object, name: str, pages: List) -> None:
+    """将模块中的接口函数替换为依次返回合成数据的函数
+
+    Args:
+        module (object): 模块
+        name (str): 接口函数名
+        pages (List): 每次调用返回的数据
+    """
+    state = {"index": 0}
+
+    def FakeApi(*args, **kwargs):
+        page = pages[state["index"] % len(pages)]
+        state["index"] += 1
+        return page
+
+    setattr(module, name, FakeApi)
+
+
+def Measure(func: Callable[[], List], pages_count: int) -> Tuple[float, int, List]:
+    """多次调用函数并保留全部结果，统计耗时与结果占用的内存
+
+    Args:
+        func (Callable[[], List]): 获取一页数据的函数
+        pages_count (int): 调用次数
+
+    Returns:
+        Tuple[float, int, List]: (耗时（秒）, 结果占用的内存（字节）, 全部结果)
+    """
+    collect()
+    tracemalloc_start()
+    start_time = perf_counter()
+    result = []
+    for _ in range(pages_count):
+        result.extend(func())
+    cost = perf_counter() - start_time
+    collect()
+    memory = get_traced_memory()[0]
+    tracemalloc_stop()
+    return cost, memory, result
+
+
+def main() -> None:
+    parser = ArgumentParser(description="对比返回字典与返回记录时的耗时与内存占用")
+    parser.add_argument("--items", type=int, default=10000, help="每项测试的数据条数")
+    args = parser.parse_args()
+    pages_count = max(1, args.items // PAGE_SIZE)
+
+    _PatchApi(JianshuResearchTools.user, "GetUserArticlesListJsonDataApi", [MakeArticlesListJson(PAGE_SIZE)])
+    _PatchApi(JianshuResearchTools.article, "GetArticleCommentsJsonDataApi", [MakeCommentsJson(PAGE_SIZE)])
+    _PatchApi(JianshuResearchTools.island, "GetIslandPostsJsonDataApi", [MakeIslandPostsJson(PAGE_SIZE)])
+    tasks = {
+        "用户文章列表": lambda as_record: GetUserArticlesInfo(USER_URL, count=PAGE_SIZE, disable_check=True, as_record=as_record),
+        "文章评论": lambda as_record: GetArticleCommentsData(1, count=PAGE_SIZE, as_record=as_record),
+        "小岛帖子": lambda as_record: GetIslandPosts(ISLAND_URL, count=PAGE_SIZE, disable_check=True, as_record=as_record)
+    }
+
+    for name, func in tasks.items():
+        if [item.to_dict() for item in func(True)] != func(False):
+            print(f"{name}：记录转换为字典后与原结果不一致")
+        dict_cost, dict_memory, dict_result = Measure(lambda: func(False), pages_count)
+        del dict_result
+        record_cost, record_memory, record_result = Measure(lambda: func(True), pages_count)
+        items_count = len(record_result)
+        del record_result
+        print(f"{name}：{items_count} 条数据，"
+              f"字典耗时 {dict_cost * 1000:.1f} 毫秒、占用 {dict_memory / items_count:.0f} 字节/条，"
+              f"记录耗时 {record_cost * 1000:.1f} 毫秒、占用 {record_memory / items_count:.0f} 字节/条，"
+              f"内存减少 {1 - record_memory / dict_memory:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -13,17 +13,18 @@ setuptools.setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/FHU-yezi/JianshuResearchTools",
-    packages=["JianshuResearchTools"],
+    packages=["JianshuResearchTools", "JianshuResearchTools.aio"],
     install_requires=["lxml==4.8.0", "httpx==0.22.0"],
     extras_require={
         "md-convert": ["tomd==0.1.3"],
         "high-perf": ["ujson==5.3.0"],
-        "full": ["tomd==0.1.3", "ujson==5.3.0"]
+        "http2": ["h2==4.1.0"],
+        "full": ["tomd==0.1.3", "ujson==5.3.0", "h2==4.1.0"]
     },
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT Licerense",
         "Operating System :: OS Independent",
     ],
-    python_requires=">=3.6"
+    python_requires=">=3.7"
 )
@@ -1,13 +1,25 @@
+from asyncio import CancelledError, ensure_future
+from asyncio import gather as asyncio_gather
+from asyncio import run as asyncio_run
+from asyncio import sleep as asyncio_sleep
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, List, Union
+from json import dumps
+from os import environ
+from threading import get_ident
+from time import monotonic, sleep, time
+from typing import Any, Dict, Iterator, List, Union
 
+import httpx
 import pytest
+from lxml import etree
 from yaml import FullLoader
 from yaml import load as yaml_load
 
 import JianshuResearchTools as jrt
 from JianshuResearchTools.convert import (ArticleSlugToArticleId,
                                           ArticleSlugToArticleUrl,
+                                          ArticleUrlsToArticleIds,
                                           ArticleUrlToArticleId,
                                           ArticleUrlToArticleSlug,
                                           CollectionSlugToCollectionUrl,
@@ -17,9 +29,12 @@ from JianshuResearchTools.convert import (ArticleSlugToArticleId,
                                           IslandUrlToIslandSlug,
                                           NotebookSlugToNotebookUrl,
                                           NotebookUrlToNotebookSlug,
-                                          UserSlugToUserId, UserSlugToUserUrl,
-                                          UserUrlToUserId, UserUrlToUserSlug)
+                                          UserSlugsToUserIds, UserSlugToUserId,
+                                          UserSlugToUserUrl, UserUrlToUserId,
+                                          UserUrlToUserSlug)
 from JianshuResearchTools.exceptions import APIError, InputError, ResourceError
+from JianshuResearchTools.headers import PC_header, api_request_header
+from JianshuResearchTools.transport import RecordTransport, ReplayTransport
 
 error_text_to_obj = {
     "InputError": InputError,
@@ -54,6 +69,13 @@ def AssertListCase(value: List[Any], case: List[Any]):
 with open("test_cases.yaml", "r", encoding="utf-8") as f:
     test_cases = yaml_load(f, Loader=FullLoader)
 
+# 设置 JRT_RECORD_DIR 时将测试用到的响应录制到该目录，设置 JRT_REPLAY_DIR 时从该目录离线回放
+if environ.get("JRT_RECORD_DIR"):
+    jrt.configure_client(transport=RecordTransport(environ["JRT_RECORD_DIR"]))
+elif environ.get("JRT_REPLAY_DIR"):
+    jrt.configure_client(transport=ReplayTransport(environ["JRT_REPLAY_DIR"],
+                                                   latency=float(environ.get("JRT_REPLAY_LATENCY", 0))))
+
 
 class TestEggs:  # 测试彩蛋内容
     def TestFuture(self):
@@ -93,6 +115,16 @@ class TestConvertModule:
         for case in test_cases["article_cases"]["success_cases"]:
             AssertNormalCase(ArticleUrlToArticleId(case["url"]), case["aid"])
 
+    def test_UserSlugsToUserIds(self):
+        cases = test_cases["convert_cases"]["user_convert_cases"]
+        AssertNormalCase(UserSlugsToUserIds([case["uslug"] for case in cases]), [case["uid"] for case in cases])
+        with pytest.raises(InputError):  # 检查参数时不发送请求
+            UserSlugsToUserIds([cases[0]["uslug"], "abc"])
+
+    def test_ArticleUrlsToArticleIds(self):
+        cases = test_cases["article_cases"]["success_cases"]
+        AssertNormalCase(ArticleUrlsToArticleIds([case["url"] for case in cases]), [case["aid"] for case in cases])
+
     def test_NotebookUrlToNotebookSlug(self):
         for case in test_cases["convert_cases"]["notebook_convert_cases"]:
             AssertNormalCase(NotebookUrlToNotebookSlug(case["url"]), case["nslug"])
@@ -121,6 +153,17 @@ class TestConvertModule:
         for case in test_cases["convert_cases"]["island_convert_cases"]:
             AssertNormalCase(IslandSlugToIslandUrl(case["islug"]), case["url"])
 
+    def test_ClassifyJianshuUrl(self):
+        for case in test_cases["convert_cases"]["user_convert_cases"]:
+            AssertNormalCase(jrt.convert.ClassifyJianshuUrl(case["url"]), ("user", case["uslug"]))
+        for case in test_cases["convert_cases"]["article_convert_cases"]:
+            AssertNormalCase(jrt.convert.ClassifyJianshuUrl(case["url"]), ("article", case["aslug"]))
+        assert jrt.convert.ClassifyJianshuUrl("https://www.jianshu.com/p/abc") is None
+
+        urls = [case["url"] for case in test_cases["convert_cases"]["island_convert_cases"]] + ["https://example.com"]
+        result = list(jrt.convert.ClassifyJianshuUrls(urls))
+        assert [item[0] if item else None for item in result] == ["island"] * (len(urls) - 1) + [None]
+
 
 class TestArticleModule:
     def test_GetArticleTitle(self):
@@ -131,6 +174,15 @@ class TestArticleModule:
             with pytest.raises(error_text_to_obj[case["exception_name"]]):
                 jrt.article.GetArticleTitle(case["url"])
 
+    def test_GetArticlesAllBasicData(self):
+        cases = test_cases["article_cases"]["success_cases"] + test_cases["article_cases"]["fail_cases"]
+        result = dict(jrt.article.GetArticlesAllBasicData([case["url"] for case in cases], ordered=False))
+        for case in cases:
+            if "exception_name" in case:
+                assert isinstance(result[case["url"]], error_text_to_obj[case["exception_name"]])
+            else:
+                AssertNormalCase(result[case["url"]]["title"], case["title"])
+
     def test_GetArticleAuthorName(self):
         for case in test_cases["article_cases"]["success_cases"]:
             AssertNormalCase(jrt.article.GetArticleAuthorName(case["url"]), case["author_name"])
@@ -245,6 +297,27 @@ class TestUserModule:
             with pytest.raises(error_text_to_obj[case["exception_name"]]):
                 jrt.user.GetUserName(case["url"])
 
+    def test_GetUsersAllBasicData(self):
+        cases = test_cases["user_cases"]["success_cases"] + test_cases["user_cases"]["fail_cases"]
+        result = list(jrt.user.GetUsersAllBasicData([case["url"] for case in cases], concurrency=4))
+        assert [user_url for user_url, _ in result] == [case["url"] for case in cases]
+        for case, (_, data) in zip(cases, result):
+            if "exception_name" in case:
+                assert isinstance(data, error_text_to_obj[case["exception_name"]])
+            else:
+                AssertNormalCase(data["name"], case["name"])
+
+    def test_GetUserData(self):
+        for case in test_cases["user_cases"]["success_cases"]:
+            result = jrt.user.GetUserData(case["url"], ["FTN_count", "name"])
+            assert list(result) == ["FTN_count", "name"]
+            AssertNormalCase(result["name"], case["name"])
+            AssertRangeCase(result["FTN_count"], case["FTN_count"])
+
+        for case in test_cases["user_cases"]["fail_cases"]:
+            with pytest.raises(error_text_to_obj[case["exception_name"]]):
+                jrt.user.GetUserData(case["url"], ["assets_count"])
+
     def test_GetUserGender(self):
         for case in test_cases["user_cases"]["success_cases"]:
             AssertNormalCase(jrt.user.GetUserGender(case["url"]), case["gender"])
@@ -484,5 +557,748 @@ class TestNotebookModule:
                 jrt.notebook.GetNotebookUpdateTime(case["url"])
 
 
+class TestAssertFuncsModule:
+    def test_AssertUserJsonDataNormal(self):
+        jrt.assert_funcs.AssertUserJsonDataNormal("https://www.jianshu.com/u/ea36c8d8aa30", {"nickname": "初心不变_叶子"})
+        with pytest.raises(ResourceError):
+            jrt.assert_funcs.AssertUserJsonDataNormal("https://www.jianshu.com/u/ea36c8d8aa31", {"error": []})
+
+    def test_StatusCache(self):
+        jrt.clear_status_cache()
+        jrt.assert_funcs.AssertUserJsonDataNormal("https://www.jianshu.com/u/ea36c8d8aa30", {"nickname": "初心不变_叶子"})
+        with pytest.raises(ResourceError):
+            jrt.assert_funcs.AssertUserJsonDataNormal("https://www.jianshu.com/u/ea36c8d8aa31", {"error": []})
+
+        # 状态异常的结果同样会被缓存
+        assert jrt.assert_funcs.AssertCachedStatusNormal("https://www.jianshu.com/u/ea36c8d8aa30")
+        with pytest.raises(ResourceError):
+            jrt.assert_funcs.AssertCachedStatusNormal("https://www.jianshu.com/u/ea36c8d8aa31")
+
+        jrt.invalidate_status_cache("https://www.jianshu.com/u/ea36c8d8aa31")
+        assert not jrt.assert_funcs.AssertCachedStatusNormal("https://www.jianshu.com/u/ea36c8d8aa31")
+        stats = jrt.get_status_cache_stats()
+        assert (stats["hits"], stats["misses"], stats["size"]) == (2, 1, 1)
+        jrt.clear_status_cache()
+
+    def test_KnownAbnormalResourceNotRequested(self, monkeypatch):
+        jrt.clear_status_cache()
+        requested_urls = []
+
+        def FakeGetUserJsonDataApi(user_url: str) -> Dict:
+            requested_urls.append(user_url)
+            return {"error": []}
+
+        monkeypatch.setattr(jrt.user, "GetUserJsonDataApi", FakeGetUserJsonDataApi)
+        for _ in range(2):
+            with pytest.raises(ResourceError):
+                jrt.user.GetUserName("https://www.jianshu.com/u/ea36c8d8aa31")
+        AssertNormalCase(len(requested_urls), 1)  # 第二次调用命中状态异常的缓存，不再请求
+        jrt.clear_status_cache()
+
+
+class TestClientModule:
+    def test_ClientLifecycle(self):
+        client = jrt.client.get_client()
+        assert jrt.client.get_client() is client
+        jrt.close()
+        assert jrt.client.get_client() is not client
+        jrt.close()
+
+    def test_ConfigureClient(self):
+        old_timeout = jrt.client.get_client_config()["timeout"]
+        jrt.configure_client(timeout=10)
+        assert jrt.client.get_client_config()["timeout"] == 10
+        jrt.configure_client(timeout=old_timeout)
+
+        with pytest.raises(InputError):
+            jrt.configure_client(unknown_option=1)
+
+    def test_AsyncClientLifecycle(self):
+        async def main():
+            client = jrt.client.get_async_client()
+            assert jrt.client.get_async_client() is client
+            await jrt.aio.close()
+            assert jrt.client.get_async_client() is not client
+            await jrt.aio.close()
+
+        asyncio_run(main())
+
+    def test_ReplacedAsyncClientClosed(self):
+        async def main():
+            client = jrt.client.get_async_client()
+            jrt.configure_client(timeout=jrt.client.get_client_config()["timeout"])
+            await asyncio_sleep(0.01)
+            assert client.is_closed  # 修改配置后旧客户端在所属的事件循环中关闭
+            await jrt.aio.close()
+
+        asyncio_run(main())
+
+
+class TestCacheModule:
+    def test_TTLCache(self):
+        cache = jrt.cache.TTLCache(max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1
+        cache.set("c", 3)  # 淘汰最久未使用的 b
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+        cache.set("d", 4, ttl=0.01)
+        sleep(0.02)
+        assert cache.get("d") is None
+
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["size"]) == (2, 2, 1)
+
+    def test_GetResponseTTL(self):
+        AssertNormalCase(jrt.cache.GetResponseTTL("https://www.jianshu.com/asimov/users/slug/ea36c8d8aa30"), 10)
+        assert jrt.cache.GetResponseTTL("https://www.jianshu.com/asimov/fp_rankings/voter_notes",
+                                        {"date": "20210101", "type": None}) is None
+
+
+class TestDiskCacheModule:
+    def test_DiskCache(self):
+        cache = jrt.disk_cache.DiskCache(":memory:")
+        cache.set("a", "https://www.jianshu.com/u/ea36c8d8aa30", b"content", etag='W/"abc"', ttl=0.01)
+        entry = cache.get("a")
+        assert entry.content == b"content"
+        assert entry.conditional_headers() == {"If-None-Match": 'W/"abc"'}
+
+        sleep(0.02)
+        assert not cache.get("a").is_fresh()
+        cache.touch("a", ttl=None)  # 重新验证成功后永不过期
+        assert cache.get("a").is_fresh()
+        assert cache.get("b") is None
+        assert len(cache) == 1
+
+        with ThreadPoolExecutor(max_workers=8) as executor:  # 并发计数时不会丢失
+            list(executor.map(lambda _: cache._Count("hits"), range(8000)))
+        AssertNormalCase(cache.stats()["hits"], 8000)
+        cache.close()
+        # 关闭后正在进行的请求不会出错，读取视为未命中，写入被忽略
+        assert cache.get("a") is None
+        cache.set("b", "https://www.jianshu.com/u/ea36c8d8aa30", b"content")
+        AssertNormalCase(len(cache), 0)
+
+    def test_AsyncDiskCacheOffEventLoop(self, monkeypatch):
+        threads = []
+
+        def GetDiskCachedEntry(key):
+            threads.append(get_ident())
+            return jrt.disk_cache.DiskCacheEntry(b"cached", None, None, time(), None)
+
+        monkeypatch.setattr(jrt.client, "GetDiskCachedEntry", GetDiskCachedEntry)
+        monkeypatch.setattr(jrt.client, "GetCachedResponse", lambda key: None)
+        jrt.set_disk_cache_status(True, ":memory:")
+        try:
+            content = asyncio_run(jrt.client.async_send_request("GET", "https://www.jianshu.com/u/ea36c8d8aa30", {}))
+        finally:
+            jrt.set_disk_cache_status(False)
+        AssertNormalCase(content, b"cached")
+        assert threads and threads[0] != get_ident()  # SQLite 读写不在事件循环所在的线程中进行
+
+
+class TestSlugIndexModule:
+    def test_ExtractIdSlugPairs(self):
+        json_obj = [{"object": {"data": {"id": 87256893, "slug": "52698676395f",
+                                         "user": {"id": 19867175, "slug": "ea36c8d8aa30"}}}}]
+        AssertNormalCase(jrt.slug_index.ExtractIdSlugPairs(json_obj, "article", ("*", "object", "data")),
+                         [("article", 87256893, "52698676395f")])
+        AssertNormalCase(jrt.slug_index.ExtractIdSlugPairs(json_obj, "user", ("*", "object", "data", "user")),
+                         [("user", 19867175, "ea36c8d8aa30")])
+        # 只提取指定位置，不根据 users、notes 等键名推断其它位置的资源类型
+        json_obj = {"id": 1, "slug": "ea36c8d8aa30", "users": [{"id": 2, "slug": "f8c2072f9afe"}]}
+        AssertNormalCase(jrt.slug_index.ExtractIdSlugPairs(json_obj, "user"), [("user", 1, "ea36c8d8aa30")])
+        AssertNormalCase(jrt.slug_index.ExtractIdSlugPairs({"error": "deleted"}, "user", ("users", "*")), [])
+
+    def test_SlugIndex(self, tmp_path):
+        assert not jrt.get_slug_index_status()  # 默认关闭
+        index = jrt.slug_index.SlugIndex(str(tmp_path / "index.db"))
+        index.add_many([("user", 19867175, "ea36c8d8aa30"), ("notebook", 1, "1")])
+        other_index = jrt.slug_index.SlugIndex(str(tmp_path / "index.db"))
+        assert other_index.get_id("user", "ea36c8d8aa30") is None  # 新条目批量写入，尚未提交
+        index.flush()
+        AssertNormalCase(other_index.get_id("user", "ea36c8d8aa30"), 19867175)
+        other_index.close()
+        index.close()
+
+        index = jrt.slug_index.SlugIndex(str(tmp_path / "index.db"))  # 重新打开后数据仍然存在
+        AssertNormalCase(index.get_id("user", "ea36c8d8aa30"), 19867175)
+        AssertNormalCase(index.get_slug("user", 19867175), "ea36c8d8aa30")
+        assert index.get_id("article", "52698676395f") is None
+        assert index.stats()["size"] == {"user": 1, "article": 0, "collection": 0}
+        index.close()
+
+
+class TestCheckpointModule:
+    def test_CheckpointStore(self, tmp_path):
+        for store_class, file_name in ((jrt.checkpoint.JsonCheckpointStore, "checkpoints.json"),
+                                       (jrt.checkpoint.SQLiteCheckpointStore, "checkpoints.db")):
+            store = store_class(str(tmp_path / file_name))
+            assert store.get("ea36c8d8aa30") is None
+            store.set("ea36c8d8aa30", 1000)
+            store.close()
+
+            store = store_class(str(tmp_path / file_name))  # 重新打开后数据仍然存在
+            AssertNormalCase(store.get("ea36c8d8aa30"), 1000)
+            AssertNormalCase(len(store), 1)
+            store.close()
+
+        class IncompleteStore(jrt.checkpoint.CheckpointStore):
+            def get(self, key: str) -> None:
+                return None
+
+        with pytest.raises(TypeError):  # 没有实现 set 方法
+            IncompleteStore()
+
+    def test_GetUserNewTimelineInfo(self, monkeypatch):
+        user_url = "https://www.jianshu.com/u/ea36c8d8aa30"
+        operation_ids = list(range(10, 0, -1))  # 动态按时间从新到旧排列
+        requested_max_ids = []
+
+        def FakeGetUserTimelineInfo(user_url: str, max_id: int = None, disable_check: bool = False) -> List[Dict]:
+            requested_max_ids.append(max_id)
+            return [{"operation_id": x} for x in operation_ids if max_id is None or x < max_id][:3]
+
+        monkeypatch.setattr(jrt.user, "GetUserTimelineInfo", FakeGetUserTimelineInfo)
+        store = jrt.checkpoint.MemoryCheckpointStore()
+
+        def GetNewOperationIds(**kwargs) -> List[int]:
+            requested_max_ids.clear()
+            return [item["operation_id"] for item in
+                    jrt.user.GetUserNewTimelineInfo(user_url, store, disable_check=True, **kwargs)]
+
+        # 超过 max_count 时从最旧的新动态开始返回，检查点只推进到已返回的部分
+        AssertNormalCase(GetNewOperationIds(max_count=4), [4, 3, 2, 1])
+        AssertNormalCase(store.get("ea36c8d8aa30"), 4)
+        AssertNormalCase(GetNewOperationIds(max_count=4), [8, 7, 6, 5])
+        AssertNormalCase(requested_max_ids, [None, 8, 5])  # 到达检查点所在的页面后停止翻页
+        AssertNormalCase(GetNewOperationIds(), [10, 9])
+        AssertNormalCase(store.get("ea36c8d8aa30"), 10)
+
+        AssertNormalCase(GetNewOperationIds(), [])  # 没有新动态时只发送一次请求，检查点不变
+        AssertNormalCase(requested_max_ids, [None])
+        AssertNormalCase(store.get("ea36c8d8aa30"), 10)
+
+        operation_ids.insert(0, 11)
+        AssertNormalCase(GetNewOperationIds(), [11])
+        AssertNormalCase(GetNewOperationIds(last_operation_id=9), [11, 10])  # 显式传入的值优先于检查点
+
+        def FakeAssertUserStatusNormal(user_url: str) -> None:
+            raise ResourceError("用户账号状态异常")
+
+        operation_ids.clear()  # 账号状态异常的用户动态为空
+        monkeypatch.setattr(jrt.user, "AssertUserStatusNormal", FakeAssertUserStatusNormal)
+        with pytest.raises(ResourceError):
+            jrt.user.GetUserNewTimelineInfo(user_url, store)
+
+
+class TestCrawlerModule:
+    def test_BloomFilter(self):
+        bloom_filter = jrt.crawler.BloomFilter(capacity=1000, error_rate=0.01)
+        assert bloom_filter.add("ea36c8d8aa30")
+        assert not bloom_filter.add("ea36c8d8aa30")  # 重复添加时返回 False
+        assert "ea36c8d8aa30" in bloom_filter
+        for i in range(1000):
+            bloom_filter.add(str(i))
+        assert all(str(i) in bloom_filter for i in range(1000))  # 已添加的元素不会被误判为不存在
+        AssertRangeCase(sum(str(i) in bloom_filter for i in range(1000, 11000)), [0, 300])
+
+    def test_CrawlUserGraph(self, tmp_path, monkeypatch):
+        with pytest.raises(InputError):
+            jrt.crawler.CrawlUserGraph([], str(tmp_path / "edges.tsv"), direction="unknown")
+
+        a, b, c, d, e, broken = (char * 12 for char in "abcdex")
+        following = {a: [b, c], b: [c, d], c: [a], d: [e]}
+        fans = {a: [c], b: [a], c: [a, b], d: [b]}
+        crawled_slugs = []
+
+        def FakeGetNeighbors(user_slug: str, direction: str, max_count: int) -> Dict[str, List[str]]:
+            crawled_slugs.append(user_slug)
+            if user_slug == broken:
+                raise ResourceError(f"用户 {user_slug} 账号状态异常")
+            result = {}
+            if direction in ("following", "both"):
+                result["following"] = following[user_slug]
+            if direction in ("fans", "both"):
+                result["fans"] = fans[user_slug]
+            return result
+
+        def ReadEdges() -> List[str]:
+            return sorted((tmp_path / "edges.tsv").read_text(encoding="utf-8").splitlines())
+
+        monkeypatch.setattr(jrt.crawler, "_GetNeighbors", FakeGetNeighbors)
+
+        # 第二层发现的 d 不会被继续抓取
+        stats = jrt.crawler.CrawlUserGraph([UserSlugToUserUrl(a)], str(tmp_path / "edges.tsv"), max_depth=2,
+                                           disable_check=True)
+        AssertNormalCase(stats, {"crawled_users_count": 3, "found_users_count": 4, "edges_count": 5, "failed_users_count": 0})
+        AssertNormalCase(crawled_slugs[0], a)  # 按层抓取
+        AssertNormalCase(sorted(crawled_slugs[1:]), [b, c])
+        AssertNormalCase(ReadEdges(), sorted([f"{a}\t{b}", f"{a}\t{c}", f"{b}\t{c}", f"{b}\t{d}", f"{c}\t{a}"]))
+
+        # 粉丝列表中的边方向为 “粉丝<Tab>当前用户”，重复的种子用户只抓取一次，失败的用户单独计数
+        crawled_slugs.clear()
+        visited = set()
+        stats = jrt.crawler.CrawlUserGraph([UserSlugToUserUrl(slug) for slug in (a, a, broken)], str(tmp_path / "edges.tsv"),
+                                           direction="both", visited=visited, disable_check=True)
+        AssertNormalCase(stats, {"crawled_users_count": 1, "found_users_count": 4, "edges_count": 3, "failed_users_count": 1})
+        AssertNormalCase(sorted(crawled_slugs), [a, broken])
+        AssertNormalCase(visited, {a, b, c, broken})
+        AssertNormalCase(ReadEdges(), sorted([f"{a}\t{b}", f"{a}\t{c}", f"{c}\t{a}"]))
+
+
+class TestGraphStoreModule:
+    def test_UserGraph(self, tmp_path):
+        (tmp_path / "edges.tsv").write_text("ea36c8d8aa30\tbb36c8d8aa30\nea36c8d8aa30\taa36c8d8aa30\n"
+                                            "bb36c8d8aa30\tea36c8d8aa30\nea36c8d8aa30\tbb36c8d8aa30\n")
+        AssertNormalCase(jrt.graph_store.BuildUserGraph(str(tmp_path / "edges.tsv"), str(tmp_path / "graph")),
+                         {"nodes_count": 3, "edges_count": 3})  # 重复的边只保留一条
+
+        graph = jrt.graph_store.UserGraph(str(tmp_path / "graph"))
+        AssertNormalCase(graph.out_neighbors("ea36c8d8aa30"), ["aa36c8d8aa30", "bb36c8d8aa30"])
+        AssertNormalCase(graph.in_neighbors("ea36c8d8aa30"), ["bb36c8d8aa30"])
+        AssertNormalCase(graph.out_degree("aa36c8d8aa30"), 0)
+        AssertNormalCase(graph.in_degree(graph.get_id("bb36c8d8aa30")), 1)
+        assert "cc36c8d8aa30" not in graph
+        with pytest.raises(InputError):
+            graph.out_degree("cc36c8d8aa30")
+        graph.close()
+
+
+class TestRecordsModule:
+    def test_CommentRecord(self):
+        user = {"id": 1, "nickname": "简书", "slug": "ea36c8d8aa30", "avatar": "avatar.png"}
+        json_obj = {
+            "id": 10, "created_at": "2021-05-01T12:34:56+08:00", "compiled_content": "评论",
+            "floor": 1, "images": [{"url": "image.png"}], "likes_count": 2, "children_count": 1,
+            "user": dict(user, member={"type": "gold", "expires_at": 1700000000}),
+            "children": [{"id": 11, "created_at": "2021-05-01T13:00:00+08:00", "compiled_content": "回复",
+                          "images": [], "parent_id": 10, "user": user}]
+        }
+        record = jrt.records.CommentRecord.from_json(json_obj)
+        AssertNormalCase(record.sub_comments[0].user.vip_type, None)
+        AssertNormalCase(record.to_dict(), {
+            "cmid": 10, "publish_time": datetime.fromisoformat("2021-05-01T12:34:56+08:00"),
+            "content": "评论", "floor": 1, "images": ["image.png"], "likes_count": 2, "sub_comments_count": 1,
+            "user": {"uid": 1, "name": "简书", "uslug": "ea36c8d8aa30", "avatar_url": "avatar.png",
+                     "vip_type": "黄金", "vip_expire_date": datetime.fromtimestamp(1700000000)},
+            "sub_comments": [{  # 为 None 的可选字段不会出现在字典中
+                "cmid": 11, "publish_time": datetime.fromisoformat("2021-05-01T13:00:00+08:00"),
+                "content": "回复", "images": [], "parent_comment_id": 10,
+                "user": {"uid": 1, "name": "简书", "uslug": "ea36c8d8aa30", "avatar_url": "avatar.png"}
+            }]
+        })
+        assert "sub_comments" not in jrt.records.CommentRecord.from_json(
+            dict(json_obj, children_count=0, children=None)).to_dict()
+
+    def test_RankRecord(self):
+        record = jrt.records.AssetsRankRecord.from_json({
+            "ranking": 1, "amount": 12345,
+            "user": {"id": 1, "slug": "ea36c8d8aa30", "nickname": "简书", "avatar": "avatar.png"}
+        })
+        AssertNormalCase(record.to_dict(), {"ranking": 1, "uid": 1, "uslug": "ea36c8d8aa30", "name": "简书",
+                                            "avatar_url": "avatar.png", "FP": 12.345})
+        AssertNormalCase(record._replace(Assets=20.0, FTN=7.655).to_dict()["FTN"], 7.655)
+
+
+class TestUtilsModule:
+    def test_RunConcurrently(self):
+        AssertNormalCase(jrt.utils.RunConcurrently([lambda: 1, lambda: 2, lambda: 3]), [1, 2, 3])
+
+        def Fail(message: str) -> None:
+            raise ResourceError(message)
+
+        with pytest.raises(ResourceError, match="first"):  # 按传入顺序抛出第一个异常
+            jrt.utils.RunConcurrently([lambda: 1, lambda: Fail("first"), lambda: Fail("second")])
+
+    def test_AsyncRunConcurrently(self):
+        state = {"running": 0, "max_running": 0}
+
+        async def Get(arg: int) -> int:
+            state["running"] += 1
+            state["max_running"] = max(state["max_running"], state["running"])
+            await asyncio_sleep(0.01)
+            state["running"] -= 1
+            return arg
+
+        async def Run(concurrency: Union[int, None]) -> List[int]:
+            return await jrt.utils.AsyncRunConcurrently([Get(arg) for arg in range(10)], concurrency=concurrency)
+
+        AssertNormalCase(asyncio_run(Run(3)), list(range(10)))
+        AssertNormalCase(state["max_running"], 3)
+        asyncio_run(Run(None))
+        AssertNormalCase(state["max_running"], 10)
+
+    def test_BatchCall(self):
+        def Get(arg: int) -> int:
+            if arg == 1:
+                raise ResourceError("deleted")
+            if arg == 2:
+                raise APIError("circuit open")
+            return {}["missing"] if arg == 3 else arg  # 3 模拟解析代码中的错误
+
+        result = dict(jrt.utils.BatchCall(Get, [0, 1, 2], 2))
+        AssertNormalCase(result[0], 0)
+        assert type(result[1]) is ResourceError and type(result[2]) is APIError  # 保留原始异常类型
+        with pytest.raises(KeyError):  # 程序错误不会被转换为返回值
+            list(jrt.utils.BatchCall(Get, [0, 3], 2))
+
+        async def AsyncGet(arg: int) -> int:
+            return Get(arg)
+
+        async def Collect(args: List[int]) -> Dict:
+            return {arg: result async for arg, result in jrt.utils.AsyncBatchCall(AsyncGet, args, 2)}
+
+        assert type(asyncio_run(Collect([1, 2]))[2]) is APIError
+        with pytest.raises(KeyError):
+            asyncio_run(Collect([3]))
+
+    def test_BatchCallInputError(self):
+        def Get(url: str) -> str:
+            jrt.assert_funcs.AssertUserUrl(url)
+            return url
+
+        result = dict(jrt.utils.BatchCall(Get, ["https://www.jianshu.com/u/ea36c8d8aa30", "bad"], 2))
+        assert type(result["bad"]) is InputError  # 单个参数无效不会中断整批调用
+        AssertNormalCase(result["https://www.jianshu.com/u/ea36c8d8aa30"], "https://www.jianshu.com/u/ea36c8d8aa30")
+
+    def test_BatchCallBoundedWindow(self):
+        consumed = []
+
+        def Args() -> Iterator[int]:
+            for arg in range(1000):
+                consumed.append(arg)
+                yield arg
+
+        def Get(arg: int) -> int:
+            sleep(0.01)
+            return arg
+
+        for ordered in (True, False):
+            consumed.clear()
+            results = jrt.utils.BatchCall(Get, Args(), 4, ordered)
+            next(results)
+            sleep(0.05)
+            assert len(consumed) <= 5  # 最多读取 concurrency 个尚未返回结果的参数
+            results.close()
+
+        async def AsyncGet(arg: int) -> int:
+            await asyncio_sleep(0.01)
+            return arg
+
+        async def FirstResult(ordered: bool) -> None:
+            results = jrt.utils.AsyncBatchCall(AsyncGet, Args(), 4, ordered)
+            await results.__anext__()
+            await asyncio_sleep(0.05)
+            assert len(consumed) <= 5
+            await results.aclose()
+
+        for ordered in (True, False):
+            consumed.clear()
+            asyncio_run(FirstResult(ordered))
+
+    def test_IterPages(self):
+        def GetPage(page: int) -> List[int]:
+            sleep(0.01)
+            return [page * 10, page * 10 + 1] if page <= 5 else []
+
+        expected = [page * 10 + i for page in range(1, 6) for i in range(2)]
+        AssertNormalCase(list(jrt.utils.IterPages(GetPage)), expected)
+        AssertNormalCase(list(jrt.utils.IterPages(GetPage, prefetch=3)), expected)  # 乱序完成时仍按页码顺序返回
+        AssertNormalCase(list(jrt.utils.IterPages(GetPage, prefetch=3, total_pages=5)), expected)
+        AssertNormalCase(list(jrt.utils.IterPages(GetPage, prefetch=3, max_count=3)), expected[:3])
+
+        requested_pages = []
+
+        def GetRecordedPage(page: int) -> List[int]:
+            requested_pages.append(page)
+            return GetPage(page)
+
+        pages = jrt.utils.IterPages(GetRecordedPage, prefetch=3, total_pages=100)
+        next(pages)
+        sleep(0.1)
+        assert max(requested_pages) <= 4  # 最多领先调用方 prefetch 页，与总页数无关
+        pages.close()
+
+        requested_pages.clear()
+        list(jrt.utils.IterPages(GetRecordedPage, prefetch=3, total_pages=5))
+        AssertNormalCase(sorted(requested_pages), [1, 2, 3, 4, 5])  # 已知总页数时不请求空页
+
+    def test_AsyncIterPages(self):
+        async def GetPage(page: int) -> List[int]:
+            await asyncio_sleep(0.01)
+            return [page * 10, page * 10 + 1] if page <= 5 else []
+
+        async def Collect(**kwargs: Any) -> List[int]:
+            return [item async for item in jrt.utils.AsyncIterPages(GetPage, **kwargs)]
+
+        expected = [page * 10 + i for page in range(1, 6) for i in range(2)]
+        AssertNormalCase(asyncio_run(Collect()), expected)
+        AssertNormalCase(asyncio_run(Collect(prefetch=3, total_pages=5)), expected)
+        AssertNormalCase(asyncio_run(Collect(prefetch=3, max_count=3)), expected[:3])
+
+
+class TestPlannerModule:
+    def test_PlanUserDataSources(self):
+        AssertNormalCase(jrt.planner.PlanUserDataSources(["fans_count", "url", "fans_count"]),
+                         (["fans_count", "url"], ["json"]))
+        AssertNormalCase(jrt.planner.PlanUserDataSources(["assets_count", "FTN_count"]),
+                         (["assets_count", "FTN_count"], ["json", "pc_html"]))
+        with pytest.raises(InputError):
+            jrt.planner.PlanUserDataSources(["unknown_field"])
+
+    def test_ParseUserData(self):
+        AssertNormalCase(jrt.planner.PlanUserDataSources(["FTN_count"]), (["FTN_count"], ["json", "pc_html"]))
+        html_obj = etree.HTML("<div class='info'><ul><li/><li/><li/><li/><li/>"
+                              "<li><div class='meta-block'><p>1.2w</p></div></li></ul></div>")
+        payloads = {"json": {"total_wordage": 100, "jsd_balance": 5500}, "pc_html": html_obj}
+        AssertNormalCase(jrt.planner.ParseUserData("", ["FTN_count", "FP_count"], payloads),
+                         {"FTN_count": 11994.5, "FP_count": 5.5})
+        payloads["json"] = {"total_wordage": 0, "jsd_balance": 0}  # 依赖的字段为 None 时派生字段也为 None
+        AssertNormalCase(jrt.planner.ParseUserData("", ["FTN_count"], payloads), {"FTN_count": None})
+
+    def test_ParseArticlesCount(self):
+        # GetUserAllBasicData 的 articles_count 从个人主页解析，而不是旧版本中的整个 JSON 数据
+        html_obj = etree.HTML("<div class='info'><ul><li/><li/>"
+                              "<li><div class='meta-block'><a><p>42</p></a></div></li></ul></div>")
+        AssertNormalCase(jrt.planner.PlanUserDataSources(["articles_count"]), (["articles_count"], ["pc_html"]))
+        result = jrt.planner.ParseUserData("", ["articles_count"], {"pc_html": html_obj})
+        AssertNormalCase(result, {"articles_count": 42})
+        assert type(result["articles_count"]) is int
+
+    def test_SourcesFetchedConcurrently(self, monkeypatch):
+        user_url = "https://www.jianshu.com/u/ea36c8d8aa30"
+        monkeypatch.setattr(jrt.user, "ParseUserData", lambda user_url, fields, payloads: payloads)
+        monkeypatch.setattr(jrt.aio.user, "ParseUserData", lambda user_url, fields, payloads: payloads)
+        for name in ("GetUserJsonDataApi", "GetUserPCHtmlDataApi", "GetUserNextAnniversaryDayHtmlDataApi"):
+            # 每个数据来源模拟 50 毫秒的网络延迟
+            monkeypatch.setattr(jrt.user, name, lambda *args, name=name: sleep(0.05) or name)
+
+            async def AsyncGet(*args, name=name):
+                await asyncio_sleep(0.05)
+                return name
+            monkeypatch.setattr(jrt.aio.user, name, AsyncGet)
+
+        start_time = monotonic()
+        AssertNormalCase(len(jrt.user.GetUserAllBasicData(user_url, disable_check=True)), 3)
+        assert monotonic() - start_time < 0.1  # 依次请求三个数据来源需要 150 毫秒
+        start_time = monotonic()
+        AssertNormalCase(len(asyncio_run(jrt.aio.user.GetUserAllBasicData(user_url, disable_check=True))), 3)
+        assert monotonic() - start_time < 0.1
+
+
+class TestParsersModule:
+    def test_ParseUserFollowListHtml(self):
+        item_html = ("<li><div class='info'><a class='name' href='/u/{0}'>{0}</a>"
+                     "<div class='meta'><span>关注 1</span><span>粉丝 2</span><span>文章 3</span></div>"
+                     "<div class='meta'>写了 400 字，获得了 5 个喜欢</div></div></li>")
+        # 最后一页不足 8 项时也能正常解析
+        html_obj = etree.HTML("<div><a class='name'>owner</a></div><ul>"
+                              f"{item_html.format('a')}{item_html.format('b')}</ul>")
+        AssertNormalCase(jrt.parsers.ParseUserFollowListHtml(html_obj), [
+            {"name": name, "uslug": name, "followers_count": 1, "fans_count": 2, "articles_count": 3,
+             "words_count": 400, "likes_count": 5}
+            for name in ("a", "b")
+        ])
+        AssertNormalCase(jrt.parsers.ParseUserFollowListHtml(etree.HTML("<a class='name'>owner</a>")), [])
+
+    def test_ParseUserTimelineHtml(self):
+        block_html = ("<li id='feed-{0}'><a class='avatar'><img src='avatar.png'/></a>"
+                      "<a class='nickname' href='/u/x{1}'>nickname</a>"
+                      "<span data-type='{2}' data-datetime='2022-01-01T08:00:00+08:00'></span></li>")
+        html_obj = etree.HTML("<ul>" + block_html.format(2, "ea36c8d8aa30", "join_jianshu")
+                              + block_html.format(1, "ea36c8d8aa30", "unknown_type") + "</ul>")
+        result = jrt.parsers.ParseUserTimelineHtml(html_obj)
+        AssertNormalCase([item["operation_id"] for item in result], [2, 1])
+        AssertNormalCase(result[0]["operator_url"], "https://www.jianshu.com/u/ea36c8d8aa30")
+        AssertNormalCase(len(result[1]), 3)  # 不在可解析列表中的动态只包含基础信息
+
+    def test_ParseArticleCommentsJson(self, monkeypatch):
+        def User(member: bool) -> Dict:
+            result = {"id": 1, "nickname": "name", "slug": "ea36c8d8aa30", "avatar": "avatar.png"}
+            if member:
+                result["member"] = {"type": "ordinary", "expires_at": 1640995200}
+            return result
+
+        comment = {"id": 1, "created_at": "2022-01-01T08:00:00+08:00", "compiled_content": "content",
+                   "images": [{"url": "image.png"}], "user": User(True)}
+        json_obj = {"comments": [
+            dict(comment, floor=1, likes_count=2, children_count=1,
+                 children=[dict(comment, id=2, parent_id=1, images=[], user=User(False))]),
+            dict(comment, id=3, floor=2, likes_count=0, children_count=0)
+        ]}
+        result = jrt.parsers.ParseArticleCommentsJson(json_obj)
+        AssertNormalCase(result[0]["user"]["vip_type"], "普通（旧会员）")
+        AssertNormalCase(result[0]["sub_comments"][0]["parent_comment_id"], 1)
+        assert "vip_type" not in result[0]["sub_comments"][0]["user"]  # 没有开通会员
+        assert "sub_comments" not in result[1]  # 没有子评论
+
+        # 同步与异步版本共用同一个解析函数
+        async def AsyncGetJson(*args: Any) -> Dict:
+            return json_obj
+
+        monkeypatch.setattr(jrt.article, "GetArticleCommentsJsonDataApi", lambda *args: json_obj)
+        monkeypatch.setattr(jrt.aio.article, "GetArticleCommentsJsonDataApi", AsyncGetJson)
+        AssertNormalCase(jrt.article.GetArticleCommentsData(1), result)
+        AssertNormalCase(asyncio_run(jrt.aio.article.GetArticleCommentsData(1)), result)
+
+
+class TestSingleFlightModule:
+    def test_SingleFlight(self):
+        single_flight = jrt.singleflight.SingleFlight()
+        calls_count = []
+
+        def func():
+            calls_count.append(1)
+            sleep(0.1)
+            return "result"
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lambda _: single_flight.do("key", func), range(4)))
+        assert results == ["result"] * 4
+        assert len(calls_count) == 1
+
+    def test_AsyncSingleFlight(self):
+        single_flight = jrt.singleflight.AsyncSingleFlight()
+        calls_count = []
+
+        async def func():
+            calls_count.append(1)
+            await asyncio_sleep(0.1)
+            return "result"
+
+        async def main():
+            return await asyncio_gather(*[single_flight.do("key", func) for _ in range(4)])
+
+        assert asyncio_run(main()) == ["result"] * 4
+        assert len(calls_count) == 1
+
+    def test_AsyncSingleFlightLeaderCancelled(self):
+        single_flight = jrt.singleflight.AsyncSingleFlight()
+        calls_count = []
+
+        async def func():
+            calls_count.append(1)
+            await asyncio_sleep(0.05)
+            return "result"
+
+        async def main():
+            leader = ensure_future(single_flight.do("key", func))
+            await asyncio_sleep(0)
+            follower = ensure_future(single_flight.do("key", func))
+            await asyncio_sleep(0.01)
+            leader.cancel()
+            with pytest.raises(CancelledError):
+                await leader
+            return await follower  # 发起调用的协程被取消后，其它等待者仍能得到结果
+
+        AssertNormalCase(asyncio_run(main()), "result")
+        AssertNormalCase(len(calls_count), 1)
+
+        async def cancel_all():
+            waiter = ensure_future(single_flight.do("key", func))
+            await asyncio_sleep(0.01)
+            waiter.cancel()
+            with pytest.raises(CancelledError):
+                await waiter
+            return await single_flight.do("key", func)  # 所有等待者都被取消后，调用会重新执行
+
+        AssertNormalCase(asyncio_run(cancel_all()), "result")
+        AssertNormalCase(len(calls_count), 3)
+
+
+class TestRateLimitModule:
+    def test_TokenBucket(self):
+        bucket = jrt.ratelimit.TokenBucket(rate=20, burst=2)
+        start_time = monotonic()
+        for _ in range(4):
+            bucket.acquire()
+        # 前两次请求使用积累的令牌，后两次请求需要等待约 0.1 秒
+        assert monotonic() - start_time >= 0.09
+
+        stats = bucket.stats()
+        assert (stats["requests_count"], stats["waited_requests_count"], stats["queue_depth"]) == (4, 2, 0)
+
+    def test_TokenBucketCancelled(self):
+        bucket = jrt.ratelimit.TokenBucket(rate=10, burst=1)
+        bucket.acquire()
+
+        async def main() -> float:
+            task = ensure_future(bucket.async_acquire())
+            await asyncio_sleep(0.01)
+            task.cancel()
+            with pytest.raises(CancelledError):
+                await task
+            return await bucket.async_acquire()
+
+        # 被取消的任务归还了预约的令牌，下一次请求只需等待约 0.1 秒，而不是约 0.2 秒
+        assert asyncio_run(main()) < 0.1
+        AssertNormalCase(bucket.stats()["queue_depth"], 0)
+
+    def test_GetBucketName(self):
+        AssertNormalCase(jrt.ratelimit.GetBucketName("https://www.jianshu.com/asimov/users/slug/ea36c8d8aa30",
+                                                     api_request_header), "jianshu_api")
+        AssertNormalCase(jrt.ratelimit.GetBucketName("https://www.jianshu.com/u/ea36c8d8aa30", PC_header), "jianshu_html")
+
+        with pytest.raises(InputError):
+            jrt.configure_rate_limit("unknown", rate=1)
+
+
+class TestTransportModule:
+    def test_ReplayTransport(self, tmp_path):
+        request = httpx.Request("GET", "https://www.jianshu.com/asimov/users/slug/ea36c8d8aa30")
+        with open(tmp_path / f"{jrt.transport.GetRequestCorpusKey(request)}.json", "w", encoding="utf-8") as f:
+            f.write(dumps(jrt.transport._DumpResponse(request, httpx.Response(200, content=b'{"nickname": "test"}'))))
+
+        transport = ReplayTransport(str(tmp_path), latency=0.05)
+        with httpx.Client(transport=transport) as client:
+            start_time = monotonic()
+            response = client.get("https://www.jianshu.com/asimov/users/slug/ea36c8d8aa30")
+            assert monotonic() - start_time >= 0.05
+            assert response.json() == {"nickname": "test"}
+
+            with pytest.raises(APIError):
+                client.get("https://www.jianshu.com/asimov/users/slug/f8c2072f9afe")
+
+
+class TestRetryModule:
+    def test_CircuitBreaker(self):
+        breaker = jrt.retry.CircuitBreaker(failure_threshold=2, recovery_timeout=0.05)
+        breaker.record_failure()
+        assert breaker.allow_request()
+        breaker.record_failure()
+        assert not breaker.allow_request()  # 连续失败两次后熔断
+
+        sleep(0.06)
+        assert breaker.allow_request()  # 放行一次试探请求
+        assert not breaker.allow_request()
+        breaker.record_success()
+        assert breaker.allow_request()
+        assert breaker.open_count == 1
+
+        breaker.record_failure()
+        breaker.record_failure()
+        sleep(0.06)
+        assert breaker.allow_request()  # 试探请求的结果没有被记录
+        assert not breaker.allow_request()
+        sleep(0.06)
+        assert breaker.allow_request()  # 再经过恢复时间后放行新的试探请求
+
+    def test_GetBackoffTime(self):
+        response = httpx.Response(503, headers={"Retry-After": "3600"})
+        AssertNormalCase(jrt.retry.GetBackoffTime(1, response), jrt.get_retry_config()["backoff_max"])
+        assert 1 <= jrt.retry.GetBackoffTime(1, httpx.Response(503, headers={"Retry-After": "1"})) <= 10
+
+    def test_GetEndpointName(self):
+        AssertNormalCase(jrt.retry.GetEndpointName("https://www.jianshu.com/asimov/users/slug/ea36c8d8aa30"),
+                         "www.jianshu.com/asimov/users")
+        AssertNormalCase(jrt.retry.GetEndpointName("https://www.jianshu.com/u/ea36c8d8aa30"), "www.jianshu.com/u")
+
+        with pytest.raises(InputError):
+            jrt.configure_retry(unknown_option=1)
+
+
 if __name__ == "__main__":
     pytest.main(args=["-n 4"])  # 运行测试